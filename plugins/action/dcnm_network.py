@@ -63,7 +63,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     get_nd_version,
     obtain_federated_fabric_associations,
     obtain_fabric_associations,
-    deploy_fabric
+    deploy_fabric,
+    run_child_fabric_tasks
 )
 
 display = Display()
@@ -292,7 +293,7 @@ class ActionModule(ActionBase):
             display.vvv("Checking MSD fabric associations API")
             display.vvv("=" * 80)
 
-            msd_fabrics = obtain_fabric_associations(self, task_vars, tmp)
+            msd_fabrics = obtain_fabric_associations(self, task_vars, tmp, fabrics=missing_fabrics)
             if msd_fabrics is None:
                 result['failed'] = True
                 result['msg'] = "Failed to get MSD fabric associations"
@@ -633,6 +634,66 @@ class ActionModule(ActionBase):
 
         return fabric_configs, None
 
+    def _execute_fabric_config(self, fabric_config, module_args, task_vars, tmp):
+        """
+        Execute the dcnm_network module for a single fabric configuration.
+
+        Child fabric configurations may be executed concurrently on worker
+        threads, so this method must not modify shared plugin state.
+
+        Args:
+            fabric_config (dict): Fabric configuration from _split_config
+            module_args (dict): Original Ansible module arguments from playbook
+            task_vars (dict): Ansible task variables for module execution context
+            tmp (str): Temporary directory path for module execution
+
+        Returns:
+            tuple: (fabric_module_args, fabric_result)
+                - fabric_module_args (dict): Module arguments used for this fabric
+                - fabric_result (dict): dcnm_network module result
+        """
+        fabric_details = fabric_config['_fabric_details']
+        fabric_type = fabric_details['fabric_type']
+
+        # Prepare module arguments for this fabric
+        fabric_module_args = module_args.copy()
+        fabric_module_args['fabric'] = fabric_config['fabric']
+        fabric_module_args['state'] = fabric_config['state']
+        fabric_module_args['config'] = fabric_config['config']
+        fabric_module_args['_fabric_details'] = fabric_details  # Pass full fabric_details to module
+
+        # Call the dcnm_network module for this fabric
+        display.vvv(f"Processing fabric '{fabric_config['fabric']}' with {len(fabric_config['config'])} network(s)")
+
+        # In vvv mode, display fabric and key attributes being pushed to module
+        if display.verbosity >= 3:
+            display.vvv(f"Fabric: {fabric_module_args['fabric']}")
+            display.vvv(f"Fabric Type: {fabric_type}")
+            display.vvv(f"Cluster Name: {fabric_details['cluster_name']}")
+            display.vvv(f"State: {fabric_module_args['state']}")
+            display.vvv("Networks being processed:")
+            for i, net_config in enumerate(fabric_module_args['config'], 1):
+                net_name = net_config.get('net_name', 'unknown')
+                vrf_name = net_config.get('vrf_name', 'N/A')
+                net_id = net_config.get('net_id', 'auto')
+                vlan_id = net_config.get('vlan_id', 'auto')
+                deploy = net_config.get('deploy', True)
+                display.vvv(f"  {i}. {net_name} (VRF: {vrf_name}, Net ID: {net_id}, VLAN: {vlan_id}, Deploy: {deploy})")
+
+        fabric_result = self._execute_module(
+            module_name="cisco.dcnm.dcnm_network",
+            module_args=fabric_module_args,
+            task_vars=task_vars,
+            tmp=tmp
+        )
+
+        # Show raw output in vvv mode
+        if display.verbosity >= 3:
+            display.vvv(f"Raw execution result for fabric '{fabric_config['fabric']}':")
+            display.vvv(json.dumps(fabric_result, indent=2))
+
+        return fabric_module_args, fabric_result
+
     def _execute_fabric_configs(self, configs, module_args, result, task_vars, tmp):
         """
         Execute dcnm_network module for each fabric configuration and aggregate results.
@@ -644,6 +705,7 @@ class ActionModule(ActionBase):
         Execution Behavior:
         - Standalone fabrics: Returns module result exactly as-is (pass-through)
         - MSD fabrics: Executes parent first, then children, with aggregated results
+        - Child fabrics: Up to child_fabric_parallelism children are executed at a time
         - Fail-fast: Stops on first error and returns failure immediately
         - Verbose logging: Displays detailed execution information in vvv mode
         - Deployment: Collects deploy_payload from parent fabric and deploys at the end
@@ -682,47 +744,19 @@ class ActionModule(ActionBase):
         parent_fabric_name = None
         parent_fabric_type = None
 
+        # Child fabric configs are run together once the parent is done
+        child_fabric_configs = []
+
         # Process each fabric config by calling the dcnm_network module
         for fabric_config in configs:
             fabric_details = fabric_config['_fabric_details']
             fabric_type = fabric_details['fabric_type']
 
-            # Prepare module arguments for this fabric
-            fabric_module_args = module_args.copy()
-            fabric_module_args['fabric'] = fabric_config['fabric']
-            fabric_module_args['state'] = fabric_config['state']
-            fabric_module_args['config'] = fabric_config['config']
-            fabric_module_args['_fabric_details'] = fabric_details  # Pass full fabric_details to module
-
-            # Call the dcnm_network module for this fabric
-            display.vvv(f"Processing fabric '{fabric_config['fabric']}' with {len(fabric_config['config'])} network(s)")
-
-            # In vvv mode, display fabric and key attributes being pushed to module
-            if display.verbosity >= 3:
-                display.vvv(f"Fabric: {fabric_module_args['fabric']}")
-                display.vvv(f"Fabric Type: {fabric_type}")
-                display.vvv(f"Cluster Name: {fabric_details['cluster_name']}")
-                display.vvv(f"State: {fabric_module_args['state']}")
-                display.vvv("Networks being processed:")
-                for i, net_config in enumerate(fabric_module_args['config'], 1):
-                    net_name = net_config.get('net_name', 'unknown')
-                    vrf_name = net_config.get('vrf_name', 'N/A')
-                    net_id = net_config.get('net_id', 'auto')
-                    vlan_id = net_config.get('vlan_id', 'auto')
-                    deploy = net_config.get('deploy', True)
-                    display.vvv(f"  {i}. {net_name} (VRF: {vrf_name}, Net ID: {net_id}, VLAN: {vlan_id}, Deploy: {deploy})")
-
-            fabric_result = self._execute_module(
-                module_name="cisco.dcnm.dcnm_network",
-                module_args=fabric_module_args,
-                task_vars=task_vars,
-                tmp=tmp
-            )
+            if fabric_type in ['multisite_child', 'multicluster_child']:
+                child_fabric_configs.append(fabric_config)
+                continue
 
-            # Show raw output in vvv mode
-            if display.verbosity >= 3:
-                display.vvv(f"Raw execution result for fabric '{fabric_config['fabric']}':")
-                display.vvv(json.dumps(fabric_result, indent=2))
+            fabric_module_args, fabric_result = self._execute_fabric_config(fabric_config, module_args, task_vars, tmp)
 
             # For standalone fabrics, return the module result exactly as-is
             if fabric_type == 'standalone':
@@ -799,14 +833,38 @@ class ActionModule(ActionBase):
                     display.vvvv(f"deploy_payload_wrapper type: {type(deploy_payload_wrapper)}")
                     display.vvvv(f"deploy_payload_wrapper keys: {list(deploy_payload_wrapper.keys()) if isinstance(deploy_payload_wrapper, dict) else 'N/A'}")
 
-            elif fabric_type in ['multisite_child', 'multicluster_child']:
-                child_fabric_results.append({
-                    'fabric_name': fabric_config['fabric'],
-                    'changed': fabric_result.get('changed', False),
-                    'failed': fabric_result.get('failed', False),
-                    'response': fabric_result.get('response', []),
-                    'diff': fabric_result.get('diff', [])
-                })
+        # Child fabric operations are independent of each other, so run up to
+        # child_fabric_parallelism of them at a time. Results keep config order.
+        executed = run_child_fabric_tasks(
+            self,
+            child_fabric_configs,
+            lambda fabric_config: self._execute_fabric_config(fabric_config, module_args, task_vars, tmp)[1],
+            module_args.get('child_fabric_parallelism', 1)
+        )
+        for fabric_config, fabric_result in executed:
+            fabric_type = fabric_config['_fabric_details']['fabric_type']
+
+            # FAIL FAST on first error
+            if fabric_result.get('failed'):
+                result['failed'] = True
+                result['msg'] = (
+                    f"Failed processing fabric '{fabric_config['fabric']}' "
+                    f"({fabric_type}): {fabric_result.get('msg', 'Unknown error')}"
+                )
+                return result
+
+            # Set overall changed flag if any fabric changed
+            if fabric_result.get('changed'):
+                result['changed'] = True
+                display.vvv(f"Fabric '{fabric_config['fabric']}' execution resulted in changes")
+
+            child_fabric_results.append({
+                'fabric_name': fabric_config['fabric'],
+                'changed': fabric_result.get('changed', False),
+                'failed': fabric_result.get('failed', False),
+                'response': fabric_result.get('response', []),
+                'diff': fabric_result.get('diff', [])
+            })
 
         # Deploy networks on parent fabric if deploy_payload is not None
         # Note: deploy_payload can be an empty list [] or empty dict {} which are valid for deployment
@@ -30,7 +30,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.common.action_logger im
     ActionLogger as Logger,
 )
 from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
-    get_nd_version, obtain_federated_fabric_associations, obtain_fabric_associations, deploy_fabric
+    get_nd_version, obtain_federated_fabric_associations, obtain_fabric_associations, deploy_fabric,
+    run_child_fabric_tasks
 )
 from ansible.utils.display import Display
 
@@ -129,7 +130,7 @@ class ActionModule(ActionNetworkModule):
         # Special handling for cases where federation manager does not exist which is the case for
         # standalone or MSD fabrics in a non-clustered environment
         if fabric_association_data == 'A federation manager does not exist':
-            fabric_association_data = obtain_fabric_associations(self, task_vars, tmp)
+            fabric_association_data = obtain_fabric_associations(self, task_vars, tmp, fabrics=[fabric_name])
             # Skip MCFG detection, go directly to MSD
             fabric_type, fabric_data = self.detect_fabric_type(fabric_name, fabric_association_data, "msd")
         else:
@@ -137,7 +138,7 @@ class ActionModule(ActionNetworkModule):
             fabric_type, fabric_data = self.detect_fabric_type(fabric_name, fabric_association_data, "mcfg")
             if not fabric_type:
                 # Fallback to MSD associations if MCFG detection fails
-                fabric_association_data = obtain_fabric_associations(self, task_vars, tmp)
+                fabric_association_data = obtain_fabric_associations(self, task_vars, tmp, fabrics=[fabric_name])
                 fabric_type, fabric_data = self.detect_fabric_type(fabric_name, fabric_association_data, "msd")
 
         if not fabric_type:
@@ -532,17 +533,22 @@ class ActionModule(ActionNetworkModule):
                 self.logger.info(f"Processing {len(child_tasks_dict)} child fabrics",
                                  fabric=parent_fabric, operation="child_execution")
 
-                for child_task in child_tasks_dict.values():
-                    # Execute child fabric task
-                    self.logger.info("Executing child task", fabric=child_task["fabric"], operation="child_execution")
-                    child_result = self.execute_child_task(child_task, task_vars, tmp)
+                # Child fabric tasks are independent once the parent succeeded.
+                # Run up to child_fabric_parallelism of them at a time, stopping
+                # on the first failure. Results keep child_tasks_dict order.
+                executed = run_child_fabric_tasks(
+                    self,
+                    list(child_tasks_dict.values()),
+                    lambda child_task: self.execute_child_task(child_task, task_vars, tmp),
+                    module_args.get("child_fabric_parallelism", 1)
+                )
+                for child_task, child_result in executed:
                     child_results.append(child_result)
 
-                    # Handle child task failures with immediate abort
+                    # Log child task failures; remaining tasks were not started
                     if child_result.get("failed", False):
                         error_msg = f"Child fabric task failed for {child_task['fabric']}: {child_result.get('msg', 'Unknown error')}"
                         self.logger.error(error_msg, fabric=child_task["fabric"], operation="child_execution")
-                        break
 
             # Step 4: Retrieve deployment payload from parent module
             # result, if any
@@ -923,8 +929,9 @@ class ActionModule(ActionNetworkModule):
 
         child_module_args["fabric_details"] = child_task.get("fabric_details")
 
-        # Execute child fabric operations using base module
-        child_result = self.execute_module_with_args(child_module_args, task_vars, tmp)
+        # Execute child fabric operations using base module. Child tasks may
+        # run concurrently, so the shared task arguments are left untouched.
+        child_result = self.execute_module_with_args(child_module_args, task_vars, tmp, swap_task_args=False)
 
         # Enhance result with child fabric context
         child_result["child_fabric"] = fabric_name
@@ -942,7 +949,7 @@ class ActionModule(ActionNetworkModule):
     # UTILITY & HELPER METHODS
     # =========================================================================
 
-    def execute_module_with_args(self, module_args, task_vars, tmp):
+    def execute_module_with_args(self, module_args, task_vars, tmp, swap_task_args=True):
         """
         Execute the dcnm_vrf module with specified arguments and context.
 
@@ -965,6 +972,8 @@ class ActionModule(ActionNetworkModule):
         Args:
             module_args (dict): Custom module arguments to execute with
             task_vars (dict): Ansible task variables for execution context
+            swap_task_args (bool): Temporarily replace the task arguments.
+                Must be False when called from a worker thread.
 
         Returns:
             dict: Module execution result containing:
@@ -981,7 +990,8 @@ class ActionModule(ActionNetworkModule):
             # Log module execution initiation
             self.logger.debug("Executing NDFC VRF module", fabric=fabric_name, operation="execute_module")
             # Temporarily replace task arguments with custom ones
-            self._task.args = module_args
+            if swap_task_args:
+                self._task.args = module_args
             # Execute base dcnm_vrf module with custom arguments
             result = self._execute_module(
                 module_name="cisco.dcnm.dcnm_vrf",
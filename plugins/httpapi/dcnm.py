@@ -37,9 +37,91 @@ options:
     - name: ANSIBLE_HTTPAPI_LOGIN_DOMAIN
     vars:
     - name: ansible_httpapi_login_domain
+  url_probe_ttl:
+    description:
+    - Number of seconds a verified connection to the controller URL is trusted
+      before the URL is probed again.
+    - The controller URL is always probed when the connection is established
+      and after a transport failure.
+    - Any successful request to the controller also verifies the connection.
+    - Set to 0 to probe the controller URL before every request.
+    type: int
+    default: 300
+    env:
+    - name: ANSIBLE_HTTPAPI_URL_PROBE_TTL
+    vars:
+    - name: ansible_httpapi_url_probe_ttl
+  response_cache:
+    description:
+    - Cache successful responses to read-only GET requests for controller
+      resources that rarely change (controller version, fabric details and
+      fabric associations) in the persistent connection.
+    - Cached responses are shared by all tasks that use the same persistent
+      connection and user.
+    - Cached responses for a fabric are discarded whenever a request other
+      than GET is sent for that fabric.
+    type: bool
+    default: false
+    env:
+    - name: ANSIBLE_HTTPAPI_RESPONSE_CACHE
+    vars:
+    - name: ansible_httpapi_response_cache
+  response_cache_ttl:
+    description:
+    - Number of seconds a cached GET response is reused.
+    - The controller version is always cached for one hour.
+    - Only used when I(response_cache=true).
+    type: int
+    default: 60
+    env:
+    - name: ANSIBLE_HTTPAPI_RESPONSE_CACHE_TTL
+    vars:
+    - name: ansible_httpapi_response_cache_ttl
+  controller_context_ttl:
+    description:
+    - Number of seconds the controller context is shared by the tasks that use
+      the same persistent connection and user.
+    - The controller context holds the controller version, the supported
+      features, fabric details and fabric associations. It is computed by the
+      first task that needs it, so that later tasks can skip probing the
+      controller.
+    - Fabric details are discarded whenever a request other than GET is sent
+      for that fabric. Fabric associations are discarded whenever fabrics are
+      deleted or Multi-Site Domain or multi-cluster memberships change.
+    - The controller context is disabled by default. Set to a positive number
+      of seconds to enable it, for example when a playbook runs many tasks
+      against a controller whose fabrics are not changed by anything else
+      while the playbook runs.
+    type: int
+    default: 0
+    env:
+    - name: ANSIBLE_HTTPAPI_CONTROLLER_CONTEXT_TTL
+    vars:
+    - name: ansible_httpapi_controller_context_ttl
+  token_refresh_margin:
+    description:
+    - Number of seconds before the authentication token expires at which the
+      persistent connection logs in again, before sending the next request or
+      handing out the token for image uploads.
+    - The expiry of NDFC tokens is read from the token. DCNM tokens expire
+      after I(persistent_connect_timeout).
+    - The login method that succeeded is remembered per controller and user,
+      and is tried first by later logins and by later persistent connections.
+    - Set to 0 to only log in again after the controller rejects the token.
+    type: int
+    default: 60
+    env:
+    - name: ANSIBLE_HTTPAPI_TOKEN_REFRESH_MARGIN
+    vars:
+    - name: ansible_httpapi_token_refresh_margin
 """
 
+import copy
+import hashlib
 import json
+import os
+import re
+import time
 
 # Any third party modules should be imported as below, if not sanity tests will fail
 try:
@@ -49,9 +131,11 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+from ansible import constants as C
 from ansible.module_utils._text import to_text
 from ansible.module_utils.connection import ConnectionError
 from ansible.plugins.httpapi import HttpApiBase
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.auth_token import AuthToken
 
 # Constants
 DCNM_VERSION = 11
@@ -60,6 +144,31 @@ HTTP_SUCCESS_MIN = 200
 HTTP_SUCCESS_MAX = 600
 DEFAULT_LOGIN_DOMAIN = "local"
 DEFAULT_RETRY_COUNT = 5
+DEFAULT_URL_PROBE_TTL = 300
+DEFAULT_RESPONSE_CACHE_TTL = 60
+DEFAULT_CONTROLLER_CONTEXT_TTL = 0
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
+# Login methods that succeeded, per controller and user, in the persistent
+# connection directory. Only the name of the login method is saved.
+LOGIN_METHODS_FILE = "dcnm_login_methods.json"
+
+# GET paths whose responses may be cached and their TTL in seconds.
+# A TTL of None uses the response_cache_ttl option.
+RESPONSE_CACHE_PATHS = (
+    (re.compile(r"/about/version$"), 3600),
+    (re.compile(r"/rest/control/fabrics/msd/fabric-associations$"), None),
+    (re.compile(r"/api/v1/onemanage/fabrics$"), None),
+    (re.compile(r"/rest/control/fabrics/[^/?]+$"), None),
+)
+RESPONSE_CACHE_FABRIC = re.compile(r"/fabrics/(?!msd/)([^/?]+)")
+
+# Non-GET paths that may change fabric associations
+CONTROLLER_CONTEXT_ASSOCIATIONS = re.compile(r"msd|onemanage|fabric-associations", re.IGNORECASE)
+# Non-GET paths that may change the controller capabilities
+CONTROLLER_CONTEXT_FEATURES = re.compile(r"/fm/features")
+CONTROLLER_CONTEXT_VERSION = re.compile(r"/about/version$")
+# Controller context keys that depend on the controller version
+CONTROLLER_CONTEXT_VERSION_KEYS = ("capabilities", "version", "nd_version", "bulk_api")
 
 
 class HttpApi(HttpApiBase):
@@ -70,6 +179,17 @@ class HttpApi(HttpApiBase):
         self.txt_headers = {"Content-Type": "text/plain"}
         self.version = None
         self.retrycount = DEFAULT_RETRY_COUNT
+        self.url_probe_session = None
+        self.url_verified_time = None
+        self.url_probe_stats = {"performed": 0, "skipped": 0, "failed": 0}
+        self.response_cache = {}
+        self.response_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self.controller_context = {}
+        self.token = None
+        # refresh_margin is set from the token_refresh_margin option on first use
+        self.auth_token = AuthToken(refresh_margin=None)
+        self.token_stats = {"refreshes": 0}
+        self.login_method = None
 
     def get_version(self):
         return self.version
@@ -83,8 +203,99 @@ class HttpApi(HttpApiBase):
         self.token = token
 
     def get_token(self):
+        # Hand out a token that does not expire in the middle of an upload
+        self._refresh_token_if_due()
         return self.token
 
+    def _get_token_refresh_margin(self):
+        """Return the number of seconds before token expiry at which the token is refreshed."""
+        try:
+            return int(self._get_option_default("token_refresh_margin", DEFAULT_TOKEN_REFRESH_MARGIN))
+        except (TypeError, ValueError):
+            return DEFAULT_TOKEN_REFRESH_MARGIN
+
+    def _refresh_token_if_due(self):
+        """
+        Log in again if the token expires within token_refresh_margin seconds.
+
+        A failed refresh is ignored: the current token is still valid for a
+        little while, and a rejected token triggers a login anyway.
+        """
+        if self.auth_token.refresh_margin is None:
+            self.auth_token.refresh_margin = self._get_token_refresh_margin()
+        if self.connection._auth is None or not self.auth_token.needs_refresh():
+            return
+        try:
+            self.login(self.connection.get_option("remote_user"), self.connection.get_option("password"))
+        except ConnectionError:
+            return
+        self.token_stats["refreshes"] += 1
+
+    def get_token_stats(self):
+        """Return the login method, login and proactive refresh counters and the seconds until the token expires."""
+        stats = dict(self.token_stats)
+        stats["login_method"] = self.login_method
+        stats["logins"] = self.auth_token.logins
+        expires_in = self.auth_token.expires_in()
+        stats["expires_in"] = None if expires_in is None else int(expires_in)
+        return stats
+
+    def _login_methods_key(self):
+        """Return the key of the controller and user in LOGIN_METHODS_FILE, or None."""
+        try:
+            host = self.connection.get_option("host")
+            port = self.connection.get_option("port")
+            user = self.connection.get_option("remote_user")
+        except (AttributeError, KeyError):
+            return None
+        if not isinstance(host, str) or not isinstance(user, str):
+            return None
+        return hashlib.sha256("{0}:{1}:{2}".format(host, port, user).encode("utf-8")).hexdigest()[:16]
+
+    def _login_methods_path(self):
+        return os.path.join(os.path.expanduser(C.PERSISTENT_CONTROL_PATH_DIR), LOGIN_METHODS_FILE)
+
+    def _load_login_method(self):
+        """Return the login method that last succeeded for this controller and user, or None."""
+        if self.login_method is not None:
+            return self.login_method
+        key = self._login_methods_key()
+        if key is None:
+            return None
+        try:
+            with open(self._login_methods_path()) as methods_file:
+                methods = json.load(methods_file)
+        except (IOError, OSError, ValueError):
+            return None
+        return methods.get(key) if isinstance(methods, dict) else None
+
+    def _save_login_method(self, method):
+        """Remember the login method that succeeded for this controller and user."""
+        if method == self.login_method:
+            return
+        self.login_method = method
+        key = self._login_methods_key()
+        if key is None:
+            return
+        path = self._login_methods_path()
+        try:
+            with open(path) as methods_file:
+                methods = json.load(methods_file)
+            if not isinstance(methods, dict):
+                methods = {}
+        except (IOError, OSError, ValueError):
+            methods = {}
+        methods[key] = method
+        try:
+            # Replace the file atomically, other persistent connections may read it
+            tmp_path = "{0}.{1}".format(path, os.getpid())
+            with open(tmp_path, "w") as methods_file:
+                json.dump(methods, methods_file)
+            os.replace(tmp_path, path)
+        except (IOError, OSError):
+            # Remembering the login method only saves login attempts
+            pass
+
     def _attempt_login(self, login_config):
         """Unified login method that handles different API versions and formats."""
         try:
@@ -112,6 +323,7 @@ class HttpApi(HttpApiBase):
             self.login_succeeded = True
             self.set_version(login_config["version"])
             self.set_token(self.connection._auth)
+            self.auth_token.set(token, lifetime=login_config.get("lifetime"))
             return True
 
         except Exception as e:
@@ -124,6 +336,7 @@ class HttpApi(HttpApiBase):
         self.login_fail_msg = []
         login_domain = self.get_option("login_domain") or "local"
 
+        persistent_connect_timeout = self.connection.get_option("persistent_connect_timeout")
         # Define login configurations in order of preference
         login_configs = [
             {
@@ -144,14 +357,20 @@ class HttpApi(HttpApiBase):
                 "controller_type": "DCNM",
                 "version": 11,
                 "path": "/rest/logon",
-                "data": "{'expirationTime': %s}" % (self.connection.get_option("persistent_connect_timeout") * 1000),
+                "data": "{'expirationTime': %s}" % (persistent_connect_timeout * 1000),
                 "force_basic_auth": True,
+                "lifetime": persistent_connect_timeout,
             },
         ]
 
+        # Try the login method that succeeded last time first
+        login_method = self._load_login_method()
+        login_configs.sort(key=lambda config: config["controller_type"] != login_method)
+
         # Try each login method
         for config in login_configs:
             if self._attempt_login(config):
+                self._save_login_method(config["controller_type"])
                 return
 
         # If all login attempts fail, raise ConnectionError
@@ -200,15 +419,217 @@ class HttpApi(HttpApiBase):
         if self._attempt_logout(logout_config):
             self.logout_succeeded = True
             self.connection._auth = None
+            self.auth_token.clear()
         else:
             error_message = "Logout failed: " + "; ".join(self.logout_fail_msg)
             raise ConnectionError(error_message)
 
+    def _get_url_probe_session(self):
+        """Return a keep-alive requests session reused for every URL probe."""
+        if self.url_probe_session is None:
+            self.url_probe_session = requests.Session()
+            self.url_probe_session.verify = False
+        return self.url_probe_session
+
+    def _get_option_default(self, option, default):
+        """Return the value of a plugin option, or default if it is not set."""
+        try:
+            value = self.get_option(option)
+        except (AttributeError, KeyError):
+            # Options are not available until the plugin is loaded by Ansible
+            value = None
+        if value is None:
+            return default
+        return value
+
+    def _get_url_probe_ttl(self):
+        """Return the number of seconds a verified controller URL is trusted."""
+        return int(self._get_option_default("url_probe_ttl", DEFAULT_URL_PROBE_TTL))
+
+    def _url_probe_due(self):
+        """
+        Return True if the controller URL must be probed before the next request.
+
+        A probe is due when the connection has not yet been verified (new
+        connection or previous transport failure) or when the last verification
+        is older than the url_probe_ttl option.
+        """
+        if self.url_verified_time is None:
+            return True
+        return time.monotonic() - self.url_verified_time >= self._get_url_probe_ttl()
+
+    def _mark_url_verified(self):
+        self.url_verified_time = time.monotonic()
+
+    def _mark_url_failed(self):
+        self.url_verified_time = None
+
+    def get_url_probe_stats(self):
+        """Return counters for controller URL probes performed, skipped and failed."""
+        return dict(self.url_probe_stats)
+
+    def _response_cache_enabled(self):
+        return bool(self._get_option_default("response_cache", False))
+
+    def _response_cache_key(self, method, path):
+        """Key cached responses by verb, path and the identity of the logged in user."""
+        return (
+            method,
+            path,
+            self.connection.get_option("remote_user"),
+            self._get_option_default("login_domain", DEFAULT_LOGIN_DOMAIN),
+        )
+
+    def _response_cache_ttl(self, path, cacheable=False):
+        """
+        Return the number of seconds the response to a GET of path may be cached,
+        or None if the response must not be cached.
+        """
+        for regex, ttl in RESPONSE_CACHE_PATHS:
+            if regex.search(path):
+                break
+        else:
+            if not cacheable:
+                return None
+            ttl = None
+        if ttl is None:
+            ttl = int(self._get_option_default("response_cache_ttl", DEFAULT_RESPONSE_CACHE_TTL))
+        return ttl
+
+    def _response_cache_get(self, method, path):
+        """Return a copy of the cached response for method and path, or None."""
+        entry = self.response_cache.get(self._response_cache_key(method, path))
+        if entry is None or entry["expires"] <= time.monotonic():
+            self.response_cache_stats["misses"] += 1
+            return None
+        self.response_cache_stats["hits"] += 1
+        return copy.deepcopy(entry["response"])
+
+    def _response_cache_put(self, method, path, response, ttl):
+        if response.get("RETURN_CODE") != 200:
+            return
+        match = RESPONSE_CACHE_FABRIC.search(path)
+        self.response_cache[self._response_cache_key(method, path)] = {
+            "expires": time.monotonic() + ttl,
+            "fabric": match.group(1) if match else None,
+            "response": copy.deepcopy(response),
+        }
+
+    def _response_cache_invalidate(self, path):
+        """
+        Discard cached responses that a non-GET request to path may have changed.
+
+        Requests for a fabric discard the cached responses of that fabric and of
+        fabric listings.  Requests that are not for a fabric discard all cached
+        responses.
+        """
+        if not self.response_cache:
+            return
+        match = RESPONSE_CACHE_FABRIC.search(path)
+        if match is None:
+            stale = list(self.response_cache)
+        else:
+            stale = [key for key, entry in self.response_cache.items() if entry["fabric"] in (None, match.group(1))]
+        for key in stale:
+            del self.response_cache[key]
+        self.response_cache_stats["invalidations"] += len(stale)
+
+    def get_response_cache_stats(self):
+        """Return GET response cache statistics, or None if the response cache is disabled."""
+        if not self._response_cache_enabled():
+            return None
+        stats = dict(self.response_cache_stats)
+        stats["entries"] = len(self.response_cache)
+        return stats
+
+    def _controller_context_ttl(self):
+        return int(self._get_option_default("controller_context_ttl", DEFAULT_CONTROLLER_CONTEXT_TTL))
+
+    def _controller_context_entry(self):
+        """Return the controller context entry of the logged in user, discarding it if it has expired."""
+        key = (
+            self.connection.get_option("remote_user"),
+            self._get_option_default("login_domain", DEFAULT_LOGIN_DOMAIN),
+        )
+        entry = self.controller_context.get(key)
+        if entry is not None and time.monotonic() - entry["created"] >= self._controller_context_ttl():
+            del self.controller_context[key]
+            entry = None
+        return key, entry
+
+    def get_controller_context(self):
+        """
+        Return a copy of the controller context shared by the tasks that use this
+        persistent connection, or an empty dict if there is none.
+
+        The context may hold the following keys:
+            version: major controller version as returned by dcnm_version_supported()
+            nd_version: major.minor controller version as returned by get_nd_version()
+            bulk_api: whether the v2 bulk-update APIs are available
+            capabilities: capability matrix as derived by DcnmCapabilities
+            fabrics: fabric details keyed by fabric name
+            fabric_associations: MSD fabric associations
+            federated_fabric_associations: multi-cluster fabric associations
+        """
+        if self._controller_context_ttl() <= 0:
+            return {}
+        key, entry = self._controller_context_entry()
+        if entry is None:
+            return {}
+        return copy.deepcopy(entry["context"])
+
+    def set_controller_context(self, context):
+        """
+        Merge context into the controller context. Fabric details are merged by fabric
+        name, other keys replace their current value.
+        """
+        if self._controller_context_ttl() <= 0:
+            return
+        key, entry = self._controller_context_entry()
+        if entry is None:
+            entry = self.controller_context[key] = {"created": time.monotonic(), "context": {}}
+        for name, value in copy.deepcopy(context).items():
+            if name == "fabrics":
+                entry["context"].setdefault("fabrics", {}).update(value)
+            else:
+                entry["context"][name] = value
+
+    def _controller_context_invalidate(self, method, path):
+        """Discard the parts of the controller context that a non-GET request to path may have changed."""
+        match = RESPONSE_CACHE_FABRIC.search(path)
+        for entry in self.controller_context.values():
+            context = entry["context"]
+            if match is None:
+                context.pop("fabrics", None)
+            else:
+                context.get("fabrics", {}).pop(match.group(1), None)
+            if CONTROLLER_CONTEXT_ASSOCIATIONS.search(path) or (method == "DELETE" and match is not None):
+                context.pop("fabric_associations", None)
+                context.pop("federated_fabric_associations", None)
+            if CONTROLLER_CONTEXT_FEATURES.search(path):
+                for key in CONTROLLER_CONTEXT_VERSION_KEYS:
+                    context.pop(key, None)
+
+    def _controller_context_check_version(self, response):
+        """Discard the version dependent controller context if the controller now reports another version."""
+        data = response.get("DATA")
+        if response.get("RETURN_CODE") != 200 or not isinstance(data, dict) or not data.get("version"):
+            return
+        for entry in self.controller_context.values():
+            context = entry["context"]
+            capabilities = context.get("capabilities")
+            if isinstance(capabilities, dict) and capabilities.get("raw_version") != data["version"]:
+                for key in CONTROLLER_CONTEXT_VERSION_KEYS:
+                    context.pop(key, None)
+
     def check_url_connection(self):
         # Verify HTTPS request URL for DCNM controller is accessible
+        self.url_probe_stats["performed"] += 1
         try:
-            requests.head(self.connection._url, verify=False)
+            self._get_url_probe_session().head(self.connection._url, verify=False)
         except requests.exceptions.RequestException as e:
+            self.url_probe_stats["failed"] += 1
+            self._mark_url_failed()
             msg = """
 
                   Please verify that the DCNM controller HTTPS URL ({0}) is
@@ -218,13 +639,31 @@ class HttpApi(HttpApiBase):
                 self.connection._url
             )
             raise ConnectionError(str(e) + msg)
+        self._mark_url_verified()
 
     def get_url_connection(self):
         return self.connection._url
 
-    def _send_request_internal(self, method, path, data=None, headers=None):
+    def _send_request_internal(self, method, path, data=None, headers=None, cacheable=False):
         """Internal method to handle common request logic."""
-        self.check_url_connection()
+        self._refresh_token_if_due()
+        cache_ttl = None
+        if self._response_cache_enabled():
+            if method == "GET":
+                cache_ttl = self._response_cache_ttl(str(path), cacheable)
+                if cache_ttl is not None:
+                    cached = self._response_cache_get(method, str(path))
+                    if cached is not None:
+                        return cached
+            else:
+                self._response_cache_invalidate(str(path))
+        if method != "GET" and self.controller_context:
+            self._controller_context_invalidate(method, str(path))
+
+        if self._url_probe_due():
+            self.check_url_connection()
+        else:
+            self.url_probe_stats["skipped"] += 1
 
         # Validate path
         path = str(path)
@@ -237,7 +676,13 @@ class HttpApi(HttpApiBase):
 
         try:
             response, rdata = self.connection.send(path, data, self.retrycount, method=method, headers=request_headers, force_basic_auth=True)
-            return self._verify_response(response, method, path, rdata)
+            self._mark_url_verified()
+            vrd = self._verify_response(response, method, path, rdata)
+            if method == "GET" and self.controller_context and CONTROLLER_CONTEXT_VERSION.search(path):
+                self._controller_context_check_version(vrd)
+            if cache_ttl is not None:
+                self._response_cache_put(method, path, vrd, cache_ttl)
+            return vrd
         except Exception as e:
             if e.args:
                 eargs = e.args[0]
@@ -246,6 +691,8 @@ class HttpApi(HttpApiBase):
             if isinstance(eargs, dict) and eargs.get("METHOD"):
                 return eargs
 
+            # Transport failure; probe the controller URL on the next request
+            self._mark_url_failed()
             error_msg = "Please verify your login credentials, access permissions and fabric details and try again"
             raise ConnectionError(str(e) + ". " + error_msg)
 
@@ -253,6 +700,13 @@ class HttpApi(HttpApiBase):
         """This method handles all DCNM REST API requests other than login"""
         return self._send_request_internal(method, path, json or {}, self.headers)
 
+    def send_cacheable_request(self, method, path, json=None):
+        """
+        Same as send_request, but the response to a GET may be served from, and
+        stored in, the response cache when it is enabled, whatever the path.
+        """
+        return self._send_request_internal(method, path, json or {}, self.headers, cacheable=True)
+
     def send_urlencoded_request(self, method, path, urlencoded=None):
         """This method handles all DCNM REST API urlencoded requests other than login"""
         return self._send_request_internal(method, path, urlencoded or {}, self.urlencoded_headers)
@@ -271,11 +725,25 @@ class HttpApi(HttpApiBase):
 
         # Check if return code is in acceptable range
         if HTTP_SUCCESS_MIN <= rc <= HTTP_SUCCESS_MAX:
-            return self._return_info(rc, method, path, msg, jrd)
+            info = self._return_info(rc, method, path, msg, jrd)
+            # Passed on for the retry policy of RestSend
+            retry_after = self._get_retry_after(response) if rc in (429, 503) else None
+            if retry_after is not None:
+                info["RETRY_AFTER"] = retry_after
+            return info
         else:
             msg = "Unknown RETURN_CODE: {0}".format(rc)
             raise ConnectionError(self._return_info(rc, method, path, msg, jrd))
 
+    def _get_retry_after(self, response):
+        """Return the Retry-After header of response, or None"""
+        headers = getattr(response, "headers", None)
+        try:
+            value = headers.get("Retry-After")
+        except AttributeError:
+            return None
+        return value if isinstance(value, str) else None
+
     def _get_response_value(self, response_data):
         """Extract string data from response_data returned from DCNM"""
         return to_text(response_data.getvalue())
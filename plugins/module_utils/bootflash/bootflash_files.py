@@ -154,7 +154,7 @@ class BootflashFiles:
                 -   ``switch_details`` is not set.
                 -   ``rest_send`` is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         if not self._rest_send_instantiated():
             msg = f"{self.class_name}.{method_name}: "
@@ -179,7 +179,7 @@ class BootflashFiles:
         -   ``ValueError`` if:
                 -   switch_details is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         self.refresh_switch_details()
 
@@ -260,7 +260,7 @@ class BootflashFiles:
         -   switch_details is not properly initialized.
         """
         # pylint: disable=no-member
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         def raise_exception(property_name: str) -> None:
             msg = f"{self.class_name}.{method_name}: "
@@ -334,7 +334,7 @@ class BootflashFiles:
                 -   ``switch_details`` is not set.
                 -   ``target`` is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         def raise_exception(property_name: str) -> None:
             msg = f"{self.class_name}.{method_name}: "
@@ -507,7 +507,7 @@ class BootflashFiles:
         -   ``ValueError`` if:
                 -   The switch does not allow file deletion.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         self.validate_prerequisites_for_add_file()
 
         if not self.ok_to_delete_files(self.ip_address):
@@ -647,7 +647,7 @@ class BootflashFiles:
 
         Set an instance of the RestSend class.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self._rest_send.params:
             msg = f"{self.class_name}.{method_name}: "
             msg += "RestSend.params must be set before accessing."
@@ -656,7 +656,7 @@ class BootflashFiles:
 
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["RestSend"] = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -694,7 +694,7 @@ class BootflashFiles:
 
     @results.setter
     def results(self, value: Results) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["Results"] = "Results"
         msg = f"{self.class_name}.{method_name}: "
@@ -748,7 +748,7 @@ class BootflashFiles:
 
     @switch_details.setter
     def switch_details(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "SwitchDetails"
         msg = f"{self.class_name}.{method_name}: "
@@ -815,7 +815,7 @@ class BootflashFiles:
 
     @target.setter
     def target(self, value: dict[str, str]) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
 
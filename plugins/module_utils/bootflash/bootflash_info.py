@@ -270,7 +270,7 @@ class BootflashInfo:
                 -   self.switches is not set.
                 -   switches is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         def raise_value_error_if_not_set(property_name: str) -> None:
             msg = f"{self.class_name}.{method_name}: "
@@ -321,7 +321,7 @@ class BootflashInfo:
         -   `ValueError` if:
                 -   serial_number cannot be found for a switch.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         self.info_dict = {}
         self.response_dict = {}
         self.result_dict = {}
@@ -363,7 +363,7 @@ class BootflashInfo:
         -   `ValueError` if:
                 -   info_dict is empty i.e. `refresh` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         if not self.info:
             msg = f"{self.class_name}.{method_name}: "
@@ -434,7 +434,7 @@ class BootflashInfo:
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         self.validate_prerequisites_for_build_matches()
         self._matches = []
@@ -619,7 +619,7 @@ class BootflashInfo:
 
         Set an instance of the RestSend class.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self._rest_send.params:
             msg = f"{self.class_name}.{method_name}: "
             msg += "RestSend.params must be set before accessing."
@@ -628,7 +628,7 @@ class BootflashInfo:
 
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["RestSend"] = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -666,7 +666,7 @@ class BootflashInfo:
 
     @results.setter
     def results(self, value: Results) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["Results"] = "Results"
         msg = f"{self.class_name}.{method_name}: "
@@ -696,7 +696,7 @@ class BootflashInfo:
 
     @switch_details.setter
     def switch_details(self, value: SwitchDetails) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["SwitchDetails"] = "SwitchDetails"
         msg = f"{self.class_name}.{method_name}: "
@@ -741,7 +741,7 @@ class BootflashInfo:
 
     @switches.setter
     def switches(self, value: list[str]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "switches must be a list. "
@@ -116,7 +116,7 @@ class ConvertFileInfoToTarget:
         -   ``ValueError`` if:
             -   ``file_info`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         def raise_error(msg):
             raise ValueError(f"{self.class_name}.{method_name}: {msg}")
@@ -177,7 +177,7 @@ class ConvertFileInfoToTarget:
         ```
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.validate_commit_parameters()
 
         def raise_error(msg):
@@ -223,7 +223,7 @@ class ConvertFileInfoToTarget:
             -   ``file_info`` has not been set before calling _get.
             -   ``key`` is not in the target dictionary.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         def raise_error(msg):
             raise ValueError(f"{self.class_name}.{method_name}: {msg}")
@@ -290,7 +290,7 @@ class ConvertFileInfoToTarget:
             -   ``date`` is not in the ``file_info`` dictionary.
             -   ``date`` cannot be converted to a datetime object.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             _date = datetime.strptime(self._get("date"), self.timestamp_format)
         except (TypeError, ValueError) as error:
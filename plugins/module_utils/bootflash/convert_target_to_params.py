@@ -133,7 +133,7 @@ class ConvertTargetToParams:
             bootflash:/myDirfoo.txt which, of course, will not match
             (or worse yet, match and delete the wrong file).
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         def raise_error(msg):
             raise ValueError(f"{self.class_name}.{method_name}: {msg}")
@@ -173,7 +173,7 @@ class ConvertTargetToParams:
         ``ValueError`` if:
         -   ``commit()`` has not been called before accessing this property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.committed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"commit() must be called before accessing {method_name}."
@@ -194,7 +194,7 @@ class ConvertTargetToParams:
         ``ValueError`` if:
         -   ``commit()`` has not been called before accessing this property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.committed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"commit() must be called before accessing {method_name}."
@@ -235,7 +235,7 @@ class ConvertTargetToParams:
         ``ValueError`` if:
         -   ``commit()`` has not been called before accessing this property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.committed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"commit() must be called before accessing {method_name}."
@@ -244,7 +244,7 @@ class ConvertTargetToParams:
 
     @partition.setter
     def partition(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not str(value).endswith(":"):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid partition: {value}. "
@@ -264,7 +264,7 @@ class ConvertTargetToParams:
         ``ValueError`` if:
         -   ``commit()`` has not been called before accessing this property.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.committed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"commit() must be called before accessing {method_name}."
@@ -273,7 +273,7 @@ class ConvertTargetToParams:
 
     @supervisor.setter
     def supervisor(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self.valid_supervisor:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid supervisor: {value}. "
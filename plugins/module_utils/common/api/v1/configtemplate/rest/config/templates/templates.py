@@ -51,7 +51,7 @@ class Templates(Config):
         - Endpoint for template retrieval.
         - Raise ``ValueError`` if template_name is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.template_name is None and "template_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "template_name must be set prior to accessing path."
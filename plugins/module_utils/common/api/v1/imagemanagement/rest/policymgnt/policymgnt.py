@@ -433,7 +433,7 @@ class EpPolicyInfo(PolicyMgnt):
 
     @property
     def path(self):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.policy_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.policy_name must be set before "
@@ -66,7 +66,7 @@ class Fabrics(Control):
 
     @fabric_name.setter
     def fabric_name(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.conversion.validate_fabric_name(value)
         except (TypeError, ValueError) as error:
@@ -82,7 +82,7 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if fabric_name is not set and
             ``self.required_properties`` contains "fabric_name".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_name is None and "fabric_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -98,7 +98,7 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if serial_number is not set.
         -   /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabricName}/switches/{serialNumber}
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -118,7 +118,7 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if template_name is not set and
             ``self.required_properties`` contains "template_name".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_name is None and "fabric_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -141,7 +141,7 @@ class Fabrics(Control):
 
     @serial_number.setter
     def serial_number(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected string for {method_name}. "
@@ -160,7 +160,7 @@ class Fabrics(Control):
 
     @template_name.setter
     def template_name(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self.fabric_types.valid_fabric_template_names:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid template_name: {value}. "
@@ -182,7 +182,7 @@ class Fabrics(Control):
 
     @ticket_id.setter
     def ticket_id(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected string for {method_name}. "
@@ -287,7 +287,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @force_show_run.setter
     def force_show_run(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
@@ -312,7 +312,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @include_all_msd_switches.setter
     def include_all_msd_switches(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
@@ -353,7 +353,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @switch_id.setter
     def switch_id(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         def error(param, param_type):
             msg = f"{self.class_name}.{method_name}: "
@@ -864,7 +864,7 @@ class EpMaintenanceModeDeploy(Fabrics):
 
     @wait_for_mode_change.setter
     def wait_for_mode_change(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
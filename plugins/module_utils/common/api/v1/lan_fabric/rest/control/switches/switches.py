@@ -60,7 +60,7 @@ class Switches(Control):
 
     @fabric_name.setter
     def fabric_name(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.conversion.validate_fabric_name(value)
         except (TypeError, ValueError) as error:
@@ -76,7 +76,7 @@ class Switches(Control):
         -   Raise ``ValueError`` if fabric_name is not set and
             ``self.required_properties`` contains "fabric_name".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_name is None and "fabric_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Track the lifetime of a controller authentication token.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import base64
+import json
+import time
+
+DEFAULT_REFRESH_MARGIN = 60
+
+
+def jwt_expiry(token):
+    """
+    ### Summary
+    Return the ``exp`` claim, in seconds since the epoch, of a JSON Web
+    Token, or ``None`` if ``token`` is not a JWT or has no ``exp`` claim.
+
+    The signature is not verified.  The claim is only used to decide when
+    to refresh the token.
+    """
+    if not isinstance(token, str) or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+    expiry = claims.get("exp")
+    if isinstance(expiry, bool) or not isinstance(expiry, (int, float)):
+        return None
+    return expiry
+
+
+class AuthToken:
+    """
+    ### Summary
+    Track a controller authentication token and its expiry, so that it can
+    be refreshed before it expires instead of after requests fail with 401.
+
+    The expiry is, in order of preference:
+
+    -   ``lifetime`` seconds after ``set()`` is called, if given.  DCNM 11
+        tokens are requested with an explicit lifetime.
+    -   The ``exp`` claim of the token, if it is a JSON Web Token.  NDFC
+        tokens are JSON Web Tokens.
+
+    A token without a known expiry never needs a refresh.
+
+    ### Usage
+    ```python
+    auth_token = AuthToken(refresh_margin=60)
+    auth_token.set(token)
+    ...
+    if auth_token.needs_refresh():
+        login()  # calls auth_token.set() with the new token
+    ```
+    """
+
+    def __init__(self, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self.value = None
+        self.expires = None
+        self.issued = None
+        self.logins = 0
+
+    def set(self, value, lifetime=None, now=None):
+        """
+        ### Summary
+        Set the token after a successful login.
+        """
+        now = time.time() if now is None else now
+        self.value = value
+        self.issued = now
+        if lifetime:
+            self.expires = now + lifetime
+        else:
+            self.expires = jwt_expiry(value)
+        self.logins += 1
+
+    def clear(self):
+        """Forget the token, e.g. after logout"""
+        self.value = None
+        self.expires = None
+        self.issued = None
+
+    def expires_in(self, now=None):
+        """Return the seconds until the token expires, or ``None`` if unknown"""
+        if self.value is None or self.expires is None:
+            return None
+        now = time.time() if now is None else now
+        return self.expires - now
+
+    def needs_refresh(self, now=None):
+        """
+        ### Summary
+        Return ``True`` if the token expires within ``refresh_margin``
+        seconds, or within half its lifetime if that is shorter.  Always
+        ``False`` if ``refresh_margin`` is 0, or if there is no token or its
+        expiry is unknown.
+        """
+        if not self.refresh_margin:
+            return False
+        remaining = self.expires_in(now)
+        if remaining is None:
+            return False
+        # A token whose lifetime is shorter than twice the margin is refreshed
+        # half way through its lifetime, rather than right after it is set
+        return remaining <= min(self.refresh_margin, (self.expires - self.issued) / 2)
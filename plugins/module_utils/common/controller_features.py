@@ -178,7 +178,7 @@ class ControllerFeatures:
             from the controller
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # pylint: disable=no-member
         if self.rest_send is None:
@@ -103,7 +103,7 @@ class ControllerVersion:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -120,7 +120,7 @@ class ControllerVersion:
         Refresh self.response_data with current version info from the Controller
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.rest_send.path = self.ep_version.path
         self.rest_send.verb = self.ep_version.verb
         self.rest_send.commit()
@@ -384,7 +384,7 @@ class ControllerVersion:
 
         - ValueError if unable to determine version
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         result = None
         try:
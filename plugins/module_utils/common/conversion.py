@@ -161,7 +161,7 @@ class ConversionUtils:
         -   Raise ``TypeError`` if value is not a string.
         -   Raise ``ValueError`` if value does not meet the requirements.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
@@ -258,7 +258,7 @@ class EppSites:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -286,7 +286,7 @@ class EppSites:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -314,7 +314,7 @@ class EppSites:
         -   ``self.data`` is a dictionary of endpoint response elements, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -520,7 +520,7 @@ class EppSitesByName(EppSites):
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -553,7 +553,7 @@ class EppSitesByName(EppSites):
                 -   ``self.filter`` has not been set.
                 -   ``self.filter`` (fabric name) does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "set instance.filter to a fabric name "
@@ -587,7 +587,7 @@ class EppSitesByName(EppSites):
         fed_mem_uuid = self._get_dict_value_by_keyname(self.fed_info, "fedMemUUID")
         ```
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             self.verify_filter(item)
@@ -1672,7 +1672,7 @@ class EppSitesByName(EppSites):
         - A dictionary of the fabric matching self.filter.
         - ``None``, if the fabric does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filter must be set before accessing "
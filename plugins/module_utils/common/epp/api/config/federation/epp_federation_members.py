@@ -110,7 +110,7 @@ class EppFederationMembers:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -138,7 +138,7 @@ class EppFederationMembers:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -166,7 +166,7 @@ class EppFederationMembers:
         -   ``self.data`` is a dictionary of endpoint response elements, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -367,7 +367,7 @@ class EppFederationMemberByName(EppFederationMembers):
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ZZZ: {self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -407,7 +407,7 @@ class EppFederationMemberByName(EppFederationMembers):
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -487,7 +487,7 @@ class EppFederationMemberByName(EppFederationMembers):
         - A dictionary of the fabric matching self.filter.
         - ``None``, if the fabric does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filter must be set before accessing "
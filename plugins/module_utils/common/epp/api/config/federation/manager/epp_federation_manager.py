@@ -123,7 +123,7 @@ class EppFederationManagerGet:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -151,7 +151,7 @@ class EppFederationManagerGet:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -179,7 +179,7 @@ class EppFederationManagerGet:
         -   ``self.data`` is a dictionary of endpoint response elements, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -235,7 +235,7 @@ class EppFederationManagerGet:
 
         See also: ``_get_meta()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.data.get(item) is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -260,7 +260,7 @@ class EppFederationManagerGet:
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.data.get("meta") is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -80,7 +80,7 @@ class EppLogin:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -108,7 +108,7 @@ class EppLogin:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.domain is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.domain must be set before calling "
@@ -179,7 +179,7 @@ class EppLogin:
         -   ``self.data`` is a dictionary of endpoint response elements, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_commit_parameters()
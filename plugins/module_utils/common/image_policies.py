@@ -66,7 +66,7 @@ class ImagePolicies:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -105,7 +105,7 @@ class ImagePolicies:
             and params properties are dynamically created by the
             @Properties class decorators.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -173,7 +173,7 @@ class ImagePolicies:
         ### Raises
         -   ``ValueError`` if ``policy_name`` is not set..
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.policy_name is None:
             msg = f"{self.class_name}.{method_name}: "
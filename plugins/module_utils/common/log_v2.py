@@ -25,6 +25,31 @@ from logging.config import dictConfig
 from os import environ
 
 
+class LazyJson:
+    """
+    ### Summary
+    Wrap a value for logging as pretty-printed JSON.  The value is
+    serialized when the log record is formatted, i.e. only if a handler
+    emits the record, rather than when the logging call is made.
+
+    ### Raises
+    None
+
+    ### Usage
+    ```python
+    self.log.debug("payload: %s", LazyJson(payload))
+    ```
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return json.dumps(self.value, indent=4, sort_keys=True, default=str)
+
+
 class Log:
     """
     ### Summary
@@ -142,6 +167,27 @@ class Log:
             self.log.debug("This is a debug message.")
     ```
 
+    ### Expensive debug messages
+
+    Build a debug message that is expensive to format, e.g. one containing a
+    controller payload or response, only if the logger is enabled for DEBUG.
+    When logging is disabled, the loggers inherit the ``WARNING`` level of the
+    base logger and the message is never built.
+
+    ```python
+    if self.log.isEnabledFor(logging.DEBUG):
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
+        self.log.debug(msg)
+    ```
+
+    Or pass the value wrapped in ``LazyJson()`` as a logging argument.  The
+    value is then serialized only if a handler emits the message.
+
+    ```python
+    self.log.debug("%s: payload: %s", self.class_name, LazyJson(payload))
+    ```
+
     ### Logging Config File
     The logging config file MUST conform to ``logging.config.dictConfig``
     from Python's standard library and MUST NOT contain any handlers or
@@ -374,7 +420,7 @@ class Log:
 
     @develop.setter
     def develop(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: Expected boolean for develop. "
             msg += f"Got: type {type(value).__name__} for value {value}."
@@ -22,13 +22,16 @@ __author__ = "Allen Robel"
 import copy
 import inspect
 import logging
+from time import sleep
 
 from .api.v1.lan_fabric.rest.control.fabrics.fabrics import (
     EpFabricConfigDeploy, EpMaintenanceModeDeploy, EpMaintenanceModeDisable,
     EpMaintenanceModeEnable)
 from .conversion import ConversionUtils
 from .exceptions import ControllerResponseError
+from .maintenance_mode_info import MaintenanceModeInfo
 from .properties import Properties
+from .results import Results
 
 
 @Properties.add_rest_send
@@ -59,8 +62,13 @@ class MaintenanceMode:
     ### Details
     -   Updates MaintenanceMode().results to reflect success/failure of
         the operation on the controller.
-    -   For switches that are to be deployed, initiates a per-fabric
+    -   For switches that are to be deployed, initiates a per-switch
+        deploy-maintenance-mode or, if ``fabric_deploy`` is True, a per-fabric
         bulk switch config-deploy.
+    -   If ``fabric_deploy`` is True, the switches with
+        ``wait_for_mode_change`` set are polled with one
+        ``MaintenanceModeInfo().refresh()`` per round, until all of them
+        are in their intended mode, or ``rest_send.timeout`` expires.
 
     ### Example value for ``config`` in the ``Usage`` section below:
     ```json
@@ -110,7 +118,7 @@ class MaintenanceMode:
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -143,6 +151,7 @@ class MaintenanceMode:
         self.ep_fabric_config_deploy = EpFabricConfigDeploy()
 
         self._config = None
+        self._fabric_deploy = False
         self._rest_send = None
         self._results = None
 
@@ -168,7 +177,7 @@ class MaintenanceMode:
             -   verify_mode()
             -   verify_serial_number()
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.config must be a list. "
@@ -197,7 +206,7 @@ class MaintenanceMode:
         -   ``TypeError`` if:
                 -   `deploy`` is not a boolean.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("deploy", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: deploy."
@@ -219,7 +228,7 @@ class MaintenanceMode:
                 -   ``fabric_name`` is not present.
                 -   ``fabric_name`` is not a valid fabric name.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("fabric_name", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: fabric_name."
@@ -238,7 +247,7 @@ class MaintenanceMode:
         -   ``ValueError`` if:
                 -   ``ip_address`` is not present.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("ip_address", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: ip_address."
@@ -254,7 +263,7 @@ class MaintenanceMode:
                 -   ``mode`` is not present.
                 -   ``mode`` is not one of "maintenance" or "normal".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("mode", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: mode."
@@ -274,7 +283,7 @@ class MaintenanceMode:
         - ``ValueError`` if:
                 -   ``serial_number`` is not present.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("serial_number", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: serial_number."
@@ -291,7 +300,7 @@ class MaintenanceMode:
         -   ``TypeError`` if:
                 -   `wait_for_mode_change`` is not a boolean.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if item.get("wait_for_mode_change", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config is missing mandatory key: wait_for_mode_change."
@@ -314,7 +323,7 @@ class MaintenanceMode:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.config is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.config must be set "
@@ -357,10 +366,46 @@ class MaintenanceMode:
         except (ControllerResponseError, ValueError, TypeError) as error:
             raise ValueError(error) from error
 
+    def commit_request(self, request) -> tuple:
+        """
+        ### Summary
+        Send ``request``, a dict with keys ``path`` and ``verb``, and return
+        copies of ``rest_send.response_current`` and
+        ``rest_send.result_current``.
+
+        ### Raises
+        -   ``ValueError`` if ``RestSend().commit()`` raises ``ValueError``.
+        """
+        self.rest_send.path = request["path"]
+        self.rest_send.verb = request["verb"]
+        self.rest_send.payload = None
+        self.rest_send.commit()
+        return (
+            copy.deepcopy(self.rest_send.response_current),
+            copy.deepcopy(self.rest_send.result_current),
+        )
+
+    def send_requests(self, requests):
+        """
+        ### Summary
+        Send ``requests`` and yield ``(response_current, result_current)``
+        for each of them, in the order of ``requests``.
+
+        ### Raises
+        -   ``ValueError`` if ``RestSend().commit()`` raises ``ValueError``.
+
+        ### Details
+        Each request is sent when the caller asks for its response, so that
+        a caller that raises on a failed response does not send the
+        remaining requests.
+        """
+        for request in requests:
+            yield self.commit_request(request)
+
     def change_system_mode(self) -> None:
         """
         ### Summary
-        Send the maintenance mode change request to the controller.
+        Send the maintenance mode change requests to the controller.
 
         ### Raises
         -   ``ControllerResponseError`` if:
@@ -372,36 +417,37 @@ class MaintenanceMode:
         -  ``TypeError`` if:
                 -   ``serial_number`` is not a string.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
+        requests = []
         for item in self.config:
             # Build endpoint
             mode = item.get("mode")
-            fabric_name = item.get("fabric_name")
-            ip_address = item.get("ip_address")
-            serial_number = item.get("serial_number")
             if mode == "normal":
                 endpoint = self.ep_maintenance_mode_disable
             else:
                 endpoint = self.ep_maintenance_mode_enable
 
             try:
-                endpoint.fabric_name = fabric_name
-                endpoint.serial_number = serial_number
+                endpoint.fabric_name = item.get("fabric_name")
+                endpoint.serial_number = item.get("serial_number")
             except (TypeError, ValueError) as error:
                 msg = f"{self.class_name}.{method_name}: "
                 msg += "Error resolving endpoint: "
                 msg += f"Error details: {error}."
                 raise ValueError(msg) from error
+            requests.append({"path": endpoint.path, "verb": endpoint.verb})
 
-            # Send request
-            self.rest_send.path = endpoint.path
-            self.rest_send.verb = endpoint.verb
-            self.rest_send.payload = None
-            self.rest_send.commit()
+        # Send requests
+        responses = self.send_requests(requests)
+        for item, (response_current, result_current) in zip(self.config, responses):
+            mode = item.get("mode")
+            fabric_name = item.get("fabric_name")
+            ip_address = item.get("ip_address")
+            serial_number = item.get("serial_number")
 
             # Update diff
-            result = self.rest_send.result_current["success"]
+            result = result_current["success"]
             if result is False:
                 self.results.diff_current = {}
             else:
@@ -417,12 +463,8 @@ class MaintenanceMode:
                 self.results.action = "change_sytem_mode"
                 self.results.check_mode = self.check_mode
                 self.results.state = self.state
-                self.results.response_current = copy.deepcopy(
-                    self.rest_send.response_current
-                )
-                self.results.result_current = copy.deepcopy(
-                    self.rest_send.result_current
-                )
+                self.results.response_current = response_current
+                self.results.result_current = result_current
                 self.results.register_task_result()
             except (TypeError, ValueError) as error:
                 raise ValueError(error) from error
@@ -522,10 +564,37 @@ class MaintenanceMode:
 
         ### Raises
         ``ValueError`` if endpoint configuration fails.
+
+        ### Details
+        -   If ``fabric_deploy`` is False, one deploy-maintenance-mode
+            endpoint per switch.
+        -   If ``fabric_deploy`` is True, one config-deploy endpoint per
+            fabric, for all switches to be deployed in the fabric.
+        -   ``serial_numbers`` contains the serial numbers deployed by
+            each endpoint.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         endpoints = []
         for fabric_name, switches in self.deploy_dict.items():
+            if self.fabric_deploy is True:
+                if len(switches) == 0:
+                    continue
+                serial_numbers = [item["serial_number"] for item in switches]
+                try:
+                    self.ep_fabric_config_deploy.fabric_name = fabric_name
+                    self.ep_fabric_config_deploy.switch_id = serial_numbers
+                except (TypeError, ValueError) as error:
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += "Error resolving endpoint: "
+                    msg += f"Error details: {error}."
+                    raise ValueError(msg) from error
+                endpoint = {}
+                endpoint["path"] = self.ep_fabric_config_deploy.path
+                endpoint["verb"] = self.ep_fabric_config_deploy.verb
+                endpoint["serial_numbers"] = serial_numbers
+                endpoint["fabric_name"] = fabric_name
+                endpoints.append(endpoint)
+                continue
             for item in switches:
                 endpoint = {}
                 try:
@@ -540,6 +609,7 @@ class MaintenanceMode:
                 endpoint["path"] = self.ep_maintenance_mode_deploy.path
                 endpoint["verb"] = self.ep_maintenance_mode_deploy.verb
                 endpoint["serial_number"] = self.ep_maintenance_mode_deploy.serial_number
+                endpoint["serial_numbers"] = [endpoint["serial_number"]]
                 endpoint["fabric_name"] = fabric_name
                 endpoints.append(copy.copy(endpoint))
         self.endpoints = copy.copy(endpoints)
@@ -554,8 +624,9 @@ class MaintenanceMode:
                 -   controller response != 200.
         -   ``ValueError`` if:
                 -   endpoint cannot be resolved.
+                -   ``wait_for_mode_change()`` raises ``ValueError``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.build_deploy_dict()
         self.build_serial_number_to_ip_address()
         try:
@@ -566,43 +637,104 @@ class MaintenanceMode:
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
-        for endpoint in self.endpoints:
-            # Send request
-            self.rest_send.path = endpoint["path"]
-            self.rest_send.verb = endpoint["verb"]
-            self.rest_send.payload = None
-            self.rest_send.commit()
-
+        responses = self.send_requests(self.endpoints)
+        for endpoint, (response_current, result_current) in zip(self.endpoints, responses):
             # Register the result
             action = "deploy_maintenance_mode"
-            result = self.rest_send.result_current["success"]
+            result = result_current["success"]
             if result is False:
                 self.results.diff_current = {}
             else:
                 diff = {}
                 diff.update({f"{action}": result})
-                ip_address = self.serial_number_to_ip_address[endpoint["serial_number"]]
-                diff.update({ip_address: ip_address})
+                for serial_number in endpoint["serial_numbers"]:
+                    ip_address = self.serial_number_to_ip_address[serial_number]
+                    diff.update({ip_address: ip_address})
                 self.results.diff_current = diff
 
             self.results.action = action
             self.results.check_mode = self.check_mode
             self.results.state = self.state
-            self.results.response_current = copy.deepcopy(
-                self.rest_send.response_current
-            )
-            self.results.result_current = copy.deepcopy(self.rest_send.result_current)
+            self.results.response_current = response_current
+            self.results.result_current = result_current
             self.results.register_task_result()
 
             if self.results.response_current["RETURN_CODE"] != 200:
                 msg = f"{self.class_name}.{method_name}: "
-                msg += "Unable to deploy switch: "
-                msg += f"fabric_name {endpoint['fabric_name']}, "
-                msg += "serial_number "
-                msg += f"{endpoint['serial_number']}. "
+                if self.fabric_deploy is True:
+                    msg += "Unable to deploy switches: "
+                    msg += f"fabric_name {endpoint['fabric_name']}, "
+                    msg += "serial_numbers "
+                    msg += f"{','.join(endpoint['serial_numbers'])}. "
+                else:
+                    msg += "Unable to deploy switch: "
+                    msg += f"fabric_name {endpoint['fabric_name']}, "
+                    msg += "serial_number "
+                    msg += f"{endpoint['serial_number']}. "
                 msg += f"Got response {self.results.response_current}."
                 raise ControllerResponseError(msg)
 
+        if self.fabric_deploy is True:
+            self.wait_for_mode_change()
+
+    def wait_for_mode_change(self) -> None:
+        """
+        ### Summary
+        Wait until the switches deployed with ``fabric_deploy`` and
+        ``wait_for_mode_change`` set are in their intended mode.
+
+        ### Raises
+        -   ``ValueError`` if:
+                -   ``MaintenanceModeInfo().refresh()`` raises ``ValueError``.
+                -   the switches are not in their intended mode within
+                    ``rest_send.timeout`` seconds.
+
+        ### Details
+        The config-deploy endpoint does not support ``waitForModeChange``.
+        Instead, the mode of all waiting switches is retrieved with one
+        ``MaintenanceModeInfo().refresh()`` per round, every
+        ``rest_send.send_interval`` seconds.  Nothing is waited for in
+        check mode.
+        """
+        method_name = inspect.currentframe().f_code.co_name
+        pending = {}
+        for item in self.config:
+            if item.get("deploy") is True and item.get("wait_for_mode_change") is True:
+                pending[item.get("ip_address")] = item.get("mode")
+        if len(pending) == 0 or self.rest_send.check_mode is True:
+            return
+
+        instance = MaintenanceModeInfo(self.params)
+        instance.rest_send = self.rest_send
+        # The polls are not part of the task result
+        instance.results = Results()
+        timeout = self.rest_send.timeout
+        while True:
+            try:
+                instance.config = list(pending)
+                instance.refresh()
+            except (TypeError, ValueError) as error:
+                raise ValueError(error) from error
+            for ip_address, info in instance.info.items():
+                if info.get("mode") == pending.get(ip_address):
+                    pending.pop(ip_address)
+            if len(pending) == 0:
+                return
+            timeout -= self.rest_send.send_interval
+            if timeout <= 0:
+                break
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Waiting for mode change on {sorted(pending)}."
+            self.log.debug(msg)
+            if self.rest_send.unit_test is False:
+                sleep(self.rest_send.send_interval)
+
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "Timed out waiting for the mode change of switches: "
+        msg += f"{', '.join(f'{key} ({value})' for key, value in sorted(pending.items()))}. "
+        msg += f"timeout: {self.rest_send.timeout} seconds."
+        raise ValueError(msg)
+
     @property
     def config(self) -> list:
         """
@@ -659,3 +791,30 @@ class MaintenanceMode:
         except (TypeError, ValueError) as error:
             raise ValueError(error) from error
         self._config = value
+
+    @property
+    def fabric_deploy(self) -> bool:
+        """
+        ### Summary
+        If True, the switches to be deployed are deployed with one
+        config-deploy request per fabric, instead of one
+        deploy-maintenance-mode request per switch.
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not a boolean.
+
+        ### Default
+        ``False``
+        """
+        return self._fabric_deploy
+
+    @fabric_deploy.setter
+    def fabric_deploy(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        if not isinstance(value, bool):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Expected boolean for {method_name}. "
+            msg += f"Got type {type(value).__name__}, "
+            msg += f"value {value}."
+            raise TypeError(msg)
+        self._fabric_deploy = value
@@ -149,7 +149,7 @@ class MaintenanceModeInfo:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.config is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.config must be set "
@@ -213,7 +213,7 @@ class MaintenanceModeInfo:
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.verify_refresh_parameters()
 
@@ -313,7 +313,7 @@ class MaintenanceModeInfo:
         -   We do not need to check that ``item`` exists in the filtered
             switch dict, since ``refresh()`` has already done so.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -385,7 +385,7 @@ class MaintenanceModeInfo:
 
     @config.setter
     def config(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.config must be a list. "
@@ -540,7 +540,7 @@ class MaintenanceModeInfo:
         }
         ```
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self._info is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.refresh() must be called before "
@@ -69,7 +69,7 @@ class MergeDicts:
         """
         Commit the merged dict.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.dict1 is None or self.dict2 is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "dict1 and dict2 must be set before calling commit()"
@@ -82,7 +82,7 @@ class MergeDicts:
         Merge dict2 into dict1 and return dict1.
         Keys in dict2 have precedence over keys in dict1.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         for key in dict2:
             if (
                 key in dict1
@@ -99,7 +99,7 @@ class MergeDicts:
         """
         Getter for the merged dictionary.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.properties["dict_merged"] is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Call instance.commit() before calling "
@@ -118,7 +118,7 @@ class MergeDicts:
 
     @dict1.setter
     def dict1(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid value. Expected type dict. "
@@ -137,7 +137,7 @@ class MergeDicts:
 
     @dict2.setter
     def dict2(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid value. Expected type dict. "
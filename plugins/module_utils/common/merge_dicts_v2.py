@@ -81,7 +81,7 @@ class MergeDicts:
         ### Raises
         -   ``ValueError`` if ``dict1`` or ``dict2`` has not been set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.dict1 is None or self.dict2 is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "dict1 and dict2 must be set before calling commit()"
@@ -115,7 +115,7 @@ class MergeDicts:
         -   ``ValueError`` if ``dict_merged`` is accessed before
             ``commit()`` has been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.properties["dict_merged"] is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Call instance.commit() before calling "
@@ -138,7 +138,7 @@ class MergeDicts:
 
     @dict1.setter
     def dict1(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid value. Expected type dict. "
@@ -161,7 +161,7 @@ class MergeDicts:
 
     @dict2.setter
     def dict2(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid value. Expected type dict. "
@@ -108,7 +108,7 @@ class ParamsMergeDefaults:
 
         The merged parameters are stored in self.merged_parameters
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.params_spec is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -148,7 +148,7 @@ class ParamsMergeDefaults:
 
     @parameters.setter
     def parameters(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid parameters. Expected type dict. "
@@ -165,7 +165,7 @@ class ParamsMergeDefaults:
 
     @params_spec.setter
     def params_spec(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid params_spec. Expected type dict. "
@@ -123,7 +123,7 @@ class ParamsMergeDefaults:
         -   ``ValueError`` if ``params_spec`` is None.
         -   ``ValueError`` if ``parameters`` is None.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.params_spec is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -172,7 +172,7 @@ class ParamsMergeDefaults:
 
     @parameters.setter
     def parameters(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid parameters. Expected type dict. "
@@ -193,7 +193,7 @@ class ParamsMergeDefaults:
 
     @params_spec.setter
     def params_spec(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid params_spec. Expected type dict. "
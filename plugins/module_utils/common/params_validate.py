@@ -195,7 +195,7 @@ class ParamsValidate:
         """
         Verify that parameters in self.parameters conform to self.params_spec
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.parameters is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.parameters needs to be set "
@@ -214,7 +214,7 @@ class ParamsValidate:
         """
         Recursively traverse parameters and verify conformity with spec
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         for param in spec:
             if param in self.reserved_params:
@@ -273,7 +273,7 @@ class ParamsValidate:
         """
         Verify that value is one of the choices
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if choices is None:
             return
 
@@ -290,7 +290,7 @@ class ParamsValidate:
         """
         Verify that value is within the range range_min to range_max
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         for range_value in [range_min, range_max]:
             if not isinstance(range_value, int):
@@ -312,7 +312,7 @@ class ParamsValidate:
         """
         Verify that value's type matches the expected type
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         self._verify_expected_type(expected_type, param)
 
         value = params[param]
@@ -343,7 +343,7 @@ class ParamsValidate:
         this, we need to fail int and bool values if expected_type is
         one of ipv4, ipv6, ipv4_subnet, or ipv6_subnet.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if type(value) not in [int, bool]:
             return
         if expected_type not in self._ipaddress_types:
@@ -361,7 +361,7 @@ class ParamsValidate:
         """
         Calls fail_json when value's type does not match expected_type
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Invalid type for parameter '{param}'. "
         msg += f"Expected {expected_type}. "
@@ -379,7 +379,7 @@ class ParamsValidate:
         1.  We've disabled inconsistent-return-statements.  We're pretty
             sure this method is correct.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # preferred_type is mandatory for multitype
         self._verify_preferred_type_param_spec_is_present(spec, param)
@@ -431,7 +431,7 @@ class ParamsValidate:
         """
         verify that spec contains the key 'preferred_type'
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if spec.get("preferred_type", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid param_spec for parameter '{param}'. "
@@ -545,7 +545,7 @@ class ParamsValidate:
         specification for each param contains the mandatory keys
         defined in self.mandatory_param_spec_keys
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         for param in params_spec:
             if not isinstance(params_spec[param], Map):
                 continue
@@ -564,7 +564,7 @@ class ParamsValidate:
         """
         Verify that expected_type is valid
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if expected_type in self.valid_expected_types:
             return
         msg = f"{self.class_name}.{method_name}: "
@@ -584,7 +584,7 @@ class ParamsValidate:
 
     @parameters.setter
     def parameters(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid parameters. Expected type dict. "
@@ -601,7 +601,7 @@ class ParamsValidate:
 
     @params_spec.setter
     def params_spec(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid params_spec. Expected type dict. "
@@ -207,7 +207,7 @@ class ParamsValidate:
         -   ``ValueError`` if an integer parameter's value is not within the
             parameter's valid range.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.parameters is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.parameters needs to be set "
@@ -243,7 +243,7 @@ class ParamsValidate:
         -   ``TypeError`` if range_min or range_max in the parameter specification
             is not an integer.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             for param in spec:
@@ -308,7 +308,7 @@ class ParamsValidate:
         -   ``ValueError`` if a parameter's value is not in the list of
             valid choices for that parameter.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if choices is None:
             return
 
@@ -332,7 +332,7 @@ class ParamsValidate:
         -   ``ValueError`` if the parameter's value is not within the
             range range_min to range_max.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         for range_value in [range_min, range_max]:
             if not isinstance(range_value, int):
@@ -400,7 +400,7 @@ class ParamsValidate:
         this, we need to fail int and bool values if expected_type is
         one of ipv4, ipv6, ipv4_subnet, or ipv6_subnet.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if type(value) not in [int, bool]:
             return
         if expected_type not in self._ipaddress_types:
@@ -422,7 +422,7 @@ class ParamsValidate:
         ### Raises
         -   ``TypeError``with error message.  Always raises.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Invalid type for parameter '{param}'. "
         msg += f"Expected {expected_type}. "
@@ -446,7 +446,7 @@ class ParamsValidate:
             sure this method is correct.
         """
         # pylint: disable=inconsistent-return-statements
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # preferred_type is mandatory for multitype
         try:
@@ -503,7 +503,7 @@ class ParamsValidate:
         ### Raises
         -   ``KeyError`` if spec does not contain the key 'preferred_type'
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if spec.get("preferred_type", None) is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid param_spec for parameter '{param}'. "
@@ -622,7 +622,7 @@ class ParamsValidate:
         -   ``ValueError`` if a mandatory key is missing from a
             parameter specification.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         for param in params_spec:
             if not isinstance(params_spec[param], Map):
                 continue
@@ -646,7 +646,7 @@ class ParamsValidate:
         -   ``ValueError`` if expected_type is not in
             self.valid_expected_types.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if expected_type in self.valid_expected_types:
             return
         msg = f"{self.class_name}.{method_name}: "
@@ -670,7 +670,7 @@ class ParamsValidate:
 
     @parameters.setter
     def parameters(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid parameters. Expected type dict. "
@@ -692,7 +692,7 @@ class ParamsValidate:
 
     @params_spec.setter
     def params_spec(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid params_spec. Expected type dict. "
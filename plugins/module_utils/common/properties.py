@@ -79,7 +79,7 @@ class Properties:
 
     @params.setter
     def params(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be a dictionary. "
@@ -115,7 +115,7 @@ class Properties:
 
     @rest_send.setter
     def rest_send(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -149,7 +149,7 @@ class Properties:
 
     @results.setter
     def results(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "Results"
         msg = f"{self.class_name}.{method_name}: "
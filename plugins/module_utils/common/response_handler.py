@@ -92,7 +92,7 @@ class ResponseHandler:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self._implements = "response_handler_v1"
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -194,7 +194,7 @@ class ResponseHandler:
                 -   ``response`` is not set.
                 -   ``verb`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"response {self.response}, verb {self.verb}"
         self.log.debug(msg)
@@ -249,7 +249,7 @@ class ResponseHandler:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.{method_name} must be a dict. "
@@ -278,7 +278,7 @@ class ResponseHandler:
 
     @result.setter
     def result(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.{method_name} must be a dict. "
@@ -307,7 +307,7 @@ class ResponseHandler:
 
     @verb.setter
     def verb(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self.valid_verbs:
             msg = f"{self.class_name}.{method_name}: "
             msg += "verb must be one of "
@@ -25,6 +25,7 @@ import logging
 import re
 from time import sleep
 
+from .log_v2 import LazyJson
 # Using only for its failed_result property
 from .results import Results
 from ..network.dcnm.dcnm import dcnm_send
@@ -126,8 +127,8 @@ class RestSend:
             -   ``response_current``: raw simulated response
             -   ``result_current``: result from self._handle_response() method
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"caller: {caller}.  "
@@ -167,8 +168,8 @@ class RestSend:
             -   ``response``: raw response from the controller
             -   ``result``: result from self._handle_response() method
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         self._verify_commit_parameters()
         try:
@@ -191,9 +192,7 @@ class RestSend:
                     self.ansible_module, self.verb, self.path
                 )
             else:
-                msg += ", payload: "
-                msg += f"{json.dumps(self.payload, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                self.log.debug("%s, payload: %s", msg, LazyJson(self.payload))
                 self.response_current = dcnm_send(
                     self.ansible_module,
                     self.verb,
@@ -202,10 +201,11 @@ class RestSend:
                 )
             self.result_current = self._handle_response(self.response_current)
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}.  "
-            msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}.  "
+                msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
 
             success = self.result_current["success"]
             if success is False and self.unit_test is False:
@@ -215,11 +215,12 @@ class RestSend:
             self.response_current = self._strip_invalid_json_from_response_data(
                 self.response_current
             )
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}.  "
-            msg += "response_current: "
-            msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}.  "
+                msg += "response_current: "
+                msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
 
         self.response = copy.deepcopy(self.response_current)
         self.result = copy.deepcopy(self.result_current)
@@ -248,7 +249,7 @@ class RestSend:
         return self._handle_unknown_request_verbs(response)
 
     def _handle_unknown_request_verbs(self, response):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Unknown request verb ({self.verb}) for response {response}."
@@ -348,7 +349,7 @@ class RestSend:
 
     @check_mode.setter
     def check_mode(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a bool(). Got {value}."
@@ -407,7 +408,7 @@ class RestSend:
 
     @response_current.setter
     def response_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response_current must be a dict. "
@@ -430,7 +431,7 @@ class RestSend:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response must be a dict. "
@@ -454,7 +455,7 @@ class RestSend:
 
     @result.setter
     def result(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result must be a dict. "
@@ -478,7 +479,7 @@ class RestSend:
 
     @result_current.setter
     def result_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result_current must be a dict. "
@@ -509,7 +510,7 @@ class RestSend:
 
     @send_interval.setter
     def send_interval(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, int):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be an int(). Got {value}."
@@ -535,7 +536,7 @@ class RestSend:
 
     @timeout.setter
     def timeout(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, int):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be an int(). Got {value}."
@@ -559,7 +560,7 @@ class RestSend:
 
     @unit_test.setter
     def unit_test(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a bool(). Got {value}."
@@ -581,7 +582,7 @@ class RestSend:
 
     @verb.setter
     def verb(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self._valid_verbs:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be one of {sorted(self._valid_verbs)}. "
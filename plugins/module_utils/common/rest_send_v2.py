@@ -29,6 +29,8 @@ from time import sleep
 
 # Using only for its failed_result property
 from .results import Results
+from .retry_policy import RetryPolicy
+from .tracer import get_tracer
 
 
 class RestSend:
@@ -42,6 +44,10 @@ class RestSend:
         handler interface.
             -   The response handler interface is defined in
                 ``module_utils/common/response_handler.py``
+    -   Accepts a ``RetryPolicy()`` class that implements the retry policy
+        interface.  ``RetryPolicy()`` is used by default.
+            -   The retry policy interface is defined in
+                ``module_utils/common/retry_policy.py``
 
     ### Raises
     -   ``ValueError`` if:
@@ -60,6 +66,7 @@ class RestSend:
                 ``ResponseHandler()``
             -   ``result`` is not a ``dict``
             -   ``result_current`` is not a ``dict``
+            -   ``retry_policy`` is not an instance of ``RetryPolicy()``
             -   ``send_interval`` is not an ``int``
             -   ``sender`` is not an instance of ``Sender()``
             -   ``timeout`` is not an ``int``
@@ -131,6 +138,8 @@ class RestSend:
         self._response_handler = None
         self._result = []
         self._result_current = {}
+        self._retry_current = {}
+        self._retry_policy = RetryPolicy()
         self._send_interval = 5
         self._sender = None
         self._timeout = 300
@@ -225,7 +234,7 @@ class RestSend:
                 -   ``unit_test`` is not a ``bool``
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"check_mode: {self.check_mode}, "
         msg += f"verb: {self.verb}, "
@@ -266,8 +275,8 @@ class RestSend:
             -   ``response_current``: raw simulated response
             -   ``result_current``: result from self._handle_response() method
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"caller: {caller}.  "
@@ -315,14 +324,21 @@ class RestSend:
 
     def _commit_normal_mode(self):
         """
-        Call dcnm_send() with retries until successful response or timeout is exceeded.
+        Call dcnm_send() with retries until successful response, timeout is
+        exceeded, or ``retry_policy`` stops the retries.
+
+        Each attempt consumes ``send_interval`` seconds of ``timeout``, as a
+        bound on the number of attempts.  The wait between attempts is set by
+        ``retry_policy`` and is at most ``send_interval`` seconds, unless the
+        controller asked for a longer wait with ``Retry-After``.
 
         ### Raises
             -   ``ValueError`` if:
                 -   HandleResponse() raises ``ValueError``
                 -   Sender().commit() raises ``ValueError``
         ### Properties read
-            -   ``send_interval``: interval between retries (set in ImageUpgradeCommon)
+            -   ``retry_policy``: classifies responses and sets the wait between retries
+            -   ``send_interval``: maximum interval between retries (set in ImageUpgradeCommon)
             -   ``timeout``: timeout in seconds (set in ImageUpgradeCommon)
             -   ``verb``: HTTP verb e.g. GET, POST, PUT, DELETE
             -   ``path``: HTTP path e.g. http://controller_ip/path/to/endpoint
@@ -331,9 +347,10 @@ class RestSend:
         ## Properties written
             -   ``response``: raw response from the controller
             -   ``result``: result from self._handle_response() method
+            -   ``retry_current``: the retries of this request
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         if self.path is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -362,25 +379,28 @@ class RestSend:
         self.sender.verb = self.verb
         if self.payload is not None:
             self.sender.payload = self.payload
-        success = False
-        while timeout > 0 and success is False:
+
+        # With tracing, the attempts are recorded as one request with retries
+        tracer = get_tracer()
+        recording = tracer.recording
+        start = tracer.now()
+
+        attempts = 0
+        waited = 0
+        stopped = None
+        while timeout > 0:
             timeout -= self.send_interval
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}. "
-            msg += f"unit_test: {self.unit_test}. "
-            msg += f"Subtracted {self.send_interval} from timeout. "
-            msg += f"timeout: {timeout}, "
-            msg += f"success: {success}."
-            self.log.debug(msg)
+            attempts += 1
 
             msg = f"{self.class_name}.{method_name}: "
             msg += f"caller: {caller}.  "
             msg += "Calling sender.commit(): "
-            msg += f"timeout {timeout}, success {success}, verb {self.verb}, path {self.path}."
+            msg += f"attempt {attempts}, timeout {timeout}, verb {self.verb}, path {self.path}."
             self.log.debug(msg)
 
             try:
-                self.sender.commit()
+                with tracer.request_group():
+                    self.sender.commit()
             except ValueError as error:
                 raise ValueError(error) from error
 
@@ -398,22 +418,52 @@ class RestSend:
                 self.log.debug(msg)
                 raise ValueError(msg) from error
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}. "
-            msg += f"timeout: {timeout}. "
-            msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}. "
+                msg += f"timeout: {timeout}. "
+                msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
+
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}. "
+                msg += f"timeout: {timeout}. "
+                msg += "response_current: "
+                msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
 
+            classification = self.retry_policy.classify(self._response_current, self._result_current)
+            if classification == self.retry_policy.SUCCESS:
+                stopped = None
+                break
+            if classification == self.retry_policy.TERMINAL:
+                stopped = "terminal"
+                break
+            if timeout <= 0:
+                stopped = "timeout"
+                break
+            stopped = self.retry_policy.refusal()
+            if stopped is not None:
+                break
+
+            delay = self.retry_policy.delay(attempts, self._response_current, self.send_interval)
+            waited += delay
             msg = f"{self.class_name}.{method_name}: "
             msg += f"caller: {caller}. "
-            msg += f"timeout: {timeout}. "
-            msg += "response_current: "
-            msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
+            msg += f"Retrying {classification} response in {delay:.2f} seconds."
             self.log.debug(msg)
+            if self.unit_test is False:
+                sleep(delay)
+
+        if recording:
+            tracer.request("RestSend", self.verb, self.path, self._response_current, start, retries=attempts - 1)
 
-            success = self.result_current["success"]
-            if success is False and self.unit_test is False:
-                sleep(self.send_interval)
+        self._retry_current = {"attempts": attempts, "retries": max(0, attempts - 1), "waited": round(waited, 3), "stopped": stopped}
+        self._retry_current.update(self.retry_policy.summary)
+        # Report retried requests, and requests the policy did not let retry,
+        # with the response.  Results() adds them to the task metadata.
+        if attempts > 1 or stopped in ("circuit_open", "retry_budget_exhausted"):
+            self._response_current["RETRY"] = copy.deepcopy(self._retry_current)
 
         self.response = copy.deepcopy(self.response_current)
         self.result = copy.deepcopy(self.result_current)
@@ -449,7 +499,7 @@ class RestSend:
 
     @check_mode.setter
     def check_mode(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a boolean. Got {value}."
@@ -525,7 +575,7 @@ class RestSend:
 
     @response_current.setter
     def response_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -555,7 +605,7 @@ class RestSend:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -589,7 +639,7 @@ class RestSend:
 
     @response_handler.setter
     def response_handler(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _implements_need = "response_handler_v1"
         _implements_have = None
         msg = f"{self.class_name}.{method_name}: "
@@ -627,7 +677,7 @@ class RestSend:
 
     @result.setter
     def result(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -659,7 +709,7 @@ class RestSend:
 
     @result_current.setter
     def result_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -667,11 +717,76 @@ class RestSend:
             raise TypeError(msg)
         self._result_current = value
 
+    @property
+    def retry_current(self):
+        """
+        ### Summary
+        The retries of the last request.  ``commit()`` must be called first.
+
+        -   ``attempts``: number of times the request was sent
+        -   ``retries``: ``attempts`` - 1
+        -   ``waited``: seconds waited between attempts
+        -   ``stopped``: why the last failed response was not retried, one of
+            ``terminal``, ``timeout``, ``circuit_open``,
+            ``retry_budget_exhausted``, or ``None`` if the request succeeded
+        -   ``circuit_open``: the circuit of ``retry_policy`` is open
+        -   ``retry_budget_remaining``: retries left in ``retry_policy``
+
+        The same ``dict`` is added to ``response_current`` under the ``RETRY``
+        key if the request was retried, or if ``retry_policy`` did not let it
+        be retried because of the circuit or the retry budget.
+
+        ### Raises
+        None
+        """
+        return copy.deepcopy(self._retry_current)
+
+    @property
+    def retry_policy(self):
+        """
+        ### Summary
+        A class that implements the retry policy interface.  This decides
+        if, and when, a failed request is sent again.
+
+        ### Raises
+        -   ``TypeError`` if:
+                -   ``value`` is not an instance of ``RetryPolicy``
+
+        ### getter
+        Return the ``retry_policy`` instance.
+
+        ### setter
+        Set the ``retry_policy`` instance.
+
+        ### NOTES
+        -   See module_utils/common/retry_policy.py for details about
+            implementing a ``RetryPolicy`` class.
+        """
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        _implements_need = "retry_policy_v1"
+        _implements_have = None
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{method_name} must implement {_implements_need}. "
+        msg += f"Got type {type(value).__name__}, "
+        msg += f"implementing {_implements_have}. "
+        try:
+            _implements_have = value.implements
+        except AttributeError as error:
+            msg += f"Error detail: {error}."
+            raise TypeError(msg) from error
+        if _implements_have != _implements_need:
+            raise TypeError(msg)
+        self._retry_policy = value
+
     @property
     def send_interval(self):
         """
         ### Summary
-        Send interval, in seconds, for retrying responses from the controller.
+        Maximum interval, in seconds, between retries of a request.
 
         ### Valid values
         ``int``
@@ -691,7 +806,7 @@ class RestSend:
 
     @send_interval.setter
     def send_interval(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"{method_name} must be an integer. "
         msg += f"Got type {type(value).__name__}, "
@@ -732,7 +847,7 @@ class RestSend:
 
     @sender.setter
     def sender(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _implements_have = None
         _implements_need = "sender_v1"
 
@@ -774,7 +889,7 @@ class RestSend:
 
     @timeout.setter
     def timeout(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"{method_name} must be an integer. "
         msg += f"Got type {type(value).__name__}, "
@@ -808,7 +923,7 @@ class RestSend:
 
     @unit_test.setter
     def unit_test(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a boolean. "
@@ -833,7 +948,7 @@ class RestSend:
 
     @verb.setter
     def verb(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"{method_name} must be one of {sorted(self._valid_verbs)}. "
         msg += f"Got {value}."
@@ -23,6 +23,8 @@ import inspect
 import json
 import logging
 
+from .tracer import get_tracer
+
 
 class Results:
     """
@@ -232,7 +234,7 @@ class Results:
         Return True if there were any changes
         Otherwise, return False
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: ENTERED: "
         msg += f"self.action: {self.action}, "
@@ -284,7 +286,7 @@ class Results:
         - self.diff      : list of diffs
         - self.metadata  : list of metadata
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"ENTERED: self.action: {self.action}, "
@@ -314,21 +316,22 @@ class Results:
             self.log.debug(msg)
             self.failed = False
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
     def build_final_result(self):
         """
@@ -372,6 +375,8 @@ class Results:
         self.final_result["response"] = self.response
         self.final_result["result"] = self.result
         self.final_result["metadata"] = self.metadata
+        # The trace of the module run, if tracing is enabled
+        get_tracer().add_to(self.final_result)
 
     @property
     def failed_result(self) -> dict:
@@ -412,7 +417,7 @@ class Results:
 
     @action.setter
     def action(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
@@ -442,7 +447,7 @@ class Results:
 
     @changed.setter
     def changed(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.changed must be a bool. Got {value}"
@@ -463,7 +468,7 @@ class Results:
 
     @check_mode.setter
     def check_mode(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a bool. "
@@ -486,7 +491,7 @@ class Results:
 
     @diff.setter
     def diff(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.diff must be a dict. Got {value}"
@@ -510,7 +515,7 @@ class Results:
 
     @diff_current.setter
     def diff_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.diff_current must be a dict. "
@@ -533,7 +538,7 @@ class Results:
 
     @failed.setter
     def failed(self, value: bool) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             # Setting failed, itself failed(!)
             # Add True to failed to indicate this.
@@ -558,7 +563,7 @@ class Results:
 
     @metadata.setter
     def metadata(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.metadata must be a dict. Got {value}"
@@ -571,7 +576,8 @@ class Results:
         """
         ### Summary
         -   getter: Return the current metadata which is comprised of the
-            properties action, check_mode, and state.
+            properties action, check_mode, and state, and the retries of
+            the current response, if any (see RestSend().retry_current).
 
         ### Raises
         None
@@ -581,6 +587,9 @@ class Results:
         value["check_mode"] = self.check_mode
         value["state"] = self.state
         value["sequence_number"] = self.task_sequence_number
+        retry = self.properties.get("response_current", {}).get("RETRY")
+        if retry:
+            value["retry"] = copy.deepcopy(retry)
         return value
 
     @property
@@ -601,7 +610,7 @@ class Results:
 
     @response_current.setter
     def response_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response_current must be a dict. "
@@ -625,7 +634,7 @@ class Results:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response must be a dict. "
@@ -668,7 +677,7 @@ class Results:
 
     @result.setter
     def result(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result must be a dict. "
@@ -694,7 +703,7 @@ class Results:
 
     @result_current.setter
     def result_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result_current must be a dict. "
@@ -717,7 +726,7 @@ class Results:
 
     @state.setter
     def state(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
@@ -25,9 +25,10 @@ import copy
 import inspect
 import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from .operation_type import OperationType
+from .tracer import get_tracer
 
 
 class Results:
@@ -65,6 +66,18 @@ class Results:
     The `Results` instance can then be used to build the final result, by
     calling `Results.build_final_result()`.
 
+    ## Memory usage
+
+    The `add_*()` methods store a shallow copy of each value.  Nested objects,
+    such as the DATA of large controller responses, are shared with the
+    caller rather than copied for every registered task.  Deep copies are
+    made once, by `build_final_result()`.  Callers must therefore not modify
+    nested objects of a value after adding it.
+
+    Set `max_response_data_size` to replace the DATA of responses larger
+    than the given number of characters (when serialized to JSON) with a
+    summary in the final result.
+
     ## Example Usage
 
     We assume an Ansible module structure as follows:
@@ -251,6 +264,7 @@ class Results:
         self._result: list[dict] = []
         self._result_current: dict = {}
         self._state: str = ""
+        self._max_response_data_size: Optional[int] = None
 
         msg = f"ENTERED {self.class_name}():"
         self.log.debug(msg)
@@ -285,13 +299,13 @@ class Results:
 
         -   `TypeError`: if value is not a dict
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.diff must be a dict. Got {value}"
             raise TypeError(msg)
         value["sequence_number"] = self.task_sequence_number
-        self._diff.append(copy.deepcopy(value))
+        self._diff.append(dict(value))
 
     def add_failed(self, value: bool) -> None:
         """
@@ -327,13 +341,13 @@ class Results:
 
         `@metadata` property
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"value must be a dict. Got {type(value).__name__}."
             raise TypeError(msg)
         value["sequence_number"] = self.task_sequence_number
-        self._metadata.append(copy.deepcopy(value))
+        self._metadata.append(dict(value))
 
     def add_response(self, value: dict) -> None:
         """
@@ -349,13 +363,13 @@ class Results:
 
         `@response` property
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.add_response must be a dict. Got {value}"
             raise TypeError(msg)
         value["sequence_number"] = self.task_sequence_number
-        self._response.append(copy.deepcopy(value))
+        self._response.append(dict(value))
 
     def add_response_data(self, value: dict) -> None:
         """
@@ -371,12 +385,12 @@ class Results:
 
         `@response_data` property
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.add_response_data must be a dict. Got {value}"
             raise TypeError(msg)
-        self._response_data.append(copy.deepcopy(value))
+        self._response_data.append(dict(value))
 
     def add_result(self, value: dict) -> None:
         """
@@ -392,13 +406,13 @@ class Results:
 
         `@result` property
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.add_result must be a dict. Got {value}"
             raise TypeError(msg)
         value["sequence_number"] = self.task_sequence_number
-        self._result.append(copy.deepcopy(value))
+        self._result.append(dict(value))
 
     def _increment_task_sequence_number(self) -> None:
         """
@@ -427,7 +441,7 @@ class Results:
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: ENTERED: "
         msg += f"self.action: {self.action}, "
@@ -454,11 +468,7 @@ class Results:
         if self.result_current.get("changed", True) is False:
             return False
         for diff in self.diff:
-            something_changed = False
-            test_diff = copy.deepcopy(diff)
-            test_diff.pop("sequence_number", None)
-            if len(test_diff) != 0:
-                something_changed = True
+            something_changed = any(key != "sequence_number" for key in diff)
         msg = f"{self.class_name}.{method_name}: "
         msg += f"something_changed: {something_changed}"
         self.log.debug(msg)
@@ -491,7 +501,7 @@ class Results:
         - self.diff      : list of diffs
         - self.metadata  : list of metadata
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"ENTERED: self.action: {self.action}, "
@@ -520,21 +530,22 @@ class Results:
             self.log.debug(msg)
             self._failed.add(False)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
     def build_final_result(self) -> None:
         """
@@ -581,10 +592,42 @@ class Results:
             self.final_result["changed"] = True
         else:
             self.final_result["changed"] = False
-        self.final_result["diff"] = self.diff
-        self.final_result["response"] = self.response
-        self.final_result["result"] = self.result
-        self.final_result["metadata"] = self.metadata
+        self.final_result["diff"] = copy.deepcopy(self.diff)
+        self.final_result["response"] = [self._summarize_response(response) for response in self.response]
+        self.final_result["result"] = copy.deepcopy(self.result)
+        self.final_result["metadata"] = copy.deepcopy(self.metadata)
+        # The trace of the module run, if tracing is enabled
+        get_tracer().add_to(self.final_result)
+
+    def _summarize_response(self, response: dict) -> dict:
+        """
+        # Summary
+
+        Return a deep copy of response.  If `max_response_data_size` is set
+        and the DATA of response is larger, DATA is replaced with a summary.
+
+        ## Raises
+
+        None
+        """
+        if self.max_response_data_size is None or "DATA" not in response:
+            return copy.deepcopy(response)
+        data = response["DATA"]
+        try:
+            size = len(json.dumps(data))
+        except (TypeError, ValueError):
+            return copy.deepcopy(response)
+        if size <= self.max_response_data_size:
+            return copy.deepcopy(response)
+        summary: dict[str, Any] = {}
+        summary["truncated"] = True
+        summary["size"] = size
+        summary["type"] = type(data).__name__
+        if isinstance(data, (dict, list)):
+            summary["length"] = len(data)
+        value = {key: copy.deepcopy(item) for key, item in response.items() if key != "DATA"}
+        value["DATA"] = summary
+        return value
 
     def add_to_failed(self, value: bool) -> None:
         """
@@ -655,7 +698,7 @@ class Results:
 
     @action.setter
     def action(self, value: str) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
@@ -700,7 +743,7 @@ class Results:
 
         - value: The operation type to set (must be an OperationType enum value)
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, OperationType):
             msg = f"{self.class_name}.{method_name}: "
             msg += "value must be an OperationType instance. "
@@ -748,7 +791,7 @@ class Results:
 
     @check_mode.setter
     def check_mode(self, value: bool) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a bool. "
@@ -792,7 +835,7 @@ class Results:
 
     @diff_current.setter
     def diff_current(self, value: dict) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.diff_current must be a dict. "
@@ -847,6 +890,7 @@ class Results:
         - check_mode
         - sequence_number
         - state
+        - retry, if the current response was retried (see `RestSend().retry_current`)
 
         ## Raises
 
@@ -857,8 +901,41 @@ class Results:
         value["check_mode"] = self.check_mode
         value["sequence_number"] = self.task_sequence_number
         value["state"] = self.state
+        if self._response_current.get("RETRY"):
+            value["retry"] = copy.deepcopy(self._response_current["RETRY"])
         return value
 
+    @property
+    def max_response_data_size(self) -> Optional[int]:
+        """
+        # Summary
+
+        The maximum size, in characters when serialized to JSON, of the DATA
+        of each response included in the final result.  The DATA of larger
+        responses is replaced with a summary containing its size, type and
+        length.
+
+        Default: None (responses are never summarized)
+
+        -   getter: Return the maximum size.
+        -   setter: Set the maximum size.
+
+        ## Raises
+
+        -   setter: `TypeError` if value is not an int or None.
+        """
+        return self._max_response_data_size
+
+    @max_response_data_size.setter
+    def max_response_data_size(self, value: Optional[int]) -> None:
+        method_name: str = inspect.currentframe().f_code.co_name
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.max_response_data_size must be an int or None. "
+            msg += f"Got {value}."
+            raise TypeError(msg)
+        self._max_response_data_size = value
+
     @property
     def response_current(self) -> dict:
         """
@@ -880,7 +957,7 @@ class Results:
 
     @response_current.setter
     def response_current(self, value: dict) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response_current must be a dict. "
@@ -964,7 +1041,7 @@ class Results:
 
     @result_current.setter
     def result_current(self, value) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result_current must be a dict. "
@@ -990,7 +1067,7 @@ class Results:
 
     @state.setter
     def state(self, value) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
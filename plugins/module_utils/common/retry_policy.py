@@ -0,0 +1,351 @@
+#
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pylint: disable=too-many-instance-attributes
+"""
+Decide if, and when, RestSend() retries a failed request.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import inspect
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    ### Summary
+    Implement the retry policy interface for injection into RestSend().
+
+    -   Classify a failed response as retryable or terminal.
+            -   ``retryable_codes`` (408, 423, 425, 429, 500, 502, 503, 504)
+                are retryable.
+            -   Other 4xx return codes are terminal, e.g. a 400 caused by
+                a bad payload is not sent again.
+            -   Any other failed response is retryable, e.g. a 200 response
+                with an error message while the controller is busy.
+    -   Wait between attempts with exponential backoff and jitter, starting
+        at ``backoff_base`` and capped by RestSend().send_interval, or by
+        ``backoff_max`` if set.
+    -   Honor the ``RETRY_AFTER`` key of a response (the ``Retry-After``
+        header of the controller response), up to ``retry_after_max``.
+    -   Limit the total number of retries, across all requests sent with the
+        policy, to ``retry_budget``.
+    -   Open the circuit after ``circuit_threshold`` consecutive responses
+        in ``unavailable_codes``.  While the circuit is open, requests are
+        sent once, without retries.  The next successful response closes it.
+
+    RestSend().timeout still bounds the number of attempts of a request.
+
+    ### Raises
+    -   ``TypeError`` if a property is set to a value of the wrong type.
+    -   ``ValueError`` if a property is set to a negative value.
+
+    ### Usage example
+    ```python
+    retry_policy = RetryPolicy()
+    retry_policy.retry_budget = 5
+    rest_send.retry_policy = retry_policy
+    ```
+
+    A ``RetryPolicy()`` instance is shared by all requests sent by the
+    ``RestSend()`` instance it is assigned to.  Assign the same instance to
+    several ``RestSend()`` instances for them to share the retry budget and
+    the circuit.
+    """
+
+    SUCCESS = "success"
+    RETRYABLE = "retryable"
+    TERMINAL = "terminal"
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        self._implements = "retry_policy_v1"
+
+        self.log = logging.getLogger(f"dcnm.{self.class_name}")
+
+        self._backoff_base = 1
+        self._backoff_max = None
+        self._circuit_threshold = 3
+        self._jitter = 0.5
+        self._retry_after_max = 60
+        self._retry_budget = 20
+
+        self.retryable_codes = {408, 423, 425, 429, 500, 502, 503, 504}
+        self.unavailable_codes = {502, 503, 504}
+
+        self.circuit_open = False
+        self.consecutive_unavailable = 0
+        self.retries = 0
+        self.terminal = 0
+
+    def classify(self, response, result):
+        """
+        ### Summary
+        Return ``SUCCESS``, ``RETRYABLE`` or ``TERMINAL`` for a response and
+        the result derived from it by the response handler, and update the
+        state of the circuit.
+
+        ### Raises
+        None
+        """
+        return_code = response.get("RETURN_CODE")
+        if result.get("success") is True:
+            classification = self.SUCCESS
+        elif isinstance(return_code, int) and 400 <= return_code < 500 and return_code not in self.retryable_codes:
+            classification = self.TERMINAL
+            self.terminal += 1
+        else:
+            classification = self.RETRYABLE
+
+        if return_code in self.unavailable_codes:
+            self.consecutive_unavailable += 1
+        else:
+            self.consecutive_unavailable = 0
+        if classification == self.SUCCESS:
+            self.circuit_open = False
+        elif self.consecutive_unavailable >= self.circuit_threshold and self.circuit_open is False:
+            self.circuit_open = True
+            msg = f"{self.class_name}.classify: "
+            msg += f"Opening the circuit after {self.consecutive_unavailable} "
+            msg += f"consecutive responses with RETURN_CODE in {sorted(self.unavailable_codes)}."
+            self.log.debug(msg)
+        return classification
+
+    def refusal(self):
+        """
+        ### Summary
+        Return the reason a retryable request must not be retried, or
+        ``None`` if it can be retried.
+
+        ### Raises
+        None
+        """
+        if self.circuit_open:
+            return "circuit_open"
+        if self.retries >= self.retry_budget:
+            return "retry_budget_exhausted"
+        return None
+
+    def delay(self, attempt, response, send_interval):
+        """
+        ### Summary
+        Consume one retry from the budget and return the number of seconds
+        to wait before sending ``attempt + 1``.
+
+        ### Raises
+        None
+        """
+        self.retries += 1
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        cap = send_interval if self.backoff_max is None else self.backoff_max
+        value = min(cap, self.backoff_base * 2 ** (attempt - 1))
+        return value - random.uniform(0, value * self.jitter)
+
+    def _retry_after(self, response):
+        """
+        Return the ``RETRY_AFTER`` of ``response`` in seconds, or ``None``
+        if absent or invalid.  Both delay-seconds and HTTP-date are accepted.
+        """
+        value = response.get("RETRY_AFTER")
+        if value is None:
+            return None
+        try:
+            return max(0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @property
+    def summary(self):
+        """
+        ### Summary
+        The state of the policy, as reported by RestSend().
+
+        ### Raises
+        None
+        """
+        return {
+            "circuit_open": self.circuit_open,
+            "retry_budget_remaining": max(0, self.retry_budget - self.retries),
+        }
+
+    def _verify_number(self, name, value, none_ok=False, integer=False):
+        if value is None and none_ok:
+            return
+        msg = f"{self.class_name}.{name}: "
+        msg += f"{name} must be a{'n integer' if integer else ' number'} greater than or equal to 0. "
+        msg += f"Got type {type(value).__name__}, "
+        msg += f"value {value}."
+        valid_types = (int,) if integer else (int, float)
+        if isinstance(value, bool) or not isinstance(value, valid_types):
+            raise TypeError(msg)
+        if value < 0:
+            raise ValueError(msg)
+
+    @property
+    def backoff_base(self):
+        """
+        ### Summary
+        Wait, in seconds, before the first retry.  Doubled for each
+        subsequent retry.
+
+        ### Default
+        ``1``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not a number.
+        -   setter: ``ValueError`` if value is negative.
+        """
+        return self._backoff_base
+
+    @backoff_base.setter
+    def backoff_base(self, value):
+        self._verify_number(inspect.currentframe().f_code.co_name, value)
+        self._backoff_base = value
+
+    @property
+    def backoff_max(self):
+        """
+        ### Summary
+        Maximum wait, in seconds, between attempts.  If ``None``,
+        RestSend().send_interval is used.
+
+        ### Default
+        ``None``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not a number or ``None``.
+        -   setter: ``ValueError`` if value is negative.
+        """
+        return self._backoff_max
+
+    @backoff_max.setter
+    def backoff_max(self, value):
+        self._verify_number(inspect.currentframe().f_code.co_name, value, none_ok=True)
+        self._backoff_max = value
+
+    @property
+    def circuit_threshold(self):
+        """
+        ### Summary
+        Number of consecutive responses in ``unavailable_codes`` that
+        open the circuit.
+
+        ### Default
+        ``3``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not an ``int``.
+        -   setter: ``ValueError`` if value is negative.
+        """
+        return self._circuit_threshold
+
+    @circuit_threshold.setter
+    def circuit_threshold(self, value):
+        self._verify_number(inspect.currentframe().f_code.co_name, value, integer=True)
+        self._circuit_threshold = value
+
+    @property
+    def implements(self):
+        """
+        ### Summary
+        The interface implemented by this class.
+
+        ### Raises
+        None
+        """
+        return self._implements
+
+    @property
+    def jitter(self):
+        """
+        ### Summary
+        Fraction of the backoff wait that is randomized, so that hosts
+        retrying in parallel do not retry in lockstep.  ``0`` disables jitter.
+
+        ### Default
+        ``0.5``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not a number.
+        -   setter: ``ValueError`` if value is not between 0 and 1.
+        """
+        return self._jitter
+
+    @jitter.setter
+    def jitter(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        self._verify_number(method_name, value)
+        if value > 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be between 0 and 1. "
+            msg += f"Got {value}."
+            raise ValueError(msg)
+        self._jitter = value
+
+    @property
+    def retry_after_max(self):
+        """
+        ### Summary
+        Maximum wait, in seconds, honored from a ``Retry-After`` header.
+
+        ### Default
+        ``60``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not a number.
+        -   setter: ``ValueError`` if value is negative.
+        """
+        return self._retry_after_max
+
+    @retry_after_max.setter
+    def retry_after_max(self, value):
+        self._verify_number(inspect.currentframe().f_code.co_name, value)
+        self._retry_after_max = value
+
+    @property
+    def retry_budget(self):
+        """
+        ### Summary
+        Maximum number of retries, across all requests sent with the policy.
+
+        ### Default
+        ``20``
+
+        ### Raises
+        -   setter: ``TypeError`` if value is not an ``int``.
+        -   setter: ``ValueError`` if value is negative.
+        """
+        return self._retry_budget
+
+    @retry_budget.setter
+    def retry_budget(self, value):
+        self._verify_number(inspect.currentframe().f_code.co_name, value, integer=True)
+        self._retry_budget = value
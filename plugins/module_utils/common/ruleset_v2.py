@@ -132,7 +132,7 @@ class RuleSet:
 
     @template.setter
     def template(self, value: dict) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary."
             raise ValueError(msg)
@@ -196,7 +196,7 @@ class RuleSet:
 
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         annotations = self.annotations(parameter)
         parameter_name = self.name(parameter)
         msg = f"{self.class_name}.{method_name}: IS_SHOW PARAMETER: {parameter_name}. "
@@ -296,7 +296,7 @@ class RuleSet:
         }
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"key {self.param_name}: {self._rule}"
         self.log.debug(msg)
@@ -321,9 +321,10 @@ class RuleSet:
         term["value"] = rhs_converted
         self.ruleset[self.param_name]["terms"]["na"].append(term)
 
-        msg = f"{self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset_boolean(self) -> None:
         """
@@ -381,7 +382,7 @@ class RuleSet:
         }
         ```
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"key {self.param_name}: {self._rule}"
         self.log.debug(msg)
@@ -427,15 +428,16 @@ class RuleSet:
             self.ruleset[self.param_name]["terms"][boolean_type].append(term)
         msg = f"{boolean_type.upper()}: key {self.param_name}: {new_rule}"
         self.log.debug(msg)
-        msg = f"{boolean_type.upper()}: key {self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{boolean_type.upper()}: key {self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset(self) -> None:
         """
         Update the ruleset for self.parameter and self._rule
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"key {self.param_name}: {self._rule}"
         self.log.debug(msg)
@@ -479,7 +481,7 @@ class RuleSet:
         - raise ValueError if template has no parameters.
         - raise ValueError if template[parameters] is not a list.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         if self.template is None:
             msg += "template is not set.  "
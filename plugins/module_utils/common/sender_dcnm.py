@@ -24,6 +24,7 @@ import json
 import logging
 
 from ..network.dcnm.dcnm import dcnm_send
+from .log_v2 import LazyJson
 
 
 class Sender:
@@ -86,7 +87,7 @@ class Sender:
         -   ``ValueError`` if ``verb`` is not set
         -   ``ValueError`` if ``path`` is not set
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.ansible_module is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ansible_module must be set before calling commit()."
@@ -118,8 +119,8 @@ class Sender:
         ## Properties written
             -   ``response``: raw response from the controller
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         try:
             self._verify_commit_parameters()
@@ -135,9 +136,7 @@ class Sender:
             self.log.debug(msg)
             response = self._dcnm_send(self.ansible_module, self.verb, self.path)
         else:
-            msg += ", payload: "
-            msg += f"{json.dumps(self.payload, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            self.log.debug("%s, payload: %s", msg, LazyJson(self.payload))
             response = self._dcnm_send(
                 self.ansible_module,
                 self.verb,
@@ -158,7 +157,7 @@ class Sender:
 
     @ansible_module.setter
     def ansible_module(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.params = value.params
         except AttributeError as error:
@@ -209,7 +208,7 @@ class Sender:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -234,7 +233,7 @@ class Sender:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -258,7 +257,7 @@ class Sender:
 
     @verb.setter
     def verb(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self._valid_verbs:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be one of {sorted(self._valid_verbs)}. "
@@ -85,7 +85,7 @@ class Sender:
         -   ``ValueError`` if ``verb`` is not set
         -   ``ValueError`` if ``path`` is not set
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.gen is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "gen must be set before calling commit()."
@@ -101,7 +101,7 @@ class Sender:
         -   ``self.raise_exception`` if set and
             ``self.raise_method`` == "commit"
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.raise_method == method_name:
             msg = f"{self.class_name}.{method_name}: "
@@ -116,8 +116,8 @@ class Sender:
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"caller {caller}"
         self.log.debug(msg)
@@ -150,7 +150,7 @@ class Sender:
 
     @gen.setter
     def gen(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "Expected a class implementing the "
         msg += "response_generator interface. "
@@ -43,6 +43,8 @@ except ImportError:
 
 # These will be checked at runtime rather than import time
 
+from .auth_token import AuthToken
+
 
 class Sender:
     """
@@ -106,6 +108,11 @@ class Sender:
     # etc...
     # See rest_send_v2.py for RestSend() usage.
     ```
+
+    ### Token refresh
+    After ``login()``, the token is refreshed with ``refresh_login()``
+    before a request is sent if it expires within ``auth_token.refresh_margin``
+    seconds (60 by default).  The expiry is read from the token.
     """
 
     def __init__(self):
@@ -116,6 +123,7 @@ class Sender:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
+        self.auth_token = AuthToken()
         self._domain = environ.get("ND_DOMAIN", "local")
         self._headers = None
         self._history_rc = deque(maxlen=50)
@@ -144,7 +152,7 @@ class Sender:
         -   ``ValueError`` if ``verb`` is not set
         -   ``ValueError`` if ``path`` is not set
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.ip4 is None and self.ip6 is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ip4 or ip6 must be set before calling commit()."
@@ -175,9 +183,9 @@ class Sender:
         ## Properties written
             -   ``response``: raw response from the controller
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         # Check for required dependencies at runtime
         if not HAS_REQUESTS:
@@ -196,6 +204,7 @@ class Sender:
             msg += "Not all mandatory parameters are set. "
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
+        self._refresh_login_if_due()
         self.get_url()
         msg = f"{self.class_name}.{method_name}: "
         msg += f"caller: {caller}.  "
@@ -231,6 +240,20 @@ class Sender:
         self._payload = None
         self.gen_response(response)
 
+    def _refresh_login_if_due(self):
+        """
+        ### Summary
+        Call ``refresh_login()`` if the token expires soon, preserving the
+        request being committed.
+        """
+        if self._logged_in is not True or self.path in ("/login", "/refresh"):
+            return
+        if not self.auth_token.needs_refresh():
+            return
+        request = (self._path, self._verb, self._payload, self._headers)
+        self.refresh_login()
+        self._path, self._verb, self._payload, self._headers = request
+
     def get_headers(self):
         headers = dict()
         headers["Cookie"] = f"AuthCookie={self.token}"
@@ -244,7 +267,7 @@ class Sender:
         Returns the server IP address to use based on the values
         of ip4 and ip6.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.ip4 is not None:
             return self.ip4
         if self.ip6 is not None:
@@ -256,7 +279,7 @@ class Sender:
         raise ValueError(msg)
 
     def get_url(self):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.path is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "call Sender.path before calling "
@@ -287,7 +310,7 @@ class Sender:
         """
         Generate a response dictionary from the requests response object.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # set the token to the value of Set-Cookie in the
         # response headers (if present)
         token = response.headers.get("Set-Cookie", None)
@@ -346,7 +369,7 @@ class Sender:
         self.__logged_in = True
 
     def update_token(self):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED"
         self.log.debug(msg)
@@ -354,6 +377,7 @@ class Sender:
             self.token = self.response["DATA"]["jwttoken"]
             self.jwttoken = self.response["DATA"]["jwttoken"]
             self.rbac = self.response["DATA"]["rbac"]
+            self.auth_token.set(self.jwttoken)
         except KeyError as error:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Unable to parse token from response: "
@@ -362,7 +386,7 @@ class Sender:
             raise ValueError(msg) from error
 
     def refresh_login(self):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED"
         self.log.debug(msg)
@@ -502,7 +526,7 @@ class Sender:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -535,7 +559,7 @@ class Sender:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -93,7 +93,7 @@ class SwitchDetails:
         -   ``ValueError`` if instance.rest_send is not set.
         -   ``ValueError`` if instance.results is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -139,7 +139,7 @@ class SwitchDetails:
         -   ``ValueError`` if:
                 - ``Results()`` raises ``TypeError``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # Update and register results
         try:
             self.results.action = self.action
@@ -178,7 +178,7 @@ class SwitchDetails:
                 -   There is an error sending the request to the controller.
                 -   There is an error updatingcontroller results.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.validate_refresh_parameters()
         except ValueError as error:
@@ -219,7 +219,7 @@ class SwitchDetails:
         -   ``ValueError`` if ``filter`` is not in the controller response.
         -   ``ValueError`` if item is not in the filtered switch dict.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -401,7 +401,7 @@ class SwitchDetails:
             To resolve ``inconsistent`` state, a switch ``config-deploy``
             must be initiated on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.mode is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "mode is not set. Either 'filter' has not been "
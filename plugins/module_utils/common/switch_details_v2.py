@@ -106,7 +106,7 @@ class SwitchDetails:
 
         - instance.rest_send.params is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self.rest_send.params:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -156,7 +156,7 @@ class SwitchDetails:
 
         - `Results()` raises `TypeError`.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         # Update and register results
         try:
             self.results.action = self.action
@@ -197,7 +197,7 @@ class SwitchDetails:
         - There is an error sending the request to the controller.
         - There is an error updating controller results.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.validate_refresh_parameters()
         except ValueError as error:
@@ -243,7 +243,7 @@ class SwitchDetails:
         - `filter` is not in the controller response.
         - `item` is not in the filtered switch dict.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         if not self._filter:
             msg = f"{self.class_name}.{method_name}: "
@@ -462,7 +462,7 @@ class SwitchDetails:
           `inconsistent` for the switch's `maintenanceMode` state. To resolve `inconsistent` state, a
           switch `config-deploy` must be initiated on the controller.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self.mode:
             msg = f"{self.class_name}.{method_name}: "
             msg += "mode is not set. Either 'filter' has not been "
@@ -947,7 +947,7 @@ class SwitchDetails:
 
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["RestSend"] = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -989,7 +989,7 @@ class SwitchDetails:
 
     @results.setter
     def results(self, value: Results) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["Results"] = "Results"
         msg = f"{self.class_name}.{method_name}: "
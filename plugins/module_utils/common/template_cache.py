@@ -0,0 +1,305 @@
+#
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persist controller templates on the Ansible control node between runs.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import inspect
+import json
+import logging
+import os
+import re
+import time
+
+DEFAULT_MAX_AGE = 86400
+
+# Keys of a template parameter consumed by ParamInfo() and RuleSet()
+PARAMETER_KEYS = (
+    "annotations",
+    "choices",
+    "defaultValue",
+    "description",
+    "metaProperties",
+    "name",
+    "optional",
+    "parameterType",
+    "type",
+)
+
+
+def default_cache_dir():
+    """
+    ### Summary
+    Return the template cache directory under the Ansible home directory,
+    ``$ANSIBLE_HOME/cache/cisco.dcnm/templates``.  ``ANSIBLE_HOME``
+    defaults to ``~/.ansible``.
+    """
+    ansible_home = os.environ.get("ANSIBLE_HOME") or os.path.join("~", ".ansible")
+    return os.path.join(os.path.expanduser(ansible_home), "cache", "cisco.dcnm", "templates")
+
+
+class TemplateCache:
+    """
+    ### Summary
+    Persist controller templates on the Ansible control node, so that
+    ``TemplateGet()`` reads them from a file instead of retrieving them
+    from the controller on every run.
+
+    -   Templates are cached per controller, in a directory named after
+        ``controller_uuid`` and ``controller_version``.  Templates only
+        change on controller upgrade, which changes the directory.  The
+        cache is disabled until ``controller_version`` is set.
+    -   Only the template parameter keys consumed by ``ParamInfo()`` and
+        ``RuleSet()`` are cached, see ``PARAMETER_KEYS``.
+    -   A cached template is stale if it is older than ``max_age`` seconds.
+
+    Errors reading or writing the cache are logged and otherwise ignored.
+    The template is then retrieved from the controller.
+
+    ### Raises
+    -   ``TypeError`` if a property is set to a value of the wrong type.
+    -   ``ValueError`` if ``max_age`` is set to a negative value.
+
+    ### Usage example
+    ```python
+    template_cache = TemplateCache()
+    template_cache.controller_version = controller_version.version
+    template_cache.controller_uuid = controller_version.uuid
+    template_get.template_cache = template_cache
+    ```
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path=None):
+        self.class_name = self.__class__.__name__
+        self._implements = "template_cache_v1"
+
+        self.log = logging.getLogger(f"dcnm.{self.class_name}")
+
+        self._controller_uuid = None
+        self._controller_version = None
+        self._max_age = DEFAULT_MAX_AGE
+        self._path = path or default_cache_dir()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _safe_name(value):
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", value)
+
+    @staticmethod
+    def compact_parameters(parameters):
+        """
+        ### Summary
+        Return ``parameters`` with only the keys in ``PARAMETER_KEYS``.
+        """
+        return [{key: parameter[key] for key in PARAMETER_KEYS if key in parameter} for parameter in parameters]
+
+    @property
+    def enabled(self):
+        """Return ``True`` if ``controller_version`` is set"""
+        return bool(self.controller_version)
+
+    def _controller_dir(self):
+        name = self.controller_version
+        if self.controller_uuid:
+            name = f"{self.controller_uuid}_{name}"
+        return os.path.join(self.path, self._safe_name(name))
+
+    def _template_path(self, template_name):
+        return os.path.join(self._controller_dir(), "templates", f"{self._safe_name(template_name)}.json")
+
+    def _read(self, path):
+        """
+        ### Summary
+        Return the content of a cache file, or ``None`` if the file does
+        not exist, cannot be read, or is stale.
+        """
+        method_name = inspect.currentframe().f_code.co_name
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                content = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(content, dict) or content.get("format") != self.FORMAT:
+            return None
+        if content.get("controller_version") != self.controller_version:
+            return None
+        written = content.get("written")
+        if not isinstance(written, (int, float)) or time.time() - written > self.max_age:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Ignoring stale cache file {path}."
+            self.log.debug(msg)
+            return None
+        return content
+
+    def _write(self, path, content):
+        """
+        ### Summary
+        Write a cache file.  The file is replaced atomically, since tasks
+        running in parallel may read it.
+        """
+        method_name = inspect.currentframe().f_code.co_name
+        content["format"] = self.FORMAT
+        content["controller_version"] = self.controller_version
+        content["written"] = time.time()
+        tmp_path = f"{path}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(content, cache_file, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except (IOError, OSError, TypeError, ValueError) as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to write cache file {path}. "
+            msg += f"Error detail: {error}"
+            self.log.debug(msg)
+
+    def get(self, template_name):
+        """
+        ### Summary
+        Return the cached template ``template_name``, with keys
+        ``template_name`` and ``parameters``, or ``None`` if it is not
+        cached, or is stale.
+
+        ### Raises
+        None
+        """
+        if not self.enabled:
+            return None
+        content = self._read(self._template_path(template_name))
+        if content is None or not isinstance(content.get("parameters"), list):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {"template_name": content.get("template_name", template_name), "parameters": content["parameters"]}
+
+    def put(self, template_name, template):
+        """
+        ### Summary
+        Cache a template, as returned in the ``DATA`` of the controller
+        response.
+
+        ### Raises
+        None
+        """
+        if not self.enabled:
+            return
+        content = {}
+        content["template_name"] = template.get("name") or template_name
+        content["timestamp"] = template.get("timestamp")
+        content["parameters"] = self.compact_parameters(template.get("parameters") or [])
+        self._write(self._template_path(template_name), content)
+
+    @property
+    def implements(self):
+        """
+        ### Summary
+        The interface implemented by this class.
+        """
+        return self._implements
+
+    @property
+    def controller_uuid(self):
+        """
+        ### Summary
+        The controller uuid, or ``None``.  Used with ``controller_version``
+        to name the cache directory of the controller.
+
+        ### Raises
+        -   ``TypeError`` if the value is not a string or ``None``.
+        """
+        return self._controller_uuid
+
+    @controller_uuid.setter
+    def controller_uuid(self, value):
+        self._verify_optional_string(inspect.currentframe().f_code.co_name, value)
+        self._controller_uuid = value
+
+    @property
+    def controller_version(self):
+        """
+        ### Summary
+        The controller version.  The cache is disabled while it is ``None``.
+
+        ### Raises
+        -   ``TypeError`` if the value is not a string or ``None``.
+        """
+        return self._controller_version
+
+    @controller_version.setter
+    def controller_version(self, value):
+        self._verify_optional_string(inspect.currentframe().f_code.co_name, value)
+        self._controller_version = value
+
+    @property
+    def max_age(self):
+        """
+        ### Summary
+        The age, in seconds, after which a cached template is stale.
+
+        ### Raises
+        -   ``TypeError`` if the value is not an integer.
+        -   ``ValueError`` if the value is negative.
+        """
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be an integer. "
+            msg += f"Got type {type(value).__name__}, value {value}."
+            raise TypeError(msg)
+        if value < 0:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be >= 0. Got {value}."
+            raise ValueError(msg)
+        self._max_age = value
+
+    @property
+    def path(self):
+        """
+        ### Summary
+        The cache directory.  Default: ``default_cache_dir()``.
+
+        ### Raises
+        -   ``TypeError`` if the value is not a string.
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        if not isinstance(value, str):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be a string. "
+            msg += f"Got type {type(value).__name__}, value {value}."
+            raise TypeError(msg)
+        self._path = value
+
+    def _verify_optional_string(self, method_name, value):
+        if value is not None and not isinstance(value, str):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{method_name} must be a string, or None. "
+            msg += f"Got type {type(value).__name__}, value {value}."
+            raise TypeError(msg)
@@ -23,12 +23,13 @@ __author__ = "Allen Robel"
 import copy
 import inspect
 import logging
-from typing import Any
+from typing import Any, Union
 
 from .api.v1.configtemplate.rest.config.templates.templates import EpTemplate
 from .exceptions import ControllerResponseError
 from .rest_send_v2 import RestSend
 from .results_v2 import Results
+from .template_cache import TemplateCache
 
 
 class TemplateGet:
@@ -48,6 +49,9 @@ class TemplateGet:
     template_name = instance.template_name
     ```
 
+    Set `instance.template_cache` to a `TemplateCache()` instance to read
+    the template from, and persist it to, the Ansible control node.
+
     `instance.template` will be a dict with the following top-level keys:
 
     -   "template_name": The name of the template.
@@ -102,6 +106,7 @@ class TemplateGet:
         self._rest_send: RestSend = RestSend({})
         self._results: Results = Results()
         self._template: dict[str, Any] = {}
+        self._template_cache: Union[TemplateCache, None] = None
         self._template_name: str = ""
 
     def _set_template_endpoint(self) -> None:
@@ -114,7 +119,7 @@ class TemplateGet:
 
         -   `ValueError` if the endpoint assignment fails.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self.template_name:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Set instance.template_name property before calling instance.refresh()"
@@ -130,7 +135,8 @@ class TemplateGet:
         """
         # Summary
 
-        -   Retrieve the template from the controller.
+        -   Retrieve the template from the template cache, if set, or
+            from the controller.
         -   Populate the instance.template property.
 
         # Raises
@@ -138,7 +144,7 @@ class TemplateGet:
         -   `ValueError` if the template endpoint assignment fails
         -   `ControllerResponseError` if the controller `RETURN_CODE` != 200
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         try:
             self._set_template_endpoint()
@@ -151,6 +157,16 @@ class TemplateGet:
             self.log.debug(msg)
             raise ValueError(msg)
 
+        if self.template_cache is not None:
+            cached = self.template_cache.get(self.template_name)
+            if cached is not None:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Using template {self.template_name} "
+                msg += f"from the template cache at {self.template_cache.path}."
+                self.log.debug(msg)
+                self.template = cached
+                return
+
         self.rest_send.path = self.ep_template.path
         self.rest_send.verb = self.ep_template.verb
         self.rest_send.check_mode = False
@@ -175,6 +191,8 @@ class TemplateGet:
         self.template = {}
         self.template["template_name"] = self.response_current.get("DATA", {}).get("name", "")
         self.template["parameters"] = self.response_current.get("DATA", {}).get("parameters", [])
+        if self.template_cache is not None:
+            self.template_cache.put(self.template_name, self.response_current.get("DATA", {}))
 
     @property
     def rest_send(self) -> RestSend:
@@ -191,7 +209,7 @@ class TemplateGet:
 
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not value.params:
             msg = f"{self.class_name}.{method_name}: "
             msg += "rest_send must have params set."
@@ -228,7 +246,7 @@ class TemplateGet:
 
     @template.setter
     def template(self, value) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be an instance of dict."
@@ -236,6 +254,31 @@ class TemplateGet:
             raise TypeError(msg)
         self._template = value
 
+    @property
+    def template_cache(self) -> Union[TemplateCache, None]:
+        """
+        # Summary
+
+        An instance of the TemplateCache class, or None.
+
+        ## Raises
+
+        -   setter: `TypeError` if the value does not implement
+            template_cache_v1, and is not None.
+        """
+        return self._template_cache
+
+    @template_cache.setter
+    def template_cache(self, value: Union[TemplateCache, None]) -> None:
+        method_name: str = inspect.currentframe().f_code.co_name
+        if value is not None and getattr(value, "implements", None) != "template_cache_v1":
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "template_cache must implement template_cache_v1, or be None. "
+            msg += f"Got type: {type(value)} for value: {value}."
+            self.log.debug(msg)
+            raise TypeError(msg)
+        self._template_cache = value
+
     @property
     def template_name(self) -> str:
         """
@@ -255,7 +298,7 @@ class TemplateGet:
 
     @template_name.setter
     def template_name(self, value: str) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template_name must be an instance of str. "
@@ -0,0 +1,339 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Opt-in tracing of controller requests and module phases.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import atexit
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+# Path segments that hold a name or an identifier rather than a resource:
+# the segment after "fabrics" or "switches", and segments with digits or
+# commas (serial numbers, lists of names, UUIDs). API versions are kept.
+PATH_PARAMETER_PARENTS = ("fabrics", "switches")
+PATH_PARAMETER = re.compile(r"[\d,]")
+PATH_VERSION = re.compile(r"^v\d+$")
+
+
+def path_template(path):
+    """
+    ### Summary
+    Return ``path`` with its names, identifiers and query values replaced by ``{}``
+
+    ### Example
+    ``/rest/top-down/fabrics/f1/vrfs/attachments?vrf-names=v1,v2`` becomes
+    ``/rest/top-down/fabrics/{}/vrfs/attachments?vrf-names={}``
+    """
+    path = str(path)
+    path, sep, query = path.partition("?")
+    segments = path.split("/")
+    for index, segment in enumerate(segments):
+        if not segment or PATH_VERSION.match(segment):
+            continue
+        if segments[index - 1] in PATH_PARAMETER_PARENTS or PATH_PARAMETER.search(segment):
+            segments[index] = "{}"
+    template = "/".join(segments)
+    if sep:
+        template += "?" + "&".join(item.partition("=")[0] + "={}" for item in query.split("&"))
+    return template
+
+
+class Tracer:
+    """
+    ### Summary
+    Record the controller requests and the timed phases of a module run.
+
+    Tracing is disabled unless one of the following environment variables is set.
+
+    -   ``NDFC_TRACE``: ``true`` to return the trace in the module output,
+        under the ``trace`` key.
+    -   ``NDFC_TRACE_FILE``: path of a file the trace is appended to when the
+        module exits, in addition to the module output.  A path ending with
+        ``.jsonl`` gets one JSON object per line.  Any other path gets the
+        Chrome trace event format, which can be opened with ``chrome://tracing``
+        or https://ui.perfetto.dev.  Each module run shows up as one process.
+
+    The environment of ansible-playbook is passed to the modules, so e.g.
+
+    ```bash
+    export NDFC_TRACE_FILE=/tmp/dcnm-trace.json
+    ansible-playbook -i hosts.yml vrfs.yml
+    ```
+
+    ### Recorded data
+    -   For each request: the source (``dcnm_send`` or ``RestSend``), the verb,
+        the path template (see ``path_template()``), the status, the size of
+        the JSON encoded response ``DATA``, the start time relative to the
+        start of the module, the latency and the number of retries.  The
+        latency of a ``RestSend`` request covers all its attempts, including
+        the waits between them.
+    -   For each span: its name, start time and duration.  Spans are recorded
+        with ``span()``.
+
+    ### Usage
+    ```python
+    from ..module_utils.common.tracer import get_tracer
+
+    def main():
+        ...
+        tracer = get_tracer()
+        with tracer.span("get_have"):
+            dcnm_vrf.get_have()
+        ...
+        module.exit_json(**tracer.add_to(dcnm_vrf.result))
+    ```
+    """
+
+    def __init__(self, environ=None):
+        environ = os.environ if environ is None else environ
+        self.file = environ.get("NDFC_TRACE_FILE") or None
+        self.enabled = bool(self.file) or str(environ.get("NDFC_TRACE", "")).lower() in TRUE_VALUES
+        self.name = None
+        self.requests = []
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._epoch = time.time()
+        self._origin = time.monotonic()
+        self._written = False
+        if self.file:
+            atexit.register(self.write)
+
+    @property
+    def module_name(self):
+        """Name of the traced module, from the AnsiballZ wrapper if no request named it"""
+        if self.name:
+            return self.name
+        match = re.match(r"^AnsiballZ_(\w+)\.py$", os.path.basename(sys.argv[0] if sys.argv else ""))
+        return match.group(1) if match else "dcnm"
+
+    def now(self):
+        """Seconds since the tracer was created"""
+        return time.monotonic() - self._origin
+
+    def request(self, source, verb, path, response, start, retries=0, module=None):
+        """
+        ### Summary
+        Record a request that started at ``start`` (see ``now()``) and just completed.
+
+        ### Parameters
+        -   ``source``: ``dcnm_send`` or ``RestSend``
+        -   ``response``: the response dict, with ``RETURN_CODE`` and ``DATA``
+        -   ``retries``: number of times the request was sent again
+        -   ``module``: the AnsibleModule, used to name the trace
+        """
+        end = self.now()
+        status = None
+        size = 0
+        if isinstance(response, dict):
+            status = response.get("RETURN_CODE")
+            try:
+                size = len(json.dumps(response.get("DATA"), separators=(",", ":")))
+            except (TypeError, ValueError):
+                size = 0
+        record = {
+            "source": source,
+            "verb": verb,
+            "path": path_template(path),
+            "status": status,
+            "bytes": size,
+            "start": round(start, 4),
+            "latency_ms": round((end - start) * 1000, 1),
+            "retries": retries,
+            "thread": threading.get_ident(),
+        }
+        with self._lock:
+            if self.name is None and module is not None:
+                self.name = getattr(module, "_name", None)
+            self.requests.append(record)
+
+    @contextmanager
+    def span(self, name):
+        """Record the duration of the enclosed block as span ``name``"""
+        if not self.enabled:
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            record = {
+                "name": name,
+                "start": round(start, 4),
+                "duration_ms": round((self.now() - start) * 1000, 1),
+                "thread": threading.get_ident(),
+            }
+            with self._lock:
+                self.spans.append(record)
+
+    @contextmanager
+    def request_group(self):
+        """
+        ### Summary
+        Do not record the requests sent from the enclosed block on this thread.
+
+        Used by callers that record the requests themselves, e.g.
+        ``RestSend.commit()`` records one request with its retries instead of
+        one request per attempt.
+        """
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+
+    @property
+    def recording(self):
+        """True if requests sent from this thread should be recorded"""
+        return self.enabled and getattr(self._local, "depth", 0) == 0
+
+    def summary(self):
+        """
+        ### Summary
+        Return the trace as returned in the module output.
+
+        ``request_time`` is the time at least one request was in progress and
+        ``local_time`` is the rest of the elapsed time, i.e. the time spent in
+        the module itself.
+        """
+        with self._lock:
+            requests = list(self.requests)
+            spans = list(self.spans)
+        elapsed = self.now()
+
+        request_time = 0.0
+        busy_until = 0.0
+        endpoints = {}
+        for record in sorted(requests, key=lambda item: item["start"]):
+            start = record["start"]
+            end = start + record["latency_ms"] / 1000.0
+            if end > busy_until:
+                request_time += end - max(start, busy_until)
+                busy_until = end
+            endpoint = endpoints.setdefault("{0} {1}".format(record["verb"], record["path"]), {"count": 0, "time_ms": 0.0})
+            endpoint["count"] += 1
+            endpoint["time_ms"] = round(endpoint["time_ms"] + record["latency_ms"], 1)
+
+        return {
+            "elapsed": round(elapsed, 3),
+            "request_count": len(requests),
+            "request_time": round(request_time, 3),
+            "local_time": round(max(0.0, elapsed - request_time), 3),
+            "endpoints": endpoints,
+            "spans": spans,
+            "requests": requests,
+        }
+
+    def add_to(self, result):
+        """Add the trace to the module ``result`` if tracing is enabled and return ``result``"""
+        if self.enabled:
+            result["trace"] = self.summary()
+        return result
+
+    def events(self):
+        """Return the trace as a list of Chrome trace events"""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "{0} [{1}]".format(self.module_name, pid)}}]
+        with self._lock:
+            requests = list(self.requests)
+            spans = list(self.spans)
+        for record in spans:
+            events.append(
+                {
+                    "name": record["name"],
+                    "cat": "span",
+                    "ph": "X",
+                    "ts": int((self._epoch + record["start"]) * 1000000),
+                    "dur": int(record["duration_ms"] * 1000),
+                    "pid": pid,
+                    "tid": record["thread"],
+                }
+            )
+        for record in requests:
+            events.append(
+                {
+                    "name": "{0} {1}".format(record["verb"], record["path"]),
+                    "cat": record["source"],
+                    "ph": "X",
+                    "ts": int((self._epoch + record["start"]) * 1000000),
+                    "dur": int(record["latency_ms"] * 1000),
+                    "pid": pid,
+                    "tid": record["thread"],
+                    "args": {key: record[key] for key in ("status", "bytes", "retries")},
+                }
+            )
+        return events
+
+    def write(self):
+        """
+        ### Summary
+        Append the trace to ``NDFC_TRACE_FILE``.  Called when the module exits.
+
+        The Chrome trace event format allows the closing bracket of the event
+        array to be missing, which lets every module run append its events to
+        the same file.
+        """
+        if not self.file or self._written or not (self.requests or self.spans):
+            return
+        self._written = True
+        pid = os.getpid()
+        if self.file.endswith(".jsonl"):
+            name = self.module_name
+            lines = [dict(record, type="span", module=name, pid=pid) for record in self.spans]
+            lines += [dict(record, type="request", module=name, pid=pid) for record in self.requests]
+            text = "".join(json.dumps(line, sort_keys=True) + "\n" for line in lines)
+        else:
+            text = "".join(json.dumps(event, sort_keys=True) + ",\n" for event in self.events())
+            if not os.path.exists(self.file) or os.path.getsize(self.file) == 0:
+                text = "[\n" + text
+        try:
+            with open(self.file, "a", encoding="utf-8") as trace_file:
+                trace_file.write(text)
+        except (IOError, OSError):
+            # Tracing must never fail the module
+            pass
+
+
+_TRACER = None
+_TRACER_LOCK = threading.Lock()
+
+
+def get_tracer():
+    """Return the tracer of this process, created on first use"""
+    global _TRACER  # pylint: disable=global-statement
+    if _TRACER is None:
+        with _TRACER_LOCK:
+            if _TRACER is None:
+                _TRACER = Tracer()
+    return _TRACER
+
+
+def set_tracer(tracer):
+    """Replace the tracer of this process, e.g. with Tracer({"NDFC_TRACE": "true"}) in unit tests"""
+    global _TRACER  # pylint: disable=global-statement
+    _TRACER = tracer
+    return tracer
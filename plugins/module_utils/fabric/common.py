@@ -131,7 +131,7 @@ class FabricCommon:
             Raise ``ValueError`` if payload is missing FABRIC_NAME.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         fabric_name = payload.get("FABRIC_NAME", None)
         if fabric_name is None:
@@ -163,7 +163,7 @@ class FabricCommon:
         -   Re-raise ``ValueError`` from FabricConfigDeploy(), if any.
         -   Raise ``ValueError`` if the payload is missing the FABRIC_NAME key.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         fabric_name = payload.get("FABRIC_NAME")
         if fabric_name is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -218,7 +218,7 @@ class FabricCommon:
             -   Register the task result
             -   raise ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             mac_address = self.conversion.translate_mac_address(mac_address)
         except ValueError as error:
@@ -265,7 +265,7 @@ class FabricCommon:
             controller expects.
         -   Raise ``ValueError`` if the translation fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         for payload in self._payloads_to_commit:
             if "ANYCAST_GW_MAC" not in payload:
                 continue
@@ -288,7 +288,7 @@ class FabricCommon:
         """
         Raise ``ValueError`` if BGP_AS is not a valid BGP ASN.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         for payload in self._payloads_to_commit:
             if "BGP_AS" not in payload:
                 continue
@@ -307,7 +307,7 @@ class FabricCommon:
         - raise ``ValueError`` if the payload is not a dict
         - raise ``ValueError`` if the payload is missing mandatory keys
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.action not in {"fabric_create", "fabric_replace", "fabric_update"}:
             return
         msg = f"{self.class_name}.{method_name}: "
@@ -407,7 +407,7 @@ class FabricCommon:
 
     @fabric_type.setter
     def fabric_type(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if value not in self.fabric_types.valid_fabric_types:
             msg = f"{self.class_name}.{method_name}: "
             msg += "FABRIC_TYPE must be one of "
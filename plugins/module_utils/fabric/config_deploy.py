@@ -97,7 +97,7 @@ class FabricConfigDeploy:
             can be deployed.
         -   Set self.fabric_can_be_deployed to False otherwise.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.fabric_can_be_deployed = False
 
@@ -192,7 +192,7 @@ class FabricConfigDeploy:
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.fabric_details is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -298,7 +298,7 @@ class FabricConfigDeploy:
 
     @fabric_details.setter
     def fabric_details(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "fabric_details must be an instance of FabricDetailsByName. "
         try:
@@ -324,7 +324,7 @@ class FabricConfigDeploy:
 
     @fabric_summary.setter
     def fabric_summary(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "fabric_summary must be an instance of FabricSummary. "
         try:
@@ -349,7 +349,7 @@ class FabricConfigDeploy:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
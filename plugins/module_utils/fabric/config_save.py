@@ -108,7 +108,7 @@ class FabricConfigSave:
         -   Save the fabric configuration to the controller.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # pylint: disable=no-member
 
         if self.payload is None:
@@ -197,7 +197,7 @@ class FabricConfigSave:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
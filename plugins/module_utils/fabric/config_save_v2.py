@@ -109,7 +109,7 @@ class FabricConfigSave:
         -   Save the fabric configuration to the controller.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # pylint: disable=no-member
 
         if self.payload is None:
@@ -198,7 +198,7 @@ class FabricConfigSave:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
@@ -226,7 +226,7 @@ class FabricConfigSave:
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
         if not value.params:
-            method_name = inspect.stack()[0][3]
+            method_name = inspect.currentframe().f_code.co_name
             msg = f"{self.class_name}.{method_name}: "
             msg += "rest_send must have params set."
             raise ValueError(msg)
@@ -84,7 +84,7 @@ class FabricCreateCommon(FabricCommon):
         - raise ``ValueError`` if the fabric_type to template_name mapping fails
         - raise ``ValueError`` if the fabric_create endpoint assignment fails
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         try:
             self.ep_fabric_create.fabric_name = payload.get("FABRIC_NAME")
         except ValueError as error:
@@ -123,7 +123,7 @@ class FabricCreateCommon(FabricCommon):
 
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         fabric_type = payload.get("FABRIC_TYPE")
         if fabric_type not in self.fabric_types.external_fabric_types:
@@ -191,8 +191,9 @@ class FabricCreateCommon(FabricCommon):
             self.results.result_current = copy.deepcopy(self.rest_send.result_current)
             self.results.register_task_result()
 
-            msg = f"self.results.diff: {json.dumps(self.results.diff, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"self.results.diff: {json.dumps(self.results.diff, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
     @property
     def payloads(self):
@@ -209,7 +210,7 @@ class FabricCreateCommon(FabricCommon):
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"value: {value}"
@@ -287,7 +288,7 @@ class FabricCreateBulk(FabricCreateCommon):
         - raise ``ValueError`` if payload fixup fails.
         - raise ``ValueError`` if sending the payloads fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # pylint: disable=no-member
         if self.rest_send is None:
@@ -302,9 +303,10 @@ class FabricCreateBulk(FabricCreateCommon):
 
         self._build_payloads_to_commit()
 
-        msg = "self._payloads_to_commit: "
-        msg += f"{json.dumps(self._payloads_to_commit, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self._payloads_to_commit: "
+            msg += f"{json.dumps(self._payloads_to_commit, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if len(self._payloads_to_commit) == 0:
             return
@@ -351,7 +353,7 @@ class FabricCreate(FabricCreateCommon):
             to a list and leverage the processing that already exists
             in FabricCreateCommom()
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:  # pylint: disable=no-member
             msg = f"{self.class_name}.{method_name}: "
             msg += "rest_send must be set prior to calling commit. "
@@ -385,7 +387,7 @@ class FabricCreate(FabricCreateCommon):
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payload must be a dict. "
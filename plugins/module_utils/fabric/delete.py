@@ -105,7 +105,7 @@ class FabricDelete(FabricCommon):
         raise ``ValueError`` if the fabric cannot be deleted
         return otherwise
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         self.fabric_summary.fabric_name = fabric_name
 
         try:
@@ -125,7 +125,7 @@ class FabricDelete(FabricCommon):
         - validate the parameters for commit
         - raise ``ValueError`` if ``fabric_names`` is not set
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         if self.fabric_details is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -159,7 +159,7 @@ class FabricDelete(FabricCommon):
         - delete each of the fabrics in self.fabric_names
         - raise ``ValueError`` if any commit parameters are invalid
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self._validate_commit_parameters()
@@ -311,7 +311,7 @@ class FabricDelete(FabricCommon):
 
     @fabric_names.setter
     def fabric_names(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_names must be a list. "
@@ -69,7 +69,7 @@ class FabricDetails:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -97,7 +97,7 @@ class FabricDetails:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -125,7 +125,7 @@ class FabricDetails:
         -   ``self.data`` is a dictionary of fabric details, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -549,7 +549,7 @@ class FabricDetailsByName(FabricDetails):
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -589,7 +589,7 @@ class FabricDetailsByName(FabricDetails):
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -633,7 +633,7 @@ class FabricDetailsByName(FabricDetails):
         - A dictionary of the fabric matching self.filter.
         - ``None``, if the fabric does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filter must be set before accessing "
@@ -723,7 +723,7 @@ class FabricDetailsByNvPair(FabricDetails):
                 -   ``filter_key`` has not been set.
                 -   ``filter_value`` has not been set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter_key is None:
             msg = f"{self.class_name}.{method_name}: "
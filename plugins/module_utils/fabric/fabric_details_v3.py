@@ -75,7 +75,7 @@ class FabricDetails:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.action = self.action
             self.results.response_current = self.rest_send.response_current
@@ -103,7 +103,7 @@ class FabricDetails:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -131,7 +131,7 @@ class FabricDetails:
         -   ``self.data`` is a dictionary of fabric details, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -565,7 +565,7 @@ class FabricDetailsByName(FabricDetails):
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -603,7 +603,7 @@ class FabricDetailsByName(FabricDetails):
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -643,7 +643,7 @@ class FabricDetailsByName(FabricDetails):
         - A dictionary of the fabric matching self.filter.
         - Empty dictionary, if the fabric does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.filter:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filter must be set before accessing "
@@ -755,7 +755,7 @@ class FabricDetailsByNvPair(FabricDetails):
                 -   ``filter_key`` has not been set.
                 -   ``filter_value`` has not been set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not self.filter_key:
             msg = f"{self.class_name}.{method_name}: "
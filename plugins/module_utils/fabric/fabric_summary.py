@@ -131,11 +131,12 @@ class FabricSummary(FabricCommon):
         -   By the time refresh() calls this method, self.data
             has been verified, so no need to verify it here.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
-        msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self._border_gateway_count = self.data.get("switchRoles", {}).get(
             "border gateway", 0
@@ -169,7 +170,7 @@ class FabricSummary(FabricCommon):
         -  Raise ``ControllerResponseError`` if RETURN_CODE != 200.
         -  Raise ``ControllerResponseError`` if DATA is missing or empty.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # pylint: disable=no-member
         controller_return_code = self.rest_send.response_current.get(
@@ -203,7 +204,7 @@ class FabricSummary(FabricCommon):
         -   raise ``ControllerResponseError`` if the controller
             ``RETURN_CODE`` != 200
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_name prior to calling "
@@ -233,8 +234,9 @@ class FabricSummary(FabricCommon):
         self.rest_send.check_mode = save_check_mode
         self.data = copy.deepcopy(self.rest_send.response_current.get("DATA", {}))
 
-        msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self.results.response_current = self.rest_send.response_current
         self.results.response = self.rest_send.response_current
@@ -269,7 +271,7 @@ class FabricSummary(FabricCommon):
         - Return raw fabric summary data from the controller.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -282,7 +284,7 @@ class FabricSummary(FabricCommon):
         - Return the number of border gateway devices in fabric fabric_name.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -295,7 +297,7 @@ class FabricSummary(FabricCommon):
         - Return the total number of devices in fabric fabric_name.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -308,7 +310,7 @@ class FabricSummary(FabricCommon):
         - Return True if the fabric is empty.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -342,7 +344,7 @@ class FabricSummary(FabricCommon):
         - Return the number of leaf devices in fabric fabric_name.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -355,7 +357,7 @@ class FabricSummary(FabricCommon):
         - Return the number of spine devices in fabric fabric_name.
         - Raise ``ValueError`` if ``refresh()`` has not been called.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -143,11 +143,12 @@ class FabricSummary:
 
         - `self.data` is empty.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
-        msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if not self.data:
             msg = f"{self.class_name}.{method_name}: "
@@ -194,7 +195,7 @@ class FabricSummary:
         -  RETURN_CODE != 200.
         -  DATA is missing or empty.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         controller_return_code = self._rest_send.response_current.get("RETURN_CODE", None)
         controller_message = self._rest_send.response_current.get("MESSAGE", None)
@@ -235,7 +236,7 @@ class FabricSummary:
 
         - The controller `RETURN_CODE` != 200
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if self.fabric_name == "":
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_name prior to calling "
@@ -263,8 +264,9 @@ class FabricSummary:
         self._rest_send.commit()
         self._rest_send.check_mode = save_check_mode
         self.data = copy.deepcopy(self._rest_send.response_current.get("DATA", {}))
-        msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"self.data: {json.dumps(self.data, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self.results.response_current = self._rest_send.response_current
         self.results.result_current = self._rest_send.result_current
@@ -315,7 +317,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -335,7 +337,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -355,7 +357,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -375,7 +377,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -422,7 +424,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
@@ -449,12 +451,12 @@ class FabricSummary:
 
         Set an instance of the RestSend class.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         return self._rest_send
 
     @rest_send.setter
     def rest_send(self, value: RestSend) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["RestSend"] = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -492,7 +494,7 @@ class FabricSummary:
 
     @results.setter
     def results(self, value: Results) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have: str = ""
         _class_need: Literal["Results"] = "Results"
         msg = f"{self.class_name}.{method_name}: "
@@ -520,7 +522,7 @@ class FabricSummary:
 
         - `refresh()` has not been called.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self.verify_refresh_has_been_called(method_name)
         except ValueError as error:
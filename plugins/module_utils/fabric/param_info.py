@@ -62,6 +62,10 @@ class ParamInfo:
     parameter_max = my_parameter_info["max"] # int, or None
     parameter_default = my_parameter_info["default"] # Any, or None
     ```
+
+    Parameter information is built once per template.  Calling refresh()
+    again with the same template reuses it.  Templates must not be
+    modified after they are passed to ``ParamInfo``.
     """
 
     def __init__(self):
@@ -71,6 +75,9 @@ class ParamInfo:
         self.conversion = ConversionUtils()
 
         self.info = {}
+        # info already built, keyed on id(template).  The template is
+        # stored alongside its info so that its id cannot be reused.
+        self._infos = {}
         self._init_properties()
 
     def _init_properties(self):
@@ -91,7 +98,7 @@ class ParamInfo:
 
     @template.setter
     def template(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be a dict. "
@@ -107,8 +114,10 @@ class ParamInfo:
         - raise ValueError if template is not set
         - raise ValueError if template has no parameters key
         - raise ValueError if template[parameters] is not a list
+        - Reuse the parameter information already built for this
+          template, if any.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         if self.template is None:
             msg += "Call instance.template before calling instance.refresh()."
@@ -120,7 +129,13 @@ class ParamInfo:
             msg += "template['parameters'] is not a list."
             raise ValueError(msg)
 
+        cached = self._infos.get(id(self.template))
+        if cached is not None and cached[0] is self.template:
+            self.info = cached[1]
+            return
+
         self._build_info()
+        self._infos[id(self.template)] = (self.template, self.info)
 
     def parameter(self, value):
         """
@@ -156,7 +171,7 @@ class ParamInfo:
         - default: (``str``, ``int``, etc, or ``None``)
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             return self.info[value]
         except KeyError as error:
@@ -256,7 +271,7 @@ class ParamInfo:
         -   Return the ``name`` key from the parameter dict.
         -   Raise ``KeyError`` if ``name`` key is missing
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         param_name = parameter.get("name", None)
         if param_name is None:
@@ -315,12 +330,13 @@ class ParamInfo:
         ```
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.info = {}
         for parameter in self.template.get("parameters", []):
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             param_name = self._get_param_name(parameter)
             if param_name not in self.info:
                 self.info[param_name] = {}
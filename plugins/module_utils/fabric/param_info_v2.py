@@ -116,7 +116,7 @@ class ParamInfo:
             - template has no parameters key
             - template[parameters] is not a list
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         if self.template is None:
             msg += "Call instance.template before calling instance.refresh()."
@@ -245,7 +245,7 @@ class ParamInfo:
 
         - None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         value = parameter.get("annotations", {}).get("DisplayName", None)
         if value is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -282,7 +282,7 @@ class ParamInfo:
         - `ValueError` if
             -   metaProperties.IsMandatory key is not found in the parameter dict and self.raise_on_missing is True
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         value = parameter.get("metaProperties", {}).get("IsMandatory", None)
         if value is None:
             value = parameter.get("annotations", {}).get("IsMandatory", None)
@@ -339,7 +339,7 @@ class ParamInfo:
         - `ValueError` if
             -   optional key is not found in the parameter dict and self.raise_on_missing is True.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         value = parameter.get("optional")
         if value is None and self.raise_on_missing:
             msg = f"{self.class_name}.{method_name}: "
@@ -377,7 +377,7 @@ class ParamInfo:
 
         - None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         value = parameter.get("annotations", {}).get("Section", None)
         value = re.sub('"', "", value) if value else value
         if value is None:
@@ -455,12 +455,13 @@ class ParamInfo:
         ```
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         self.info = {}
         for parameter in self.template.get("parameters", []):
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             param_name = self._get_param_name(parameter)
             if param_name not in self.info:
                 self.info[param_name] = {}
@@ -490,7 +491,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in self.info
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         if not self.template:
             msg += "Call instance.template before accessing getter properties."
@@ -518,7 +519,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["choices"]
@@ -541,7 +542,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["default"]
@@ -564,7 +565,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["description"]
@@ -587,7 +588,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["display_name"]
@@ -616,7 +617,7 @@ class ParamInfo:
 
         - annotations.IsInternal
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["internal"]
@@ -639,7 +640,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["mandatory"]
@@ -662,7 +663,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["max"]
@@ -685,7 +686,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["min"]
@@ -724,7 +725,7 @@ class ParamInfo:
         `ValueError` if:
             - template is not set
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         if not self.template:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.template before accessing parameter_names."
@@ -745,7 +746,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["optional"]
@@ -768,7 +769,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["type"]
@@ -791,7 +792,7 @@ class ParamInfo:
             - parameter_name is not set
             - parameter_name is not found in the template
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._validate_property_prerequisites()
             return self.info[self.parameter_name]["section"]
@@ -834,7 +835,7 @@ class ParamInfo:
 
     @template.setter
     def template(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be a dict. "
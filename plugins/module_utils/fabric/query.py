@@ -108,7 +108,7 @@ class FabricQuery(FabricCommon):
 
     @fabric_names.setter
     def fabric_names(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_names must be a list. "
@@ -141,7 +141,7 @@ class FabricQuery(FabricCommon):
             -   ``rest_send`` is not set.
             -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         if self.fabric_details is None:
             msg = f"{self.class_name}.{method_name}: "
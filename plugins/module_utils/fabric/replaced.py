@@ -201,7 +201,7 @@ class FabricReplacedCommon(FabricCommon):
         -   Raise ``ValueError`` if the value types differ between:
             playbook, controller, and default values.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         type_set = set()
         value_source_set = set()
         if user_value is not None:
@@ -251,7 +251,7 @@ class FabricReplacedCommon(FabricCommon):
         -   self.fabric_templates has already been populated in
             ``_build_payloads_for_replaced_state()``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         fabric_name = payload.get("FABRIC_NAME", None)
         fabric_type = payload.get("FABRIC_TYPE", None)
@@ -336,12 +336,13 @@ class FabricReplacedCommon(FabricCommon):
         self._fabric_changes_payload[fabric_name]["FABRIC_NAME"] = fabric_name
         self._fabric_changes_payload[fabric_name]["FABRIC_TYPE"] = fabric_type
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"fabric_name: {fabric_name}, "
-        msg += f"fabric_update_required: {self._fabric_update_required}, "
-        msg += "fabric_changes_payload: "
-        msg += f"{json.dumps(self._fabric_changes_payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"fabric_name: {fabric_name}, "
+            msg += f"fabric_update_required: {self._fabric_update_required}, "
+            msg += "fabric_changes_payload: "
+            msg += f"{json.dumps(self._fabric_changes_payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _build_fabric_templates(self):
         """
@@ -526,17 +527,18 @@ class FabricReplacedCommon(FabricCommon):
         - Send one fabric update payload
         - raise ``ValueError`` if the endpoint assignment fails
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             self._set_fabric_update_endpoint(payload)
         except ValueError as error:
             raise ValueError(error) from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"verb: {self.verb}, path: {self.path}, "
-        msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"verb: {self.verb}, path: {self.path}, "
+            msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         # We don't want RestSend to retry on errors since the likelihood of a
         # timeout error when updating a fabric is low, and there are many cases
@@ -578,7 +580,7 @@ class FabricReplacedCommon(FabricCommon):
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be a list of dict. "
@@ -652,7 +654,7 @@ class FabricReplacedBulk(FabricReplacedCommon):
         - raise ``ValueError`` if ``_build_payloads_for_replaced_state`` fails
         - raise ``ValueError`` if ``_send_payloads`` fails
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_details is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_details must be set prior to calling commit."
@@ -50,6 +50,9 @@ class RuleSetCommon:
         self.rule: Union[str, bool] = ""
         self._template: dict[str, Any] = {}
         self._ruleset: dict[str, Any] = {}
+        # Rulesets already built, keyed on id(template).  The template is
+        # stored alongside its ruleset so that its id cannot be reused.
+        self._rulesets: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
 
     def clean_rule(self) -> None:
         """
@@ -93,7 +96,7 @@ class RuleSetCommon:
 
     @template.setter
     def template(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary."
             raise ValueError(msg)
@@ -225,6 +228,13 @@ class RuleSet(RuleSetCommon):
     # Retrieve IsShow for "MY_PARAM"
     is_show = rule.is_show(parameter)
     ```
+
+    ## Caching
+
+    The ruleset is built once per template.  Calling ``refresh()`` again
+    with the same template (e.g. for each fabric of the same type) returns
+    the ruleset that was built for it.  Templates must not be modified
+    after they are passed to ``RuleSet``.
     """
 
     def _update_ruleset_no_boolean(self) -> None:
@@ -263,7 +273,7 @@ class RuleSet(RuleSetCommon):
         }
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"key {self.param_name}: {self.rule}"
         self.log.debug(msg)
 
@@ -290,9 +300,10 @@ class RuleSet(RuleSetCommon):
         term["value"] = rhs
         self.ruleset[self.param_name]["terms"]["na"].append(term)
 
-        msg = f"{self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset_multi_rule(self) -> None:
         """
@@ -354,7 +365,7 @@ class RuleSet(RuleSetCommon):
         }
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"key {self.param_name}: {self.rule}"
         self.log.debug(msg)
 
@@ -424,9 +435,10 @@ class RuleSet(RuleSetCommon):
 
             msg = f"{boolean_type.upper()}: key {self.param_name}: {new_rule}"
             self.log.debug(msg)
-            msg = f"{boolean_type.upper()}: key {self.param_name}: "
-            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{boolean_type.upper()}: key {self.param_name}: "
+                msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
     def _update_ruleset_boolean(self) -> None:
         """
@@ -514,9 +526,10 @@ class RuleSet(RuleSetCommon):
 
         msg = f"{boolean_type.upper()}: key {self.param_name}: {new_rule}"
         self.log.debug(msg)
-        msg = f"{boolean_type.upper()}: key {self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{boolean_type.upper()}: key {self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset(self) -> None:
         """
@@ -554,8 +567,9 @@ class RuleSet(RuleSetCommon):
         - raise ValueError if template is not set.
         - raise ValueError if template has no parameters.
         - raise ValueError if template[parameters] is not a list.
+        - Reuse the ruleset already built for this template, if any.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not self.template:
             msg = f"{self.class_name}.{method_name}: "
             msg += "template is not set.  "
@@ -571,6 +585,11 @@ class RuleSet(RuleSetCommon):
             msg += "template[parameters] is not a list."
             raise ValueError(msg)
 
+        cached = self._rulesets.get(id(self.template))
+        if cached is not None and cached[0] is self.template:
+            self._ruleset = cached[1]
+            return
+
         self._ruleset = {}
 
         for parameter in self.template["parameters"]:
@@ -585,3 +604,5 @@ class RuleSet(RuleSetCommon):
                 raise ValueError(msg)
             self.rule = self.is_show(parameter)
             self._update_ruleset()
+
+        self._rulesets[id(self.template)] = (self.template, self._ruleset)
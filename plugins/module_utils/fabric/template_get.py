@@ -44,6 +44,19 @@ class TemplateGet:
     template = instance.template
     ```
 
+    -   Caching
+
+    Templates are cached per instance, keyed on ``(template_name,
+    controller_version)``.  Calling ``refresh()`` again for a template
+    that was already retrieved returns the cached template without
+    sending a request to the controller.  Set ``controller_version``
+    so that a cached template is never reused for a different controller
+    version.  The cached template is shared between callers and must
+    not be modified.
+
+    Set ``template_cache`` to a ``TemplateCache()`` instance to also
+    persist templates on the Ansible control node between runs.
+
     TODO: We are not using the `results` property in this class. We should
     remove it or decide whether we want to record the results in the main
     task result.  If we do decide to remove it, we also need to remove the
@@ -65,9 +78,12 @@ class TemplateGet:
         self.result = []
         self.result_current = {}
 
+        self._cache = {}
+        self._controller_version = None
         self._rest_send = None
         self._results = None
         self._template = None
+        self._template_cache = None
         self._template_name = None
 
     def _set_template_endpoint(self) -> None:
@@ -76,7 +92,7 @@ class TemplateGet:
             the controller.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.template_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Set instance.template_name property before "
@@ -91,13 +107,14 @@ class TemplateGet:
 
     def refresh(self):
         """
-        -   Retrieve the template from the controller.
+        -   Retrieve the template from the controller, unless it is
+            already cached.
         -   raise ``ValueError`` if the template endpoint assignment fails
         -   raise ``ControllerResponseError`` if the controller
             ``RETURN_CODE`` != 200
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             self._set_template_endpoint()
@@ -111,16 +128,38 @@ class TemplateGet:
             self.log.debug(msg)
             raise ValueError(msg)
 
+        cache_key = (self.template_name, self.controller_version)
+        if cache_key in self._cache:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Using cached template {self.template_name}, "
+            msg += f"controller_version {self.controller_version}."
+            self.log.debug(msg)
+            self.template = self._cache[cache_key]
+            return
+
+        if self.template_cache is not None:
+            cached = self.template_cache.get(self.template_name)
+            if cached is not None:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Using template {self.template_name} "
+                msg += f"from the template cache at {self.template_cache.path}."
+                self.log.debug(msg)
+                self.template = {"parameters": cached["parameters"]}
+                self._cache[cache_key] = self.template
+                return
+
         self.rest_send.path = self.ep_template.path
         self.rest_send.verb = self.ep_template.verb
         self.rest_send.check_mode = False
         self.rest_send.timeout = 2
         self.rest_send.commit()
 
+        # The template response is large.  Copy it once and share the
+        # copy between response_current and response.
         self.response_current = copy.deepcopy(self.rest_send.response_current)
-        self.response.append(copy.deepcopy(self.rest_send.response_current))
+        self.response.append(self.response_current)
         self.result_current = copy.deepcopy(self.rest_send.result_current)
-        self.result.append(copy.deepcopy(self.rest_send.result_current))
+        self.result.append(self.result_current)
 
         controller_return_code = self.response_current.get("RETURN_CODE", None)
         controller_message = self.response_current.get("MESSAGE", None)
@@ -136,6 +175,32 @@ class TemplateGet:
         self.template["parameters"] = self.response_current.get("DATA", {}).get(
             "parameters", []
         )
+        self._cache[cache_key] = self.template
+        if self.template_cache is not None:
+            self.template_cache.put(self.template_name, self.response_current.get("DATA", {}))
+
+    @property
+    def controller_version(self):
+        """
+        -   getter: Return the controller version used to key the
+            template cache.
+        -   setter: Set the controller version used to key the
+            template cache.
+        -   setter: Raise ``TypeError`` if the value is not a str or None.
+        -   Default: None
+        """
+        return self._controller_version
+
+    @controller_version.setter
+    def controller_version(self, value) -> None:
+        method_name = inspect.currentframe().f_code.co_name
+        if value is not None and not isinstance(value, str):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "controller_version must be an instance of str, or None. "
+            msg += f"Got type: {type(value)} for value: {value}."
+            self.log.debug(msg)
+            raise TypeError(msg)
+        self._controller_version = value
 
     @property
     def template(self):
@@ -149,7 +214,7 @@ class TemplateGet:
 
     @template.setter
     def template(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be an instance of dict."
@@ -157,6 +222,30 @@ class TemplateGet:
             raise TypeError(msg)
         self._template = value
 
+    @property
+    def template_cache(self):
+        """
+        -   getter: Return the TemplateCache() instance used to persist
+            templates, or None.
+        -   setter: Set the TemplateCache() instance used to persist
+            templates.
+        -   setter: Raise ``TypeError`` if the value does not implement
+            template_cache_v1, and is not None.
+        -   Default: None
+        """
+        return self._template_cache
+
+    @template_cache.setter
+    def template_cache(self, value) -> None:
+        method_name = inspect.currentframe().f_code.co_name
+        if value is not None and getattr(value, "implements", None) != "template_cache_v1":
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "template_cache must implement template_cache_v1, or be None. "
+            msg += f"Got type: {type(value)} for value: {value}."
+            self.log.debug(msg)
+            raise TypeError(msg)
+        self._template_cache = value
+
     @property
     def template_name(self) -> str:
         """
@@ -170,7 +259,7 @@ class TemplateGet:
 
     @template_name.setter
     def template_name(self, value: str) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template_name must be an instance of str. "
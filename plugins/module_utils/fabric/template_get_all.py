@@ -77,7 +77,7 @@ class TemplateGetAll:
         - raise ``ControllerResponseError`` if RETURN_CODE != 200.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -122,7 +122,7 @@ class TemplateGetAll:
 
     @templates.setter
     def templates(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "templates must be an instance of dict."
@@ -118,7 +118,7 @@ class FabricUpdateCommon(FabricCommon):
         -   We've already verified that the fabric exists on the
             controller in ``_build_payloads_for_merged_state()``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         fabric_name = payload.get("FABRIC_NAME", None)
 
@@ -217,12 +217,13 @@ class FabricUpdateCommon(FabricCommon):
             self._remove_nd4x_problematic_keys(full_payload)
             self._fabric_changes_payload[fabric_name] = full_payload
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"fabric_name: {fabric_name}, "
-        msg += f"fabric_update_required: {self._fabric_update_required}, "
-        msg += "fabric_changes_payload: "
-        msg += f"{json.dumps(self._fabric_changes_payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"fabric_name: {fabric_name}, "
+            msg += f"fabric_update_required: {self._fabric_update_required}, "
+            msg += "fabric_changes_payload: "
+            msg += f"{json.dumps(self._fabric_changes_payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _build_payloads_for_merged_state(self):
         """
@@ -336,17 +337,18 @@ class FabricUpdateCommon(FabricCommon):
         - Send one fabric update payload
         - raise ``ValueError`` if the endpoint assignment fails
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             self._set_fabric_update_endpoint(payload)
         except ValueError as error:
             raise ValueError(error) from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"verb: {self.verb}, path: {self.path}, "
-        msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"verb: {self.verb}, path: {self.path}, "
+            msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         # We don't want RestSend to retry on errors since the likelihood of a
         # timeout error when updating a fabric is low, and there are many cases
@@ -388,7 +390,7 @@ class FabricUpdateCommon(FabricCommon):
 
     @controller_version.setter
     def controller_version(self, value: ControllerVersion) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # Use duck-typing to allow mock objects in unit tests
         if not hasattr(value, "is_controller_version_4x"):
             msg = f"{self.class_name}.{method_name}: "
@@ -413,7 +415,7 @@ class FabricUpdateCommon(FabricCommon):
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be a list of dict. "
@@ -487,7 +489,7 @@ class FabricUpdateBulk(FabricUpdateCommon):
         - raise ``ValueError`` if ``_build_payloads_for_merged_state`` fails
         - raise ``ValueError`` if ``_send_payloads`` fails
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.fabric_details is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_details must be set prior to calling commit."
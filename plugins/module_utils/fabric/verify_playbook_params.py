@@ -24,12 +24,23 @@ __author__ = "Allen Robel"
 import inspect
 import json
 import logging
+import operator
 from typing import Any, Callable, Union
 
 from ..common.conversion import ConversionUtils
 from .param_info import ParamInfo
 from .ruleset import RuleSet
 
+# Comparison operators supported in fabric template rules.
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
 
 class VerifyPlaybookParams:
     """
@@ -136,7 +147,7 @@ class VerifyPlaybookParams:
         -   getter: `ValueError` if config_controller is not set.
         -   getter: `TypeError` if config_controller is not a dict.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if self._config_controller is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "config_controller must be set prior to accessing."
@@ -145,7 +156,7 @@ class VerifyPlaybookParams:
 
     @config_controller.setter
     def config_controller(self, value: Union[dict[str, Any], None]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if value is None:
             self._config_controller = {}
             return
@@ -168,7 +179,7 @@ class VerifyPlaybookParams:
 
     @config_playbook.setter
     def config_playbook(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "config_playbook must be a dict. "
@@ -188,7 +199,7 @@ class VerifyPlaybookParams:
 
     @template.setter
     def template(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be a dict. "
@@ -215,7 +226,7 @@ class VerifyPlaybookParams:
         ```
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"rule: {rule}"
@@ -233,8 +244,8 @@ class VerifyPlaybookParams:
             msg += f"'user_value' not found in parameter {parameter} rule: {rule}"
             raise KeyError(msg)
 
-        operator: str = rule.get("operator", "")
-        if not operator:
+        rule_operator: str = rule.get("operator", "")
+        if not rule_operator:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"'operator' not found in parameter {parameter} rule: {rule}"
             raise KeyError(msg)
@@ -251,7 +262,7 @@ class VerifyPlaybookParams:
         msg = f"{self.class_name}.{method_name}: "
         msg += f"parameter: {parameter}, "
         msg += f"user_value: {user_value}, "
-        msg += f"operator: {operator}, "
+        msg += f"operator: {rule_operator}, "
         msg += f"rule_value: {rule_value}"
         self.log.debug(msg)
 
@@ -266,26 +277,17 @@ class VerifyPlaybookParams:
             self.log.debug(msg)
             raise ValueError(msg)
 
-        operators: dict[str, Callable[[Any, Any], bool]] = {
-            "==": lambda a, b: a == b,
-            "!=": lambda a, b: a != b,
-            ">": lambda a, b: a > b,
-            "<": lambda a, b: a < b,
-            ">=": lambda a, b: a >= b,
-            "<=": lambda a, b: a <= b,
-        }
-
-        if operator not in operators:
+        if rule_operator not in OPERATORS:
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Unsupported operator: {operator}"
+            msg += f"Unsupported operator: {rule_operator}"
             raise ValueError(msg)
 
-        result = operators[operator](user_value, rule_value)
+        result = OPERATORS[rule_operator](user_value, rule_value)
 
         msg = f"{self.class_name}.{method_name}: "
         msg += "EVAL: "
         msg += f"{user_value} "
-        msg += f"{operator} "
+        msg += f"{rule_operator} "
         msg += f"{rule_value} "
         msg += f"result: {result}"
         self.log.debug(msg)
@@ -309,11 +311,12 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"item: {json.dumps(item, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"item: {json.dumps(item, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         rule_parameter: str = item.get("parameter", "")
         rule_value: Any = item.get("value", None)
@@ -375,7 +378,7 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         rule_parameter = item.get("parameter", None)
         rule_value = item.get("value", None)
@@ -424,7 +427,7 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         rule_parameter: str = item.get("parameter", "")
         rule_value: Any = item.get("value", None)
@@ -498,7 +501,7 @@ class VerifyPlaybookParams:
            - playbook_param_is_valid()
            - default_param_is_valid()
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         decision_set: set[bool] = set()
 
         msg = f"{self.class_name}.{method_name}: "
@@ -605,7 +608,7 @@ class VerifyPlaybookParams:
         -   Raise ``ValueError`` for all parameters, if the parameter value
             is a boolean string.
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         playbook_value = self.config_playbook.get(self.parameter)
 
         # Skip "local" parameters i.e. parameters that are valid in a
@@ -683,23 +686,25 @@ class VerifyPlaybookParams:
         -   ``ValueError`` if an unsupported rules_operator is encountered.
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED update_decision_set_for_multi_rules()"
         self.log.debug(msg)
 
         rules_operator: str = param_rule.get("operator", "")
         boolean_operator: str = ""
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "param_rule:"
-        msg += f"{json.dumps(param_rule, indent=4, sort_keys=True)}"
-        msg += f"rules_operator: {rules_operator}"
-        self.log.debug(msg)
-        for rule in param_rule.get("rules", []):
+        if self.log.isEnabledFor(logging.DEBUG):
             msg = f"{self.class_name}.{method_name}: "
-            msg += "Processing rule: "
-            msg += f"{json.dumps(rule, indent=4, sort_keys=True)}"
+            msg += "param_rule:"
+            msg += f"{json.dumps(param_rule, indent=4, sort_keys=True)}"
+            msg += f"rules_operator: {rules_operator}"
             self.log.debug(msg)
+        for rule in param_rule.get("rules", []):
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "Processing rule: "
+                msg += f"{json.dumps(rule, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             if "and" in rule.get("terms", ""):
                 boolean_operator = "and"
             elif "or" in rule.get("terms", ""):
@@ -774,7 +779,7 @@ class VerifyPlaybookParams:
 
         -   `KeyError` if an error is encountered while updating the decision set.
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         for item in param_rule.get("terms", {}).get("and"):
             try:
                 decision_set = self.update_decision_set(item)
@@ -819,7 +824,7 @@ class VerifyPlaybookParams:
         -   `KeyError` if an error is encountered while updating the decision set.
         -   `ValueError` if an unexpected number of dependent parameters are found in param_rule.
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         decision_set: set[bool] = set()
         # valid_values is used in the error message for OR'd parameters
@@ -890,7 +895,7 @@ class VerifyPlaybookParams:
             - ["na"]["terms")
         - `ValueError` if the rule["na"]["terms"] does not contain one element
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         if len(param_rule.get("terms", {}).get("na")) != 1:
             msg = f"{self.class_name}.{method_name}: "
@@ -936,7 +941,7 @@ class VerifyPlaybookParams:
         -   `ValueError` if FABRIC_NAME is not present in the playbook.
         -   `ValueError` if the parameter does not match any of the valid values specified in the template for the parameter
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         # self.fabric_name is used in:
         #   - bad_params to help the user identify which fabric contains the bad parameter(s)
@@ -1021,7 +1026,7 @@ class VerifyPlaybookParams:
 
         - `ValueError` if required parameters are not set
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if self.config_controller is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.config_controller "
@@ -1051,7 +1056,7 @@ class VerifyPlaybookParams:
         -   `TypeError` if the template is not a dict
         -   `ValueError` if ParamInfo.refresh() fails
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             self._param_info.template = self.template
         except TypeError as error:
@@ -1062,10 +1067,11 @@ class VerifyPlaybookParams:
         except ValueError as error:
             raise ValueError(error) from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "self._param_info.info: "
-        msg += f"{json.dumps(self._param_info.info, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "self._param_info.info: "
+            msg += f"{json.dumps(self._param_info.info, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def update_ruleset(self) -> None:
         """
@@ -1077,15 +1083,16 @@ class VerifyPlaybookParams:
 
         - None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         self._ruleset.template = self.template
         self._ruleset.refresh()
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "self._ruleset.ruleset: "
-        msg += f"{json.dumps(self._ruleset.ruleset, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "self._ruleset.ruleset: "
+            msg += f"{json.dumps(self._ruleset.ruleset, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def generate_error_message(self) -> None:
         """
@@ -1157,9 +1164,10 @@ class VerifyPlaybookParams:
         except (TypeError, ValueError) as error:
             raise ValueError(error) from error
 
-        msg = "self.config_playbook: "
-        msg += f"{json.dumps(self.config_playbook, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.config_playbook: "
+            msg += f"{json.dumps(self.config_playbook, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self.params_are_valid = set()
         for self.parameter in self.config_playbook:
@@ -113,7 +113,7 @@ class FabricGroupCommon:
             `payload["nvPairs"]`.
         -   This method checks both locations to support both fabric types.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         for payload in self._payloads_to_commit:
             # Determine where ANYCAST_GW_MAC is located
             if "ANYCAST_GW_MAC" in payload:
@@ -139,7 +139,7 @@ class FabricGroupCommon:
         """
         Raise ``ValueError`` if BGP_AS is not a valid BGP ASN.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         for payload in self._payloads_to_commit:
             if "BGP_AS" not in payload:
                 continue
@@ -176,7 +176,7 @@ class FabricGroupCommon:
         - raise ``ValueError`` if the payload is not a dict
         - raise ``ValueError`` if the payload is missing mandatory keys
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if self.action not in {"fabric_group_create", "fabric_group_replace", "fabric_group_update"}:
             return
         msg = f"{self.class_name}.{method_name}: "
@@ -253,7 +253,7 @@ class FabricGroupCommon:
 
     @fabric_group_type.setter
     def fabric_group_type(self, value: str) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if value not in self.fabric_group_types.valid_fabric_group_types:
             msg: str = f"{self.class_name}.{method_name}: "
             msg += "fabric_group_type must be one of "
@@ -100,7 +100,7 @@ class FabricGroupConfigDeploy:
             can be deployed.
         -   Set self.fabric_can_be_deployed to False otherwise.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.fabric_can_be_deployed = False
 
@@ -195,7 +195,7 @@ class FabricGroupConfigDeploy:
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not self.fabric_name:
             msg = f"{self.class_name}.{method_name}: "
@@ -301,7 +301,7 @@ class FabricGroupConfigDeploy:
 
     @fabric_details.setter
     def fabric_details(self, value: FabricDetailsByName) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "fabric_details must be an instance of FabricDetailsByName. "
         try:
@@ -327,7 +327,7 @@ class FabricGroupConfigDeploy:
 
     @fabric_summary.setter
     def fabric_summary(self, value: FabricSummary) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "fabric_summary must be an instance of FabricSummary. "
         try:
@@ -352,7 +352,7 @@ class FabricGroupConfigDeploy:
 
     @payload.setter
     def payload(self, value: dict) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
@@ -144,7 +144,7 @@ class FabricGroupConfigSave:
         -   Save the fabric configuration to the controller.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # pylint: disable=no-member
 
         if not self.payload:
@@ -228,7 +228,7 @@ class FabricGroupConfigSave:
 
     @payload.setter
     def payload(self, value: dict) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
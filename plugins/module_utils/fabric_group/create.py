@@ -154,7 +154,7 @@ class FabricGroupCreate(FabricGroupCommon):
 
         -  `ValueError` if `seed_member` is not a `dict`
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(seed_member, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "seed_member must be a dictionary."
@@ -258,7 +258,7 @@ class FabricGroupCreate(FabricGroupCommon):
             - `_build_payload_top_level` raises `ValueError`.
             - `FABRIC_NAME` is missing from any payload.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         self._fabric_groups.rest_send = self.rest_send
         self._fabric_groups.results = self.results
         self._fabric_groups.refresh()
@@ -339,7 +339,7 @@ class FabricGroupCreate(FabricGroupCommon):
         - raise ``ValueError`` if payload fixup fails.
         - raise ``ValueError`` if sending the payloads fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not self.rest_send.params:
             msg = f"{self.class_name}.{method_name}: "
@@ -384,7 +384,7 @@ class FabricGroupCreate(FabricGroupCommon):
 
     @payloads.setter
     def payloads(self, value: list[dict[str, Any]]):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"value: {value}"
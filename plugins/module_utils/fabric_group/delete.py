@@ -120,7 +120,7 @@ class FabricGroupDelete:
             -   Any fabric group in `fabric_group_names` cannot be deleted.
             -   Error querying fabric group details from the controller.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name} ENTERED"
         self.log.debug(msg)
 
@@ -148,7 +148,7 @@ class FabricGroupDelete:
         - Raise `ValueError` if the fabric cannot be deleted
         - Return otherwise
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name} ENTERED"
         self.log.debug(msg)
 
@@ -185,7 +185,7 @@ class FabricGroupDelete:
             - `rest_send.params` is not set
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name} ENTERED"
         self.log.debug(msg)
 
@@ -204,7 +204,7 @@ class FabricGroupDelete:
         - delete each of the fabrics in self.fabric_group_names
         - raise ``ValueError`` if any commit parameters are invalid
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name} ENTERED"
         self.log.debug(msg)
 
@@ -381,7 +381,7 @@ class FabricGroupDelete:
 
     @fabric_group_names.setter
     def fabric_group_names(self, value: list[str]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_group_names must be a list. "
@@ -66,7 +66,7 @@ class FabricGroupDefault:
     """
 
     def __init__(self) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -103,7 +103,7 @@ class FabricGroupDefault:
             -   `fabric_group_name` is not set.
             -   `rest_send` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg: str = ""
         if not self.fabric_group_name:
             msg = f"{self.class_name}.{method_name}: "
@@ -127,7 +127,7 @@ class FabricGroupDefault:
 
         -   `ValueError` if unable to retrieve template from controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg: str = f"{self.class_name}.{method_name}: "
         msg += f"Retrieving template: {self._template_name} from controller."
         self.log.debug(msg)
@@ -204,7 +204,7 @@ class FabricGroupDefault:
 
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg: str = f"{self.class_name}.{method_name}: "
         msg += "Building NV pairs for fabric group default config."
         self.log.debug(msg)
@@ -136,7 +136,7 @@ class FabricGroupDetails:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.response_current = self.rest_send.response_current
             self.results.result_current = self.rest_send.result_current
@@ -161,7 +161,7 @@ class FabricGroupDetails:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        # method_name = inspect.stack()[0][3]
+        # method_name = inspect.currentframe().f_code.co_name
         # if self._rest_send is None:
         #     msg = f"{self.class_name}.{method_name}: "
         #     msg += f"{self.class_name}.rest_send must be set before calling "
@@ -181,7 +181,7 @@ class FabricGroupDetails:
 
         Build self.data from the rest_send.response_current.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.data = {}
         new_data: dict = {}
@@ -246,7 +246,7 @@ class FabricGroupDetails:
         -   ``self.data`` is a dictionary of fabric details, keyed on
             fabric name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         if self._rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -317,7 +317,7 @@ class FabricGroupDetails:
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.fabric_group_name {self.fabric_group_name} "
@@ -355,7 +355,7 @@ class FabricGroupDetails:
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.fabric_group_name {self.fabric_group_name} "
@@ -677,7 +677,7 @@ class FabricGroupDetails:
         - A dictionary of the fabric group matching fabric_group_name.
         - Empty dictionary, if the fabric group does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.fabric_group_name:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.fabric_group_name must be set before accessing "
@@ -466,7 +466,7 @@ class FabricGroupMemberInfo:
         -   `ValueError`if:
                 -    `Results()` raises `TypeError`
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.response_current = self.rest_send.response_current
             self.results.result_current = self.rest_send.result_current
@@ -493,7 +493,7 @@ class FabricGroupMemberInfo:
                 -   `rest_send` is not set.
                 -   `results` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "ENTERED"
         self.log.debug(msg)
@@ -510,7 +510,7 @@ class FabricGroupMemberInfo:
 
         Build the self.data dictionary from the response DATA key.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if data is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "DATA key is missing from response."
@@ -559,7 +559,7 @@ class FabricGroupMemberInfo:
                 -   fabrics - dictionary of member fabrics
                 -   localGroupName
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.validate_refresh_parameters()
         except ValueError as error:
@@ -631,7 +631,7 @@ class FabricGroupMemberInfo:
                 -   ``refresh()`` has not been called.
                 -   ``self.data`` does not contain the members key.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"refresh() must be called before accessing {method_name}."
@@ -652,7 +652,7 @@ class FabricGroupMemberInfo:
                 -   ``refresh()`` has not been called.
                 -   ``self.data`` does not contain the members key.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"refresh() must be called before accessing {method_name}."
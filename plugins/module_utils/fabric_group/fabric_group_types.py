@@ -140,7 +140,7 @@ class FabricGroupTypes:
 
     @fabric_group_type.setter
     def fabric_group_type(self, value: str) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         if value not in self._valid_fabric_group_types:
             msg = f"{self.class_name}.{method_name}.setter: "
             msg += f"Invalid fabric group type: {value}. "
@@ -160,7 +160,7 @@ class FabricGroupTypes:
 
         -   `ValueError` if `fabric_group_type` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.fabric_group_type:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_group_type before accessing "
@@ -180,7 +180,7 @@ class FabricGroupTypes:
 
         -   `ValueError` if `fabric_group_type` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.fabric_group_type:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_group_type before accessing "
@@ -199,7 +199,7 @@ class FabricGroupTypes:
 
         -   `ValueError` if `fabric_group_type` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.fabric_group_type:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_group_type before accessing "
@@ -219,7 +219,7 @@ class FabricGroupTypes:
         -   `ValueError` if
             -   `fabric_group_type` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.fabric_group_type:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Set {self.class_name}.fabric_group_type before accessing "
@@ -582,7 +582,7 @@ class FabricGroups:
         -   ``ValueError``if:
                 -    ``Results()`` raises ``TypeError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.results.response_current = self.rest_send.response_current
             self.results.result_current = self.rest_send.result_current
@@ -627,7 +627,7 @@ class FabricGroups:
         -   `self.data` is a dictionary of fabric details, keyed on
             fabric group name.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.validate_refresh_parameters()
@@ -698,7 +698,7 @@ class FabricGroups:
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -736,7 +736,7 @@ class FabricGroups:
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -887,7 +887,7 @@ class FabricGroups:
         - e.g. ["FABRIC-1", "FABRIC-2", "FABRIC-3"]
         - [] (empty list) if no fabrics exist on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.refreshed is False:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.refresh() before accessing fabric_group_names."
@@ -1059,7 +1059,7 @@ class FabricGroups:
         - A dictionary of the fabric matching self.filter.
         - Empty dictionary, if the fabric does not exist on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not self.filter:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.filter must be set before accessing "
@@ -1093,7 +1093,7 @@ class FabricGroups:
         """
         An instance of the RestSend class.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self._rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "rest_send property has not been set."
@@ -1110,7 +1110,7 @@ class FabricGroups:
         """
         An instance of the Results class.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self._results is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "results property has not been set."
@@ -121,7 +121,7 @@ class FabricGroupQuery:
 
     @fabric_group_names.setter
     def fabric_group_names(self, value: list[str]) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_group_names must be a list. "
@@ -154,7 +154,7 @@ class FabricGroupQuery:
             -   ``rest_send`` is not set.
             -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         if self.fabric_group_details is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -167,7 +167,7 @@ class FabricGroupUpdate(FabricGroupCommon):
 
         -   `ValueError` if ANYCAST_GW_MAC translation fails.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -220,7 +220,7 @@ class FabricGroupUpdate(FabricGroupCommon):
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -252,7 +252,7 @@ class FabricGroupUpdate(FabricGroupCommon):
 
         1. For now, we assume all fabric groups are VXLAN MFD fabrics
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -285,7 +285,7 @@ class FabricGroupUpdate(FabricGroupCommon):
         None
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -344,7 +344,7 @@ class FabricGroupUpdate(FabricGroupCommon):
 
         -   `ValueError` if `_merge_payload` fails.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         self.fabric_groups.rest_send = self.rest_send
         self.fabric_groups.results = Results()
         self.fabric_groups.refresh()
@@ -396,7 +396,7 @@ class FabricGroupUpdate(FabricGroupCommon):
             -   `FabricUpdateCommon()._config_save()`
             -   `FabricUpdateCommon()._config_deploy()`
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -425,7 +425,7 @@ class FabricGroupUpdate(FabricGroupCommon):
             - The endpoint assignment fails
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         fabric_name: Union[str, None] = payload.get("nvPairs", {}).get("FABRIC_NAME", None)
         if not fabric_name:
@@ -490,7 +490,7 @@ class FabricGroupUpdate(FabricGroupCommon):
 
     @payloads.setter
     def payloads(self, value: list[dict[str, Any]]):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be a list of dict. "
@@ -527,7 +527,7 @@ class FabricGroupUpdate(FabricGroupCommon):
             -   `_build_payloads` fails
             -   `_send_payloads` fails
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg: str = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
 
@@ -81,7 +81,7 @@ class ImagePolicyCreateCommon:
         -   ``TypeError`` if payload is not a dict.
         -   ``ValueError`` if payload is missing mandatory keys.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(payload, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payload must be a dict. "
@@ -117,7 +117,7 @@ class ImagePolicyCreateCommon:
         Populate ``self._payloads_to_commit`` with a list of payloads
         to commit.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self._image_policies.rest_send = self.rest_send  # pylint: disable=no-member
         self._image_policies.refresh()
@@ -196,7 +196,7 @@ class ImagePolicyCreateCommon:
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         if not isinstance(value, list):
             msg += "payloads must be a list of dict. "
@@ -289,7 +289,7 @@ class ImagePolicyCreateBulk(ImagePolicyCreateCommon):
                 -   ``rest_send`` is not set prior to calling ``commit``.
                 -   ``results`` is not set prior to calling ``commit``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.params is None:  # pylint: disable=no-member
             msg = f"{self.class_name}.{method_name}: "
@@ -403,7 +403,7 @@ class ImagePolicyCreate(ImagePolicyCreateCommon):
                 -   ``rest_send`` is not set prior to calling ``commit``.
                 -   ``results`` is not set prior to calling ``commit``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.params is None:  # pylint: disable=no-member
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be set prior to calling commit."
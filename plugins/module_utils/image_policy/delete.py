@@ -103,7 +103,7 @@ class ImagePolicyDelete:
         -   ``instance`` : ImagePolicies() instance
         -   ``policy_names`` : list of policy names
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _non_zero_ref_counts = {}
         for policy_name in policy_names:
             instance.policy_name = policy_name
@@ -141,7 +141,7 @@ class ImagePolicyDelete:
         -   ``ValueError`` if any policy in policy_names has a ref_count
             greater than 0 (i.e. devices are using the policy).
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         # pylint: disable=no-member
         self._image_policies.rest_send = self.rest_send
         # pylint: enable=no-member
@@ -179,7 +179,7 @@ class ImagePolicyDelete:
                 -   ``rest_send`` is not set prior to calling commit.
                 -   ``results`` is not set prior to calling commit.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.params is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be set prior to calling commit."
@@ -212,7 +212,7 @@ class ImagePolicyDelete:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -263,7 +263,7 @@ class ImagePolicyDelete:
         - self.diff_nok     : list of payloads for which the request failed
         ```
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -321,7 +321,7 @@ class ImagePolicyDelete:
 
     @policy_names.setter
     def policy_names(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "policy_names must be a list. "
@@ -53,7 +53,7 @@ class Payload:
 
     @config.setter
     def config(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "config must be a dictionary. "
@@ -75,7 +75,7 @@ class Payload:
 
     @params.setter
     def params(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be a dictionary. "
@@ -97,7 +97,7 @@ class Payload:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payload must be a dictionary. "
@@ -136,7 +136,7 @@ class Config2Payload(Payload):
             -   ``params`` is not set.
             -   ``config`` is empty.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.params is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -200,7 +200,7 @@ class Payload2Config(Payload):
         ### Raises
         -   ``ValueError`` if payload is empty.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.payload == {}:
             msg = f"{self.class_name}.{method_name}: "
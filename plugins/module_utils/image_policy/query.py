@@ -95,7 +95,7 @@ class ImagePolicyQuery:
 
     @policy_names.setter
     def policy_names(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "policy_names must be a list. "
@@ -132,7 +132,7 @@ class ImagePolicyQuery:
         -   pylint: disable=no-member is needed due to the rest_send property
             being dynamically created by the @Properties.add_results decorator.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.params is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be set prior to calling commit."
@@ -204,7 +204,7 @@ class ImagePolicyQuery:
 
     @image_policies.setter
     def image_policies(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "ImagePolicies"
         msg = f"{self.class_name}.{method_name}: "
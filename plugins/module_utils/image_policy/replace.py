@@ -125,7 +125,7 @@ class ImagePolicyReplaceBulk:
         -   ``TypeError`` if payload is not a dict.
         -   ``ValueError`` if payload is missing mandatory keys.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(payload, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payload must be a dict. "
@@ -159,7 +159,7 @@ class ImagePolicyReplaceBulk:
         -   ``instance`` : ImagePolicies() instance
         -   ``policy_names`` : list of policy names
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _non_zero_ref_counts = {}
         for policy_name in policy_names:
             instance.policy_name = policy_name
@@ -190,7 +190,7 @@ class ImagePolicyReplaceBulk:
         ### Raises
         -   ``TypeError`` if policy_name is not a string.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(policy_name, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += "policy_name must be a string. "
@@ -223,7 +223,7 @@ class ImagePolicyReplaceBulk:
                 -   ``payloads`` is not set prior to calling commit.
                 -   ref_count for any policy is not 0.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         # pylint: disable=no-member
         self._image_policies.rest_send = self.rest_send
@@ -283,7 +283,7 @@ class ImagePolicyReplaceBulk:
         ### Raises
         -   ``ValueError`` if any payload is not sent successfully.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.rest_send.check_mode = self.params.get(  # pylint: disable=no-member
             "check_mode"
         )
@@ -311,7 +311,7 @@ class ImagePolicyReplaceBulk:
             and params properties are dynamically created by the
             @Properties class decorators.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"verb: {self.verb}, path: {self.path}, "
         msg += f"payload: {json.dumps(payload, indent=4, sort_keys=True)}"
@@ -361,7 +361,7 @@ class ImagePolicyReplaceBulk:
         -   ``ValueError`` if payloads, results, or rest_send are not set prior
             to calling commit.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.payloads is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"payloads must be set prior to calling {method_name}."
@@ -391,7 +391,7 @@ class ImagePolicyReplaceBulk:
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be a list of dict. "
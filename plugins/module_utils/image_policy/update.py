@@ -74,7 +74,7 @@ class ImagePolicyUpdateCommon:
         """
         Verify that the payload is a dict and contains all mandatory keys
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(payload, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payload must be a dict. "
@@ -106,7 +106,7 @@ class ImagePolicyUpdateCommon:
         Populates self._payloads_to_commit with a list of payloads
         to commit.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.payloads is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be set prior to calling commit."
@@ -169,7 +169,7 @@ class ImagePolicyUpdateCommon:
         -   ``instance`` : ImagePolicies() instance
         -   ``policy_names`` : list of policy names
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _non_zero_ref_counts = {}
         for policy_name in policy_names:
             instance.policy_name = policy_name
@@ -219,7 +219,7 @@ class ImagePolicyUpdateCommon:
             and params properties are dynamically created by the
             @Properties class decorators.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"verb: {self.verb}, path: {self.path}, "
@@ -261,7 +261,7 @@ class ImagePolicyUpdateCommon:
 
     @payloads.setter
     def payloads(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "payloads must be a list of dict. "
@@ -353,7 +353,7 @@ class ImagePolicyUpdateBulk(ImagePolicyUpdateCommon):
             and params properties are dynamically created by the
             @Properties class decorators.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.payloads is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"payloads must be set prior to calling {method_name}."
@@ -440,7 +440,7 @@ class ImagePolicyUpdate(ImagePolicyUpdateCommon):
         Update policy.
         If policy does not exist on the controller, do nothing.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.payload is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"payload must be set prior to calling {method_name}."
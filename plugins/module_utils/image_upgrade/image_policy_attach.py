@@ -80,7 +80,7 @@ class ImagePolicyAttach:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.action = "image_policy_attach"
         self.diff: dict = {}
@@ -109,7 +109,7 @@ class ImagePolicyAttach:
 
         caller _attach_policy()
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -151,7 +151,7 @@ class ImagePolicyAttach:
                 -   ``policy_name`` does not exist on the controller.
                 -   ``policy_name`` does not support the switch platform.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED"
         self.log.debug(msg)
@@ -189,7 +189,7 @@ class ImagePolicyAttach:
                 -   ``policy_name`` does not exist on the controller.
                 -   ``policy_name`` does not support the switch platform.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -229,7 +229,7 @@ class ImagePolicyAttach:
                 -   ``policy_name`` does not exist on the controller.
                 -   ``policy_name`` does not support the switch platform.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -271,7 +271,7 @@ class ImagePolicyAttach:
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.wait_for_controller_done.items = set(copy.copy(self.serial_numbers))
             self.wait_for_controller_done.item_type = "serial_number"
@@ -289,7 +289,7 @@ class ImagePolicyAttach:
         ### Summary
         Build the diff for the task result.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -313,7 +313,7 @@ class ImagePolicyAttach:
         ### Raises
         -   ValueError: if the result of the POST request is not successful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -381,7 +381,7 @@ class ImagePolicyAttach:
 
     @serial_numbers.setter
     def serial_numbers(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.serial_numbers must be a "
@@ -409,7 +409,7 @@ class ImagePolicyAttach:
 
     @check_interval.setter
     def check_interval(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -436,7 +436,7 @@ class ImagePolicyAttach:
 
     @check_timeout.setter
     def check_timeout(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -79,7 +79,7 @@ class ImagePolicyDetach:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -109,7 +109,7 @@ class ImagePolicyDetach:
         ### Raises
         -   ValueError: if the switch is not managed by the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -143,7 +143,7 @@ class ImagePolicyDetach:
         -   ValueError: if:
                 -   ``serial_numbers`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED"
         self.log.debug(msg)
@@ -178,7 +178,7 @@ class ImagePolicyDetach:
                     to complete.
                 -   The result of the DELETE request is not successful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -242,7 +242,7 @@ class ImagePolicyDetach:
         -   ``ControllerResponseError`` if:
                 -   The result of the DELETE request is not successful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -299,7 +299,7 @@ class ImagePolicyDetach:
 
     @serial_numbers.setter
     def serial_numbers(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.serial_numbers must be a "
@@ -327,7 +327,7 @@ class ImagePolicyDetach:
 
     @check_interval.setter
     def check_interval(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -354,7 +354,7 @@ class ImagePolicyDetach:
 
     @check_timeout.setter
     def check_timeout(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
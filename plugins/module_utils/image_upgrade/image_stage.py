@@ -133,7 +133,7 @@ class ImageStage:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -169,7 +169,7 @@ class ImageStage:
         ### Raises
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -196,7 +196,7 @@ class ImageStage:
         """
         Populate self.controller_version with the running controller version.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -209,7 +209,7 @@ class ImageStage:
         If the image is already staged on a switch, remove that switch's
         serial number from the list of serial numbers to stage.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers {self.serial_numbers}"
@@ -228,7 +228,7 @@ class ImageStage:
         Register a successful unchanged result with the results object.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -253,7 +253,7 @@ class ImageStage:
         -   ``ControllerResponseError`` if:
                 -   "imageStaged" is "Failed" for any serial_number.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
@@ -277,7 +277,7 @@ class ImageStage:
         """
         Verify mandatory parameters are set before calling commit.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -302,7 +302,7 @@ class ImageStage:
         ### Summary
         Build the payload for the image stage request.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -330,7 +330,7 @@ class ImageStage:
         -   ``ControllerResponseError`` if:
                 -   The controller response is unsuccessful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -422,7 +422,7 @@ class ImageStage:
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -451,7 +451,7 @@ class ImageStage:
                     seconds.
                 -   Image stage fails for any switch.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -517,7 +517,7 @@ class ImageStage:
 
     @serial_numbers.setter
     def serial_numbers(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "must be a python list of switch serial numbers."
@@ -546,7 +546,7 @@ class ImageStage:
 
     @check_interval.setter
     def check_interval(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -574,7 +574,7 @@ class ImageStage:
 
     @check_timeout.setter
     def check_timeout(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -30,6 +30,7 @@ from ..common.exceptions import ControllerResponseError
 from ..common.properties import Properties
 from ..common.results import Results
 from ..image_upgrade.install_options import ImageInstallOptions
+from .issu_progress_tracker import IssuProgressTracker
 from .switch_issu_details import SwitchIssuDetailsByIpAddress
 from .wait_for_controller_done import WaitForControllerDone
 
@@ -158,7 +159,7 @@ class ImageUpgrade:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -175,6 +176,7 @@ class ImageUpgrade:
         self.ep_upgrade_image = EpUpgradeImage()
         self.install_options = ImageInstallOptions()
         self.issu_detail = SwitchIssuDetailsByIpAddress()
+        self.progress = IssuProgressTracker()
         self.wait_for_controller_done = WaitForControllerDone()
 
         self._rest_send = None
@@ -232,7 +234,7 @@ class ImageUpgrade:
         ### Raises
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -250,6 +252,7 @@ class ImageUpgrade:
             self.diff[ipv4]["logical_name"] = self.issu_detail.device_name
             self.diff[ipv4]["policy_name"] = self.issu_detail.policy
             self.diff[ipv4]["serial_number"] = self.issu_detail.serial_number
+            self.diff[ipv4]["progress"] = self.progress.timelines.get(ipv4, [])
             msg = f"{self.class_name}.{method_name}: "
             msg += f"self.diff[{ipv4}]: "
             msg += f"{json.dumps(self.diff[ipv4], indent=4)}"
@@ -263,7 +266,7 @@ class ImageUpgrade:
             switches which can be upgraded.  This is used in
             _wait_for_current_actions_to_complete
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}: "
         msg = f"self.devices: {json.dumps(self.devices, indent=4, sort_keys=True)}"
@@ -292,7 +295,7 @@ class ImageUpgrade:
         """
         Build the request payload to upgrade the switches.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"device {device}"
@@ -340,7 +343,7 @@ class ImageUpgrade:
         """
         Build the issuUpgrade portion of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -358,7 +361,7 @@ class ImageUpgrade:
         """
         Build the issuUpgradeOptions1 portion of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -394,7 +397,7 @@ class ImageUpgrade:
         """
         Build the issuUpgradeOptions2 portion of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -417,7 +420,7 @@ class ImageUpgrade:
         """
         Build the epldUpgrade and epldOptions portions of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -467,7 +470,7 @@ class ImageUpgrade:
         """
         Build the reboot portion of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -486,7 +489,7 @@ class ImageUpgrade:
         """
         Build the rebootOptions portion of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -516,7 +519,7 @@ class ImageUpgrade:
         """
         Build the packageInstall and packageUnInstall portions of the payload.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -553,7 +556,7 @@ class ImageUpgrade:
         Verify mandatory parameters are set before calling commit.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -579,7 +582,7 @@ class ImageUpgrade:
         -   ``ValueError`` if:
                 -   ``RestSend()`` raises a ``TypeError`` or ``ValueError``.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -675,7 +678,7 @@ class ImageUpgrade:
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -697,6 +700,9 @@ class ImageUpgrade:
         ### Summary
         Wait for image upgrade to complete
 
+        The controller is polled at an adaptive interval based on
+        ``check_interval``.  See ``IssuProgressTracker``.
+
         ### Raises
         -   ``ValueError`` if:
                 -   The upgrade does not complete within ``check_timeout``
@@ -704,7 +710,7 @@ class ImageUpgrade:
                 -   The upgrade fails for any device.
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -715,24 +721,29 @@ class ImageUpgrade:
             self.ipv4_done = set()
         timeout = self.check_timeout
 
+        self.progress = IssuProgressTracker()
+        self.progress.issu_details = self.issu_detail
+        self.progress.interval = self.check_interval
+
         while self.ipv4_done != self.ipv4_todo and timeout > 0:
+            interval = self.progress.next_interval(timeout)
             if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.check_interval)
-            timeout -= self.check_interval
+                sleep(interval)
+            timeout -= interval
             self.issu_detail.refresh()
 
-            for ipv4 in self.ip_addresses:
-                if ipv4 in self.ipv4_done:
-                    continue
-                self.issu_detail.filter = ipv4
-
-                ip_address = self.issu_detail.ip_address
-                device_name = self.issu_detail.device_name
-                upgrade_percent = self.issu_detail.upgrade_percent
-                upgrade_status = self.issu_detail.upgrade
-                serial_number = self.issu_detail.serial_number
+            pending = self.ipv4_todo - self.ipv4_done
+            self.progress.update(pending)
+            for ipv4 in sorted(pending):
+                upgrade_status = self.progress.switch(ipv4).get("upgrade")
 
                 if upgrade_status == "Failed":
+                    self.issu_detail.filter = ipv4
+                    ip_address = self.issu_detail.ip_address
+                    device_name = self.issu_detail.device_name
+                    upgrade_percent = self.issu_detail.upgrade_percent
+                    serial_number = self.issu_detail.serial_number
+
                     msg = f"{self.class_name}.{method_name}: "
                     msg += f"Seconds remaining {timeout}: upgrade image "
                     msg += f"{upgrade_status} for "
@@ -775,7 +786,7 @@ class ImageUpgrade:
 
     @bios_force.setter
     def bios_force(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.bios_force must be a boolean."
@@ -793,7 +804,7 @@ class ImageUpgrade:
 
     @config_reload.setter
     def config_reload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.config_reload must be a boolean."
@@ -817,7 +828,7 @@ class ImageUpgrade:
 
     @devices.setter
     def devices(self, value: list):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.devices must be a python list of dict. "
@@ -849,7 +860,7 @@ class ImageUpgrade:
 
     @disruptive.setter
     def disruptive(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.disruptive must be a boolean."
@@ -867,7 +878,7 @@ class ImageUpgrade:
 
     @epld_golden.setter
     def epld_golden(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.epld_golden must be a boolean."
@@ -885,7 +896,7 @@ class ImageUpgrade:
 
     @epld_upgrade.setter
     def epld_upgrade(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.epld_upgrade must be a boolean."
@@ -905,7 +916,7 @@ class ImageUpgrade:
 
     @epld_module.setter
     def epld_module(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             value = value.upper()
         except AttributeError:
@@ -931,7 +942,7 @@ class ImageUpgrade:
 
     @force_non_disruptive.setter
     def force_non_disruptive(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.force_non_disruptive must be a boolean."
@@ -949,7 +960,7 @@ class ImageUpgrade:
 
     @non_disruptive.setter
     def non_disruptive(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.non_disruptive must be a boolean."
@@ -967,7 +978,7 @@ class ImageUpgrade:
 
     @package_install.setter
     def package_install(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.package_install must be a boolean."
@@ -985,7 +996,7 @@ class ImageUpgrade:
 
     @package_uninstall.setter
     def package_uninstall(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.package_uninstall must be a boolean."
@@ -1003,7 +1014,7 @@ class ImageUpgrade:
 
     @reboot.setter
     def reboot(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.reboot must be a boolean."
@@ -1021,7 +1032,7 @@ class ImageUpgrade:
 
     @write_erase.setter
     def write_erase(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.write_erase must be a boolean."
@@ -1037,7 +1048,7 @@ class ImageUpgrade:
 
     @check_interval.setter
     def check_interval(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.{method_name} must be an integer."
         # isinstance(False, int) returns True, so we need first
@@ -1057,7 +1068,7 @@ class ImageUpgrade:
 
     @check_timeout.setter
     def check_timeout(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.{method_name} must be an integer."
         # isinstance(False, int) returns True, so we need first
@@ -90,7 +90,7 @@ class ImageValidate:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -126,7 +126,7 @@ class ImageValidate:
         ### Raises
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -154,7 +154,7 @@ class ImageValidate:
         """
         Build the payload for the image validation request
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
         self.log.debug(msg)
@@ -168,7 +168,7 @@ class ImageValidate:
         If the image is already validated on a switch, remove that switch's
         serial number from the list of serial numbers to validate.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers {self.serial_numbers}"
@@ -190,7 +190,7 @@ class ImageValidate:
         Register a successful unchanged result with the results object.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -211,7 +211,7 @@ class ImageValidate:
         -   ``ControllerResponseError`` if:
                 -   "validated" is "Failed" for any serial_number.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
@@ -241,7 +241,7 @@ class ImageValidate:
                 -   ``results`` is not set.
                 -   ``serial_numbers`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -274,7 +274,7 @@ class ImageValidate:
         -   ``ControllerResponseError`` if:
                 -   The controller response is unsuccessful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
@@ -362,7 +362,7 @@ class ImageValidate:
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -389,7 +389,7 @@ class ImageValidate:
                 -   The image validation does not complete within the timeout.
                 -   The image validation fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -479,7 +479,7 @@ class ImageValidate:
 
     @serial_numbers.setter
     def serial_numbers(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "must be a python list of switch serial numbers."
@@ -504,7 +504,7 @@ class ImageValidate:
 
     @non_disruptive.setter
     def non_disruptive(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         value = self.conversion.make_boolean(value)
         if not isinstance(value, bool):
@@ -529,7 +529,7 @@ class ImageValidate:
 
     @check_interval.setter
     def check_interval(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -556,7 +556,7 @@ class ImageValidate:
 
     @check_timeout.setter
     def check_timeout(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += "must be a positive integer or zero. "
         msg += f"Got value {value} of type {type(value)}."
@@ -154,7 +154,7 @@ class ImageInstallOptions:
 
     def __init__(self) -> None:
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -196,7 +196,7 @@ class ImageInstallOptions:
         ``ValueError`` if parameters are not set correctly.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.policy_name is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -228,7 +228,7 @@ class ImageInstallOptions:
         -   ``ControllerResponseError``: if the controller response is bad.
             e.g. 401, 500 error, etc.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self._validate_refresh_parameters()
 
@@ -356,7 +356,7 @@ class ImageInstallOptions:
 
     @policy_name.setter
     def policy_name(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.policy_name must be a string. Got {value}."
@@ -400,7 +400,7 @@ class ImageInstallOptions:
 
     @issu.setter
     def issu(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         value = self.conversion.make_boolean(value)
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
@@ -429,7 +429,7 @@ class ImageInstallOptions:
 
     @epld.setter
     def epld(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         value = self.conversion.make_boolean(value)
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
@@ -458,7 +458,7 @@ class ImageInstallOptions:
 
     @package_install.setter
     def package_install(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         value = self.conversion.make_boolean(value)
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
@@ -0,0 +1,235 @@
+#
+# Copyright (c) 2025 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import inspect
+import logging
+
+
+class IssuProgressTracker:
+    """
+    ### Summary
+    Track the progress of controller actions (image stage, validate,
+    upgrade) for a set of switches while polling the controller.
+
+    ``SwitchIssuDetails`` subclasses index the controller's issu data by
+    their filter key (``ipAddress``, ``serialNumber``, ``deviceName``) each
+    time ``refresh()`` is called.  ``update()`` reads the progress of every
+    pending item directly from that index, rather than setting
+    ``SwitchIssuDetails.filter`` and calling property getters per item.
+
+    ### Adaptive interval
+    ``next_interval()`` returns the number of seconds to wait before the
+    next refresh.
+
+    -   ``interval`` before the first refresh.
+    -   Half of ``interval`` (minimum 1) after a refresh in which any
+        tracked progress value changed for any item.
+    -   Otherwise, the previous interval doubled, up to four times
+        ``interval``.
+
+    Switches spend most of an upgrade reloading, when no progress values
+    change, so the controller is polled less often during that time and
+    more often while progress is being reported.
+
+    ### Timelines
+    ``timelines`` contains, for each item, the list of progress values seen
+    while polling.  An entry is added only when a value changes.  Each
+    entry contains ``elapsed``, the seconds returned by ``next_interval()``
+    up to that point, and the values of ``progress_keys``.
+
+    ### Raises
+    -   ``TypeError`` if:
+            -   ``interval`` is not an integer.
+    -   ``ValueError`` if:
+            -   ``issu_details`` is not set before calling ``update()``.
+            -   ``switch()`` is called for an item that does not exist
+                on the controller.
+
+    ### Usage
+    ```python
+    tracker = IssuProgressTracker()
+    tracker.issu_details = SwitchIssuDetailsByIpAddress()
+    tracker.interval = 10
+    while todo != done and timeout > 0:
+        interval = tracker.next_interval(timeout)
+        sleep(interval)
+        timeout -= interval
+        tracker.issu_details.refresh()
+        tracker.update(todo - done)
+        for item in todo - done:
+            if tracker.switch(item).get("upgrade") == "Success":
+                done.add(item)
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = self.__class__.__name__
+        method_name = inspect.currentframe().f_code.co_name
+
+        self.log = logging.getLogger(f"dcnm.{self.class_name}")
+
+        self.elapsed = 0
+        self.progressed = False
+        self.progress_keys = (
+            "imageStaged",
+            "imageStagedPercent",
+            "validated",
+            "validatedPercent",
+            "upgrade",
+            "upgradePercent",
+        )
+        self.timelines = {}
+
+        self.current_interval = None
+
+        self._interval = 5
+        self._issu_details = None
+
+        msg = f"ENTERED {self.class_name}().{method_name}"
+        self.log.debug(msg)
+
+    def next_interval(self, limit=None) -> int:
+        """
+        ### Summary
+        Return the number of seconds to wait before the next refresh and
+        add it to ``elapsed``.
+
+        If ``limit`` is not None, e.g. the seconds remaining before a
+        timeout, the returned value is at most ``limit`` (minimum 1).
+
+        ### Raises
+        None
+        """
+        if self.current_interval is None:
+            self.current_interval = self.interval
+        elif self.progressed:
+            self.current_interval = max(1, self.interval // 2)
+        else:
+            self.current_interval = min(self.current_interval * 2, self.interval * 4)
+        interval = self.current_interval
+        if limit is not None:
+            interval = max(1, min(interval, limit))
+        self.elapsed += interval
+        return interval
+
+    def update(self, items) -> None:
+        """
+        ### Summary
+        Record the progress of ``items`` from the most recent
+        ``issu_details.refresh()``.
+
+        ``progressed`` is set to ``True`` if any tracked progress value
+        changed for any item since the previous ``update()``.
+
+        ### Raises
+        -   ``ValueError`` if ``issu_details`` is not set.
+        """
+        method_name = inspect.currentframe().f_code.co_name
+
+        if self.issu_details is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "issu_details must be set before calling update()."
+            raise ValueError(msg)
+
+        self.progressed = False
+        index = self.issu_details.data_subclass
+        for item in items:
+            switch = index.get(item)
+            if switch is None:
+                continue
+            progress = {key: switch.get(key) for key in self.progress_keys}
+            timeline = self.timelines.setdefault(item, [])
+            if timeline:
+                previous = {key: timeline[-1].get(key) for key in self.progress_keys}
+                if previous == progress:
+                    continue
+                self.progressed = True
+            progress["elapsed"] = self.elapsed
+            timeline.append(progress)
+
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"elapsed {self.elapsed}, progressed {self.progressed}"
+        self.log.debug(msg)
+
+    def switch(self, item) -> dict:
+        """
+        ### Summary
+        Return the controller's issu data for ``item`` from the most recent
+        ``issu_details.refresh()``.
+
+        ### Raises
+        -   ``ValueError`` if ``item`` does not exist on the controller.
+        """
+        method_name = inspect.currentframe().f_code.co_name
+        switch = self.issu_details.data_subclass.get(item)
+        if switch is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{item} does not exist on the controller."
+            raise ValueError(msg)
+        return switch
+
+    def actions_in_progress(self, item) -> bool:
+        """
+        ### Summary
+        -   Return ``True`` if any actions are in progress for ``item``.
+        -   Return ``False`` otherwise.
+
+        ### Raises
+        -   ``ValueError`` if ``item`` does not exist on the controller.
+        """
+        switch = self.switch(item)
+        for action_key in ("imageStaged", "upgrade", "validated"):
+            if switch.get(action_key) == "In-Progress":
+                return True
+        return False
+
+    @property
+    def issu_details(self):
+        """
+        ### Summary
+        An instance of a ``SwitchIssuDetails`` subclass.  The caller is
+        responsible for calling ``issu_details.refresh()`` before calling
+        ``update()``.
+        """
+        return self._issu_details
+
+    @issu_details.setter
+    def issu_details(self, value):
+        self._issu_details = value
+
+    @property
+    def interval(self) -> int:
+        """
+        ### Summary
+        The configured polling interval, in seconds, on which
+        ``next_interval()`` is based.
+
+        ### Raises
+        -   ``TypeError`` if value is not an integer.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        method_name = inspect.currentframe().f_code.co_name
+        if isinstance(value, bool) or not isinstance(value, int):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"instance.{method_name} must be an integer."
+            raise TypeError(msg)
+        self._interval = value
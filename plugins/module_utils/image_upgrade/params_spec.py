@@ -56,7 +56,7 @@ class ParamsSpec:
         -   ``ValueError`` if:
                 -   ``params`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self._params is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -356,7 +356,7 @@ class ParamsSpec:
 
     @params.setter
     def params(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}.setter: "
             msg += "Invalid type. Expected dict but "
@@ -96,7 +96,7 @@ class SwitchIssuDetails:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -125,7 +125,7 @@ class SwitchIssuDetails:
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.rest_send must be set before calling "
@@ -142,7 +142,7 @@ class SwitchIssuDetails:
         ### Summary
         Refresh current issu details from the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -793,7 +793,7 @@ class SwitchIssuDetailsByIpAddress(SwitchIssuDetails):
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -812,7 +812,7 @@ class SwitchIssuDetailsByIpAddress(SwitchIssuDetails):
         None
         """
         self.refresh_super()
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.action = "switch_issu_details_by_ip_address"
 
         self.data_subclass = {}
@@ -830,7 +830,7 @@ class SwitchIssuDetailsByIpAddress(SwitchIssuDetails):
                 -   ``filter`` does not exist on the controller.
                 -   ``filter`` references an unknown property name.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -909,7 +909,7 @@ class SwitchIssuDetailsBySerialNumber(SwitchIssuDetails):
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.action = "switch_issu_details_by_serial_number"
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -929,7 +929,7 @@ class SwitchIssuDetailsBySerialNumber(SwitchIssuDetails):
         None
         """
         self.refresh_super()
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.data_subclass = {}
         for switch in self.rest_send.response_current["DATA"]["lastOperDataObject"]:
@@ -946,7 +946,7 @@ class SwitchIssuDetailsBySerialNumber(SwitchIssuDetails):
                 -   ``filter`` does not exist on the controller.
                 -   ``filter`` references an unknown property name.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -1035,7 +1035,7 @@ class SwitchIssuDetailsByDeviceName(SwitchIssuDetails):
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.action = "switch_issu_details_by_device_name"
 
         self.data_subclass = {}
@@ -1053,7 +1053,7 @@ class SwitchIssuDetailsByDeviceName(SwitchIssuDetails):
         None
         """
         self.refresh_super()
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.data_subclass = {}
         for switch in self.rest_send.response_current["DATA"]["lastOperDataObject"]:
@@ -1070,7 +1070,7 @@ class SwitchIssuDetailsByDeviceName(SwitchIssuDetails):
                 -   ``filter`` does not exist on the controller.
                 -   ``filter`` references an unknown property name.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -25,6 +25,7 @@ from time import sleep
 
 from ..common.properties import Properties
 from ..common.results import Results
+from .issu_progress_tracker import IssuProgressTracker
 from .switch_issu_details import (
     SwitchIssuDetailsByDeviceName,
     SwitchIssuDetailsByIpAddress,
@@ -40,6 +41,11 @@ class WaitForControllerDone:
 
     Actions include image staging, image upgrade, and image validation.
 
+    The controller is polled at an adaptive interval based on
+    ``rest_send.send_interval``.  See ``IssuProgressTracker``.
+    The progress of each item is available in ``timelines`` after
+    ``commit()``.
+
     ### Raises
     -   ``ValueError`` if:
             - Controller actions do not complete within ``rest_send.timeout`` seconds.
@@ -50,7 +56,7 @@ class WaitForControllerDone:
 
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -58,6 +64,7 @@ class WaitForControllerDone:
         self.done = set()
         self.todo = set()
         self.issu_details = None
+        self.progress = IssuProgressTracker()
 
         self._items = None
         self._item_type = None
@@ -99,7 +106,7 @@ class WaitForControllerDone:
                 - ``item_type`` is not set.
                 - ``rest_send`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
 
         if self.items is None:
@@ -132,7 +139,7 @@ class WaitForControllerDone:
                 -   ``rest_send`` is not set.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.verify_commit_parameters()
 
@@ -142,20 +149,28 @@ class WaitForControllerDone:
         self.todo = copy.copy(self.items)
         timeout = self.rest_send.timeout
 
+        self.progress = IssuProgressTracker()
+        self.progress.issu_details = self.issu_details
+        self.progress.interval = self.rest_send.send_interval
+
         while self.done != self.todo and timeout > 0:
+            interval = self.progress.next_interval(timeout)
             if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.rest_send.send_interval)
-            timeout -= self.rest_send.send_interval
+                sleep(interval)
+            timeout -= interval
 
             self.issu_details.refresh()
 
-            for item in self.todo:
-                if item in self.done:
-                    continue
-                self.issu_details.filter = item
-                if self.issu_details.actions_in_progress is False:
+            pending = self.todo - self.done
+            self.progress.update(pending)
+            for item in pending:
+                if self.progress.actions_in_progress(item) is False:
                     self.done.add(item)
 
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"timelines: {self.progress.timelines}"
+        self.log.debug(msg)
+
         if self.done != self.todo:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Timed out after {self.rest_send.timeout} seconds "
@@ -166,6 +181,15 @@ class WaitForControllerDone:
                 msg += f"{','.join(sorted(self.done))}."
             raise ValueError(msg)
 
+    @property
+    def timelines(self):
+        """
+        ### Summary
+        A dict, keyed on item, containing the progress values seen for
+        each item while waiting.  See ``IssuProgressTracker``.
+        """
+        return self.progress.timelines
+
     @property
     def items(self):
         """
@@ -16,15 +16,21 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import copy
+import hashlib
 import socket
 import json
 import time
 import html
 import re
 import os
-import sys
+import random
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ansible.module_utils.common import validation
-from ansible.module_utils.connection import Connection
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.tracer import get_tracer
 
 # Any third party module must be imported as shown. If not ansible sanity tests will fail
 try:
@@ -233,7 +239,7 @@ def get_fabric_inventory_details(module, fabric):
     count = 1
     while rc is False:
 
-        response = dcnm_send(module, method, path)
+        response = dcnm_send(module, method, path, cacheable=True)
 
         if not response.get("RETURN_CODE"):
             rc = True
@@ -294,7 +300,7 @@ def get_nd_fabric_inventory_details(module, nd_version, fabric, fabric_details):
     count = 1
     while rc is False:
 
-        response = dcnm_send(module, method, path)
+        response = dcnm_send(module, method, path, cacheable=True)
 
         if not response.get("RETURN_CODE"):
             rc = True
@@ -519,6 +525,10 @@ def get_fabric_details(module, fabric):
     Returns:
         dict: Fabric details
     """
+    fabric_data = dcnm_get_controller_context(module).get("fabrics", {}).get(fabric)
+    if fabric_data:
+        return fabric_data
+
     fabric_data = {}
     rc = False
     method = "GET"
@@ -559,6 +569,8 @@ def get_fabric_details(module, fabric):
         fabric_data = response.get("DATA")
         rc = True
 
+    if isinstance(fabric_data, dict) and fabric_data:
+        dcnm_set_controller_context(module, {"fabrics": {fabric: fabric_data}})
     return fabric_data
 
 
@@ -627,11 +639,25 @@ def get_nd_fabric_details(module, nd_version, fabric, fabric_details):
     return fabric_data
 
 
-def dcnm_send(module, method, path, data=None, data_type="json"):
+def dcnm_send(module, method, path, data=None, data_type="json", cacheable=False):
+
+    tracer = get_tracer()
+    if not tracer.recording:
+        return _dcnm_send(module, method, path, data, data_type, cacheable)
+
+    start = tracer.now()
+    response = _dcnm_send(module, method, path, data, data_type, cacheable)
+    tracer.request("dcnm_send", method, path, response, start, module=module)
+    return response
+
+
+def _dcnm_send(module, method, path, data, data_type, cacheable):
 
     conn = Connection(module._socket_path)
 
     if data_type == "json":
+        if cacheable:
+            return conn.send_cacheable_request(method, path, data)
         return conn.send_request(method, path, data)
     elif data_type == "urlencoded":
         return conn.send_urlencoded_request(method, path, data)
@@ -639,6 +665,26 @@ def dcnm_send(module, method, path, data=None, data_type="json"):
         return conn.send_txt_request(method, path, data)
 
 
+def dcnm_get_response_cache_stats(module):
+    """
+    Return the GET response cache statistics of the persistent connection
+
+    Parameters:
+        module: Ansible module instance
+
+    Returns:
+        dict: hits, misses, invalidations and entries of the response cache,
+              or None if the response cache is disabled
+    """
+
+    if not module._socket_path:
+        return None
+
+    conn = Connection(module._socket_path)
+
+    return conn.get_response_cache_stats()
+
+
 def dcnm_reset_connection(module):
 
     conn = Connection(module._socket_path)
@@ -646,91 +692,321 @@ def dcnm_reset_connection(module):
     return conn.login(conn.get_option("remote_user"), conn.get_option("password"))
 
 
-def dcnm_version_supported(module):
+def dcnm_controller_context_call(obj, method, *args):
     """
-    Query DCNM/NDFC and return the major software version
+    Call a controller context method of the persistent connection used by obj, which
+    is either a module or an action plugin. Returns None if the connection does not
+    provide a controller context, for example because it uses another httpapi plugin.
+    Other errors are raised.
+    """
+
+    socket_path = getattr(obj, "_socket_path", None)
+    if not isinstance(socket_path, str):
+        socket_path = getattr(getattr(obj, "_connection", None), "socket_path", None)
+    if not isinstance(socket_path, str) or not socket_path:
+        return None
+
+    try:
+        return getattr(Connection(socket_path), method)(*args)
+    except ConnectionError:
+        return None
+
+
+def dcnm_get_controller_context(obj):
+    """
+    Return the controller context shared by the tasks that use the persistent
+    connection of obj, a module or an action plugin.
+
+    The controller context is computed once per host and reused until it expires,
+    so that modules and action plugins can skip probing the controller. See
+    get_controller_context() of the httpapi plugin for its contents.
 
     Parameters:
-        module: String representing the module
+        obj: Ansible module or action plugin instance
 
     Returns:
-        int: Major software version for DCNM/NDFC
+        dict: Controller context, empty if there is none
     """
 
-    method = "GET"
-    supported = None
-    data = None
+    context = dcnm_controller_context_call(obj, "get_controller_context")
+    return context if isinstance(context, dict) else {}
 
-    paths = [
+
+def dcnm_set_controller_context(obj, context):
+    """
+    Merge context into the controller context of the persistent connection of obj
+
+    Parameters:
+        obj: Ansible module or action plugin instance
+        context: dict of controller context keys to update
+    """
+
+    dcnm_controller_context_call(obj, "set_controller_context", context)
+
+
+class DcnmCapabilities(object):
+    """
+    Capabilities of the DCNM/NDFC controller used by a module
+
+    Each endpoint is only queried when a capability that depends on it is first asked
+    for, and at most once per module run, see for_module(): the version endpoints,
+    tried one after the other, for the capabilities that depend on the controller
+    version, the features endpoint for the controller features and the bulk-update
+    endpoint of a bulk API for its capability. The capabilities known so far are
+    stored in the controller context together with the controller version they were
+    derived from. The httpapi plugin discards them when the controller reports
+    another version or when features are changed on the controller.
+
+    The capability matrix holds the following keys:
+        raw_version: controller version string, e.g. 12.2.2
+        version: major controller version, e.g. 12
+        nd_version: major.minor controller version, 11.0 for any DCNM 11.x
+        ndfc_api: whether the /appcenter/cisco/ndfc/api/v1 endpoints are available
+        v2_api: whether any of the top-down v2 bulk APIs is available
+        bulk_network_api: whether the v2 bulk-update networks API is available
+        bulk_vrf_api: whether the v2 bulk-update vrfs API is available
+        onemanage: whether the onemanage (multi-cluster) APIs are available
+        onemanage_proxy: path prefix of the onemanage APIs
+        features: admin_state and oper_state of the controller features
+
+    Usage:
+        capabilities = DcnmCapabilities.for_module(module)
+        if capabilities.supports("bulk_network_api"):
+            ...
+    """
+
+    VERSION_PATHS = [
         "/fm/fmrest/about/version",
         "/appcenter/cisco/ndfc/api/about/version",
     ]
-    for path in paths:
-        response = dcnm_send(module, method, path)
-        if response["RETURN_CODE"] == 200:
-            data = response.get("DATA")
-            break
+    FEATURES_PATH = "/appcenter/cisco/ndfc/api/v1/fm/features"
+    # The bulk-update APIs only accept POST. A GET on them returns 405 when they exist
+    # and 404 when they do not, without changing anything on the controller.
+    BULK_API_PATHS = {
+        "bulk_network_api": "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/v2/bulk-update/networks",
+        "bulk_vrf_api": "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/v2/bulk-update/vrfs",
+    }
+    # Minimum nd_version of the capabilities that only depend on the controller version
+    VERSION_TABLE = {
+        "ndfc_api": 12.0,
+        "onemanage": 12.2,
+    }
+    ONEMANAGE_PROXY_VERSION = 12.4
+    # Instances shared by the callers of for_module() during a module run
+    _instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, module, refresh=False):
+        self.module = module
+        self.responses = {}
+        self.capabilities = {}
+        if not refresh:
+            capabilities = dcnm_get_controller_context(module).get("capabilities")
+            if isinstance(capabilities, dict):
+                self.capabilities = capabilities
+
+    @classmethod
+    def for_module(cls, module):
+        """Return the instance shared by all the callers during the run of module"""
 
-    if data:
+        try:
+            instance = cls._instances.get(module)
+        except TypeError:
+            return cls(module)
+        if instance is None:
+            instance = cls._instances[module] = cls(module)
+        return instance
+
+    def _get(self, path):
+        if path not in self.responses:
+            try:
+                self.responses[path] = dcnm_send(self.module, "GET", path)
+            except Exception:
+                self.responses[path] = None
+        return self.responses[path]
+
+    def refresh(self):
+        """Discard the known capabilities, so that they are queried again when asked for"""
+
+        self.responses = {}
+        self.capabilities = {}
+
+    def _probe(self, name):
+        """Query the endpoints that capability name depends on, unless it is already known"""
+
+        if name in self.capabilities:
+            return
+        if name in self.BULK_API_PATHS:
+            self._get(self.BULK_API_PATHS[name])
+        elif name == "v2_api":
+            for path in self.BULK_API_PATHS.values():
+                self._get(path)
+        else:
+            if "raw_version" not in self.capabilities:
+                for path in self.VERSION_PATHS:
+                    if self._response_version(self.responses):
+                        break
+                    self._get(path)
+                self._update()
+            if name == "features" and self.capabilities.get("ndfc_api"):
+                self._get(self.FEATURES_PATH)
+        self._update()
+
+    def _update(self):
+        """Merge the capabilities derived from the responses and store them in the controller context"""
+
+        capabilities = self.derive(self.responses, self.capabilities.get("raw_version"))
+        if not capabilities or all(self.capabilities.get(name) == value for name, value in capabilities.items()):
+            return
+        self.capabilities.update(capabilities)
+        context = {"capabilities": self.capabilities}
+        if "version" in self.capabilities:
+            context["version"] = self.capabilities["version"]
+            context["nd_version"] = self.capabilities["nd_version"]
+        if "bulk_network_api" in self.capabilities:
+            context["bulk_api"] = self.capabilities["bulk_network_api"]
+        dcnm_set_controller_context(self.module, context)
+
+    @classmethod
+    def _response_version(cls, responses):
+        for path in cls.VERSION_PATHS:
+            response = responses.get(path) or {}
+            if response.get("RETURN_CODE") == 200 and isinstance(response.get("DATA"), dict):
+                if response["DATA"].get("version"):
+                    return response["DATA"]["version"]
+        return None
+
+    @classmethod
+    def derive(cls, responses, raw_version=None):
+        """
+        Derive the capability matrix from the responses to the capability queries.
+        Capabilities whose endpoint has not been queried are left out, unless the
+        controller version already rules them out.
+
+        Parameters:
+            responses: dict of responses keyed by path, None for failed requests
+            raw_version: controller version string, if it is already known
+
+        Returns:
+            dict: capability matrix, None if no capability could be derived
+        """
+
+        capabilities = {}
+        ndfc_api = None
+
+        raw_version = raw_version or cls._response_version(responses)
         # Parse version information
         # Examples:
-        #   11.5(1), 12.0.1a'
-        # For these examples 11 or 12 would be returned
-        raw_version = data["version"]
+        #   11.5(1), 12.0.1a, 12.4.1.321
+        # For these examples 11 and 11.0, 12 and 12.0, or 12 and 12.4 would be derived
+        mo = re.search(r"^(\d+)\.(\d+)", "11.5(1)" if raw_version == "DEVEL" else raw_version or "")
+        if mo:
+            version = int(mo.group(1))
+            nd_version = 11.0 if version == 11 else float(mo.group(0))
+            capabilities.update(
+                {
+                    "raw_version": raw_version,
+                    "version": version,
+                    "nd_version": nd_version,
+                }
+            )
+            for name, minimum in cls.VERSION_TABLE.items():
+                capabilities[name] = nd_version >= minimum
+            capabilities["onemanage_proxy"] = "/onemanage" if nd_version >= cls.ONEMANAGE_PROXY_VERSION else ""
+            ndfc_api = capabilities["ndfc_api"]
+
+        for name, path in cls.BULK_API_PATHS.items():
+            if ndfc_api is False or path in responses:
+                response = responses.get(path)
+                capabilities[name] = bool(
+                    ndfc_api is not False and isinstance(response, dict) and response.get("RETURN_CODE") != 404
+                )
+        if all(name in capabilities for name in cls.BULK_API_PATHS):
+            capabilities["v2_api"] = any(capabilities[name] for name in cls.BULK_API_PATHS)
+
+        if ndfc_api is False or (ndfc_api and cls.FEATURES_PATH in responses):
+            # Same structure as the response processed by ControllerFeatures().refresh()
+            features = {}
+            response = responses.get(cls.FEATURES_PATH) or {}
+            if ndfc_api and response.get("RETURN_CODE") == 200 and isinstance(response.get("DATA"), dict):
+                for name, feature in (response["DATA"].get("data") or {}).get("features", {}).items():
+                    if isinstance(feature, dict):
+                        features[name] = {
+                            "admin_state": feature.get("admin_state"),
+                            "oper_state": feature.get("oper_state"),
+                        }
+            capabilities["features"] = features
 
-        if raw_version == "DEVEL":
-            raw_version = "11.5(1)"
+        return capabilities or None
 
-        regex = r"^(\d+)\.\d+"
-        mo = re.search(regex, raw_version)
-        if mo:
-            supported = int(mo.group(1))
+    @property
+    def version(self):
+        """Major controller version, None if unknown"""
+        return self.get("version")
 
-    if supported is None:
+    @property
+    def nd_version(self):
+        """major.minor controller version, None if unknown"""
+        return self.get("nd_version")
+
+    def get(self, name, default=None):
+        """Return the value of capability name, querying the controller for it if needed"""
+        self._probe(name)
+        return self.capabilities.get(name, default)
+
+    def supports(self, name):
+        """Return True if the controller has capability name"""
+        return self.get(name) is True
+
+    def feature_enabled(self, name):
+        """Return True if the admin_state of controller feature name is enabled"""
+        return self.get("features", {}).get(name, {}).get("admin_state") == "enabled"
+
+    def feature_started(self, name):
+        """Return True if the oper_state of controller feature name is started"""
+        return self.get("features", {}).get(name, {}).get("oper_state") == "started"
+
+
+def dcnm_version_supported(module):
+    """
+    Query DCNM/NDFC and return the major software version
+
+    Parameters:
+        module: String representing the module
+
+    Returns:
+        int: Major software version for DCNM/NDFC
+    """
+
+    capabilities = DcnmCapabilities.for_module(module)
+    if capabilities.version is None:
         msg = (
             "Unable to determine the DCNM/NDFC Software Version, "
             + "RESP = "
-            + str(response)
+            + str(capabilities.responses)
         )
         module.fail_json(msg=msg)
 
-    return supported
+    return capabilities.version
 
 
-def dcnm_get_bulk_api_support(module):
+def dcnm_get_bulk_api_support(module, entity="networks"):
     """
     Check if NDFC bulk API endpoints are available.
 
-    Tests for the presence of v2 bulk-update APIs by sending a POST
-    request to the bulk-update endpoint. This API was introduced in
-    NDFC 12.x with specific patches and may not be present in all
-    NDFC 12.x installations.
+    The v2 bulk-update APIs were introduced in NDFC 12.x with specific patches
+    and may not be present in all NDFC 12.x installations. See DcnmCapabilities
+    for how their presence is detected.
 
     Parameters:
         module: Ansible module instance
+        entity: networks or vrfs
 
     Returns:
         bool: True if bulk API is supported, False otherwise
     """
 
-    method = "POST"
-    path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/v2/bulk-update/networks"
-    data = {}
-
-    try:
-        response = dcnm_send(module, method, path, data)
-
-        # 404 means endpoint doesn't exist (bulk API not available)
-        if response.get("RETURN_CODE") == 404:
-            return False
-
-        # 405 (Method Not Allowed) or any other response means endpoint exists
-        # Even errors indicate the endpoint is present, just not called correctly
-        return True
-
-    except Exception:
-        # If there's an exception, assume bulk API is not available
-        return False
+    name = "bulk_vrf_api" if entity == "vrfs" else "bulk_network_api"
+    return DcnmCapabilities.for_module(module).supports(name)
 
 
 def parse_response(response):
@@ -742,12 +1018,73 @@ def parse_response(response):
     return False, False
 
 
-def dcnm_get_url(module, fabric, path, items, module_name):
+# NDFC/DCNM12 can handle urls upto 6144 characters. The limit applies to the
+# URL encoded path, leaving some room for the scheme, address and port.
+DCNM_MAX_URL_LENGTH = 6000
+
+# Characters that are not percent-encoded in a query path
+DCNM_URL_SAFE_CHARS = "/:?=&,~"
+
+
+def dcnm_batch_url_items(path, fabric, items, max_url_length=DCNM_MAX_URL_LENGTH):
+    """
+    Pack query items into as few comma separated batches as possible, such
+    that path.format(fabric, batch) is at most max_url_length bytes long
+    once URL encoded. An item that does not fit in a URL on its own is
+    sent in a batch by itself.
+
+    Parameters:
+        path: String representing the path to query
+        fabric: String representing the fabric
+        items: Comma separated string, or list, of query items
+        max_url_length: Maximum length of the URL encoded path
+
+    Returns:
+        list: Comma separated strings of items, in the order of items
+    """
+
+    if isinstance(items, str):
+        items = items.split(",")
+
+    base_length = len(quote(path.format(fabric, ""), safe=DCNM_URL_SAFE_CHARS))
+
+    batches = []
+    batch = []
+    length = base_length
+    for item in items:
+        item_length = len(quote(item, safe=DCNM_URL_SAFE_CHARS))
+        if batch and length + item_length + 1 > max_url_length:
+            batches.append(",".join(batch))
+            batch = []
+            length = base_length
+        if batch:
+            item_length += 1
+        batch.append(item)
+        length += item_length
+
+    if batch:
+        batches.append(",".join(batch))
+    return batches
+
+
+def dcnm_get_url(
+    module,
+    fabric,
+    path,
+    items,
+    module_name,
+    max_url_length=DCNM_MAX_URL_LENGTH,
+):
     """
     Query DCNM/NDFC and return query values.
     Some queries like network/vrf queries send thier names
     as part of URL. This method sends multiple queries and returns
-    a consolidated response if the url exceeds 6144 characters.
+    a consolidated response if the url exceeds max_url_length characters.
+
+    The items are packed into batches by dcnm_batch_url_items(). The
+    queries are sent one after the other, since dcnm_send() requests share
+    a single connection to the controller and are serialized anyway, and
+    the responses are merged in the order of the batches.
 
     Parameters:
         module: String representing the module
@@ -755,43 +1092,21 @@ def dcnm_get_url(module, fabric, path, items, module_name):
         path: String representing the path to query
         items: String representing query items
         module_name: String representing the name of calling module
+        max_url_length: Maximum length of the URL encoded query path
 
     Returns:
         dict: Response DATA from DCNM/NDFC
     """
 
     method = "GET"
-    send_count = 1
-
-    # NDFC/DCNM12 can handle urls upto 6144 characters.
-    # The size here represents the total size of all item names.
-    # The number 5900 has been arrived after making some room
-    # for query path(url)
-    if sys.getsizeof(items) > 5900:
-        if (sys.getsizeof(items) % 5900) == 0:
-            send_count = sys.getsizeof(items) / 5900
-        else:
-            send_count = sys.getsizeof(items) // 5900 + 1
-
-    itemlist = items.split(",")
-
-    iter = 0
-    while iter < send_count:
-        if send_count == 1:
-            url = path.format(fabric, items)
-        elif iter != (send_count - 1):
-            itemstr = ",".join(
-                itemlist[
-                    (iter * (len(itemlist) // send_count)) : (
-                        (iter + 1) * (len(itemlist) // send_count)
-                    )
-                ]
-            )
-            url = path.format(fabric, itemstr)
-        else:
-            itemstr = ",".join(itemlist[iter * (len(itemlist) // send_count) :])
-            url = path.format(fabric, itemstr)
 
+    urls = [
+        path.format(fabric, batch)
+        for batch in dcnm_batch_url_items(path, fabric, items, max_url_length)
+    ]
+
+    attach_objects = None
+    for url in urls:
         att_objects = dcnm_send(module, method, url)
 
         missing_fabric, not_ok = parse_response(att_objects)
@@ -805,16 +1120,145 @@ def dcnm_get_url(module, fabric, path, items, module_name):
             module.fail_json(msg=msg1 if missing_fabric else msg2)
             return
 
-        if iter == 0:
+        if attach_objects is None:
             attach_objects = att_objects
         else:
             attach_objects["DATA"].extend(att_objects["DATA"])
 
-        iter += 1
-
     return attach_objects
 
 
+class DcnmWaiter(object):
+    """
+    Wait for a controller side operation to complete.
+
+    poll() is called until it returns True or the overall deadline expires. The delay between polls starts at
+    'initial' seconds and is multiplied by 'factor' after each unsuccessful poll up to 'maximum' seconds. Up to
+    'jitter' of each delay is randomly removed, so that several waiters polling the controller at the same time
+    drift apart. The last delay is shortened so that the deadline is never overshot.
+
+    record() keeps a per-item timeline of state transitions, timestamped with the seconds elapsed since the
+    waiter was created. An entry is added only when the state of an item changes.
+
+    due() paces periodic corrective actions on elapsed time rather than on the number of polls, whose spacing
+    varies with the backoff.
+    """
+
+    def __init__(self, timeout, initial=2, maximum=30, factor=2, jitter=0.25):
+
+        self.timeout = timeout
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.start = time.monotonic()
+        self.slept = 0
+        self.polls = 0
+        self.timeline = {}
+        self.periods = {}
+
+    @property
+    def elapsed(self):
+        # Never less than the time spent sleeping
+        return max(time.monotonic() - self.start, self.slept)
+
+    @property
+    def remaining(self):
+        return max(0, self.timeout - self.elapsed)
+
+    def delays(self):
+
+        delay = self.initial
+        while True:
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(self.maximum, delay * self.factor)
+
+    def wait(self, poll):
+
+        # Returns True if poll() succeeded before the deadline, False otherwise. poll() is always called at
+        # least once.
+        for delay in self.delays():
+            self.polls += 1
+            if poll():
+                return True
+            if self.remaining <= 0:
+                return False
+            delay = min(delay, self.remaining)
+            time.sleep(delay)
+            self.slept += delay
+
+    def due(self, action, interval):
+
+        # Returns True the first time it is called for 'action' after each further 'interval' seconds have
+        # elapsed since the waiter was created, False otherwise
+        period = int(self.elapsed // interval)
+        if period <= self.periods.get(action, 0):
+            return False
+        self.periods[action] = period
+        return True
+
+    def record(self, item, state):
+
+        timeline = self.timeline.setdefault(item, [])
+        if timeline and all(timeline[-1].get(key) == value for key, value in state.items()):
+            return
+        entry = {"elapsed": round(self.elapsed, 1)}
+        entry.update(state)
+        timeline.append(entry)
+
+
+class DcnmStatusPoller(object):
+    """
+    Wait for a set of objects to reach a final state, polling all of them together.
+
+    Objects are polled in rounds spaced by 'waiter', a DcnmWaiter. In each round, pending objects are grouped on
+    key(obj) and fetch(obj) is called once per group, with the first pending object of the group. state(obj, status)
+    then returns the state of each object of the group from that single status. When objects are still pending at
+    the end of a round, on_round(states) is called once with their states keyed on name(obj), so that corrective
+    actions like a config-save-and-deploy are triggered once per round instead of once per object.
+
+    converged maps the name of each object that reached the final state to the seconds elapsed until it did.
+    states holds the last state of every polled object.
+    """
+
+    def __init__(self, waiter, name, key, fetch, state):
+
+        self.waiter = waiter
+        self.name = name
+        self.key = key
+        self.fetch = fetch
+        self.state = state
+        self.rounds = 0
+        self.fetches = 0
+        self.converged = {}
+        self.states = {}
+
+    def wait(self, objects, final_state, on_round=None):
+
+        # Returns True if all objects reached 'final_state' before the deadline of the waiter, False otherwise
+        pending = dict((self.name(obj), obj) for obj in objects)
+
+        def poll():
+            self.rounds += 1
+            statuses = {}
+            for obj_name, obj in list(pending.items()):
+                key = self.key(obj)
+                if key not in statuses:
+                    self.fetches += 1
+                    statuses[key] = self.fetch(obj)
+                state = self.state(obj, statuses[key])
+                self.states[obj_name] = state
+                self.waiter.record(obj_name, {"state": state})
+                if state == final_state:
+                    self.converged[obj_name] = round(self.waiter.elapsed, 1)
+                    del pending[obj_name]
+            if pending and on_round is not None:
+                on_round(dict((obj_name, self.states[obj_name]) for obj_name in pending))
+            return not pending
+
+        return self.waiter.wait(poll)
+
+
 def dcnm_load_mapping_data():
 
     path = os.path.join("./", "{0}.json".format("type_mappings"))
@@ -1070,10 +1514,89 @@ def dcnm_get_auth_token(module):
     return conn.get_token()
 
 
+DCNM_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class DcnmMultipartFile(object):
+    """
+    A multipart/form-data body with a single file part. The file is read in chunk_size pieces while the body is
+    being sent, so large images are never loaded into memory. SHA-256 and MD5 digests of the file contents are
+    computed as the file is read; the controller reports an MD5 checksum for uploaded images.
+
+    The length of the body is known up front, so requests sends it with a Content-Length header rather than
+    using chunked transfer encoding.
+    """
+
+    def __init__(self, fileobj, filename, size, field="file", chunk_size=DCNM_UPLOAD_CHUNK_SIZE):
+
+        self.fileobj = fileobj
+        self.size = size
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        self.sent = 0
+        self.sha256 = hashlib.sha256()
+        try:
+            self.md5 = hashlib.md5(usedforsecurity=False)
+        except TypeError:
+            self.md5 = hashlib.md5()
+
+        filename = filename.replace('"', '\\"')
+        self.head = (
+            "--{0}\r\n"
+            'Content-Disposition: form-data; name="{1}"; filename="{2}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).format(self.boundary, field, filename).encode("utf-8")
+        self.tail = "\r\n--{0}--\r\n".format(self.boundary).encode("utf-8")
+
+    @property
+    def content_type(self):
+        return "multipart/form-data; boundary=" + self.boundary
+
+    @property
+    def complete(self):
+        return self.sent == self.size
+
+    def __len__(self):
+        return len(self.head) + self.size + len(self.tail)
+
+    def __iter__(self):
+
+        yield self.head
+        while True:
+            chunk = self.fileobj.read(self.chunk_size)
+            if not chunk:
+                break
+            self.sent += len(chunk)
+            self.sha256.update(chunk)
+            self.md5.update(chunk)
+            yield chunk
+        yield self.tail
+
+
 def dcnm_post_request(path, hdrs, verify_flag, upload_files):
 
-    resp = requests.post(path, headers=hdrs, verify=verify_flag, files=upload_files)
-    json_resp = resp.json()
+    # upload_files is either a dict suitable for the 'files' argument of requests.post() or a DcnmMultipartFile
+    # which is streamed to the controller.
+    # Transport errors and responses without a JSON body are returned as a 5xx response, so that callers can
+    # retry the request.
+    try:
+        if isinstance(upload_files, DcnmMultipartFile):
+            hdrs = dict(hdrs)
+            hdrs["Content-Type"] = upload_files.content_type
+            resp = requests.post(path, headers=hdrs, verify=verify_flag, data=upload_files)
+        else:
+            resp = requests.post(path, headers=hdrs, verify=verify_flag, files=upload_files)
+    except requests.RequestException as error:
+        return {"RETURN_CODE": 503, "METHOD": "POST", "REQUEST_PATH": path, "DATA": str(error)}
+    try:
+        json_resp = resp.json()
+    except ValueError:
+        return {
+            "RETURN_CODE": resp.status_code if resp.status_code >= 500 else 502,
+            "METHOD": "POST",
+            "REQUEST_PATH": path,
+            "DATA": resp.text,
+        }
     if json_resp:
         json_resp["RETURN_CODE"] = resp.status_code
         json_resp["DATA"] = json_resp["message"]
@@ -1332,6 +1855,10 @@ def get_nd_version(action_module, task_vars, tmp):
         float: Major software version for NDFC
     """
 
+    supported = dcnm_get_controller_context(action_module).get("nd_version")
+    if isinstance(supported, float):
+        return supported
+
     method = "GET"
     supported = None
     data = None
@@ -1382,9 +1909,71 @@ def get_nd_version(action_module, task_vars, tmp):
         error_msg = "Failed to retrieve NDFC version from API responses."
         return action_module.error_handler.handle_failure(error_msg)
 
+    dcnm_set_controller_context(action_module, {"nd_version": supported})
     return supported
 
 
+def run_child_fabric_tasks(action_module, child_tasks, execute, parallelism=1):
+    """
+    Run child fabric tasks with bounded concurrency and fail-fast semantics.
+
+    Child fabric operations are independent once the parent fabric has been
+    processed, so up to parallelism tasks are run at the same time on worker
+    threads. When a task returns a failed result, tasks that have not started
+    yet are cancelled. Tasks that are already running are allowed to finish.
+
+    Parallel execution requires module pipelining, since modules run without
+    pipelining share the same remote tmpdir. If pipelining is not enabled the
+    tasks are run sequentially.
+
+    Parameters:
+        action_module: Action plugin module instance
+        child_tasks (list): Child fabric tasks, in the order results are returned
+        execute (callable): Called with one child task, returns the module result dict
+        parallelism (int): Maximum number of child tasks run at the same time
+
+    Returns:
+        list: (child_task, result) tuples, in child_tasks order, for every
+            task that was run
+    """
+    parallelism = max(1, int(parallelism or 1))
+    results = [None] * len(child_tasks)
+
+    if parallelism > 1 and len(child_tasks) > 1 and not action_module._is_pipelining_enabled("new"):
+        action_module.logger.warning(
+            "Module pipelining is not enabled, running child fabric tasks sequentially",
+            operation="child_execution"
+        )
+        parallelism = 1
+
+    if parallelism == 1 or len(child_tasks) <= 1:
+        for index, child_task in enumerate(child_tasks):
+            results[index] = execute(child_task)
+            if results[index].get("failed", False):
+                break
+    else:
+        action_module.logger.info(
+            f"Running {len(child_tasks)} child fabric tasks with parallelism {parallelism}",
+            operation="child_execution"
+        )
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(child_tasks))) as executor:
+            futures = {executor.submit(execute, child_task): index for index, child_task in enumerate(child_tasks)}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                if results[futures[future]].get("failed", False):
+                    for pending in futures:
+                        pending.cancel()
+
+    return [(child_task, result) for child_task, result in zip(child_tasks, results) if result is not None]
+
+
 def obtain_federated_fabric_associations(action_module, task_vars, tmp):
     """
     Retrieve federated fabric associations from ND controller.
@@ -1426,6 +2015,10 @@ def obtain_federated_fabric_associations(action_module, task_vars, tmp):
     Raises:
         ActionError: On API failure or invalid response structure
     """
+    cached = dcnm_get_controller_context(action_module).get("federated_fabric_associations")
+    if cached is not None:
+        return cached
+
     # Log fabric discovery initiation
     action_module.logger.debug(
         "Fetching federated fabric associations from NDFC", operation="fabric_discovery"
@@ -1474,12 +2067,18 @@ def obtain_federated_fabric_associations(action_module, task_vars, tmp):
 
             if error_msg in FEDERATION_MANAGER_NOT_FOUND_ERRORS:
                 # Return the same error message for both ND3.2 and ND4.X for consistency
+                dcnm_set_controller_context(
+                    action_module, {"federated_fabric_associations": 'A federation manager does not exist'}
+                )
                 return 'A federation manager does not exist'
 
             # ND3.1 Returns a very cryptic error message using RC 404
             # 'Invalid JSON response: <html>\r\n<head><title>404 Not Found<...<snip>...n'
             if action_module.ndfc_version < 12.4 and error_code == 404 and \
                error_msg.startswith("Invalid JSON response: <html>"):
+                dcnm_set_controller_context(
+                    action_module, {"federated_fabric_associations": 'A federation manager does not exist'}
+                )
                 return 'A federation manager does not exist'
 
         # Validate API response structure and extract data
@@ -1517,6 +2116,7 @@ def obtain_federated_fabric_associations(action_module, task_vars, tmp):
 
         # Log successful fabric data retrieval
         action_module.logger.info(f"Retrieved {len(fabric_associations)} federated fabric associations", operation="fabric_discovery")
+        dcnm_set_controller_context(action_module, {"federated_fabric_associations": fabric_associations})
         return fabric_associations
 
     except Exception as e:
@@ -1524,7 +2124,7 @@ def obtain_federated_fabric_associations(action_module, task_vars, tmp):
         return action_module.error_handler.handle_exception(e, "fabric_discovery")
 
 
-def obtain_fabric_associations(action_module, task_vars, tmp):
+def obtain_fabric_associations(action_module, task_vars, tmp, fabrics=None):
     """
     Retrieve fabric associations and relationships from ND controller.
 
@@ -1552,6 +2152,10 @@ def obtain_fabric_associations(action_module, task_vars, tmp):
     Args:
         task_vars (dict): Ansible task variables for module execution
         tmp (str): Temporary directory path for module operations
+        fabrics (iterable, optional): Names of the fabrics the caller looks up.
+            Fabric associations from the controller context are only used if
+            they include all of these fabrics, so that fabrics created since
+            the associations were cached are found.
 
     Returns:
         dict: Fabric associations indexed by fabric name:
@@ -1567,6 +2171,10 @@ def obtain_fabric_associations(action_module, task_vars, tmp):
     Raises:
         ActionError: On API failure or invalid response structure
     """
+    cached = dcnm_get_controller_context(action_module).get("fabric_associations")
+    if isinstance(cached, dict) and all(fabric in cached for fabric in fabrics or []):
+        return cached
+
     # Log fabric discovery initiation
     action_module.logger.debug(
         "Fetching fabric associations from NDFC", operation="fabric_discovery"
@@ -1618,6 +2226,7 @@ def obtain_fabric_associations(action_module, task_vars, tmp):
 
         # Log successful fabric data retrieval
         action_module.logger.info(f"Retrieved {len(fabric_associations)} fabric associations", operation="fabric_discovery")
+        dcnm_set_controller_context(action_module, {"fabric_associations": fabric_associations})
         return fabric_associations
 
     except Exception as e:
@@ -208,7 +208,7 @@ class Common:
 
     def __init__(self, params: dict[str, Any]) -> None:
         self.class_name = self.__class__.__name__
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -338,7 +338,7 @@ class Common:
         ```
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -397,7 +397,7 @@ class Common:
 
     @rest_send.setter
     def rest_send(self, value: RestSend):
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "RestSend"
         msg = f"{self.class_name}.{method_name}: "
@@ -425,7 +425,7 @@ class Deleted(Common):
 
     def __init__(self, params: dict[str, Any]) -> None:
         self.class_name: str = self.__class__.__name__
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -476,7 +476,7 @@ class Deleted(Common):
         }
         ```
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         self.bootflash_info.filter_switch = switch["ip_address"]
         if switch["ip_address"] not in self.files_to_delete:
             self.files_to_delete[switch["ip_address"]] = []
@@ -504,7 +504,7 @@ class Deleted(Common):
         -    ``ValueError`` if:
                 -   ``BootflashFiles().add_file`` raises ``ValueError``.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         try:
             self.convert_target_to_params.target = target
@@ -535,7 +535,7 @@ class Deleted(Common):
         try:
             self.bootflash_files.add_file()
         except ValueError as error:
-            msg = f"{self.class_name}.{inspect.stack()[0][3]}: "
+            msg = f"{self.class_name}.{inspect.currentframe().f_code.co_name}: "
             msg += "Error adding file to bootflash_files. "
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
@@ -607,7 +607,7 @@ class Query(Common):
         self.log: logging.Logger = logging.getLogger(f"dcnm.{self.class_name}")
 
         self.action: str = "bootflash_info"
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         try:
             super().__init__(params)
@@ -661,7 +661,7 @@ class Query(Common):
         -   ValueError
 
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
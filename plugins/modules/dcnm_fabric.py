@@ -43,6 +43,14 @@ options:
         description:
         - Skip playbook parameter validation.  Useful for debugging.
         type: bool
+    template_cache:
+        default: false
+        description:
+        - Cache the fabric templates retrieved from the controller on the
+          Ansible control node, under C($ANSIBLE_HOME/cache/cisco.dcnm/templates).
+        - Cached templates are reused by later runs against the same controller
+          and controller version, for up to 24 hours.
+        type: bool
     config:
         description:
         - A list of fabric configuration dictionaries
@@ -4056,6 +4064,7 @@ from ..module_utils.common.response_handler import ResponseHandler
 from ..module_utils.common.rest_send_v2 import RestSend
 from ..module_utils.common.results import Results
 from ..module_utils.common.sender_dcnm import Sender
+from ..module_utils.common.template_cache import TemplateCache
 from ..module_utils.fabric.common import FabricCommon
 from ..module_utils.fabric.create import FabricCreateBulk
 from ..module_utils.fabric.delete import FabricDelete
@@ -4086,7 +4095,7 @@ class Common(FabricCommon):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         super().__init__()
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.controller_features = ControllerFeatures()
         self.controller_version = ControllerVersion()
@@ -4125,7 +4134,7 @@ class Common(FabricCommon):
         ### Raises
         -   ValueError if check_mode is not provided.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.check_mode = self.params.get("check_mode", None)
         if self.check_mode is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -4142,7 +4151,7 @@ class Common(FabricCommon):
                 -   ``state`` is "merged" or "replaced" and ``config`` is None.
                 -   ``config`` is not a list.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         states_requiring_config = {"merged", "replaced"}
         self.config = self.params.get("config", None)
         if self.state in states_requiring_config:
@@ -4166,7 +4175,7 @@ class Common(FabricCommon):
                 -   ``state`` is not provided.
                 -   ``state`` is not a valid state.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         valid_states = ["deleted", "merged", "query", "replaced"]
 
@@ -4208,7 +4217,7 @@ class Common(FabricCommon):
         ```
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         try:
             self.have = FabricDetailsByName()
             self.have.rest_send = self.rest_send
@@ -4230,7 +4239,7 @@ class Common(FabricCommon):
         ### Raises
         -   ``ValueError`` if the playbook configs are invalid.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         merged_configs = []
         for config in self.config:
             try:
@@ -4259,7 +4268,7 @@ class Common(FabricCommon):
         -   ``ValueError`` if the controller returns an error when attempting to
             retrieve the controller features.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.features = {}
         self.controller_features.rest_send = self.rest_send
         try:
@@ -4286,7 +4295,7 @@ class Common(FabricCommon):
         -   ``ValueError`` if the controller returns an error when attempting
             to retrieve the controller version.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.controller_version.rest_send = self.rest_send
             self.controller_version.refresh()
@@ -4297,6 +4306,27 @@ class Common(FabricCommon):
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
+    def get_template_cache(self):
+        """
+        ### Summary
+        Return a ``TemplateCache()`` for the controller, if the
+        ``template_cache`` parameter is true.  Otherwise, return ``None``.
+
+        ### Raises
+        None
+        """
+        if not self.params.get("template_cache"):
+            return None
+        template_cache = TemplateCache()
+        try:
+            template_cache.controller_version = str(self.controller_version.version)
+        except ValueError:
+            # Without a controller version, templates are not cached
+            return None
+        uuid = self.controller_version.uuid
+        template_cache.controller_uuid = uuid if isinstance(uuid, str) else None
+        return template_cache
+
 
 class Deleted(Common):
     """
@@ -4330,7 +4360,7 @@ class Deleted(Common):
             delete the fabrics.
         """
         self.get_want()
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -4387,7 +4417,7 @@ class Merged(Common):
     def __init__(self, params):
         self.class_name = self.__class__.__name__
         super().__init__(params)
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.action = "fabric_create"
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -4424,8 +4454,17 @@ class Merged(Common):
             -   The controller returns an error when attempting to retrieve
                 the fabric details.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.payloads = {}
+
+        # self.template caches each template it retrieves, so fabrics
+        # of the same type share one template, ruleset, and parameter info.
+        try:
+            self.template.controller_version = str(self.controller_version.version)
+        except ValueError:
+            self.template.controller_version = None
+        self.template.template_cache = self.get_template_cache()
+
         for want in self.want:
 
             fabric_name = want.get("FABRIC_NAME", None)
@@ -4547,7 +4586,7 @@ class Merged(Common):
                 the fabric.
             -   The controller returns an error when attempting to update
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -4578,10 +4617,11 @@ class Merged(Common):
             -   The controller returns an error when attempting to create
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
-        msg = f"{self.class_name}.{method_name}: entered. "
-        msg += f"self.need_create: {json_pretty(self.need_create)}"
-        self.log.debug(msg)
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: entered. "
+            msg += f"self.need_create: {json_pretty(self.need_create)}"
+            self.log.debug(msg)
 
         if len(self.need_create) == 0:
             msg = f"{self.class_name}.{method_name}: "
@@ -4615,11 +4655,12 @@ class Merged(Common):
             -   The controller returns an error when attempting to update
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
-        msg = f"{self.class_name}.{method_name}: entered. "
-        msg += "self.need_update: "
-        msg += f"{json_pretty(self.need_update)}"
-        self.log.debug(msg)
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: entered. "
+            msg += "self.need_update: "
+            msg += f"{json_pretty(self.need_update)}"
+            self.log.debug(msg)
 
         if len(self.need_update) == 0:
             msg = f"{self.class_name}.{method_name}: "
@@ -4731,7 +4772,7 @@ class Replaced(Common):
     def __init__(self, params):
         self.class_name = self.__class__.__name__
         super().__init__(params)
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.action = "fabric_replaced"
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -4761,7 +4802,7 @@ class Replaced(Common):
             -   The controller features required for the fabric type are not
                 running on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.payloads = {}
         for want in self.want:
 
@@ -4805,7 +4846,7 @@ class Replaced(Common):
             -   The controller features required for the fabric type are not
                 running on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -4836,11 +4877,12 @@ class Replaced(Common):
             -   The controller returns an error when attempting to
                  update the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
-        msg = f"{self.class_name}.{method_name}: entered. "
-        msg += "self.need_replaced: "
-        msg += f"{json_pretty(self.need_replaced)}"
-        self.log.debug(msg)
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: entered. "
+            msg += "self.need_replaced: "
+            msg += f"{json_pretty(self.need_replaced)}"
+            self.log.debug(msg)
 
         if len(self.need_create) != 0:
             self.merged = Merged(self.params)
@@ -4861,6 +4903,7 @@ class Replaced(Common):
         self.fabric_replaced.fabric_summary = self.fabric_summary
         self.fabric_replaced.rest_send = self.rest_send
         self.fabric_replaced.results = self.results
+        self.fabric_replaced.template_get.template_cache = self.get_template_cache()
 
         try:
             self.fabric_replaced.payloads = self.need_replaced
@@ -4896,6 +4939,11 @@ def main():
         "type": "bool",
         "default": False,
     }
+    argument_spec["template_cache"] = {
+        "required": False,
+        "type": "bool",
+        "default": False,
+    }
     argument_spec["state"] = {
         "default": "merged",
         "choices": ["deleted", "merged", "query", "replaced"],
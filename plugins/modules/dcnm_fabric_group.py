@@ -39,11 +39,28 @@ options:
         description:
         - The state of the feature or object after module completion
         type: str
+    max_response_data_size:
+        description:
+        - The maximum size, in characters when serialized to JSON, of the DATA
+          of each controller response returned in I(response).
+        - The DATA of larger responses is replaced with a summary of its size,
+          type and length.
+        - By default, responses are returned in full.
+        required: false
+        type: int
     skip_validation:
         default: false
         description:
         - Skip playbook parameter validation.  Useful for debugging.
         type: bool
+    template_cache:
+        default: false
+        description:
+        - Cache the fabric group templates retrieved from the controller on the
+          Ansible control node, under C($ANSIBLE_HOME/cache/cisco.dcnm/templates).
+        - Cached templates are reused by later runs against the same controller
+          and controller version, for up to 24 hours.
+        type: bool
     config:
         description:
         - A list of fabric configuration dictionaries
@@ -422,6 +439,7 @@ from ..module_utils.common.response_handler import ResponseHandler
 from ..module_utils.common.rest_send_v2 import RestSend
 from ..module_utils.common.results_v2 import Results
 from ..module_utils.common.sender_dcnm import Sender
+from ..module_utils.common.template_cache import TemplateCache
 from ..module_utils.common.template_get_v2 import TemplateGet
 from ..module_utils.fabric.verify_playbook_params import VerifyPlaybookParams
 from ..module_utils.fabric_group.common import FabricGroupCommon
@@ -461,7 +479,7 @@ class Common(FabricGroupCommon):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         super().__init__()
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.params = params
 
@@ -483,6 +501,7 @@ class Common(FabricGroupCommon):
         self.results: Results = Results()
         self.results.state = self.state
         self.results.check_mode = self.check_mode
+        self.results.max_response_data_size = self.params.get("max_response_data_size")
         self._verify_playbook_params: VerifyPlaybookParams = VerifyPlaybookParams()
 
         self.have: FabricGroups = FabricGroups()
@@ -505,7 +524,7 @@ class Common(FabricGroupCommon):
 
         -   `ValueError` if check_mode is not provided.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.check_mode = self.params.get("check_mode", None)
         if self.check_mode is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -524,7 +543,7 @@ class Common(FabricGroupCommon):
             -   ``state`` is "merged" and ``config`` is None.
             -   ``config`` is not a list.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         states_requiring_config = {"merged"}
         self.config: list[dict] = self.params.get("config", None)
         if self.state in states_requiring_config:
@@ -550,7 +569,7 @@ class Common(FabricGroupCommon):
             -   ``state`` is not provided.
             -   ``state`` is not a valid state.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         valid_states = ["deleted", "merged", "query"]
 
@@ -582,7 +601,7 @@ class Common(FabricGroupCommon):
         See FabricGroupDetails
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         try:
             self.have.rest_send = self.rest_send
             self.have.results = Results()
@@ -605,7 +624,7 @@ class Common(FabricGroupCommon):
 
         -   `ValueError` if the playbook configs are invalid.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         merged_configs: list[dict] = []
         for config in self.config:
             try:
@@ -634,7 +653,7 @@ class Common(FabricGroupCommon):
         -   `ValueError` if the controller returns an error when attempting to
             retrieve the controller features.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.features = {}
         self.controller_features.rest_send = self.rest_send
         try:
@@ -662,7 +681,7 @@ class Common(FabricGroupCommon):
         -   `ValueError` if the controller returns an error when attempting
             to retrieve the controller version.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self.controller_version.rest_send = self.rest_send
             self.controller_version.refresh()
@@ -673,6 +692,29 @@ class Common(FabricGroupCommon):
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
+    def get_template_cache(self) -> Union[TemplateCache, None]:
+        """
+        # Summary
+
+        Return a `TemplateCache()` for the controller, if the `template_cache`
+        parameter is true.  Otherwise, return `None`.
+
+        ## Raises
+
+        None
+        """
+        if not self.params.get("template_cache"):
+            return None
+        template_cache = TemplateCache()
+        try:
+            template_cache.controller_version = str(self.controller_version.version)
+        except ValueError:
+            # Without a controller version, templates are not cached
+            return None
+        uuid = self.controller_version.uuid
+        template_cache.controller_uuid = uuid if isinstance(uuid, str) else None
+        return template_cache
+
 
 class Deleted(Common):
     """
@@ -712,7 +754,7 @@ class Deleted(Common):
             delete the fabric groups.
         """
         self.get_want()
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED: {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -760,7 +802,7 @@ class Merged(Common):
     def __init__(self, params):
         self.class_name = self.__class__.__name__
         super().__init__(params)
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         self.action = "fabric_group_create"
         self.log: logging.Logger = logging.getLogger(f"dcnm.{self.class_name}")
@@ -791,7 +833,7 @@ class Merged(Common):
         -   `ValueError` if the controller returns an error when attempting to
             retrieve the template.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             template_name = self.fabric_group_types.template_name
         except ValueError as error:
@@ -822,7 +864,7 @@ class Merged(Common):
 
         -   `ValueError` if the playbook config in ``want`` is invalid.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             self._verify_playbook_params.config_controller = None
         except TypeError as error:
@@ -853,7 +895,7 @@ class Merged(Common):
 
         -   `ValueError` if the playbook config in ``want`` is invalid.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: ENTERED"
         self.log.debug(msg)
         fabric_name: str = want.get("FABRIC_NAME", "")
@@ -897,7 +939,7 @@ class Merged(Common):
             -   The controller returns an error when attempting to retrieve
                 the fabric group details.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.payloads = {}
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
@@ -983,11 +1025,12 @@ class Merged(Common):
             -   The controller returns an error when attempting to update
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
         self.get_controller_version()
+        self.template.template_cache = self.get_template_cache()
 
         self.get_controller_features()
         self.get_want()
@@ -1016,7 +1059,7 @@ class Merged(Common):
             -   The controller returns an error when attempting to create
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: entered. "
         msg += f"self.need_create: {json_pretty(self.need_create)}"
         self.log.debug(msg)
@@ -1053,7 +1096,7 @@ class Merged(Common):
             -   The controller returns an error when attempting to update
                 the fabric.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
         msg = f"{self.class_name}.{method_name}: ENTERED. "
         msg += "self.need_update: "
         msg += f"{json_pretty(self.need_update)}"
@@ -1164,11 +1207,20 @@ def main():
 
     argument_spec = {}
     argument_spec["config"] = {"required": False, "type": "list", "elements": "dict"}
+    argument_spec["max_response_data_size"] = {
+        "required": False,
+        "type": "int",
+    }
     argument_spec["skip_validation"] = {
         "required": False,
         "type": "bool",
         "default": False,
     }
+    argument_spec["template_cache"] = {
+        "required": False,
+        "type": "bool",
+        "default": False,
+    }
     argument_spec["state"] = {
         "default": "merged",
         "choices": list(valid_states),
@@ -292,7 +292,7 @@ class Common:
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -361,7 +361,7 @@ class Common:
 
         self.have consists of the current image policies on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -378,7 +378,7 @@ class Common:
         2. Convert the validated configs to payloads
         3. Update self.want with this list of payloads
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -423,7 +423,7 @@ class Replaced(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -463,7 +463,7 @@ class Deleted(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -518,7 +518,7 @@ class Query(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             super().__init__(params)
@@ -540,7 +540,7 @@ class Query(Common):
         """
         1.  query the fabrics in self.want that exist on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -582,7 +582,7 @@ class Overridden(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -605,7 +605,7 @@ class Overridden(Common):
         -   Delete all policies on the controller that are not in self.want
         -   Instantiate`` Merged()`` and call ``Merged().commit()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -637,7 +637,7 @@ class Overridden(Common):
         ### Summary
         Delete all policies on the controller that are not in self.want
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         want_policy_names = set()
         for want in self.want:
             want_policy_names.add(want["policyName"])
@@ -679,7 +679,7 @@ class Merged(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -725,7 +725,7 @@ class Merged(Common):
                     are identical, do not append the policy to self.need_update
                     (i.e. do nothing).
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -752,7 +752,7 @@ class Merged(Common):
         """
         Commit the merged state requests
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"state: {self.state}, "
         msg += f"check_mode: {self.check_mode}"
@@ -793,7 +793,7 @@ class Merged(Common):
         ### Summary
         Merge the parameters in want with the parameters in have.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         (have, want) = self._prepare_for_merge(have, want)
 
         # Merge the parameters in want with the parameters in have.
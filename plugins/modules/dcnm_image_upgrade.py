@@ -454,7 +454,7 @@ class Common:
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -509,7 +509,7 @@ class Common:
                         -   ``merged``
                         -   ``query``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.check_mode = self.params.get("check_mode", None)
         if self.check_mode is None:
@@ -539,7 +539,7 @@ class Common:
 
         Determine current switch ISSU state on the controller
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -555,7 +555,7 @@ class Common:
         ### Summary
         Update self.want for all switches defined in the playbook.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += "Calling _merge_global_and_switch_configs with "
@@ -609,7 +609,7 @@ class Common:
         and values are modified based on results from the have item,
         and the information returned by ImageInstallOptions.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"want: {json.dumps(want, indent=4, sort_keys=True)}"
@@ -710,7 +710,7 @@ class Common:
         -   ``True`` if newVersion > oldVersion for any module.
         -   ``False`` otherwise.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"epld_modules: {epld_modules}"
@@ -759,7 +759,7 @@ class Common:
                 -   Playbook is missing list of switches.
                 -   ``MergedDicts()`` raises an error.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if not config.get("switches"):
             msg = f"{self.class_name}.{method_name}: "
@@ -804,7 +804,7 @@ class Common:
         For any items in config which are not set, apply the default
         value from params_spec (if a default value exists).
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"ENTERED {self.class_name}.{method_name}."
         self.log.debug(msg)
@@ -838,7 +838,7 @@ class Common:
                         -   ``merged``
                         -   ``query``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         try:
             self.params_spec.params = self.params
@@ -875,7 +875,7 @@ class Merged(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -905,7 +905,7 @@ class Merged(Common):
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -926,7 +926,7 @@ class Merged(Common):
         -   Validate the image if requested.
         -   Upgrade the image if requested.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -994,7 +994,7 @@ class Merged(Common):
         our want list that are not in our have list.  These items will
         be sent to the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         need: list[dict] = []
 
         msg = f"{self.class_name}.{method_name}: "
@@ -1041,7 +1041,7 @@ class Merged(Common):
         Callers:
         - handle_merged_state
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"serial_numbers: {serial_numbers}"
         self.log.debug(msg)
@@ -1059,7 +1059,7 @@ class Merged(Common):
         Callers:
         - handle_merged_state
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: "
         msg += f"serial_numbers: {serial_numbers}"
         self.log.debug(msg)
@@ -1116,7 +1116,7 @@ class Merged(Common):
         Callers:
         - self.handle_merged_state
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"len(devices): {len(devices)}, "
@@ -1179,7 +1179,7 @@ class Merged(Common):
         ### Summary
         Attach image policies to switches.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}."
         self.log.debug(msg)
 
@@ -1228,7 +1228,7 @@ class Deleted(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -1276,7 +1276,7 @@ class Deleted(Common):
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -1294,7 +1294,7 @@ class Deleted(Common):
         ### Summary
         Detach image policies from switches.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}."
         self.log.debug(msg)
 
@@ -1324,7 +1324,7 @@ class Deleted(Common):
         ### Summary
         Detach image policies from switches.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}."
         self.log.debug(msg)
 
@@ -1359,7 +1359,7 @@ class Query(Common):
 
     def __init__(self, params):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -1385,7 +1385,7 @@ class Query(Common):
                 -   ``rest_send`` is not set.
                 -   ``results`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -1417,7 +1417,7 @@ class Query(Common):
 
         Caller: main()
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"ENTERED {self.class_name}.{method_name}."
         self.log.debug(msg)
 
@@ -73,6 +73,18 @@ options:
         - or 'sftp'.
         type: str
         required: true
+  upload_workers:
+    description:
+    - Maximum number of images with source 'local' that are uploaded to the controller at the same time.
+    - Images are streamed to the controller in fixed-size chunks and are not loaded into memory. The SHA-256 and MD5
+      digests of each uploaded image are returned in the 'UPLOAD' information of its response.
+    - The digests are compared with the checksum reported by the controller for the uploaded image, and the module
+      fails if they do not match.
+    - An image with source 'local' that is already present on the controller is uploaded again only if its size
+      differs from the size reported by the controller.
+    type: int
+    required: false
+    default: 1
 """
 
 EXAMPLES = """
@@ -176,6 +188,9 @@ EXAMPLES = """
 import os
 import json
 import copy
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
@@ -185,6 +200,7 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     dcnm_get_protocol_and_address,
     dcnm_get_auth_token,
     dcnm_post_request,
+    DcnmMultipartFile,
 )
 
 
@@ -256,8 +272,8 @@ class DcnmImageUpload:
             resp
             and (resp["RETURN_CODE"] == 200)
             and resp["MESSAGE"] == "OK"
-            and resp["DATA"]
-            and resp["DATA"]["lastOperDataObject"]
+            and isinstance(resp["DATA"], dict)
+            and resp["DATA"].get("lastOperDataObject")
         ):
             return resp["DATA"]["lastOperDataObject"]
         else:
@@ -315,13 +331,39 @@ class DcnmImageUpload:
         if del_payload["deleteTasksList"] != []:
             self.diff_delete.append(del_payload)
 
+    def dcnm_image_upload_is_same_image(self, want, have):
+
+        """
+        Routine to check if an image on the controller is the same as the image in the playbook. Images are matched
+        by name. For local images, the size of the local file must also match the size reported by the controller.
+
+        Parameters:
+            want (dict): Image payload built from the playbook
+            have (dict): Image information from the controller
+
+        Returns:
+            True if the images are the same
+            False otherwise
+        """
+
+        if os.path.basename(want["filePath"]) != have["imageName"]:
+            return False
+
+        if want.get("source") != "local" or not os.path.isfile(want["filePath"]):
+            return True
+
+        if str(have.get("size", "")) in ["", "None"]:
+            return True
+
+        return str(os.path.getsize(want["filePath"])) == str(have["size"])
+
     def dcnm_image_upload_compare_want_and_have(self, want):
 
         # Check if the image is already present. If present, do not try to upload again
         match_have = [
             elem
             for elem in self.have
-            if os.path.basename(want["filePath"]) == elem["imageName"]
+            if self.dcnm_image_upload_is_same_image(want, elem)
         ]
 
         if match_have:
@@ -371,12 +413,7 @@ class DcnmImageUpload:
                 match_elem = [
                     img
                     for img in dcnm_image_list
-                    if (
-                        (
-                            os.path.basename(elem["filePath"])
-                            == img["imageName"]
-                        )
-                    )
+                    if self.dcnm_image_upload_is_same_image(elem, img)
                 ]
 
                 if match_elem == []:
@@ -608,6 +645,51 @@ class DcnmImageUpload:
 
         return image_upload_payload
 
+    def dcnm_image_upload_post_local_file(self, path, headers, file_path):
+
+        """
+        Routine to stream a local file to the controller. The upload is retried up to 3 times, waiting 1, 2 seconds
+        between attempts, if the controller cannot be reached, does not return a JSON response or returns a 5xx
+        response.
+
+        Parameters:
+            path (str): Complete URL used to upload the file
+            headers (dict): Headers including the authentication token
+            file_path (str): Complete path to the local file
+
+        Returns:
+            resp (dict): Response from the controller, with upload details included in resp["UPLOAD"]
+        """
+
+        attempts = 0
+        start = time.monotonic()
+        with open(file_path, "rb") as fd:
+            fd.seek(0, os.SEEK_END)
+            size = fd.tell()
+            while True:
+                attempts += 1
+                fd.seek(0)
+                upload = DcnmMultipartFile(fd, os.path.basename(file_path), size)
+                resp = dcnm_post_request(path, headers, False, upload)
+
+                if attempts == 3 or (resp and resp.get("RETURN_CODE", 500) < 500):
+                    break
+                time.sleep(2 ** (attempts - 1))
+
+        if not resp:
+            resp = {"RETURN_CODE": 500, "METHOD": "POST", "REQUEST_PATH": path, "DATA": ""}
+
+        resp["UPLOAD"] = {
+            "file": file_path,
+            "size": size,
+            "attempts": attempts,
+            "elapsed": round(time.monotonic() - start, 3),
+        }
+        if upload.complete:
+            resp["UPLOAD"]["sha256"] = upload.sha256.hexdigest()
+            resp["UPLOAD"]["md5"] = upload.md5.hexdigest()
+        return resp
+
     def dcnm_image_upload_handle_local_file_transfer(self, elem):
 
         """
@@ -621,6 +703,23 @@ class DcnmImageUpload:
             False otherwise
         """
 
+        return self.dcnm_image_upload_handle_local_file_transfers([elem])
+
+    def dcnm_image_upload_handle_local_file_transfers(self, elems):
+
+        """
+        Routine to transfer a list of local files specified in the playbook to DCNM controller. Up to
+        'upload_workers' files are transferred at the same time. Responses are added to self.result in the
+        order of 'elems'.
+
+        Parameters:
+            elems (list): A list of dicts containing complete path to local files
+
+        Returns:
+            True if any file was successfully transfered
+            False otherwise
+        """
+
         protocol, address = dcnm_get_protocol_and_address(self.module)
 
         path = protocol + ":" + address + self.paths["DCNM_CREATE_IMAGE_LOCAL"]
@@ -631,23 +730,84 @@ class DcnmImageUpload:
         auth_token = dcnm_get_auth_token(self.module)
         headers.update(auth_token)
 
-        file_path = elem.get("filePath", "")
-
-        if file_path:
-            upload_files = {"file": open(file_path, "rb")}
+        file_paths = [elem.get("filePath", "") for elem in elems]
+        file_paths = [file_path for file_path in file_paths if file_path]
 
-            resp = dcnm_post_request(path, headers, False, upload_files)
+        workers = min(self.params.get("upload_workers") or 1, len(file_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                resps = list(
+                    executor.map(
+                        lambda file_path: self.dcnm_image_upload_post_local_file(path, headers, file_path),
+                        file_paths,
+                    )
+                )
+        else:
+            resps = [
+                self.dcnm_image_upload_post_local_file(path, headers, file_path)
+                for file_path in file_paths
+            ]
 
+        transferred = False
+        for resp in resps:
             self.result["response"].append(resp)
 
             if resp["DATA"] == "Successfully uploaded selected image file(s).":
                 resp["MESSAGE"] = "OK"
-                return True
+                transferred = True
             else:
                 resp["MESSAGE"] = ""
-                return False
-        else:
-            return False
+
+        self.dcnm_image_upload_verify_local_files(
+            [resp for resp in resps if resp["MESSAGE"] == "OK"]
+        )
+        return transferred
+
+    def dcnm_image_upload_verify_local_files(self, resps):
+
+        """
+        Routine to compare the digests of uploaded local files with the checksum reported by the controller. The
+        checksum is compared with the MD5 digest, or with the SHA-256 digest if it is 64 characters long. The
+        result of the comparison is included in resp["UPLOAD"]["verified"]. Images without a checksum on the
+        controller are not verified.
+
+        Parameters:
+            resps (list): Responses of the successful uploads
+
+        Returns:
+            None. The module fails if a checksum does not match.
+        """
+
+        resps = [resp for resp in resps if resp["UPLOAD"].get("md5")]
+        if not resps:
+            return
+
+        images = dict(
+            (image.get("imageName"), image)
+            for image in self.dcnm_image_upload_get_info_from_dcnm()
+        )
+
+        for resp in resps:
+            upload = resp["UPLOAD"]
+            checksum = str(
+                images.get(os.path.basename(upload["file"]), {}).get("checksum") or ""
+            ).lower()
+            if not checksum:
+                upload["verified"] = False
+                continue
+            digest = upload["sha256"] if len(checksum) == 64 else upload["md5"]
+            upload["verified"] = checksum == digest
+            if not upload["verified"]:
+                self.module.fail_json(
+                    msg={
+                        "CHANGED": self.changed_dict[0],
+                        "FAILURE REASON": "Checksum of uploaded image "
+                        + os.path.basename(upload["file"])
+                        + " does not match the local file",
+                        "UPLOAD": upload,
+                        "CONTROLLER CHECKSUM": checksum,
+                    }
+                )
 
     def dcnm_image_upload_send_message_to_dcnm(self):
 
@@ -665,6 +825,7 @@ class DcnmImageUpload:
         resp = None
         create_flag = False
         delete_flag = False
+        local_files = []
 
         for elem in self.diff_delete:
             path = self.paths["DCNM_DELETE_IMAGE"]
@@ -697,12 +858,15 @@ class DcnmImageUpload:
                 else:
                     create_flag = True
             else:
-                # Source is local and so the file is present on the local host. Read the file
-                # and tranfer the contents.
-
-                create_flag = self.dcnm_image_upload_handle_local_file_transfer(
-                    elem
-                )
+                # Source is local and so the file is present on the local host. The files are
+                # transferred once all the scp/sftp requests are sent.
+                local_files.append(elem)
+
+        if local_files:
+            create_flag = (
+                self.dcnm_image_upload_handle_local_file_transfers(local_files)
+                or create_flag
+            )
 
         self.result["changed"] = create_flag or delete_flag
 
@@ -718,6 +882,7 @@ def main():
             default="merged",
             choices=["merged", "deleted", "overridden", "query"],
         ),
+        upload_workers=dict(required=False, type="int", default=1),
     )
 
     module = AnsibleModule(
@@ -1879,10 +1879,11 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     dcnm_get_ip_addr_info,
     validate_list_of_dicts,
     get_ip_sn_dict,
+    dcnm_get_response_cache_stats,
     dcnm_version_supported,
     find_dict_in_list_by_key_value,
 )
-from ..module_utils.common.log_v2 import Log
+from ..module_utils.common.log_v2 import LazyJson, Log
 
 
 def json_pretty(msg):
@@ -1967,6 +1968,15 @@ class DcnmIntf:
         self.deferred_delete_member_defaults = []
         self._deferred_delete_member_default_keys = set()
 
+        # Timings of the per-switch GETs issued while computing have.
+        # See dcnm_intf_fetch_paths().
+        self.prefetch_stats = {
+            "requests": 0,
+            "retries": 0,
+            "elapsed": 0.0,
+            "slowest": 0.0,
+        }
+
         self.changed_dict = [
             {
                 "merged": [],
@@ -2241,9 +2251,10 @@ class DcnmIntf:
                     "UNDERLAY POLICIES": have["underlayPolicies"],
                 }
             )
-        msg = "HAVE ALL = "
-        msg += f"{json_pretty(lhave_all)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "HAVE ALL = "
+            msg += f"{json_pretty(lhave_all)}"
+            self.log.debug(msg)
 
     def dcnm_intf_xlate_speed(self, speed):
 
@@ -4121,36 +4132,53 @@ class DcnmIntf:
                             else:
                                 self.want.append(intf_payload)
 
-    def dcnm_intf_bulk_fetch_intf_info(self, serialNumber):
-        """Bulk-fetch all interface policy details for a switch and populate the cache.
+    def dcnm_intf_get_with_retry(self, path, retries=1):
+        """GET a path, retrying on failure with exponential backoff.
 
-        Instead of making one HTTP GET per interface via IF_WITH_SNO_IFNAME,
-        this fetches ALL interfaces for a serial number in a single call and
-        caches the results.  Subsequent calls to dcnm_intf_get_intf_info()
-        will resolve from the cache in O(1) instead of making a network
-        round-trip.
+        The request is retried up to 'retries' times in total, waiting 1, 2, 4...
+        seconds between attempts, until the controller returns an empty
+        response or RETURN_CODE 200.
 
-        Parameters:
-            serialNumber (str): The serial number of the switch. For VPC/AA_FEX
-                                combined serial numbers pass only one side.
+        Returns:
+            tuple: (response, attempts, elapsed seconds)
         """
 
-        sno = serialNumber.split("~")[0] if "~" in serialNumber else serialNumber
-
-        if sno in self.intf_detail_cached_snos:
-            return
-
-        path = self.paths["IF_WITH_SNO"].format(sno)
-
-        retry_count = 0
+        start = time.monotonic()
+        attempt = 0
         resp = []
-        while retry_count < 3:
-            retry_count += 1
+        while attempt < retries:
+            attempt += 1
             resp = dcnm_send(self.module, "GET", path)
 
             if resp == [] or (isinstance(resp, dict) and resp.get("RETURN_CODE") == 200):
                 break
-            time.sleep(1)
+            if attempt < retries:
+                time.sleep(2 ** (attempt - 1))
+
+        return resp, attempt, time.monotonic() - start
+
+    def dcnm_intf_fetch_paths(self, paths, retries=1):
+        """GET a list of paths and return the responses in the same order.
+
+        Timings are accumulated in self.prefetch_stats.
+        """
+
+        if not paths:
+            return []
+
+        start = time.monotonic()
+        results = [self.dcnm_intf_get_with_retry(path, retries) for path in paths]
+
+        stats = self.prefetch_stats
+        stats["requests"] += len(paths)
+        stats["retries"] += sum(attempts - 1 for dummy, attempts, dummy in results)
+        stats["elapsed"] = round(stats["elapsed"] + time.monotonic() - start, 3)
+        stats["slowest"] = round(max([stats["slowest"]] + [elapsed for dummy, dummy, elapsed in results]), 3)
+
+        return [resp for resp, dummy, dummy in results]
+
+    def dcnm_intf_cache_intf_info(self, sno, resp):
+        """Populate the interface detail cache from an IF_WITH_SNO response."""
 
         if (
             resp
@@ -4181,6 +4209,40 @@ class DcnmIntf:
 
         self.intf_detail_cached_snos.add(sno)
 
+    def dcnm_intf_bulk_fetch_intf_info(self, serialNumber):
+        """Bulk-fetch all interface policy details for a switch and populate the cache.
+
+        Instead of making one HTTP GET per interface via IF_WITH_SNO_IFNAME,
+        this fetches ALL interfaces for a serial number in a single call and
+        caches the results.  Subsequent calls to dcnm_intf_get_intf_info()
+        will resolve from the cache in O(1) instead of making a network
+        round-trip.
+
+        Parameters:
+            serialNumber (str): The serial number of the switch. For VPC/AA_FEX
+                                combined serial numbers pass only one side.
+        """
+
+        self.dcnm_intf_bulk_fetch_intf_info_all([serialNumber])
+
+    def dcnm_intf_bulk_fetch_intf_info_all(self, serial_numbers):
+        """Bulk-fetch interface policy details for a list of switches.
+
+        Same as dcnm_intf_bulk_fetch_intf_info() for every serial number in
+        the list, with the GETs issued through dcnm_intf_fetch_paths().
+        Serial numbers that are already cached are skipped.
+        """
+
+        snos = []
+        for serialNumber in serial_numbers:
+            sno = serialNumber.split("~")[0] if "~" in serialNumber else serialNumber
+            if sno not in self.intf_detail_cached_snos and sno not in snos:
+                snos.append(sno)
+
+        paths = [self.paths["IF_WITH_SNO"].format(sno) for sno in snos]
+        for sno, resp in zip(snos, self.dcnm_intf_fetch_paths(paths, retries=3)):
+            self.dcnm_intf_cache_intf_info(sno, resp)
+
     def dcnm_intf_get_intf_info(self, ifName, serialNumber, ifType):
 
         # For VPC and AA_FEX interfaces the serialNumber will be a combined one. But GET on interface cannot
@@ -4287,7 +4349,7 @@ class DcnmIntf:
         # Bulk-prefetch interface details for all switches referenced in self.want.
         # This populates the cache so that individual dcnm_intf_get_intf_info calls
         # below become O(1) lookups instead of individual HTTP GETs.
-        prefetched_snos = set()
+        prefetch_snos = []
         for elem in self.want:
             for intf in elem["interfaces"]:
                 sno = intf.get("serialNumber", "")
@@ -4296,9 +4358,8 @@ class DcnmIntf:
                 # For VPC/AA_FEX, use the first part of the ~-separated pair
                 if intf.get("interfaceType") in ("INTERFACE_VPC", "AA_FEX"):
                     sno = sno.split("~")[0]
-                if sno not in prefetched_snos:
-                    prefetched_snos.add(sno)
-                    self.dcnm_intf_bulk_fetch_intf_info(sno)
+                prefetch_snos.append(sno)
+        self.dcnm_intf_bulk_fetch_intf_info_all(prefetch_snos)
 
         # We have all the requested interface config in self.want. Interfaces are grouped together based on the
         # policy string and the interface name in a single dict entry.
@@ -4498,7 +4559,7 @@ class DcnmIntf:
         found in ``self.have`` and if found will replace the member interfaces in
         self.want with the correct policy and properties that can be managed.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -4519,11 +4580,7 @@ class DcnmIntf:
                     protected_keys = ["PO_ID", "PC_MODE", "INTF_NAME", "ALLOWED_VLANS", "DESC", "ADMIN_STATE", "CONF", "PRIMARY_INTF"]
                     match_int = find_dict_in_list_by_key_value(search=want_int['interfaces'], key='ifName', value=have_pc_name)
                     if match_int and match_int['serialNumber'] == have_pc_serial:
-                        msg = "\nHave Interface Info: "
-                        msg += f"{json_pretty(have_int)}"
-                        msg += "Want Interface Info Before Update: "
-                        msg += f"{json_pretty(want_int)}"
-                        self.log.debug(msg)
+                        self.log.debug("\nHave Interface Info: %sWant Interface Info Before Update: %s", LazyJson(have_int), LazyJson(want_int))
                         # Rewrite want nvPairs and policy with the correct information
                         want_int['interfaces'][0]['nvPairs']['PO_ID'] = have_int['interfaces'][0]['nvPairs']['PO_ID']
                         want_int['interfaces'][0]['nvPairs']['INTF_NAME'] = have_int['interfaces'][0]['nvPairs']['INTF_NAME']
@@ -4542,9 +4599,7 @@ class DcnmIntf:
                         # Update want_int policy to be the same as have_int policy
                         want_int['policy'] = have_int['policy']
 
-                        msg += "Want Interface Info After Update: "
-                        msg += f"{json_pretty(want_int)}"
-                        self.log.debug(msg)
+                        self.log.debug("Want Interface Info After Update: %s", LazyJson(want_int))
 
         self.want = want
         self.have = have
@@ -4554,7 +4609,7 @@ class DcnmIntf:
         ### Summary
         Compare want and have states for each interface
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -5556,12 +5611,9 @@ class DcnmIntf:
         # (inside dcnm_intf_get_intf_info) with at most S bulk GETs
         # (one per unique serial number), dramatically speeding up the
         # overridden diff computation for large interface counts.
-        prefetched_snos = set()
-        for h in self.have_all:
-            sno = h["serialNo"]
-            if sno not in prefetched_snos:
-                prefetched_snos.add(sno)
-                self.dcnm_intf_bulk_fetch_intf_info(sno)
+        self.dcnm_intf_bulk_fetch_intf_info_all(
+            [h["serialNo"] for h in self.have_all]
+        )
 
         # Pre-build O(1) lookup structures to replace linear scans.
         # want_set:  replaces match_want list comprehension over self.want
@@ -6385,6 +6437,26 @@ class DcnmIntf:
             ulist = usno
         return ulist
 
+    def dcnm_intf_get_compliance_index(self, snos):
+        """Fetch interface details of the given switches and index them.
+
+        Returns:
+            dict: (serialNo, ifName_lower) -> interface detail, for the
+                  interfaces in self.fabric
+        """
+
+        index = {}
+        for sno in snos:
+            path = self.paths["IF_DETAIL_WITH_SNO"].format(sno)
+            resp = dcnm_send(self.module, "GET", path)
+            if not (resp and "DATA" in resp and resp["DATA"]):
+                continue
+            for have in resp["DATA"]:
+                if have.get("fabricName") != self.fabric:
+                    continue
+                index[(have["serialNo"], have["ifName"].lower())] = have
+        return index
+
     def dcnm_intf_check_deployment_status(self, deploy_list):
 
         # Check for deployment status of all the configured objects only if the check_deploy flag is set.
@@ -6393,63 +6465,72 @@ class DcnmIntf:
 
         path = self.paths["GLOBAL_IF_DEPLOY"]
 
-        resp = {}
-
+        # Interfaces yet to reach 'In-Sync', keyed by (serialNumber, ifName_lower). For vPC interfaces
+        # the serial number is a combined one, and a GET on either switch returns the interface.
+        pending = {}
+        fetch_snos = []
         for item in deploy_list:
-            retries = 0
-            while retries < 60:
-                retries += 1
-                name = item["ifName"]
-                sno = item["serialNumber"]
+            pending[(item["serialNumber"], item["ifName"].lower())] = item
+            sno = item["serialNumber"].split("~")[0]
+            if sno not in fetch_snos:
+                fetch_snos.append(sno)
+
+        # Each polling round fetches every switch with pending interfaces once and retires the
+        # interfaces that are 'In-Sync'. Interfaces that are present but not yet 'In-Sync' are
+        # deployed again on the 10th and 20th round.
+        status = {}
+        retries = 0
+        while pending and retries < 60:
+            retries += 1
+
+            index = self.dcnm_intf_get_compliance_index(fetch_snos)
+
+            found = False
+            for key in list(pending):
+                have = index.get(key)
+                if have is None:
+                    # For merge state, the interfaces would have been created just now and may not
+                    # be returned yet. Fetch them again before checking
+                    continue
+                found = True
+                status[key] = have["complianceStatus"]
+                if status[key] == "In-Sync":
+                    del pending[key]
+                    continue
 
-                match_have = [
-                    have
-                    for have in self.have_all
-                    if (
-                        (name.lower() == have["ifName"].lower())
-                        and (sno == have["serialNo"])
-                        and (self.fabric == have["fabricName"])
+                if retries == 10 or retries == 20:
+                    json_payload = json.dumps(
+                        {
+                            "ifName": pending[key]["ifName"],
+                            "serialNumber": pending[key]["serialNumber"],
+                            "fabricName": self.fabric,
+                        }
                     )
-                ]
-                if match_have:
-
-                    if match_have[0]["complianceStatus"] == "In-Sync":
-                        break
+                    dcnm_send(self.module, "POST", path, json_payload)
 
-                    if retries == 10 or retries == 20:
-                        json_payload = json.dumps(
-                            {
-                                "ifName": name,
-                                "serialNumber": sno,
-                                "fabricName": self.fabric,
-                            }
-                        )
-                        resp = dcnm_send(
-                            self.module, "POST", path, json_payload
-                        )
+            fetch_snos = [
+                sno
+                for sno in fetch_snos
+                if any(key[0].split("~")[0] == sno for key in pending)
+            ]
 
-                    time.sleep(5)
-                    self.have_all = []
-                    self.dcnm_intf_get_have_all_with_sno(sno)
-                else:
-                    # For merge state, the interfaces would have been created just now. Fetch them again before checking
-                    self.have_all = []
-                    self.dcnm_intf_get_have_all_with_sno(sno)
-            if (
-                match_have == []
-                or match_have[0]["complianceStatus"] != "In-Sync"
-            ):
-                self.module.fail_json(
-                    msg={
-                        "FAILURE REASON": "Interafce "
-                        + name
-                        + " did not reach 'In-Sync' State",
-                        "Compliance Status": match_have[0]["complianceStatus"],
-                        # "CHANGED": self.changed_dict,
-                        # "RESP": resp
-                        "RESULT": self.result,
-                    }
-                )
+            if pending and found:
+                time.sleep(5)
+
+        if pending:
+            key = next(iter(pending))
+            self.module.fail_json(
+                msg={
+                    "FAILURE REASON": "Interafce "
+                    + pending[key]["ifName"]
+                    + " did not reach 'In-Sync' State",
+                    "Compliance Status": status.get(key),
+                    "Pending Interfaces": [item["ifName"] for item in pending.values()],
+                    # "CHANGED": self.changed_dict,
+                    # "RESP": resp
+                    "RESULT": self.result,
+                }
+            )
 
     def dcnm_intf_send_message_to_dcnm(self):
 
@@ -7017,6 +7098,13 @@ def main():
 
     dcnm_intf.result["diff"] = dcnm_intf.changed_dict
 
+    response_cache_stats = dcnm_get_response_cache_stats(module)
+    if response_cache_stats is not None:
+        dcnm_intf.result["response_cache"] = response_cache_stats
+
+    if dcnm_intf.prefetch_stats["requests"]:
+        dcnm_intf.result["prefetch"] = dcnm_intf.prefetch_stats
+
     if (
         dcnm_intf.diff_create
         or dcnm_intf.diff_replace
@@ -236,6 +236,15 @@ options:
     type: bool
     required: false
     default: false
+  wait_timeout:
+    description:
+    - Maximum number of seconds to wait for added switches to be rediscovered and become
+      manageable and reachable.
+    - The switch inventory is polled with an exponentially increasing interval. The mode,
+      manageability and status changes of each added switch are returned in I(timeline).
+    type: int
+    required: false
+    default: 1800
 """
 
 EXAMPLES = """
@@ -500,6 +509,7 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     get_fabric_details,
     get_fabric_inventory_details,
     get_ip_sn_dict,
+    DcnmWaiter,
 )
 
 
@@ -528,6 +538,7 @@ class DcnmInventory:
         self.poap_inventory = []
         self.poap_inventory_by_serial = {}
         self.poap_inventory_loaded = False
+        self.waiter = None
 
         self.result = dict(changed=False, diff=[], response=[])
 
@@ -1019,11 +1030,7 @@ class DcnmInventory:
                         # Assign Role
                         self.assign_role()
 
-                        for check in range(1, 120):
-                            if not self.all_switches_ok():
-                                time.sleep(5)
-                            else:
-                                break
+                        self.wait_for_switches_ok()
 
                         # Config-save all switches
                         if self.params["save"]:
@@ -1281,17 +1288,47 @@ class DcnmInventory:
                     self.failure(import_response)
 
     def rediscover_switch(self, serial_num):
+        self.rediscover_switches([serial_num])
+
+    def send_rediscover(self, serial_num):
         method = "POST"
         path = "/rest/control/fabrics/{0}/inventory/rediscover/{1}".format(
             self.fabric, serial_num
         )
         if self.nd:
             path = self.nd_prefix + path
-        response = dcnm_send(self.module, method, path)
-        self.result["response"].append(response)
-        fail, self.result["changed"] = self.handle_response(response, "create")
-        if fail:
-            self.failure(response)
+        return dcnm_send(self.module, method, path)
+
+    def rediscover_switches(self, serial_nums):
+        # Rediscovery requests are sent in the order of serial_nums.
+        for serial_num in serial_nums:
+            response = self.send_rediscover(serial_num)
+            self.result["response"].append(response)
+            fail, self.result["changed"] = self.handle_response(response, "create")
+            if fail:
+                self.failure(response)
+
+    def get_waiter(self):
+        # A single waiter is shared by all the waits of a module run so that
+        # wait_timeout bounds the total time spent waiting for the switches.
+        if self.waiter is None:
+            self.waiter = DcnmWaiter(self.params.get("wait_timeout") or 1800)
+            self.result["timeline"] = self.waiter.timeline
+        return self.waiter
+
+    def record_switch_states(self, inv_data):
+        target_snos = set(self.switch_snos)
+        waiter = self.get_waiter()
+        for switch in inv_data.get("DATA") or []:
+            if switch["serialNumber"] in target_snos:
+                waiter.record(
+                    switch["serialNumber"],
+                    {
+                        "mode": switch.get("mode"),
+                        "managable": switch.get("managable"),
+                        "status": switch.get("status"),
+                    },
+                )
 
     def rediscover_all_switches(self):
         # V2 OPTIMIZATION: Use set-based lookups instead of O(N*M) nested loops
@@ -1299,6 +1336,8 @@ class DcnmInventory:
         # to O(N) where N = number of switches in fabric inventory.
 
         # Get Fabric Inventory Details
+        # The switchesByFabric API cannot be filtered by serial number, so every
+        # poll fetches the fabric inventory and only the added switches are looked at.
         method = "GET"
         path = "/rest/control/fabrics/{0}/inventory/switchesByFabric".format(
             self.fabric
@@ -1318,6 +1357,17 @@ class DcnmInventory:
 
         # V2: Pre-build a set for O(1) serial number lookups
         target_snos = set(self.switch_snos)
+        waiter = self.get_waiter()
+        self.record_switch_states(get_inv)
+
+        greenfield_debug = (
+            self.fabric_details["nvPairs"]["GRFIELD_DEBUG_FLAG"].lower() == "enable"
+        )
+        # It may take a few seconds for switches to enter migration mode when
+        # GRFIELD_DEBUG_FLAG is set. Unless a switch has been seen in migration
+        # mode, wait for at least this many seconds before moving on.
+        migration_warmup = 20
+        seen = {"migration": False}
 
         def ready_to_continue(inv_data):
             # This is a helper function to wait for certain events to complete
@@ -1335,13 +1385,14 @@ class DcnmInventory:
                 ):
                     # At least one switch is still in migration mode
                     # so not ready to continue
+                    seen["migration"] = True
                     return False
 
             # Check # 2
             # The fabric has a setting to prevent reload for greenfield
             # deployments.  If this is enabled we can skip check 3 and just return True
-            if self.fabric_details["nvPairs"]["GRFIELD_DEBUG_FLAG"].lower() == "enable":
-                return True
+            if greenfield_debug:
+                return seen["migration"] or waiter.elapsed >= migration_warmup
 
             # Check # 3
             # If we get to this check that means the GRFIELD_DEBUG_FLAG is disabled
@@ -1367,52 +1418,34 @@ class DcnmInventory:
                     return False
             return True
 
+        latest = {"inv": get_inv}
+
+        def poll(check):
+            def poll_inventory():
+                latest["inv"] = dcnm_send(self.module, method, path)
+                self.record_switch_states(latest["inv"])
+                return check(latest["inv"])
+
+            return poll_inventory
+
         # It can take a while to rediscover switches if they are reloading
         # while importing them into the fabric.
-        attempt = 1
-        total_attempts = 300
         # If all switches to be added have preserve_config set to true then
-        # we don't need to loop.
+        # we don't need to wait.
         all_brownfield_switches = True
         for switch in self.config:
             if not switch.get("preserve_config", True):
                 all_brownfield_switches = False
 
-        while attempt < total_attempts and not all_brownfield_switches and self.switch_snos:
+        if not all_brownfield_switches and self.switch_snos:
             # Don't error out.  We might miss the status change so worst case
-            # scenario is that we loop 300 times and then bail out.
-            if attempt == 1:
-                if (
-                    self.fabric_details["nvPairs"]["GRFIELD_DEBUG_FLAG"].lower()
-                    == "enable"
-                ):
-                    # It may take a few seconds for switches to enter migration mode when
-                    # this flag is set.  Give it a few seconds.
-                    time.sleep(20)
-            get_inv = dcnm_send(self.module, method, path)
-            if not ready_to_continue(get_inv):
-                time.sleep(5)
-                attempt += 1
-                continue
-
-            break
+            # scenario is that we wait until the deadline and then move on.
+            waiter.wait(poll(ready_to_continue))
 
-        attempt = 1
-        total_attempts = 300
-
-        while attempt < total_attempts:
-            if attempt == total_attempts:
-                msg = "Failed to rediscover switches after {0} attempts".format(
-                    total_attempts
-                )
-                self.module.fail_json(msg=msg)
-            get_inv = dcnm_send(self.module, method, path)
-            if not switches_managable(get_inv):
-                time.sleep(5)
-                attempt += 1
-                continue
-
-            break
+        # Switches that are still not manageable when the deadline expires are
+        # reported by the all_switches_ok() check that follows rediscovery.
+        waiter.wait(poll(switches_managable))
+        get_inv = latest["inv"]
 
         # V2: Collect all matching serials first, then rediscover
         # Uses set lookup O(N) instead of O(N*M) nested loop
@@ -1421,8 +1454,11 @@ class DcnmInventory:
             if inv["serialNumber"] in target_snos:
                 rediscover_serials.append(inv["serialNumber"])
 
-        for sn in rediscover_serials:
-            self.rediscover_switch(sn)
+        self.rediscover_switches(rediscover_serials)
+
+    def wait_for_switches_ok(self):
+        # Poll until all the switches are reachable or the deadline expires.
+        return self.get_waiter().wait(self.all_switches_ok)
 
     def all_switches_ok(self):
         all_ok = True
@@ -1444,11 +1480,15 @@ class DcnmInventory:
             msg2 = "Unable to find inventories under fabric: {0}".format(self.fabric)
             self.module.fail_json(msg=msg1 if missing_fabric else msg2)
 
+        self.record_switch_states(get_inv)
+
         # V2: Single pass O(N) with set lookup instead of O(N*M) nested loop
+        not_ok_serials = []
         for inv in get_inv["DATA"]:
             if inv["serialNumber"] in target_snos and inv["status"] != "ok":
                 all_ok = False
-                self.rediscover_switch(inv["serialNumber"])
+                not_ok_serials.append(inv["serialNumber"])
+        self.rediscover_switches(not_ok_serials)
 
         # If the switches added through discovery itself has issues, then there is no
         # point in checking rma switch status, so return false here.
@@ -1685,8 +1725,11 @@ class DcnmInventory:
                 break
 
             if not success and x in range(0, no_of_tries - 1):
-                # V2: 60s retry interval instead of 600s (10min)
-                time.sleep(60)
+                time.sleep(self.config_save_retry_delay(x))
+
+    def config_save_retry_delay(self, attempt):
+        # Back off from 10 seconds up to 60 seconds between retries
+        return min(60, 10 * 2 ** attempt)
 
     def config_deploy(self):
         # config-deploy
@@ -2021,6 +2064,7 @@ def main():
         query_poap=dict(type="bool", default=False),
         save=dict(type="bool", default=True),
         deploy=dict(type="bool", default=True),
+        wait_timeout=dict(type="int", default=1800),
     )
 
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=True)
@@ -2130,13 +2174,7 @@ def main():
 
             # Step 3
             # Check all devices are up
-            # V2: Reduced from 300 to 120 max iterations (120 x 5s = 10min max)
-            for check in range(1, 120):
-                if not dcnm_inv.all_switches_ok():
-                    time.sleep(5)
-                    continue
-
-                break
+            dcnm_inv.wait_for_switches_ok()
 
             # Step 4
             # Verify all devices came up finally
@@ -53,6 +53,19 @@ options:
     type: bool
     required: false
     default: true
+  have_lookup:
+    description:
+      - Method used to read existing links from the controller before computing the changes to be made.
+      - If set to 'switch_pair', the links between the source and destination switches of every link included in
+        the playbook are read separately.
+      - If set to 'fabric', all links of the source fabric are read once and the links included in the playbook
+        are matched against them. This is faster when the playbook includes a large number of links.
+    type: str
+    required: false
+    choices:
+      - switch_pair
+      - fabric
+    default: switch_pair
   config:
     description:
       - A list of dictionaries containing Links information.
@@ -854,6 +867,7 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     dcnm_get_bulk_api_support,
     dcnm_send,
     validate_list_of_dicts,
+    dcnm_get_response_cache_stats,
     dcnm_version_supported,
     get_ip_sn_dict,
     get_fabric_inventory_details,
@@ -955,6 +969,9 @@ class DcnmLinks:
         self.links_info = []
         self.want = []
         self.have = []
+        # Links in self.have indexed by the fabric, serial number and interface name
+        # of both ends. See dcnm_links_get_link_key().
+        self.have_index = {}
         self.diff_create = []
         self.diff_modify = []
         self.diff_delete = []
@@ -2191,33 +2208,12 @@ class DcnmLinks:
 
             match_links = [
                 have
-                for have in self.have
+                for have in self.have_index.get(
+                    self.dcnm_links_get_want_link_keys(want)[0], []
+                )
                 if (
-                    (have["sw1-info"]["fabric-name"] == want["sourceFabric"])
-                    and (
-                        have["sw2-info"]["fabric-name"]
-                        == want["destinationFabric"]
-                    )
-                    and (
-                        have["sw1-info"]["if-name"].lower()
-                        == want["sourceInterface"].lower()
-                    )
-                    and (
-                        have["sw2-info"]["if-name"].lower()
-                        == want["destinationInterface"].lower()
-                    )
-                    and (
-                        have["sw1-info"]["sw-serial-number"]
-                        == want["sourceDevice"]
-                    )
-                    and (
-                        have["sw2-info"]["sw-serial-number"]
-                        == want["destinationDevice"]
-                    )
-                    and (
-                        have.get("templateName", "")
-                        == want.get("templateName", "")
-                    )
+                    have.get("templateName", "")
+                    == want.get("templateName", "")
                 )
             ]
 
@@ -2385,6 +2381,110 @@ class DcnmLinks:
         else:
             return []
 
+    def dcnm_links_get_link_key(self, src_fabric, src_sno, src_intf, dst_fabric, dst_sno, dst_intf):
+
+        """
+        Routine to build the key used to index links by the fabric, serial number and interface name
+        of both ends.
+
+        Returns:
+            key (tuple): Key to be used with self.have_index
+        """
+
+        return (src_fabric, src_sno, src_intf.lower(), dst_fabric, dst_sno, dst_intf.lower())
+
+    def dcnm_links_get_have_link_key(self, have):
+
+        return self.dcnm_links_get_link_key(
+            have["sw1-info"]["fabric-name"],
+            have["sw1-info"]["sw-serial-number"],
+            have["sw1-info"]["if-name"],
+            have["sw2-info"]["fabric-name"],
+            have["sw2-info"]["sw-serial-number"],
+            have["sw2-info"]["if-name"],
+        )
+
+    def dcnm_links_get_want_link_keys(self, want, match_sno=True):
+
+        """
+        Routine to build the keys of links that match the given link from self.want. The destination
+        device of a link is identified by its serial number or, if the device is not managable, by
+        "<switch name>-<fabric>".
+
+        Parameters:
+            want (dict): Link information from self.want
+            match_sno (bool): Include the key with the serial number of the destination device. The
+                              first key is the serial number key if this is True
+
+        Returns:
+            keys (list): Keys to be used with self.have_index
+        """
+
+        dst_devices = []
+        if match_sno:
+            dst_devices.append(want["destinationDevice"])
+        dst_name = want.get("destinationSwitchName", "") + "-" + want["destinationFabric"]
+        if dst_name not in dst_devices:
+            dst_devices.append(dst_name)
+
+        return [
+            self.dcnm_links_get_link_key(
+                want["sourceFabric"],
+                want["sourceDevice"],
+                want["sourceInterface"],
+                want["destinationFabric"],
+                dst_device,
+                want["destinationInterface"],
+            )
+            for dst_device in dst_devices
+        ]
+
+    def dcnm_links_index_links(self, links):
+
+        """
+        Routine to index a list of links by the keys built by dcnm_links_get_have_link_key()
+
+        Parameters:
+            links (list): Links obtained from the controller
+
+        Returns:
+            index (dict): Key to list of links with that key, in the order of 'links'
+        """
+
+        index = {}
+        for link in links:
+            index.setdefault(self.dcnm_links_get_have_link_key(link), []).append(link)
+        return index
+
+    def dcnm_links_get_fabric_links_index(self):
+
+        """
+        Routine to get all links of the source fabric from the controller and index them.
+
+        Parameters:
+            None
+
+        Returns:
+            index (dict): Links of the source fabric indexed by dcnm_links_index_links()
+        """
+
+        path = self.paths["LINKS_GET_BY_FABRIC"].format(self.fabric)
+        resp = dcnm_send(self.module, "GET", path)
+
+        if not (
+            resp
+            and (resp["RETURN_CODE"] == 200)
+            and (resp["MESSAGE"] == "OK")
+            and resp["DATA"]
+        ):
+            return {}
+
+        # resp["DATA"] will be a list if there is more than one link. It will be a dict otherwise
+        if not isinstance(resp["DATA"], list):
+            resp["DATA"] = [resp["DATA"]]
+
+        return self.dcnm_links_index_links(resp["DATA"])
+
     def dcnm_links_get_have(self):
 
         """
@@ -2401,17 +2501,39 @@ class DcnmLinks:
         if self.want == []:
             return
 
+        fabric_links = None
+        if self.module.params.get("have_lookup") == "fabric":
+            fabric_links = self.dcnm_links_get_fabric_links_index()
+            managable_snos = set(self.ip_sn.values())
+
         for link in self.want:
-            have = self.dcnm_links_get_links_info_from_dcnm(link)
-            if (have != []) and (have not in self.have):
-                # we do not get information about PEER_CONF, PEER_DESC, MTU from DCNM
-                if have.get("templateName") == self.templates["int_pre_provision_intra_fabric_link"]:
-                    have["nvPairs"]["PEER1_CONF"] = have["nvPairs"].get("PEER1_CONF", "")
-                    have["nvPairs"]["PEER2_CONF"] = have["nvPairs"].get("PEER2_CONF", "")
-                    have["nvPairs"]["MTU"] = have["nvPairs"].get("MTU", 1500)
-                    have["nvPairs"]["PEER1_DESC"] = have["nvPairs"].get("PEER1_DESC", "")
-                    have["nvPairs"]["PEER2_DESC"] = have["nvPairs"].get("PEER2_DESC", "")
-                self.have.append(have)
+            if fabric_links is None:
+                have = self.dcnm_links_get_links_info_from_dcnm(link)
+            else:
+                # Same matching as dcnm_links_get_links_info_from_dcnm(), using the fabric links index
+                keys = self.dcnm_links_get_want_link_keys(
+                    link, match_sno=link["destinationDevice"] in managable_snos
+                )
+                match_link = [elem for key in keys for elem in fabric_links.get(key, [])]
+                have = match_link[0] if match_link else []
+
+            if have == []:
+                continue
+
+            # Only links with the same key can be equal
+            same_key_links = self.have_index.setdefault(self.dcnm_links_get_have_link_key(have), [])
+            if have in same_key_links:
+                continue
+
+            # we do not get information about PEER_CONF, PEER_DESC, MTU from DCNM
+            if have.get("templateName") == self.templates["int_pre_provision_intra_fabric_link"]:
+                have["nvPairs"]["PEER1_CONF"] = have["nvPairs"].get("PEER1_CONF", "")
+                have["nvPairs"]["PEER2_CONF"] = have["nvPairs"].get("PEER2_CONF", "")
+                have["nvPairs"]["MTU"] = have["nvPairs"].get("MTU", 1500)
+                have["nvPairs"]["PEER1_DESC"] = have["nvPairs"].get("PEER1_DESC", "")
+                have["nvPairs"]["PEER2_DESC"] = have["nvPairs"].get("PEER2_DESC", "")
+            self.have.append(have)
+            same_key_links.append(have)
 
     def dcnm_links_compare_inter_fabric_link_params(self, wlink, hlink):
 
@@ -3174,37 +3296,10 @@ class DcnmLinks:
 
         match_have = [
             have
-            for have in self.have
-            if (
-                (
-                    have.get("templateName") is not None
-                )  # if templateName is empty, link is autodicovered, consider link is new
-                and (have["sw1-info"]["fabric-name"] == want["sourceFabric"])
-                and (
-                    have["sw2-info"]["fabric-name"]
-                    == want["destinationFabric"]
-                )
-                and (
-                    have["sw1-info"]["if-name"].lower()
-                    == want["sourceInterface"].lower()
-                )
-                and (
-                    have["sw2-info"]["if-name"].lower()
-                    == want["destinationInterface"].lower()
-                )
-                and (
-                    have["sw1-info"]["sw-serial-number"]
-                    == want["sourceDevice"]
-                )
-                and (
-                    have["sw2-info"]["sw-serial-number"]
-                    == want["destinationDevice"]
-                    or have["sw2-info"]["sw-serial-number"]
-                    == want["destinationSwitchName"]
-                    + "-"
-                    + want["destinationFabric"]
-                )
-            )
+            for key in self.dcnm_links_get_want_link_keys(want)
+            for have in self.have_index.get(key, [])
+            # if templateName is empty, link is autodicovered, consider link is new
+            if have.get("templateName") is not None
         ]
 
         for mlink in match_have:
@@ -3850,6 +3945,11 @@ def main():
             choices=["merged", "deleted", "replaced", "query"],
         ),
         deploy=dict(type="bool", default="true"),
+        have_lookup=dict(
+            type="str",
+            default="switch_pair",
+            choices=["switch_pair", "fabric"],
+        ),
     )
 
     module = AnsibleModule(
@@ -3905,6 +4005,10 @@ def main():
         {"Monitoring": dcnm_links.monitoring}
     )
 
+    response_cache_stats = dcnm_get_response_cache_stats(module)
+    if response_cache_stats is not None:
+        dcnm_links.result["response_cache"] = response_cache_stats
+
     if dcnm_links.diff_create or dcnm_links.diff_delete:
         dcnm_links.result["changed"] = True
 
@@ -28,6 +28,16 @@ author: Allen Robel (@quantumonion)
 description:
 - Enable Maintenance or Normal Mode.
 options:
+    fabric_deploy:
+        default: false
+        description:
+        - Deploy the switches of each fabric with one fabric config-deploy
+          request, instead of one deploy-maintenance-mode request per switch.
+        - The mode of the switches with wait_for_mode_change enabled is then
+          polled, for all of them at once, until the mode change is complete.
+        - Only used with state merged.
+        required: false
+        type: bool
     state:
         choices:
         - merged
@@ -294,7 +304,7 @@ class ParamsSpec:
         """
         -   setter: set the params
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}.setter: "
             msg += "Invalid type. Expected dict but "
@@ -474,7 +484,7 @@ class Want:
         ### self.want structure
         See class docstring.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.validator is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -527,7 +537,7 @@ class Want:
                 from global_config.
             -   If item_config has a parameter, use it.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         if self.config is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -690,7 +700,7 @@ class Want:
 
     @params_spec.setter
     def params_spec(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "ParamsSpec"
         msg = f"{self.class_name}.{method_name}: "
@@ -726,7 +736,7 @@ class Want:
 
     @validator.setter
     def validator(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         _class_have = None
         _class_need = "ParamsValidate"
         msg = f"{self.class_name}.{method_name}: "
@@ -760,7 +770,7 @@ class Common:
                 -   ``config`` is not a dict
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
 
         self.params = params
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -840,7 +850,7 @@ class Merged(Common):
         -   ``ValueError`` if Common().__init__() raises ``ValueError``
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -909,7 +919,7 @@ class Merged(Common):
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             instance = MaintenanceModeInfo(self.params)
@@ -937,7 +947,7 @@ class Merged(Common):
         ### Raises
         -   ``ValueError`` if any of the above cases are true
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         for ip_address, value in self.have.items():
             fabric_name = value.get("fabric_name")
             mode = value.get("mode")
@@ -1026,7 +1036,7 @@ class Merged(Common):
             }
         ]
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.need = []
         for want in self.want:
             ip_address = want.get("ip_address", None)
@@ -1059,7 +1069,7 @@ class Merged(Common):
                 -   ``get_have()`` raises ``ValueError``
                 -   ``send_need()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -1106,7 +1116,7 @@ class Merged(Common):
             ``TypeError`` or ``ValueError``
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         if len(self.need) == 0:
             msg = f"{self.class_name}.{method_name}: "
@@ -1117,6 +1127,7 @@ class Merged(Common):
         try:
             self.maintenance_mode.rest_send = self.rest_send
             self.maintenance_mode.results = self.results
+            self.maintenance_mode.fabric_deploy = self.params.get("fabric_deploy", False)
             self.maintenance_mode.config = self.need
             self.maintenance_mode.commit()
         except (TypeError, ValueError) as error:
@@ -1139,7 +1150,7 @@ class Query(Common):
         -   ``ValueError`` if Common().__init__() raises ``ValueError``
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -1205,7 +1216,7 @@ class Query(Common):
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = inspect.currentframe().f_code.co_name  # pylint: disable=unused-variable
 
         try:
             self.maintenance_mode_info.rest_send = self.rest_send
@@ -1233,7 +1244,7 @@ class Query(Common):
                 -   ``get_want()`` raises ``ValueError``
                 -   ``get_have()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         msg = f"{self.class_name}.{method_name}: entered"
         self.log.debug(msg)
 
@@ -1283,6 +1294,11 @@ def main():
         "required": True,
         "type": "dict",
     }
+    argument_spec["fabric_deploy"] = {
+        "default": False,
+        "required": False,
+        "type": "bool",
+    }
     argument_spec["state"] = {
         "choices": ["merged", "query"],
         "default": "merged",
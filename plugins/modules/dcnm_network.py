@@ -87,6 +87,15 @@ options:
       - switch
       - resource
     default: switch
+  child_fabric_parallelism:
+    description:
+    - Maximum number of child fabrics that are configured at the same time
+    - Only used when I(fabric) is a multisite or multicluster parent fabric with C(child_fabric_config)
+    - Child fabrics are configured after the parent fabric. When a child fabric fails, child fabrics that have not started are skipped
+    - Values greater than 1 require module pipelining, otherwise child fabrics are configured one at a time
+    type: int
+    required: false
+    default: 1
   config:
     description:
     - List of details of networks being managed. Not required for state deleted
@@ -1005,6 +1014,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
     dcnm_get_bulk_api_support,
     dcnm_get_ip_addr_info,
+    dcnm_get_response_cache_stats,
     dcnm_get_url,
     dcnm_send,
     get_nd_fabric_details,
@@ -1015,7 +1025,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     validate_list_of_dicts,
     sanitize_lan_attach_list
 )
-from ..module_utils.common.log_v2 import Log
+from ..module_utils.common.log_v2 import LazyJson, Log
+from ..module_utils.common.tracer import get_tracer
 
 
 class DcnmNetwork:
@@ -1062,9 +1073,10 @@ class DcnmNetwork:
         self.module = module
         self.params = module.params
 
-        msg = "self.params: "
-        msg += f"{json.dumps(self.params, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.params: "
+            msg += f"{json.dumps(self.params, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self.fabric = module.params["fabric"]
         self.config = copy.deepcopy(module.params.get("config"))
@@ -1138,9 +1150,10 @@ class DcnmNetwork:
 
         self.inventory_data = get_nd_fabric_inventory_details(self.module, self.dcnm_version, self.fabric, self.fabric_details)
 
-        msg = "self.inventory_data: "
-        msg += f"{json.dumps(self.inventory_data, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.inventory_data: "
+            msg += f"{json.dumps(self.inventory_data, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         self.ip_sn, self.hn_sn = get_ip_sn_dict(self.inventory_data)
         self.logical_name_inventory = {}
@@ -1153,9 +1166,7 @@ class DcnmNetwork:
         # Use get_nd_fabric_details for ND/multicluster support (handles proxy paths for child fabrics)
         self.fabric_det = get_nd_fabric_details(module, self.dcnm_version, self.fabric, self.fabric_details)
 
-        msg = "self.fabric_det: "
-        msg += f"{json.dumps(self.fabric_det, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        self.log.debug("self.fabric_det: %s", LazyJson(self.fabric_det))
 
         self.is_ms_fabric = True if self.fabric_det.get("fabricType") == "MFD" else False
         if self.dcnm_version > 12:
@@ -1404,7 +1415,7 @@ class DcnmNetwork:
         return serials
 
     def diff_for_attach_deploy(self, want_a, have_a, replace=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -1627,7 +1638,7 @@ class DcnmNetwork:
         return attach_list, dep_net
 
     def update_attach_params(self, attach, net_name, deploy):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -1706,7 +1717,7 @@ class DcnmNetwork:
         Returns:
             list: Ordered list of unique serial numbers
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -1797,7 +1808,7 @@ class DcnmNetwork:
         Returns:
             Transformed payload mapping serial numbers to comma-separated network names
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -1832,9 +1843,10 @@ class DcnmNetwork:
         # Convert to multicluster format: {serialNumber: "net1,net2,net3"}
         result = {serial: ",".join(nets) for serial, nets in serial_to_networks.items()}
 
-        msg = "Returning transformed payload: "
-        msg += f"{json.dumps(result, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning transformed payload: "
+            msg += f"{json.dumps(result, indent=4)}"
+            self.log.debug(msg)
 
         return result
 
@@ -1846,7 +1858,7 @@ class DcnmNetwork:
         diff_deploy.  Resource deploy must target every switch touched by either
         side of that diff.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}."
@@ -1881,9 +1893,10 @@ class DcnmNetwork:
 
         result = {serial: ",".join(networks) for serial, networks in serial_to_networks.items()}
 
-        msg = "Returning combined transformed payload: "
-        msg += f"{json.dumps(result, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning combined transformed payload: "
+            msg += f"{json.dumps(result, indent=4)}"
+            self.log.debug(msg)
 
         return result
 
@@ -1925,7 +1938,7 @@ class DcnmNetwork:
                 self.failure(resp)
 
     def diff_for_create(self, want, have):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2388,7 +2401,7 @@ class DcnmNetwork:
         )
 
     def update_create_params(self, net):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2606,7 +2619,7 @@ class DcnmNetwork:
         return False
 
     def get_have(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2879,20 +2892,22 @@ class DcnmNetwork:
         self.have_deploy = have_deploy
         self.network_to_sns = network_to_sns
 
-        msg = "self.have_create: "
-        msg += f"{json.dumps(self.have_create, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.have_create: "
+            msg += f"{json.dumps(self.have_create, indent=4)}"
+            self.log.debug(msg)
 
         msg = "self.have_attach: "
         msg += f"{self.have_attach}"
         self.log.debug(msg)
 
-        msg = "self.have_deploy: "
-        msg += f"{json.dumps(self.have_deploy, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.have_deploy: "
+            msg += f"{json.dumps(self.have_deploy, indent=4)}"
+            self.log.debug(msg)
 
     def get_want(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2972,20 +2987,21 @@ class DcnmNetwork:
         self.want_attach = want_attach
         self.want_deploy = want_deploy
 
-        msg = "self.want_create: "
-        msg += f"{json.dumps(self.want_create, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.want_create: "
+            msg += f"{json.dumps(self.want_create, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.want_attach: "
-        msg += f"{json.dumps(self.want_attach, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.want_attach: "
+            msg += f"{json.dumps(self.want_attach, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.want_deploy: "
-        msg += f"{json.dumps(self.want_deploy, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.want_deploy: "
+            msg += f"{json.dumps(self.want_deploy, indent=4)}"
+            self.log.debug(msg)
 
     def get_diff_delete(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3059,20 +3075,21 @@ class DcnmNetwork:
         self.diff_undeploy = diff_undeploy
         self.diff_delete = diff_delete
 
-        msg = "self.diff_detach: "
-        msg += f"{json.dumps(self.diff_detach, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_detach: "
+            msg += f"{json.dumps(self.diff_detach, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_undeploy: "
-        msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_undeploy: "
+            msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_delete: "
-        msg += f"{json.dumps(self.diff_delete, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_delete: "
+            msg += f"{json.dumps(self.diff_delete, indent=4)}"
+            self.log.debug(msg)
 
     def get_diff_override(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3133,7 +3150,7 @@ class DcnmNetwork:
         return warn_msg
 
     def get_diff_replace(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3235,7 +3252,7 @@ class DcnmNetwork:
         return warn_msg
 
     def get_diff_merge(self, replace=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3520,7 +3537,7 @@ class DcnmNetwork:
         - Config changes: Deploy to all currently attached switches
         - Mixed operations: Correct switch selection for each operation type
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}."
@@ -3680,13 +3697,14 @@ class DcnmNetwork:
                         )
                         self.log.debug(msg)
 
-        msg = "Final network_sn_attach_map: "
-        msg += f"{json.dumps({k: list(v) for k, v in self.network_sn_attach_map.items()}, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Final network_sn_attach_map: "
+            msg += f"{json.dumps({k: list(v) for k, v in self.network_sn_attach_map.items()}, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "Final network_sn_detach_map: "
-        msg += f"{json.dumps({k: list(v) for k, v in self.network_sn_detach_map.items()}, indent=4)}"
-        self.log.debug(msg)
+            msg = "Final network_sn_detach_map: "
+            msg += f"{json.dumps({k: list(v) for k, v in self.network_sn_detach_map.items()}, indent=4)}"
+            self.log.debug(msg)
 
     def format_diff(self):
 
@@ -4004,7 +4022,7 @@ class DcnmNetwork:
 
         Calls fail_json if timeout is reached while waiting for network to reach terminal state.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = "ENTERED. "
         msg += f"caller: {caller}"
         self.log.debug(msg)
@@ -4112,7 +4130,7 @@ class DcnmNetwork:
 
         Calls fail_json if timeout is reached while waiting for attachments.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = f"ENTERED. caller: {caller}, fabric_type: {self.fabric_type}"
         self.log.debug(msg)
 
@@ -4366,8 +4384,8 @@ class DcnmNetwork:
 
         Calls failure() if deletion fails after all retry attempts
         """
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -4404,9 +4422,10 @@ class DcnmNetwork:
                 # Send the request
                 response = dcnm_send(self.module, method, delete_path)
 
-                msg = f"Attempt {attempt}, batch response: "
-                msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"Attempt {attempt}, batch response: "
+                    msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 # Always append response for visibility
                 self.result["response"].append(response)
@@ -4495,7 +4514,7 @@ class DcnmNetwork:
                     time.sleep(retry_delay)
 
     def push_to_remote(self, is_rollback=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -5159,7 +5178,7 @@ class DcnmNetwork:
         return net_spec
 
     def validate_input(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -5345,7 +5364,7 @@ class DcnmNetwork:
                 self.module.fail_json(msg=msg)
 
     def handle_response(self, resp, op):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -5409,7 +5428,7 @@ class DcnmNetwork:
         return fail, changed
 
     def failure(self, resp):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -5755,6 +5774,7 @@ def main():
             choices=["switch", "resource"],
             default="switch"
         ),
+        child_fabric_parallelism=dict(required=False, type="int", default=1),
     )
 
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=True)
@@ -5764,10 +5784,17 @@ def main():
     if not dcnm_net.ip_sn:
         module.fail_json(msg="Fabric {0} missing on ND or does not have any switches".format(dcnm_net.fabric))
 
-    dcnm_net.validate_input()
+    # Spans are recorded here rather than by decorating the methods, which
+    # log their caller from the frame above their own.
+    tracer = get_tracer()
 
-    dcnm_net.get_want()
-    dcnm_net.get_have()
+    with tracer.span("validate_input"):
+        dcnm_net.validate_input()
+
+    with tracer.span("get_want"):
+        dcnm_net.get_want()
+    with tracer.span("get_have"):
+        dcnm_net.get_have()
 
     warn_msg = None
 
@@ -5775,26 +5802,36 @@ def main():
     # these objects are handled is different between 'merged' and 'replaced' states. For 'merged'
     # state, objects not included in the playbook must be left as they are and for state 'replaced'
     # they must be purged or defaulted.
-    dcnm_net.update_want()
+    with tracer.span("update_want"):
+        dcnm_net.update_want()
 
     if module.params["state"] == "merged":
-        warn_msg = dcnm_net.get_diff_merge()
+        with tracer.span("get_diff_merge"):
+            warn_msg = dcnm_net.get_diff_merge()
 
     if module.params["state"] == "replaced":
-        warn_msg = dcnm_net.get_diff_replace()
+        with tracer.span("get_diff_replace"):
+            warn_msg = dcnm_net.get_diff_replace()
 
     if module.params["state"] == "overridden":
-        warn_msg = dcnm_net.get_diff_override()
+        with tracer.span("get_diff_override"):
+            warn_msg = dcnm_net.get_diff_override()
 
     if module.params["state"] == "deleted":
-        dcnm_net.get_diff_delete()
+        with tracer.span("get_diff_delete"):
+            dcnm_net.get_diff_delete()
 
     if module.params["state"] == "query":
-        dcnm_net.get_diff_query()
+        with tracer.span("get_diff_query"):
+            dcnm_net.get_diff_query()
         dcnm_net.result["response"] = dcnm_net.query
 
     dcnm_net.result["warnings"].append(warn_msg) if warn_msg else []
 
+    response_cache_stats = dcnm_get_response_cache_stats(module)
+    if response_cache_stats is not None:
+        dcnm_net.result["response_cache"] = response_cache_stats
+
     if (
         dcnm_net.diff_create
         or dcnm_net.diff_create_quick
@@ -5807,18 +5844,20 @@ def main():
     ):
         dcnm_net.result["changed"] = True
     else:
-        module.exit_json(**dcnm_net.result)
+        module.exit_json(**tracer.add_to(dcnm_net.result))
 
-    dcnm_net.format_diff()
+    with tracer.span("format_diff"):
+        dcnm_net.format_diff()
     dcnm_net.result["diff"] = dcnm_net.diff_input_format
 
     if module.check_mode:
-        module.exit_json(**dcnm_net.result)
+        module.exit_json(**tracer.add_to(dcnm_net.result))
 
-    dcnm_net.push_to_remote()
+    with tracer.span("push_to_remote"):
+        dcnm_net.push_to_remote()
     dcnm_net.result["deploy_payload"] = dcnm_net.deploy_payload
 
-    module.exit_json(**dcnm_net.result)
+    module.exit_json(**tracer.add_to(dcnm_net.result))
 
 
 if __name__ == "__main__":
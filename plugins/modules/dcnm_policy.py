@@ -404,12 +404,16 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     dcnm_get_ip_addr_info,
     validate_list_of_dicts,
     get_ip_sn_dict,
+    dcnm_get_response_cache_stats,
     dcnm_version_supported,
 )
 
 
 class DcnmPolicy:
 
+    # Maximum number of switches included in a single POLICY_GET_SWITCHES request
+    POLICY_GET_SWITCHES_CHUNK = 50
+
     dcnm_policy_paths = {
         11: {
             "POLICY_WITH_ID": "/rest/control/policies/{}",
@@ -449,6 +453,7 @@ class DcnmPolicy:
         self.policy_info = []
         self.want = []
         self.have = []
+        self.have_index = {"policyId": {}, "description": {}, "templateName": {}}
         self.have_all_list = []
         self.diff_create = []
         self.diff_modify = []
@@ -665,7 +670,7 @@ class DcnmPolicy:
         else:
             return []
 
-    def dcnm_policy_get_all_policies(self, snos):
+    def dcnm_policy_get_switch_policies(self, snos):
 
         path = self.paths["POLICY_GET_SWITCHES"].format(snos)
 
@@ -684,15 +689,39 @@ class DcnmPolicy:
         else:
             return []
 
+    def dcnm_policy_get_all_policies(self, snos):
+
+        # Large switch lists are split into chunks of POLICY_GET_SWITCHES_CHUNK switches to keep the URL
+        # short. The chunks are fetched one after the other, since requests share a single connection
+        # to the controller, and the policies are returned in the order of the switches.
+        sno_list = snos.split(",")
+        if len(sno_list) <= self.POLICY_GET_SWITCHES_CHUNK:
+            return self.dcnm_policy_get_switch_policies(snos)
+
+        chunks = [
+            ",".join(sno_list[i:i + self.POLICY_GET_SWITCHES_CHUNK])
+            for i in range(0, len(sno_list), self.POLICY_GET_SWITCHES_CHUNK)
+        ]
+        return [
+            pol for chunk in chunks for pol in self.dcnm_policy_get_switch_policies(chunk)
+        ]
+
     def dcnm_policy_get_snos_string(self, want):
 
-        snos = ""
+        snos = []
         for pol in want:
             if pol["serialNumber"] not in snos:
-                if snos != "":
-                    snos = snos + ","
-                snos = snos + pol["serialNumber"]
-        return snos
+                snos.append(pol["serialNumber"])
+        return ",".join(snos)
+
+    def dcnm_policy_index_have(self):
+
+        # Index self.have by (serialNumber, <key>) for each of the keys used to match policies in
+        # dcnm_policy_compare_policies()
+        self.have_index = {"policyId": {}, "description": {}, "templateName": {}}
+        for have in self.have:
+            for key, index in self.have_index.items():
+                index.setdefault((have.get("serialNumber", None), have.get(key)), []).append(have)
 
     def dcnm_policy_get_have(self):
 
@@ -711,34 +740,46 @@ class DcnmPolicy:
         # all the switches included in playbook, and then filter them out using template names.
         plist = self.dcnm_policy_get_all_policies(snos)
 
-        # Filter the list of policies and keep only those that are matching
+        # Filter the list of policies and keep only those that are matching. When use_desc_as_key is
+        # False every policy is kept. Otherwise keep policies whose template name or description matches
+        # any of the policies in self.want
+        want_templates = set(wp.get("templateName") for wp in self.want)
+        want_descriptions = set(wp.get("description", "") for wp in self.want)
+
         # self.want may have duplicates because we allow the same policy to be created multiple times. So
         # make sure self.have does not have duplicates
-        match_pol = [
-            pl
-            for pl in plist
-            for wp in self.want
+        have_ids = set()
+        for pl in plist:
             # exclude the policies that have the source
             # when the user modifies a policy but has not deployed the policy,
             # a sub-policy might be created with the same description, but marked as deleted
             # The signature of this kind of policy is that it as a original policyId as the source
             # it should be excluded from the match list
             # as the policy will be deleted once the user deploys the configuration
-            if pl.get("source", "") == ""
-            and (
-                (pl["templateName"] == wp["templateName"])
-                or (
-                    not self.use_desc_as_key
-                    or (pl.get("description") == wp.get("description", ""))
-                )
-            )
-        ]
+            if pl.get("source", "") != "":
+                continue
+            if not (
+                not self.use_desc_as_key
+                or pl["templateName"] in want_templates
+                or pl.get("description") in want_descriptions
+            ):
+                continue
 
-        # match_pol can be a list of dicts, containing duplicates. Remove the duplicate entries
-        # also exclude the policies that are marked for deletion
-        for pol in match_pol:
-            if pol not in self.have and not pol.get("deleted", True):
-                self.have.append(pol)
+            # exclude the policies that are marked for deletion
+            if pl.get("deleted", True):
+                continue
+
+            policy_id = pl.get("policyId")
+            if policy_id is None:
+                if pl in self.have:
+                    continue
+            elif policy_id in have_ids:
+                continue
+            else:
+                have_ids.add(policy_id)
+            self.have.append(pl)
+
+        self.dcnm_policy_index_have()
 
     def dcnm_policy_compare_nvpairs(self, pnv, hnv):
 
@@ -773,30 +814,27 @@ class DcnmPolicy:
         else:
             key = "templateName"
 
-        for have in self.have:
-            if (have.get(key) == policy.get(key)) and (
-                have.get("serialNumber", None) == policy["serialNumber"]
-            ):
-                found.append(have)
-                # if use description as key, use policyId got from the target
-                # if templateName is changed, remove the original policy and create a new one
-                if self.use_desc_as_key:
-                    policy["policyId"] = have.get("policyId")
-                    if have["templateName"] != policy["templateName"]:
-                        template_changed = True
-                        continue
-
-                # Have a policy with matching key. Check for other objects
-                if have.get("description", None) == policy["description"]:
-                    if have.get("priority", None) == policy["priority"]:
-                        if (
-                            self.dcnm_policy_compare_nvpairs(
-                                policy.get("nvPairs", None),
-                                have.get("nvPairs", None),
-                            )
-                            == "DCNM_POLICY_MATCH"
-                        ):
-                            match = True
+        for have in self.have_index[key].get((policy["serialNumber"], policy.get(key)), []):
+            found.append(have)
+            # if use description as key, use policyId got from the target
+            # if templateName is changed, remove the original policy and create a new one
+            if self.use_desc_as_key:
+                policy["policyId"] = have.get("policyId")
+                if have["templateName"] != policy["templateName"]:
+                    template_changed = True
+                    continue
+
+            # Have a policy with matching key. Check for other objects
+            if have.get("description", None) == policy["description"]:
+                if have.get("priority", None) == policy["priority"]:
+                    if (
+                        self.dcnm_policy_compare_nvpairs(
+                            policy.get("nvPairs", None),
+                            have.get("nvPairs", None),
+                        )
+                        == "DCNM_POLICY_MATCH"
+                    ):
+                        match = True
 
         if len(found) == 1 and not match and not template_changed:
             # Found a matching policy with the given template name, but other objects don't match.
@@ -970,39 +1008,49 @@ class DcnmPolicy:
             if pl["templateName"] == "switch_freeform_config" and self.deploy is True:
                 pl["templateName"] = "switch_freeform"
 
+        want_ids = set()
+        want_keys = set()
+        for wp in self.want:
+            if wp["policy_id_given"] is True:
+                want_ids.add(wp["policyId"])
+            else:
+                # When use_desc_as_key is True, only add the policy match the description
+                want_keys.add(
+                    (
+                        wp["templateName"],
+                        wp.get("description", "") if self.use_desc_as_key else None,
+                    )
+                )
+
         match_pol = [
             pl
             for pl in plist
-            for wp in self.want
             if (
                 (
-                    (wp["policy_id_given"] is False)
-                    and (pl["templateName"] == wp["templateName"])
-                    and (
-                        # When use_desc_as_key is True, only add the policy match the description
-                        not self.use_desc_as_key
-                        or (pl.get("description", "") == wp.get("description", ""))
-                    )
-                )
-                or (
-                    (wp["policy_id_given"] is True)
-                    and (pl["policyId"] == wp["policyId"])
+                    pl["templateName"],
+                    pl.get("description", "") if self.use_desc_as_key else None,
                 )
+                in want_keys
             )
+            or (pl["policyId"] in want_ids)
         ]
         # match_pol contains all the policies which exist and are to be deleted
         # Build the delete payloads
+        del_ids = set(pol["policyId"] for pol in self.diff_delete)
         for pol in match_pol:
 
+            if pol["policyId"] in del_ids:
+                continue
+            del_ids.add(pol["policyId"])
+
             del_payload = self.dcnm_policy_get_delete_payload(pol)
-            if del_payload not in self.diff_delete:
-                self.diff_delete.append(del_payload)
-                self.changed_dict[0]["deleted"].append(
-                    {
-                        "policy": pol["policyId"],
-                        "templateName": pol["templateName"],
-                    }
-                )
+            self.diff_delete.append(del_payload)
+            self.changed_dict[0]["deleted"].append(
+                {
+                    "policy": pol["policyId"],
+                    "templateName": pol["templateName"],
+                }
+            )
 
     def dcnm_policy_get_diff_query(self):
 
@@ -1017,17 +1065,15 @@ class DcnmPolicy:
         # 3. policy id given
         #    In this case directly fetch the policy information from the specified switches
 
-        snos = ""
+        sno_list = []
         get_specific_policies = False
         match_templates = []
         match_pol = []
         for cfg in self.config:
             if cfg.get("switch", None) is not None:
                 for sw_dict in cfg["switch"]:
-                    if self.ip_sn[sw_dict["ip"]] not in snos:
-                        if snos != "":
-                            snos = snos + ","
-                        snos = snos + self.ip_sn[sw_dict["ip"]]
+                    if self.ip_sn[sw_dict["ip"]] not in sno_list:
+                        sno_list.append(self.ip_sn[sw_dict["ip"]])
             elif "POLICY-" in cfg["name"]:
                 get_specific_policies = True
                 # Policy ID is given, Fetch the specific information.
@@ -1050,7 +1096,7 @@ class DcnmPolicy:
             # Policies cannot be obtained by using template names. Policies have 'policy-id' which is the key
             # to get a policy. Since playbook includes only template names, we need to get all policies from
             # all the switches included in playbook, and then filter them out using template names.
-            plist = self.dcnm_policy_get_all_policies(snos)
+            plist = self.dcnm_policy_get_all_policies(",".join(sno_list))
 
             if match_templates != []:
                 # Filter the list of policies and keep only those that are matching. For delete case, playbook policies
@@ -1537,6 +1583,10 @@ def main():
 
     dcnm_policy.result["diff"] = dcnm_policy.changed_dict
 
+    response_cache_stats = dcnm_get_response_cache_stats(module)
+    if response_cache_stats is not None:
+        dcnm_policy.result["response_cache"] = response_cache_stats
+
     if (
         dcnm_policy.diff_create
         or dcnm_policy.diff_modify
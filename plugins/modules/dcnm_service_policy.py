@@ -448,6 +448,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     validate_list_of_dicts,
     dcnm_reset_connection,
     dcnm_version_supported,
+    DcnmStatusPoller,
+    DcnmWaiter,
 )
 
 from datetime import datetime
@@ -1078,59 +1080,95 @@ class DcnmServicePolicy:
             if (have != []) and (have not in self.have):
                 self.have.append(have)
 
-    def dcnm_sp_get_sp_deployment_status(self, sp, refresh):
+    def dcnm_sp_get_deployment_status_key(self, sp):
 
         """
-        Routine to get the attachment/deployment information for a given service policies. This information
-        is used to implement idempotent operations. Change is deployment state will be treated as a change
-        in service policies during merge and replace operations.
+        Routine to get the key under which the attachment/deployment information of a service policy is
+        stored. Policies sharing a key are returned by a single request to DCNM.
 
         Parameters:
             sp (dict): Service policy information
-            refresh (bool): A flag indicating if the required SP information is to be obtained from DCNM
 
         Returns:
-            deployed (bool): a flag indicating is the given SRP is deployed
+            key (string): fabric, service node and attached fabric names of the SP
         """
 
-        resp = None
-        key = (
+        return (
             sp["fabricName"]
             + "-"
             + sp["serviceNodeName"]
             + "-"
             + sp["attachedFabricName"]
         )
-        if refresh or self.have_all.get(key) is None:
 
-            self.have_all[key] = []
-            # Get all policies and filter out the specific policy to check for attachment details.
-            path = self.paths["GET_DEPLOY_STATUS"].format(
-                sp["fabricName"], sp["serviceNodeName"], sp["attachedFabricName"]
-            )
+    def dcnm_sp_get_deployment_status_from_dcnm(self, sp):
 
-            retries = 0
-            while retries < 30:
-                retries += 1
-                resp = dcnm_send(self.module, "GET", path, "")
+        """
+        Routine to get the attachment/deployment information of all the service policies on the service
+        node and attached fabric of a given service policy from DCNM. The information is stored in
+        self.have_all.
 
-                if resp and resp["RETURN_CODE"] != 200:
-                    self.dcnm_sp_check_for_errors_in_resp(resp)
-                    time.sleep(10)
-                    continue
+        Parameters:
+            sp (dict): Service policy information
 
-                if resp["RETURN_CODE"] == 200 and resp.get("DATA") == []:
-                    time.sleep(10)
-                    continue
+        Returns:
+            resp (dict): Response from DCNM server
+        """
 
-                break
+        resp = None
+        key = self.dcnm_sp_get_deployment_status_key(sp)
 
-            if resp and (resp["RETURN_CODE"] == 200) and resp["DATA"]:
-                self.have_all[key].extend(resp["DATA"])
-            else:
-                self.changed_dict[0]["debugs"].append({"GET_SP_ATT_STATUS": resp})
-                resp["CHANGED"] = self.changed_dict[0]
-                self.module.fail_json(msg=resp)
+        self.have_all[key] = []
+        # Get all policies and filter out the specific policy to check for attachment details.
+        path = self.paths["GET_DEPLOY_STATUS"].format(
+            sp["fabricName"], sp["serviceNodeName"], sp["attachedFabricName"]
+        )
+
+        retries = 0
+        while retries < 30:
+            retries += 1
+            resp = dcnm_send(self.module, "GET", path, "")
+
+            if resp and resp["RETURN_CODE"] != 200:
+                self.dcnm_sp_check_for_errors_in_resp(resp)
+                time.sleep(10)
+                continue
+
+            if resp["RETURN_CODE"] == 200 and resp.get("DATA") == []:
+                time.sleep(10)
+                continue
+
+            break
+
+        if resp and (resp["RETURN_CODE"] == 200) and resp["DATA"]:
+            self.have_all[key].extend(resp["DATA"])
+        else:
+            self.changed_dict[0]["debugs"].append({"GET_SP_ATT_STATUS": resp})
+            resp["CHANGED"] = self.changed_dict[0]
+            self.module.fail_json(msg=resp)
+        return resp
+
+    def dcnm_sp_get_sp_deployment_status(self, sp, refresh, redeploy=True):
+
+        """
+        Routine to get the attachment/deployment information for a given service policies. This information
+        is used to implement idempotent operations. Change is deployment state will be treated as a change
+        in service policies during merge and replace operations.
+
+        Parameters:
+            sp (dict): Service policy information
+            refresh (bool): A flag indicating if the required SP information is to be obtained from DCNM
+            redeploy (bool): A flag indicating if the SP is to be deployed again when its status is
+                             'success' or 'out-of-sync'
+
+        Returns:
+            deployed (bool): a flag indicating is the given SRP is deployed
+        """
+
+        resp = None
+        key = self.dcnm_sp_get_deployment_status_key(sp)
+        if refresh or self.have_all.get(key) is None:
+            resp = self.dcnm_sp_get_deployment_status_from_dcnm(sp)
 
         # Filter out the required policy
         match_pol = [
@@ -1160,18 +1198,12 @@ class DcnmServicePolicy:
             ):
                 return resp, False, False, match_pol[0]["status"].lower()
             elif match_pol[0]["status"].lower() == "success":
-                pol_info = {}
-                pol_info = self.dcnm_sp_combine_policies(sp, pol_info)
-
-                for path in pol_info:
-                    self.dcnm_sp_deploy_sp(path, pol_info[path])
+                if redeploy:
+                    self.dcnm_sp_redeploy_sp([sp])
                 return resp, True, False, "success"
             elif match_pol[0]["status"].lower() == "out-of-sync":
-                pol_info = {}
-                pol_info = self.dcnm_sp_combine_policies(sp, pol_info)
-
-                for path in pol_info:
-                    self.dcnm_sp_deploy_sp(path, pol_info[path])
+                if redeploy:
+                    self.dcnm_sp_redeploy_sp([sp])
                 return resp, True, False, "out-of-sync"
             elif match_pol[0]["status"].lower() == "in progress":
                 return resp, True, True, match_pol[0]["status"].lower()
@@ -1656,33 +1688,61 @@ class DcnmServicePolicy:
             None
         """
 
-        # Scan each SP for its deployment status. If all are deployed, then we are done. Otherwise
-        # the create or modify operation is a failure
+        # Poll the deployment status of all SPs together. The status of all SPs on a service node is returned
+        # by a single request, so each round fetches it once per service node. The overall deadline is the
+        # same as polling each SP up to 50 times, 30 seconds apart.
+        waiter = DcnmWaiter(50 * 30, initial=5, maximum=30)
+
+        def sp_name(sp):
+            return self.dcnm_sp_get_deployment_status_key(sp) + "-" + sp["policyName"]
+
+        def sp_state(sp, resp):
+            # 'resp' was stored in self.have_all by the poller, read the SP status from there
+            att_state = self.dcnm_sp_get_sp_deployment_status(
+                sp, False, redeploy=False
+            )[3]
+
+            # Sometimes the deploy state will remain in "success" state after detach and deploy. Go ahead and delete
+            # once polling has gone on for 5 minutes
+            if final_state == "na" and att_state == "success":
+                if waiter.elapsed >= 300:
+                    att_state = final_state
+            return att_state
+
+        def sp_round(states):
+            # Deploy the SPs that are not yet in sync again, together, and save and deploy the configuration
+            # once for all the out-of-sync SPs
+            self.dcnm_sp_redeploy_sp(
+                [
+                    sp
+                    for sp in sp_list
+                    if states.get(sp_name(sp)) in ["success", "out-of-sync"]
+                ]
+            )
+            if "out-of-sync" in states.values():
+                self.dcnm_sp_config_save_and_deploy()
+
+        poller = DcnmStatusPoller(
+            waiter,
+            sp_name,
+            self.dcnm_sp_get_deployment_status_key,
+            self.dcnm_sp_get_deployment_status_from_dcnm,
+            sp_state,
+        )
+        poller.wait(sp_list, final_state, on_round=sp_round)
+
         for sp in sp_list:
+            self.changed_dict[0]["debugs"].append(
+                {
+                    "PolicyName": sp["policyName"],
+                    "State": poller.states.get(sp_name(sp)),
+                    "ConvergeTime": poller.converged.get(sp_name(sp)),
+                }
+            )
 
-            retries = 0
-            att_state = "Unknown"
-            while retries < 50:
-                retries += 1
-                (
-                    resp,
-                    retry,
-                    deployed,
-                    att_state,
-                ) = self.dcnm_sp_get_sp_deployment_status(sp, True)
-
-                if att_state == final_state:
-                    break
-                # Sometimes the deploy state will remain in "success" state after detach and deploy. Go ahead and delete
-                if final_state == "na":
-                    if att_state.lower() == "success":
-                        if (retries % 10) == 0:
-                            att_state = final_state
-                            break
-                if att_state == "out-of-sync":
-                    self.dcnm_sp_config_save_and_deploy()
-                time.sleep(30)
-            # After all retries, if the SP did not move to 'final_state' it is an error
+        # After all retries, if an SP did not move to 'final_state' it is an error
+        for sp in sp_list:
+            att_state = poller.states.get(sp_name(sp))
             if att_state != final_state:
                 self.module.fail_json(
                     msg={
@@ -1694,6 +1754,26 @@ class DcnmServicePolicy:
                     }
                 )
 
+    def dcnm_sp_redeploy_sp(self, sp_list):
+
+        """
+        Routine to deploy a list of service policies again. Policies are combined so that a single deploy
+        request is sent for all the policies of a service node.
+
+        Parameters:
+            sp_list (list): Service policies to be deployed
+
+        Returns:
+            None
+        """
+
+        pol_info = {}
+        for sp in sp_list:
+            pol_info = self.dcnm_sp_combine_policies(sp, pol_info)
+
+        for path in pol_info:
+            self.dcnm_sp_deploy_sp(path, pol_info[path])
+
     def dcnm_sp_combine_policies(self, sp, pol_info):
 
         """
@@ -1169,6 +1169,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     validate_list_of_dicts,
     dcnm_reset_connection,
     dcnm_version_supported,
+    DcnmStatusPoller,
+    DcnmWaiter,
 )
 
 from datetime import datetime
@@ -3502,7 +3504,7 @@ class DcnmServiceRoutePeering:
             vlan_list.append(net["vlanId"])
         return vlan_list
 
-    def dcnm_srp_get_srp_deployment_status(self, srp, have, chk_deployed):
+    def dcnm_srp_get_srp_deployment_status(self, srp, have, chk_deployed, redeploy=True):
 
         """
         Routine to get the attachment/deployment information for a given route peering. This information
@@ -3514,6 +3516,7 @@ class DcnmServiceRoutePeering:
             have (dict): Existing route peering information
             chk_deployed (string): A string indicating whether to check vlans or serial numbers
                                    from the deploy status response
+            redeploy (bool): A flag indicating if the SRP is to be deployed again when it is 'out-of-sync'
 
         Returns:
             attached (bool): a flag indicating is the given SRP is attached
@@ -3579,11 +3582,8 @@ class DcnmServiceRoutePeering:
                     ):
                         return resp, False, False, attach["attachState"].lower()
                     elif attach["attachState"].lower() == "out-of-sync":
-                        srp_info = {}
-                        self.dcnm_srp_combine_route_peerings(srp, srp_info)
-
-                        for path in srp_info:
-                            self.dcnm_srp_deploy_srp(path, srp_info[path])
+                        if redeploy:
+                            self.dcnm_srp_redeploy_srp([srp])
                         return resp, True, False, "out-of-sync"
                     elif attach["attachState"].lower() == "in progress":
                         return resp, True, True, attach["attachState"].lower()
@@ -3990,41 +3990,62 @@ class DcnmServiceRoutePeering:
             None
         """
 
-        # Scan each SRP for its deployment status. If all are deployed, then we are done. Otherwise
-        # the create or modify operation is a failure
-        for srp in srp_list:
-            retries = 0
-            att_state = "Unknown"
-            while retries < 50:
-                retries += 1
-                (
-                    resp,
-                    retry,
-                    deployed,
-                    att_state,
-                ) = self.dcnm_srp_get_srp_deployment_status(
-                    srp, srp, (final_state == "deployed")
-                )
+        # Poll the deployment status of all SRPs together, so that a slow SRP does not delay polling the
+        # others. The overall deadline is the same as polling each SRP up to 50 times, 30 seconds apart.
+        waiter = DcnmWaiter(50 * 30, initial=5, maximum=30)
+
+        def srp_name(srp):
+            return "-".join(
+                [
+                    srp["fabricName"],
+                    srp["serviceNodeName"],
+                    srp["attachedFabricName"],
+                    srp["peeringName"],
+                ]
+            )
 
-                if att_state == final_state:
-                    break
-                if att_state == "pending":
-                    if (retries % 10) == 0:
-                        self.dcnm_srp_config_save_and_deploy()
-                if att_state == "out-of-sync":
-                    if retries % 10 == 0:
-                        self.dcnm_srp_config_save_and_deploy()
-                if att_state == "na":
-                    # Sometimes the "enabled" flag is not properly applied during creation. Since
-                    # att_state is "na", try to attach and deploy the SRP again
-                    if srp["enabled"]:
-                        if (retries % 10) == 0:
-                            self.dcnm_srp_attach_and_deploy_srp(srp)
-                time.sleep(30)
+        def srp_status(srp):
+            # The deployment status is returned per route peering
+            return self.dcnm_srp_get_srp_deployment_status(
+                srp, srp, (final_state == "deployed"), redeploy=False
+            )
+
+        def srp_state(srp, status):
+            return status[3]
+
+        def srp_round(states):
+            pending = [srp for srp in srp_list if srp_name(srp) in states]
+
+            # Deploy the out-of-sync SRPs again, together
+            self.dcnm_srp_redeploy_srp(
+                [srp for srp in pending if states[srp_name(srp)] == "out-of-sync"]
+            )
+            # Save and deploy, and attach again, at most every 5 minutes
+            if not waiter.due("srp_recover", 300):
+                return
+            if ("pending" in states.values()) or ("out-of-sync" in states.values()):
+                self.dcnm_srp_config_save_and_deploy()
+            for srp in pending:
+                # Sometimes the "enabled" flag is not properly applied during creation. Since
+                # att_state is "na", try to attach and deploy the SRP again
+                if states[srp_name(srp)] == "na" and srp["enabled"]:
+                    self.dcnm_srp_attach_and_deploy_srp(srp)
+
+        poller = DcnmStatusPoller(waiter, srp_name, srp_name, srp_status, srp_state)
+        poller.wait(srp_list, final_state, on_round=srp_round)
+
+        for srp in srp_list:
             self.changed_dict[0]["debugs"].append(
-                {"PeeringName": srp["peeringName"], "State": att_state}
+                {
+                    "PeeringName": srp["peeringName"],
+                    "State": poller.states.get(srp_name(srp)),
+                    "ConvergeTime": poller.converged.get(srp_name(srp)),
+                }
             )
-            # After all retries, if the SRP did not move to 'final_state' it is an error
+
+        # After all retries, if an SRP did not move to 'final_state' it is an error
+        for srp in srp_list:
+            att_state = poller.states.get(srp_name(srp))
             if att_state != final_state:
                 # Note down the SRP to aid in debugging
                 self.module.fail_json(
@@ -4037,6 +4058,26 @@ class DcnmServiceRoutePeering:
                     }
                 )
 
+    def dcnm_srp_redeploy_srp(self, srp_list):
+
+        """
+        Routine to deploy a list of SRPs again. Route peerings are combined so that a single deploy
+        request is sent for all the peerings of a service node.
+
+        Parameters:
+            srp_list (list): Service Route Peering information to be deployed
+
+        Returns:
+            None
+        """
+
+        srp_info = {}
+        for srp in srp_list:
+            self.dcnm_srp_combine_route_peerings(srp, srp_info)
+
+        for path in srp_info:
+            self.dcnm_srp_deploy_srp(path, srp_info[path])
+
     def dcnm_srp_combine_route_peerings(self, srp, srp_info):
 
         """
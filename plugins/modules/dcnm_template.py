@@ -39,6 +39,14 @@ options:
       - query
     default: merged
 
+  bulk_fetch:
+    description:
+    - Fetch the list of all templates from the controller once, and read the templates
+      in I(config) from that list instead of fetching each template by name.
+    - Templates that are not in the list are fetched by name.
+    type: bool
+    default: false
+
   config:
     description:
     - A dictionary of template operations
@@ -195,6 +203,7 @@ class DcnmTemplate:
             "TEMPLATE": "/rest/config/templates/template",
             "TEMP_DELETE_BULK": "/rest/config/templates/delete/bulk",
             "TEMPLATE_WITH_NAME": "/rest/config/templates/{}",
+            "TEMPLATES": "/rest/config/templates",
         },
         12: {
             "TEMP_VALIDATE": "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates/validate",
@@ -203,6 +212,7 @@ class DcnmTemplate:
             "TEMPLATE": "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates/template",
             "TEMP_DELETE_BULK": "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates/delete/bulk",
             "TEMPLATE_WITH_NAME": "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates/{}",
+            "TEMPLATES": "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates",
         },
     }
 
@@ -218,6 +228,8 @@ class DcnmTemplate:
         self.diff_query = []
         self.valid_fail = []
         self.template_info = []
+        # Templates on the controller keyed on name, when 'bulk_fetch' is set. See dcnm_template_get_template()
+        self.template_index = None
         self.fd = None
         self.changed_dict = [{"merged": [], "deleted": [], "query": [], "failed": []}]
 
@@ -279,6 +291,41 @@ class DcnmTemplate:
         else:
             return []
 
+    def dcnm_template_get_template_index(self):
+
+        # Fetch the list of all templates once. An empty index is returned if the list cannot be fetched,
+        # in which case all templates are fetched by name.
+
+        if self.template_index is not None:
+            return self.template_index
+
+        self.template_index = {}
+        resp = dcnm_send(self.module, "GET", self.paths["TEMPLATES"])
+
+        if (
+            resp
+            and resp["RETURN_CODE"] == 200
+            and resp["MESSAGE"] == "OK"
+            and isinstance(resp["DATA"], list)
+        ):
+            for template in resp["DATA"]:
+                if isinstance(template, dict) and template.get("name"):
+                    self.template_index[template["name"]] = template
+        return self.template_index
+
+    def dcnm_template_get_template(self, name):
+
+        # Return the template 'name' from the template list if 'bulk_fetch' is set. Fall back to fetching the
+        # template by name if it is not in the list, or if its content is not included in the list.
+
+        if self.module.params.get("bulk_fetch"):
+            template = self.dcnm_template_get_template_index().get(name)
+            if template and template.get("content") is not None:
+                return template
+
+        path = self.paths["TEMPLATE_WITH_NAME"].format(name)
+        return self.dcnm_template_get_template_info_from_dcnm(path, name)
+
     def dcnm_template_get_template_payload(self, ditem):
 
         if self.module.params["state"] == "merged":
@@ -375,11 +422,22 @@ class DcnmTemplate:
 
         return "DCNM_TEMPLATE_ADD_NEW"
 
-    def dcnm_template_validate_template(self, template):
+    def dcnm_template_send_validate_request(self, template):
 
         path = self.paths["TEMP_VALIDATE"]
 
-        resp = dcnm_send(self.module, "POST", path, template["content"], "text")
+        return dcnm_send(self.module, "POST", path, template["content"], "text")
+
+    def dcnm_template_validate_templates(self, templates):
+
+        # Validate a list of templates. Return codes are returned, and failed responses added to self.result,
+        # in the order of 'templates'.
+
+        resps = [self.dcnm_template_send_validate_request(template) for template in templates]
+
+        return [self.dcnm_template_check_validate_resp(resp) for resp in resps]
+
+    def dcnm_template_check_validate_resp(self, resp):
 
         if resp and resp["RETURN_CODE"] == 200 and resp["MESSAGE"] == "OK":
             # DATA may have multiple dicts with different reports. Check all reports and ignore warnings.
@@ -549,10 +607,7 @@ class DcnmTemplate:
             elif self.module.params["state"] == "deleted":
                 name = template["name"]
 
-            path = self.paths["TEMPLATE_WITH_NAME"].format(name)
-            template_payload = self.dcnm_template_get_template_info_from_dcnm(
-                path, name
-            )
+            template_payload = self.dcnm_template_get_template(name)
 
             if template_payload:
                 self.have.append(template_payload)
@@ -574,17 +629,21 @@ class DcnmTemplate:
         if not self.want:
             return
 
-        for template in self.want:
-            rc = self.dcnm_template_validate_template(template)
+        # Verify if the template is already present. If there is no change between what is being requested
+        # and what is already present, ignore the same. The content of such templates was already accepted
+        # by the server, so only the remaining templates are validated.
+        changed = [
+            template
+            for template in self.want
+            if self.dcnm_template_compare_template(template) != "DCNM_TEMPLATE_DONT_ADD"
+        ]
+
+        for template, rc in zip(changed, self.dcnm_template_validate_templates(changed)):
             if rc == 0:
                 self.changed_dict[0]["failed"].append(template)
             else:
-                # Verify if the template is already present. If there is no change between what is
-                # being requested and what is already present, ignore the same.
-                rc = self.dcnm_template_compare_template(template)
-                if rc != "DCNM_TEMPLATE_DONT_ADD":
-                    self.changed_dict[0]["merged"].append(template)
-                    self.diff_create.append(template)
+                self.changed_dict[0]["merged"].append(template)
+                self.diff_create.append(template)
 
     def dcnm_template_get_diff_deleted(self):
 
@@ -613,10 +672,7 @@ class DcnmTemplate:
 
         for template in self.template_info:
 
-            path = self.paths["TEMPLATE_WITH_NAME"].format(template["name"])
-            template_payload = self.dcnm_template_get_template_info_from_dcnm(
-                path, template["name"]
-            )
+            template_payload = self.dcnm_template_get_template(template["name"])
 
             if template_payload:
                 self.diff_query.append(template_payload)
@@ -689,6 +745,7 @@ def main():
             default="merged",
             choices=["merged", "deleted", "query"],
         ),
+        bulk_fetch=dict(type="bool", default=False),
     )
 
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=True)
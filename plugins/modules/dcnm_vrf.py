@@ -59,6 +59,15 @@ options:
       - switch
       - resource
     default: switch
+  child_fabric_parallelism:
+    description:
+    - Maximum number of child fabrics that are configured at the same time
+    - Only used when I(fabric) is a multisite or multicluster parent fabric with C(child_fabric_config)
+    - Child fabrics are configured after the parent fabric. When a child fabric fails, child fabrics that have not started are skipped
+    - Values greater than 1 require module pipelining, otherwise child fabrics are configured one at a time
+    type: int
+    required: false
+    default: 1
   config:
     description:
     - List of details of vrfs being managed. Not required for state deleted
@@ -1022,12 +1031,14 @@ import time
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
-    dcnm_get_bulk_api_support, dcnm_get_ip_addr_info, dcnm_get_url, dcnm_send, dcnm_version_supported,
+    dcnm_get_bulk_api_support, dcnm_get_ip_addr_info, dcnm_get_response_cache_stats, dcnm_get_url, dcnm_send,
+    dcnm_version_supported,
     get_nd_fabric_details, get_nd_fabric_inventory_details, get_ip_sn_dict,
     get_sn_fabric_dict, validate_list_of_dicts, search_nested_json,
     sanitize_lan_attach_list)
 
-from ..module_utils.common.log_v2 import Log
+from ..module_utils.common.log_v2 import LazyJson, Log
+from ..module_utils.common.tracer import get_tracer
 
 dcnm_vrf_paths = {
     11: {
@@ -1159,7 +1170,7 @@ class DcnmVrf:
         self.log.debug(msg)
 
         # Check for bulk API support
-        self.has_bulk_api = dcnm_get_bulk_api_support(self.module)
+        self.has_bulk_api = dcnm_get_bulk_api_support(self.module, "vrfs")
         msg = f"Bulk API support detected: {self.has_bulk_api}"
         self.log.debug(msg)
 
@@ -1686,8 +1697,8 @@ class DcnmVrf:
         ```
 
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -1743,9 +1754,10 @@ class DcnmVrf:
 
             vrf_lite_conn["VRF_LITE_JYTHON_TEMPLATE"] = "Ext_VRF_Lite_Jython"
 
-            msg = "vrf_lite_conn: "
-            msg += f"{json.dumps(vrf_lite_conn, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "vrf_lite_conn: "
+                msg += f"{json.dumps(vrf_lite_conn, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             vrf_lite_connections: dict = {}
             vrf_lite_connections["VRF_LITE_CONN"] = []
@@ -1758,16 +1770,18 @@ class DcnmVrf:
             else:
                 extension_values["VRF_LITE_CONN"] = copy.deepcopy(vrf_lite_connections)
 
-            msg = "Building extension_values: "
-            msg += f"{json.dumps(extension_values, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "Building extension_values: "
+                msg += f"{json.dumps(extension_values, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
         extension_values["VRF_LITE_CONN"] = json.dumps(
             extension_values["VRF_LITE_CONN"]
         )
-        msg = "Returning extension_values: "
-        msg += f"{json.dumps(extension_values, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning extension_values: "
+            msg += f"{json.dumps(extension_values, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
         return copy.deepcopy(extension_values)
 
     def update_attach_params(self, attach, vrf_name, deploy, vlan_id) -> dict:
@@ -1882,7 +1896,7 @@ class DcnmVrf:
         -   Return True if the values for any (non-skipped) keys differs.
         -   Return False otherwise
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2034,7 +2048,7 @@ class DcnmVrf:
         - VRF deletion: Undeploy from all switches before deletion
         - Mixed operations: Correct switch selection for each operation type
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}."
@@ -2201,17 +2215,18 @@ class DcnmVrf:
                         msg = f"Added serial {serial} to vrf_sn_detach_map[{vrf_name}] from have_attach for undeploy (all states)"
                         self.log.debug(msg)
 
-        msg = "Final vrf_sn_attach_map: "
-        msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_attach_map.items()}, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Final vrf_sn_attach_map: "
+            msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_attach_map.items()}, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "Final vrf_sn_detach_map: "
-        msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
-        self.log.debug(msg)
+            msg = "Final vrf_sn_detach_map: "
+            msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
+            self.log.debug(msg)
 
     def diff_for_create(self, want, have):
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2296,7 +2311,7 @@ class DcnmVrf:
         return create, configuration_changed
 
     def update_create_params(self, vrf, vlan_id=""):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2373,7 +2388,7 @@ class DcnmVrf:
 
         Retrieve all VRF objects from the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2426,14 +2441,15 @@ class DcnmVrf:
         - serialNumber: The serial_number of the switch
         - vrfName: The vrf to search
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}"
         self.log.debug(msg)
 
-        msg = f"attach: {json.dumps(attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"attach: {json.dumps(attach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         verb = "GET"
         attach_fabric = attach["fabric"]
@@ -2446,13 +2462,14 @@ class DcnmVrf:
         self.log.debug(msg)
         lite_objects = dcnm_send(self.module, verb, path)
 
-        msg = f"Returning lite_objects: {json.dumps(lite_objects, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"Returning lite_objects: {json.dumps(lite_objects, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         return copy.deepcopy(lite_objects)
 
     def get_have(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2671,8 +2688,9 @@ class DcnmVrf:
                     attach.update({"freeformConfig": ""})
                     continue
 
-                msg = f"epv: {json.dumps(epv, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"epv: {json.dumps(epv, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 if not epv.get("extensionValues"):
                     attach.update({"freeformConfig": ""})
@@ -2747,17 +2765,18 @@ class DcnmVrf:
             msg += f"{self.have_attach}"
             self.log.debug(msg)
 
-            msg = "self.have_deploy: "
-            msg += f"{json.dumps(self.have_deploy, indent=4)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "self.have_deploy: "
+                msg += f"{json.dumps(self.have_deploy, indent=4)}"
+                self.log.debug(msg)
 
-            msg = "self.chg_deploy: "
-            msg += f"{json.dumps(self.chg_deploy, indent=4)}"
-            self.log.debug(msg)
+                msg = "self.chg_deploy: "
+                msg += f"{json.dumps(self.chg_deploy, indent=4)}"
+                self.log.debug(msg)
 
     def get_want(self):
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2840,17 +2859,18 @@ class DcnmVrf:
             msg += f"{json.dumps(self.want_create, indent=4)}"
             self.log.debug(msg)
 
-            msg = "self.want_attach: "
-            msg += f"{json.dumps(self.want_attach, indent=4)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "self.want_attach: "
+                msg += f"{json.dumps(self.want_attach, indent=4)}"
+                self.log.debug(msg)
 
-            msg = "self.want_deploy: "
-            msg += f"{json.dumps(self.want_deploy, indent=4)}"
-            self.log.debug(msg)
+                msg = "self.want_deploy: "
+                msg += f"{json.dumps(self.want_deploy, indent=4)}"
+                self.log.debug(msg)
 
     def update_want(self):
 
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2869,7 +2889,7 @@ class DcnmVrf:
                 self.log.debug(msg)
 
     def get_diff_delete(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -2949,25 +2969,28 @@ class DcnmVrf:
         self.diff_undeploy = diff_undeploy
         self.diff_delete = diff_delete
 
-        msg = "self.diff_detach: "
-        msg += f"{json.dumps(self.diff_detach, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_detach: "
+            msg += f"{json.dumps(self.diff_detach, indent=4)}"
+            self.log.debug(msg)
 
         if self.action_fabric_type != "multisite_child" and self.action_fabric_type != "multicluster_child":
-            msg = "self.vrf_sn_detach_map (built inline during DELETE processing): "
-            msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "self.vrf_sn_detach_map (built inline during DELETE processing): "
+                msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
+                self.log.debug(msg)
 
-        msg = "self.diff_undeploy: "
-        msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_undeploy: "
+            msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_delete: "
-        msg += f"{json.dumps(self.diff_delete, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_delete: "
+            msg += f"{json.dumps(self.diff_delete, indent=4)}"
+            self.log.debug(msg)
 
     def get_diff_override(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3013,25 +3036,28 @@ class DcnmVrf:
         self.diff_detach = diff_detach
         self.diff_undeploy = diff_undeploy
 
-        msg = "self.diff_delete: "
-        msg += f"{json.dumps(self.diff_delete, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_delete: "
+            msg += f"{json.dumps(self.diff_delete, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_detach: "
-        msg += f"{json.dumps(self.diff_detach, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_detach: "
+            msg += f"{json.dumps(self.diff_detach, indent=4)}"
+            self.log.debug(msg)
 
         if self.action_fabric_type != "multisite_child" and self.action_fabric_type != "multicluster_child":
-            msg = "self.vrf_sn_detach_map (built inline during OVERRIDE processing): "
-            msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "self.vrf_sn_detach_map (built inline during OVERRIDE processing): "
+                msg += f"{json.dumps({k: list(v) for k, v in self.vrf_sn_detach_map.items()}, indent=4)}"
+                self.log.debug(msg)
 
-        msg = "self.diff_undeploy: "
-        msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_undeploy: "
+            msg += f"{json.dumps(self.diff_undeploy, indent=4)}"
+            self.log.debug(msg)
 
     def get_diff_replace(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3117,13 +3143,14 @@ class DcnmVrf:
         self.diff_attach = copy.deepcopy(diff_attach)
         self.diff_deploy = copy.deepcopy(diff_deploy)
 
-        msg = "self.diff_attach: "
-        msg += f"{json.dumps(self.diff_attach, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_attach: "
+            msg += f"{json.dumps(self.diff_attach, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_deploy: "
-        msg += f"{json.dumps(self.diff_deploy, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_deploy: "
+            msg += f"{json.dumps(self.diff_deploy, indent=4)}"
+            self.log.debug(msg)
 
     def get_next_vrf_id(self, fabric) -> int:
         """
@@ -3137,8 +3164,8 @@ class DcnmVrf:
         - Controller version is unsupported
         - Unable to retrieve next available vrf_id for fabric
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3188,7 +3215,7 @@ class DcnmVrf:
         return int(str(vrf_id))
 
     def diff_merge_create(self, replace=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3207,17 +3234,19 @@ class DcnmVrf:
             have_c = self.have_create_by_name.get(want_c["vrfName"])
             if have_c is not None:
                 vrf_found = True
-                msg = "Calling diff_for_create with: "
-                msg += f"want_c: {json.dumps(want_c, indent=4, sort_keys=True)}, "
-                msg += f"have_c: {json.dumps(have_c, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = "Calling diff_for_create with: "
+                    msg += f"want_c: {json.dumps(want_c, indent=4, sort_keys=True)}, "
+                    msg += f"have_c: {json.dumps(have_c, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 diff, conf_chg = self.diff_for_create(want_c, have_c)
 
-                msg = "diff_for_create() returned with: "
-                msg += f"conf_chg {conf_chg}, "
-                msg += f"diff {json.dumps(diff, indent=4, sort_keys=True)}, "
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = "diff_for_create() returned with: "
+                    msg += f"conf_chg {conf_chg}, "
+                    msg += f"diff {json.dumps(diff, indent=4, sort_keys=True)}, "
+                    self.log.debug(msg)
 
                 msg = f"Updating self.conf_changed[{want_c['vrfName']}] "
                 msg += f"with {conf_chg}"
@@ -3225,9 +3254,10 @@ class DcnmVrf:
                 self.conf_changed.update({want_c["vrfName"]: conf_chg})
 
                 if diff:
-                    msg = "Appending diff_create_update with "
-                    msg += f"{json.dumps(diff, indent=4, sort_keys=True)}"
-                    self.log.debug(msg)
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        msg = "Appending diff_create_update with "
+                        msg += f"{json.dumps(diff, indent=4, sort_keys=True)}"
+                        self.log.debug(msg)
                     diff_create_update.append(diff)
             else:
                 vrf_found = False
@@ -3364,20 +3394,21 @@ class DcnmVrf:
         self.diff_create_update = diff_create_update
         self.diff_create_quick = diff_create_quick
 
-        msg = "self.diff_create: "
-        msg += f"{json.dumps(self.diff_create, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_create: "
+            msg += f"{json.dumps(self.diff_create, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_create_quick: "
-        msg += f"{json.dumps(self.diff_create_quick, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_create_quick: "
+            msg += f"{json.dumps(self.diff_create_quick, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_create_update: "
-        msg += f"{json.dumps(self.diff_create_update, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_create_update: "
+            msg += f"{json.dumps(self.diff_create_update, indent=4)}"
+            self.log.debug(msg)
 
     def diff_merge_attach(self, replace=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3460,16 +3491,17 @@ class DcnmVrf:
         self.diff_attach = diff_attach
         self.diff_deploy = diff_deploy
 
-        msg = "self.diff_attach: "
-        msg += f"{json.dumps(self.diff_attach, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_attach: "
+            msg += f"{json.dumps(self.diff_attach, indent=4)}"
+            self.log.debug(msg)
 
-        msg = "self.diff_deploy: "
-        msg += f"{json.dumps(self.diff_deploy, indent=4)}"
-        self.log.debug(msg)
+            msg = "self.diff_deploy: "
+            msg += f"{json.dumps(self.diff_deploy, indent=4)}"
+            self.log.debug(msg)
 
     def diff_merge_no_attach(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3509,12 +3541,13 @@ class DcnmVrf:
 
             self.diff_deploy = diff_deploy
 
-        msg = "self.diff_deploy: "
-        msg += f"{json.dumps(self.diff_deploy, indent=4)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_deploy: "
+            msg += f"{json.dumps(self.diff_deploy, indent=4)}"
+            self.log.debug(msg)
 
     def get_diff_merge(self, replace=False):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3533,7 +3566,7 @@ class DcnmVrf:
         self.diff_merge_no_attach()
 
     def format_diff(self):
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3558,29 +3591,30 @@ class DcnmVrf:
             msg += f"{json.dumps(diff_create, indent=4, sort_keys=True)}"
             self.log.debug(msg)
 
-            msg = "INPUT: diff_create_quick: "
-            msg += f"{json.dumps(diff_create_quick, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "INPUT: diff_create_quick: "
+                msg += f"{json.dumps(diff_create_quick, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "INPUT: diff_create_update: "
-            msg += f"{json.dumps(diff_create_update, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "INPUT: diff_create_update: "
+                msg += f"{json.dumps(diff_create_update, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "INPUT: diff_attach: "
-            msg += f"{json.dumps(diff_attach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "INPUT: diff_attach: "
+                msg += f"{json.dumps(diff_attach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "INPUT: diff_detach: "
-            msg += f"{json.dumps(diff_detach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "INPUT: diff_detach: "
+                msg += f"{json.dumps(diff_detach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "INPUT: diff_deploy: "
-            msg += f"{json.dumps(diff_deploy, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "INPUT: diff_deploy: "
+                msg += f"{json.dumps(diff_deploy, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "INPUT: diff_undeploy: "
-            msg += f"{json.dumps(diff_undeploy, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "INPUT: diff_undeploy: "
+                msg += f"{json.dumps(diff_undeploy, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
         diff_create.extend(diff_create_quick)
         diff_create.extend(diff_create_update)
@@ -3654,9 +3688,10 @@ class DcnmVrf:
                     elif "default" in vrf_spec[spec_key]:
                         formatted_vrf[spec_key] = vrf_spec[spec_key]["default"]
 
-            msg = "formatted_vrf: POST_UPDATE: "
-            msg += f"{json.dumps(formatted_vrf, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "formatted_vrf: POST_UPDATE: "
+                msg += f"{json.dumps(formatted_vrf, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             if diff_deploy and formatted_vrf["vrf_name"] in diff_deploy:
                 diff_deploy.remove(formatted_vrf["vrf_name"])
@@ -3714,13 +3749,14 @@ class DcnmVrf:
 
         self.diff_input_format = copy.deepcopy(diff)
 
-        msg = "self.diff_input_format: "
-        msg += f"{json.dumps(self.diff_input_format, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_input_format: "
+            msg += f"{json.dumps(self.diff_input_format, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def get_diff_query(self):
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -3984,8 +4020,8 @@ class DcnmVrf:
         - Bulk API: vrfTemplateConfig as dict, array payload, exclude serviceVrfTemplate/source
         - Individual API: vrfTemplateConfig as JSON string, single payload per VRF
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -4017,9 +4053,10 @@ class DcnmVrf:
             msg = f"Processing VRF {vrf_name}"
             self.log.debug(msg)
 
-            msg = f"VRF {vrf_name} template config: "
-            msg += f"{json.dumps(json_to_dict, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"VRF {vrf_name} template config: "
+                msg += f"{json.dumps(json_to_dict, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             # Handle VLAN ID auto-allocation (common to both)
             vlan_id = json_to_dict.get("vrfVlanId", 0)
@@ -4087,18 +4124,20 @@ class DcnmVrf:
 
         Send diff_detach to the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
-        msg = "ENTERED. "
-        msg += f"caller: {caller}. "
-        msg += "self.diff_detach: "
-        msg += f"{json.dumps(self.diff_detach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "ENTERED. "
+            msg += f"caller: {caller}. "
+            msg += "self.diff_detach: "
+            msg += f"{json.dumps(self.diff_detach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if not self.diff_detach or self.action_fabric_type == "multisite_child" or self.action_fabric_type == "multicluster_child":
-            msg = f"Early return. Fabric Type:{self.action_fabric_type}"
-            msg += f"diff_detach: {json.dumps(self.diff_detach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Early return. Fabric Type:{self.action_fabric_type}"
+                msg += f"diff_detach: {json.dumps(self.diff_detach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return
 
         # For multisite fabric, update the fabric name to the child fabric
@@ -4135,18 +4174,20 @@ class DcnmVrf:
 
         Send diff_undeploy to the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
-        msg = "ENTERED. "
-        msg += f"caller: {caller}. "
-        msg += "self.diff_undeploy: "
-        msg += f"{json.dumps(self.diff_undeploy, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "ENTERED. "
+            msg += f"caller: {caller}. "
+            msg += "self.diff_undeploy: "
+            msg += f"{json.dumps(self.diff_undeploy, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if not self.diff_undeploy or self.action_fabric_type == "multisite_child" or self.action_fabric_type == "multicluster_child":
-            msg = f"Early return. Fabric Type:{self.action_fabric_type}"
-            msg += f"diff_undeploy: {json.dumps(self.diff_undeploy, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Early return. Fabric Type:{self.action_fabric_type}"
+                msg += f"diff_undeploy: {json.dumps(self.diff_undeploy, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return
 
         action = "deploy"
@@ -4194,7 +4235,7 @@ class DcnmVrf:
         This wrapper method handles the undeploy operation and automatically
         retries if VRFs are in OUT-OF-SYNC state after the initial undeploy.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}."
@@ -4248,8 +4289,8 @@ class DcnmVrf:
 
         Calls fail_json if deletion fails after all retry attempts
         """
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -4283,9 +4324,10 @@ class DcnmVrf:
             # Send the request
             response = dcnm_send(self.module, verb, delete_path)
 
-            msg = f"Attempt {attempt} response: "
-            msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Attempt {attempt} response: "
+                msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             # Always append response for visibility
             self.result["response"].append(response)
@@ -4373,18 +4415,20 @@ class DcnmVrf:
 
         Send diff_delete to the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
-        msg = "ENTERED. "
-        msg += f"caller: {caller}. "
-        msg += "self.diff_delete: "
-        msg += f"{json.dumps(self.diff_delete, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "ENTERED. "
+            msg += f"caller: {caller}. "
+            msg += "self.diff_delete: "
+            msg += f"{json.dumps(self.diff_delete, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if not self.diff_delete or self.action_fabric_type == "multisite_child" or self.action_fabric_type == "multicluster_child":
-            msg = f"Early return. Fabric Type:{self.action_fabric_type}"
-            msg += f"diff_delete: {json.dumps(self.diff_delete, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Early return. Fabric Type:{self.action_fabric_type}"
+                msg += f"diff_delete: {json.dumps(self.diff_delete, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return
 
         action = "delete"
@@ -4441,14 +4485,15 @@ class DcnmVrf:
 
         Send diff_create to the controller
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
-        msg = "ENTERED. "
-        msg += f"caller: {caller}. "
-        msg += "self.diff_create: "
-        msg += f"{json.dumps(self.diff_create, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "ENTERED. "
+            msg += f"caller: {caller}. "
+            msg += "self.diff_create: "
+            msg += f"{json.dumps(self.diff_create, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         payload_list = []
 
@@ -4587,7 +4632,7 @@ class DcnmVrf:
 
         None
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -4601,9 +4646,10 @@ class DcnmVrf:
             extension_values = ast.literal_eval(extension_values)
             extension_values_list.append(extension_values)
 
-        msg = "Returning extension_values_list: "
-        msg += f"{json.dumps(extension_values_list, indent=4, sort_keys=True)}."
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning extension_values_list: "
+            msg += f"{json.dumps(extension_values_list, indent=4, sort_keys=True)}."
+            self.log.debug(msg)
 
         return extension_values_list
 
@@ -4618,7 +4664,7 @@ class DcnmVrf:
 
         Calls fail_json if DNCM fails to reserve the dot1q ID.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -4682,14 +4728,15 @@ class DcnmVrf:
         2. The IF_NAME in the extensionValues of the extension object
            matches the interface in vrf_attach.vrf_lite.
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
-        msg = "ENTERED. "
-        msg += f"caller: {caller}. "
-        msg += "vrf_attach: "
-        msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "ENTERED. "
+            msg += f"caller: {caller}. "
+            msg += "vrf_attach: "
+            msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         serial_number = vrf_attach.get("serialNumber")
 
@@ -4700,17 +4747,19 @@ class DcnmVrf:
             if "vrf_lite" in vrf_attach:
                 del vrf_attach["vrf_lite"]
             vrf_attach["extensionValues"] = ""
-            msg = f"serial_number: {serial_number}, "
-            msg += "vrf_attach does not contain a vrf_lite configuration. "
-            msg += "Returning it with empty extensionValues. "
-            msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"serial_number: {serial_number}, "
+                msg += "vrf_attach does not contain a vrf_lite configuration. "
+                msg += "Returning it with empty extensionValues. "
+                msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return copy.deepcopy(vrf_attach)
 
-        msg = f"serial_number: {serial_number}, "
-        msg += "Received lite: "
-        msg += f"{json.dumps(lite, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"serial_number: {serial_number}, "
+            msg += "Received lite: "
+            msg += f"{json.dumps(lite, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         ext_values = self.get_extension_values_from_lite_objects(lite)
         # ext_values now accepts None, empty list, empty string, empty dict etc
@@ -4764,21 +4813,23 @@ class DcnmVrf:
             self.log.debug(msg)
             self.module.fail_json(msg)
 
-        msg = "Matching extension object(s) found on the switch. "
-        msg += "Proceeding to convert playbook vrf_lite configuration "
-        msg += "to payload format. "
-        msg += f"matches: {json.dumps(matches, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Matching extension object(s) found on the switch. "
+            msg += "Proceeding to convert playbook vrf_lite configuration "
+            msg += "to payload format. "
+            msg += f"matches: {json.dumps(matches, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         extension_values: dict = {}
         extension_values["VRF_LITE_CONN"] = []
         extension_values["MULTISITE_CONN"] = []
 
         for interface, item in matches.items():
-            msg = f"interface: {interface}: "
-            msg += "item: "
-            msg += f"{json.dumps(item, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"interface: {interface}: "
+                msg += "item: "
+                msg += f"{json.dumps(item, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             nbr_dict = {}
             nbr_dict["IF_NAME"] = item["user"]["interface"]
@@ -4852,9 +4903,10 @@ class DcnmVrf:
         if vrf_attach.get("vrf_lite") is not None:
             del vrf_attach["vrf_lite"]
 
-        msg = "Returning modified vrf_attach: "
-        msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning modified vrf_attach: "
+            msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
         return copy.deepcopy(vrf_attach)
 
     def ip_to_serial_number(self, ip_address):
@@ -4873,7 +4925,7 @@ class DcnmVrf:
 
         If serial_number is not found, return None.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}, "
@@ -4907,35 +4959,37 @@ class DcnmVrf:
             do not include the response in the result
         -   `is_rollback`: If True, attempt to rollback on failure
         """
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}"
         self.log.debug(msg)
 
-        msg = "TX controller: "
-        msg += f"action: {action}, "
-        msg += f"verb: {verb}, "
-        msg += f"path: {path}, "
-        msg += f"log_response: {log_response}, "
-        msg += "type(payload): "
-        msg += f"{type(payload)}, "
-        msg += "payload: "
-        msg += f"{json.dumps(payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "TX controller: "
+            msg += f"action: {action}, "
+            msg += f"verb: {verb}, "
+            msg += f"path: {path}, "
+            msg += f"log_response: {log_response}, "
+            msg += "type(payload): "
+            msg += f"{type(payload)}, "
+            msg += "payload: "
+            msg += f"{json.dumps(payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if payload is not None:
             response = dcnm_send(self.module, verb, path, json.dumps(payload))
         else:
             response = dcnm_send(self.module, verb, path)
 
-        msg = "RX controller: "
-        msg += f"verb: {verb}, "
-        msg += f"path: {path}, "
-        msg += "response: "
-        msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "RX controller: "
+            msg += f"verb: {verb}, "
+            msg += f"path: {path}, "
+            msg += "response: "
+            msg += f"{json.dumps(response, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         msg = "Calling self.handle_response. "
         msg += "self.result[changed]): "
@@ -4978,16 +5032,17 @@ class DcnmVrf:
             - `fabric` : fabric name
             - `serialNumber` : switch serial number
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
         self.log.debug(msg)
 
-        msg = "Received vrf_attach: "
-        msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Received vrf_attach: "
+            msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if self.fabric_type != "MFD":
             msg = "Early return. "
@@ -5030,9 +5085,7 @@ class DcnmVrf:
 
         vrf_attach["fabric"] = child_fabric_name
 
-        msg += "Updated vrf_attach: "
-        msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        self.log.debug("%sUpdated vrf_attach: %s", msg, LazyJson(vrf_attach))
 
         return copy.deepcopy(vrf_attach)
 
@@ -5042,28 +5095,31 @@ class DcnmVrf:
 
         Send diff_attach to the controller
         """
-        caller = inspect.stack()[1][3]
-        method_name = inspect.stack()[0][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
+        method_name = inspect.currentframe().f_code.co_name
 
         msg = f"caller {caller}, "
         msg += "ENTERED. "
         self.log.debug(msg)
 
-        msg = "self.diff_attach PRE: "
-        msg += f"{json.dumps(self.diff_attach, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.diff_attach PRE: "
+            msg += f"{json.dumps(self.diff_attach, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         if not self.diff_attach or self.action_fabric_type == "multisite_child" or self.action_fabric_type == "multicluster_child":
-            msg = f"Early return. Fabric Type:{self.action_fabric_type}"
-            msg += f"diff_attach: {json.dumps(self.diff_attach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Early return. Fabric Type:{self.action_fabric_type}"
+                msg += f"diff_attach: {json.dumps(self.diff_attach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return
 
         new_diff_attach_list = []
         for diff_attach in self.diff_attach:
-            msg = "diff_attach: "
-            msg += f"{json.dumps(diff_attach, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "diff_attach: "
+                msg += f"{json.dumps(diff_attach, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             new_lan_attach_list = []
             for vrf_attach in diff_attach["lanAttachList"]:
@@ -5071,10 +5127,11 @@ class DcnmVrf:
 
                 serial_number = vrf_attach.get("serialNumber")
                 ip_address = self.serial_number_to_ip(serial_number)
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "vrf_attach: "
-                msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "vrf_attach: "
+                    msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 vrf_attach = self.update_vrf_attach_fabric_name(vrf_attach)
 
@@ -5085,20 +5142,22 @@ class DcnmVrf:
                     if "vrf_lite" in vrf_attach:
                         del vrf_attach["vrf_lite"]
                     new_lan_attach_list.append(vrf_attach)
-                    msg = f"ip_address {ip_address} ({serial_number}), "
-                    msg += "deleting null vrf_lite in vrf_attach and "
-                    msg += "skipping VRF Lite processing. "
-                    msg += "updated vrf_attach: "
-                    msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-                    self.log.debug(msg)
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        msg = f"ip_address {ip_address} ({serial_number}), "
+                        msg += "deleting null vrf_lite in vrf_attach and "
+                        msg += "skipping VRF Lite processing. "
+                        msg += "updated vrf_attach: "
+                        msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+                        self.log.debug(msg)
                     continue
 
                 # VRF Lite processing
 
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "vrf_attach.get(vrf_lite): "
-                msg += f"{json.dumps(vrf_attach.get('vrf_lite'), indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "vrf_attach.get(vrf_lite): "
+                    msg += f"{json.dumps(vrf_attach.get('vrf_lite'), indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 if not self.is_border_switch(serial_number):
                     # arobel TODO: Not covered by UT
@@ -5112,10 +5171,11 @@ class DcnmVrf:
 
                 lite_objects = self.get_vrf_lite_objects(vrf_attach)
 
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "lite_objects: "
-                msg += f"{json.dumps(lite_objects, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "lite_objects: "
+                    msg += f"{json.dumps(lite_objects, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 if not lite_objects.get("DATA"):
                     msg = f"ip_address {ip_address} ({serial_number}), "
@@ -5126,36 +5186,40 @@ class DcnmVrf:
                 lite = lite_objects["DATA"][0]["switchDetailsList"][0][
                     "extensionPrototypeValues"
                 ]
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "lite: "
-                msg += f"{json.dumps(lite, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "lite: "
+                    msg += f"{json.dumps(lite, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "old vrf_attach: "
-                msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "old vrf_attach: "
+                    msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 vrf_attach = self.update_vrf_attach_vrf_lite_extensions(
                     vrf_attach, lite
                 )
-                msg = f"ip_address {ip_address} ({serial_number}), "
-                msg += "new vrf_attach: "
-                msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
+                if self.log.isEnabledFor(logging.DEBUG):
+                    msg = f"ip_address {ip_address} ({serial_number}), "
+                    msg += "new vrf_attach: "
+                    msg += f"{json.dumps(vrf_attach, indent=4, sort_keys=True)}"
+                    self.log.debug(msg)
 
                 new_lan_attach_list.append(vrf_attach)
 
-            msg = "Updating diff_attach[lanAttachList] with: "
-            msg += f"{json.dumps(new_lan_attach_list, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "Updating diff_attach[lanAttachList] with: "
+                msg += f"{json.dumps(new_lan_attach_list, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
             diff_attach["lanAttachList"] = copy.deepcopy(new_lan_attach_list)
             new_diff_attach_list.append(copy.deepcopy(diff_attach))
 
-            msg = "new_diff_attach_list: "
-            msg += f"{json.dumps(new_diff_attach_list, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "new_diff_attach_list: "
+                msg += f"{json.dumps(new_diff_attach_list, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
         action = "attach"
         verb = "POST"
@@ -5194,7 +5258,7 @@ class DcnmVrf:
 
         Dictionary mapping serial numbers to comma-separated VRF names.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
@@ -5224,9 +5288,10 @@ class DcnmVrf:
         for serial, vrf_list in new_payload.items():
             new_payload[serial] = ','.join(vrf_list)
 
-        msg = "Returning new_payload: "
-        msg += f"{json.dumps(new_payload, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "Returning new_payload: "
+            msg += f"{json.dumps(new_payload, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
         return new_payload
 
@@ -5236,16 +5301,17 @@ class DcnmVrf:
 
         Send diff_deploy to the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = f"caller: {caller}. "
         msg += "ENTERED."
         self.log.debug(msg)
 
         if not self.diff_deploy or self.action_fabric_type == "multisite_child" or self.action_fabric_type == "multicluster_child":
-            msg = f"Early return. Fabric Type:{self.action_fabric_type}"
-            msg += f"diff_deploy: {json.dumps(self.diff_deploy, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"Early return. Fabric Type:{self.action_fabric_type}"
+                msg += f"diff_deploy: {json.dumps(self.diff_deploy, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             return
 
         action = "deploy"
@@ -5294,8 +5360,8 @@ class DcnmVrf:
         Given a list of resource IDs, send a request to the controller
         to release them.
         """
-        method_name = inspect.stack()[0][3]
-        caller = inspect.stack()[1][3]
+        method_name = inspect.currentframe().f_code.co_name
+        caller = inspect.currentframe().f_back.f_code.co_name
 
         msg = f"caller: {caller}. "
         msg += "ENTERED."
@@ -5429,8 +5495,9 @@ class DcnmVrf:
                     if not item.get("switchName"):
                         continue
 
-                    msg = f"item {json.dumps(item, indent=4, sort_keys=True)}"
-                    self.log.debug(msg)
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        msg = f"item {json.dumps(item, indent=4, sort_keys=True)}"
+                        self.log.debug(msg)
 
                     delete_ids.append(item["id"])
 
@@ -5450,7 +5517,7 @@ class DcnmVrf:
         -   `vrf_del_list`: List of VRF names that were deleted.
         -   `is_rollback`: If True, attempt to rollback on failure
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = "ENTERED. "
         msg += f"caller: {caller}. "
         msg += f"vrf_del_list: {vrf_del_list}"
@@ -5498,7 +5565,7 @@ class DcnmVrf:
 
         Send all diffs to the controller
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = "ENTERED. "
         msg += f"caller: {caller}."
         self.log.debug(msg)
@@ -5563,7 +5630,7 @@ class DcnmVrf:
 
         Calls fail_json if timeout is reached while waiting for VRF to reach terminal state.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = "ENTERED. "
         msg += f"caller: {caller}"
         self.log.debug(msg)
@@ -5674,7 +5741,7 @@ class DcnmVrf:
 
         Calls fail_json if timeout is reached while waiting for attachments.
         """
-        caller = inspect.stack()[1][3]
+        caller = inspect.currentframe().f_back.f_code.co_name
         msg = f"ENTERED. caller: {caller}"
         self.log.debug(msg)
 
@@ -6093,7 +6160,7 @@ class DcnmVrf:
 
     def validate_input(self):
         """Parse the playbook values, validate to param specs."""
-        method_name = inspect.stack()[0][3]
+        method_name = inspect.currentframe().f_code.co_name
         self.log.debug("ENTERED")
 
         attach_spec = self.attach_spec()
@@ -6105,13 +6172,14 @@ class DcnmVrf:
             msg += f"{json.dumps(attach_spec, indent=4, sort_keys=True)}"
             self.log.debug(msg)
 
-            msg = "lite_spec: "
-            msg += f"{json.dumps(lite_spec, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = "lite_spec: "
+                msg += f"{json.dumps(lite_spec, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
-            msg = "vrf_spec: "
-            msg += f"{json.dumps(vrf_spec, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+                msg = "vrf_spec: "
+                msg += f"{json.dumps(vrf_spec, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
 
         if self.state in ("merged", "overridden", "replaced"):
             fail_msg_list = []
@@ -6189,10 +6257,11 @@ class DcnmVrf:
                                     msg += f"{json.dumps(valid_lite, indent=4, sort_keys=True)}"
                                     self.log.debug(msg)
 
-                                    msg = f"state {self.state}: "
-                                    msg += "invalid_lite: "
-                                    msg += f"{json.dumps(invalid_lite, indent=4, sort_keys=True)}"
-                                    self.log.debug(msg)
+                                    if self.log.isEnabledFor(logging.DEBUG):
+                                        msg = f"state {self.state}: "
+                                        msg += "invalid_lite: "
+                                        msg += f"{json.dumps(invalid_lite, indent=4, sort_keys=True)}"
+                                        self.log.debug(msg)
 
                                 lite["vrf_lite"] = valid_lite
                                 invalid_params.extend(invalid_lite)
@@ -6229,10 +6298,11 @@ class DcnmVrf:
                                     msg += f"{json.dumps(valid_lite, indent=4, sort_keys=True)}"
                                     self.log.debug(msg)
 
-                                    msg = f"state {self.state}: "
-                                    msg += "invalid_lite: "
-                                    msg += f"{json.dumps(invalid_lite, indent=4, sort_keys=True)}"
-                                    self.log.debug(msg)
+                                    if self.log.isEnabledFor(logging.DEBUG):
+                                        msg = f"state {self.state}: "
+                                        msg += "invalid_lite: "
+                                        msg += f"{json.dumps(invalid_lite, indent=4, sort_keys=True)}"
+                                        self.log.debug(msg)
 
                                 lite["vrf_lite"] = valid_lite
                                 invalid_params.extend(invalid_lite)
@@ -6372,7 +6442,8 @@ def main():
             type="str",
             choices=["switch", "resource"],
             default="switch"
-        )
+        ),
+        child_fabric_parallelism=dict(required=False, type="int", default=1)
     )
 
     module = AnsibleModule(argument_spec=element_spec, supports_check_mode=True)
@@ -6384,31 +6455,49 @@ def main():
         msg += "does not have any switches"
         module.fail_json(msg=msg)
 
-    dcnm_vrf.validate_input()
+    # Spans are recorded here rather than by decorating the methods, which
+    # log their caller from the frame above their own.
+    tracer = get_tracer()
 
-    dcnm_vrf.get_want()
-    dcnm_vrf.get_have()
-    dcnm_vrf.update_want()
+    with tracer.span("validate_input"):
+        dcnm_vrf.validate_input()
+
+    with tracer.span("get_want"):
+        dcnm_vrf.get_want()
+    with tracer.span("get_have"):
+        dcnm_vrf.get_have()
+    with tracer.span("update_want"):
+        dcnm_vrf.update_want()
 
     if module.params["state"] == "merged":
-        dcnm_vrf.get_diff_merge()
+        with tracer.span("get_diff_merge"):
+            dcnm_vrf.get_diff_merge()
 
     if module.params["state"] == "replaced":
-        dcnm_vrf.get_diff_replace()
+        with tracer.span("get_diff_replace"):
+            dcnm_vrf.get_diff_replace()
 
     if module.params["state"] == "overridden":
-        dcnm_vrf.get_diff_override()
+        with tracer.span("get_diff_override"):
+            dcnm_vrf.get_diff_override()
 
     if module.params["state"] == "deleted":
-        dcnm_vrf.get_diff_delete()
+        with tracer.span("get_diff_delete"):
+            dcnm_vrf.get_diff_delete()
 
     if module.params["state"] == "query":
-        dcnm_vrf.get_diff_query()
+        with tracer.span("get_diff_query"):
+            dcnm_vrf.get_diff_query()
         dcnm_vrf.result["response"] = dcnm_vrf.query
 
-    dcnm_vrf.format_diff()
+    with tracer.span("format_diff"):
+        dcnm_vrf.format_diff()
     dcnm_vrf.result["diff"] = dcnm_vrf.diff_input_format
 
+    response_cache_stats = dcnm_get_response_cache_stats(module)
+    if response_cache_stats is not None:
+        dcnm_vrf.result["response_cache"] = response_cache_stats
+
     if (
         dcnm_vrf.diff_create
         or dcnm_vrf.diff_attach
@@ -6421,22 +6510,23 @@ def main():
     ):
         dcnm_vrf.result["changed"] = True
     else:
-        module.exit_json(**dcnm_vrf.result)
+        module.exit_json(**tracer.add_to(dcnm_vrf.result))
 
     if module.check_mode:
         dcnm_vrf.result["changed"] = False
         msg = f"dcnm_vrf.result: {dcnm_vrf.result}"
         dcnm_vrf.log.debug(msg)
-        module.exit_json(**dcnm_vrf.result)
+        module.exit_json(**tracer.add_to(dcnm_vrf.result))
 
-    dcnm_vrf.push_to_remote()
+    with tracer.span("push_to_remote"):
+        dcnm_vrf.push_to_remote()
 
     # Pass back the deploy payload to action plugin
     dcnm_vrf.result["deploy_payload"] = dcnm_vrf.deploy_payload
 
     msg = f"dcnm_vrf.result: {dcnm_vrf.result}"
     dcnm_vrf.log.debug(msg)
-    module.exit_json(**dcnm_vrf.result)
+    module.exit_json(**tracer.add_to(dcnm_vrf.result))
 
 
 if __name__ == "__main__":
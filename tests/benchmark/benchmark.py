@@ -0,0 +1,431 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+End-to-end performance benchmark of the cisco.dcnm modules.
+
+Each scenario runs one module state with ansible-playbook, through the httpapi
+persistent connection, against the NDFC stand-in server of ndfc_server.py. The
+fabric is reseeded before every run and the benchmark reports, per scale point:
+
+    requests    number of requests received by the server
+    wall        wall time of the ansible-playbook run in seconds
+    cpu         user plus system CPU time of the playbook processes in seconds
+    rss         peak resident set size of the playbook processes in MB
+
+Scale points are given as SWITCHESxVRFSxNETWORKSxINTERFACES[xLINKS], e.g. 8x16x64x16.
+The configuration of each scenario is derived from the seeded fabric:
+
+    merged      every seeded object plus a quarter more new VRFs and networks
+    replaced    every seeded object, attached to the first half of the leafs only
+    overridden  the first half of the seeded objects
+    deleted     the second half of the seeded objects
+    query       every seeded object
+
+The results can be saved with --json and compared with a previous run with
+--baseline. A scenario whose request count grows by more than --tolerance percent
+over the baseline fails the benchmark, which catches N+1 request regressions.
+
+Usage:
+    python benchmark.py --scale 4x4x8x8 --scale 16x32x128x16 --json results.json
+    python benchmark.py --module dcnm_vrf --state merged --baseline results.json
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.request import Request, urlopen
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ndfc_server import Fabric, Latency, NdfcServer, Topology  # noqa: E402
+
+MODULES = ("dcnm_vrf", "dcnm_network", "dcnm_interface", "dcnm_links")
+STATES = ("merged", "replaced", "overridden", "deleted", "query")
+# States that a module does not implement are skipped
+UNSUPPORTED = {"dcnm_links": ("overridden",)}
+
+# Run a command and print its exit code, and the peak RSS in kB and CPU time in seconds
+# of its process tree. RUSAGE_CHILDREN covers every descendant process that was waited for.
+MEASURE = """
+import json, resource, subprocess, sys
+rc = subprocess.call(sys.argv[1:], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+print(json.dumps({"rc": rc, "maxrss": usage.ru_maxrss, "cpu": usage.ru_utime + usage.ru_stime}))
+"""
+
+
+def parse_scale(value):
+    """Return the Topology of scale point SWITCHESxVRFSxNETWORKSxINTERFACES[xLINKS]"""
+    fields = [int(item) for item in value.lower().split("x")]
+    if len(fields) not in (4, 5):
+        raise argparse.ArgumentTypeError("expected SWITCHESxVRFSxNETWORKSxINTERFACES[xLINKS], got {0}".format(value))
+    return Topology(*([Topology().fabric] + fields))
+
+
+def scale_name(topology):
+    return "x".join(str(getattr(topology, field)) for field in Topology.FIELDS[1:])
+
+
+class Scenarios:
+    """Build the module configuration of each state from a seeded fabric"""
+
+    FABRIC_ARGS = {"dcnm_links": "src_fabric"}
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.fabric = Fabric(topology)
+        switches = sorted(self.fabric.switches.values(), key=lambda switch: switch["switchDbID"])
+        self.leafs = [switch for switch in switches if switch["switchRole"] == "leaf"]
+        self.switches = switches
+
+    @staticmethod
+    def half(items, state=None):
+        """Return the first half of items, or the second half for the deleted state"""
+        if state == "deleted":
+            return items[max(1, len(items) // 2):]
+        return items[: max(1, len(items) // 2)]
+
+    @staticmethod
+    def extra(count):
+        return max(1, count // 4)
+
+    def task(self, module, state):
+        args = {self.FABRIC_ARGS.get(module, "fabric"): self.fabric.name, "state": state}
+        config = getattr(self, module)(state)
+        if config is not None:
+            args["config"] = config
+        return {"name": "{0} {1}".format(module, state), "cisco.dcnm.{0}".format(module): args}
+
+    # dcnm_vrf
+
+    def vrf(self, name, vrf_id, vlan_id, leafs):
+        return {
+            "vrf_name": name,
+            "vrf_id": vrf_id,
+            "vlan_id": vlan_id,
+            "vrf_template": "Default_VRF_Universal",
+            "vrf_extension_template": "Default_VRF_Extension_Universal",
+            "attach": [{"ip_address": leaf["ipAddress"]} for leaf in leafs],
+            "deploy": True,
+        }
+
+    def dcnm_vrf(self, state):
+        seeded = sorted(self.fabric.vrfs.values(), key=lambda vrf: vrf["vrfId"])
+        vrfs = [(vrf["vrfName"], vrf["vrfId"], json.loads(vrf["vrfTemplateConfig"])["vrfVlanId"]) for vrf in seeded]
+        if state == "merged":
+            start = len(vrfs) + 1
+            vrfs += [("vrf_{0}".format(index), 50000 + index, 2000 + index) for index in range(start, start + self.extra(len(vrfs)))]
+        elif state in ("overridden", "deleted"):
+            vrfs = self.half(vrfs, state)
+        elif state == "query":
+            return [{"vrf_name": name} for name, vrf_id, vlan_id in vrfs]
+        leafs = self.half(self.leafs) if state == "replaced" else self.leafs
+        if state == "deleted":
+            return [{"vrf_name": name} for name, vrf_id, vlan_id in vrfs]
+        return [self.vrf(name, vrf_id, int(vlan_id), leafs) for name, vrf_id, vlan_id in vrfs]
+
+    # dcnm_network
+
+    def network(self, name, net_id, vlan_id, vrf, gateway, leafs):
+        return {
+            "net_name": name,
+            "vrf_name": vrf,
+            "net_id": net_id,
+            "vlan_id": vlan_id,
+            "gw_ip_subnet": gateway,
+            "net_template": "Default_Network_Universal",
+            "net_extension_template": "Default_Network_Extension_Universal",
+            "attach": [{"ip_address": leaf["ipAddress"], "ports": []} for leaf in leafs],
+            "deploy": True,
+        }
+
+    def dcnm_network(self, state):
+        networks = []
+        for net in sorted(self.fabric.networks.values(), key=lambda net: net["networkId"]):
+            template_config = json.loads(net["networkTemplateConfig"])
+            networks.append(
+                (net["networkName"], net["networkId"], int(template_config["vlanId"]), net["vrf"], template_config["gatewayIpAddress"])
+            )
+        if state == "merged":
+            vrf = sorted(self.fabric.vrfs)[0] if self.fabric.vrfs else "NA"
+            start = len(networks) + 1
+            networks += [
+                ("net_{0}".format(index), 30000 + index, 2300 + index, vrf, "192.168.{0}.1/24".format(index % 256))
+                for index in range(start, start + self.extra(len(networks)))
+            ]
+        elif state in ("overridden", "deleted"):
+            networks = self.half(networks, state)
+        if state in ("deleted", "query"):
+            return [{"net_name": network[0]} for network in networks]
+        leafs = self.half(self.leafs) if state == "replaced" else self.leafs
+        return [self.network(*(network + (leafs,))) for network in networks]
+
+    # dcnm_interface
+
+    def interface(self, switch, name, description):
+        return {
+            "name": name,
+            "type": "eth",
+            "switch": [switch["ipAddress"]],
+            "deploy": True,
+            "profile": {
+                "mode": "trunk",
+                "speed": "Auto",
+                "bpdu_guard": "no",
+                "port_type_fast": True,
+                "mtu": "jumbo",
+                "allowed_vlans": "none",
+                "admin_state": True,
+                "description": description,
+            },
+        }
+
+    def dcnm_interface(self, state):
+        interfaces = []
+        for switch in self.leafs:
+            for name in sorted(self.fabric.interfaces[switch["serialNumber"]]):
+                interfaces.append((switch, name))
+        if state in ("overridden", "deleted"):
+            interfaces = self.half(interfaces, state)
+        if state == "query":
+            return [{"name": name, "switch": [switch["ipAddress"]]} for switch, name in interfaces]
+        if state == "deleted":
+            return [{"name": name, "type": "eth", "switch": [switch["ipAddress"]]} for switch, name in interfaces]
+        description = "" if state == "merged" else "benchmark {0}".format(state)
+        return [self.interface(switch, name, description) for switch, name in interfaces]
+
+    # dcnm_links
+
+    def link(self, link, state, description=""):
+        nv_pairs = link["nvPairs"]
+        config = {
+            "dst_fabric": link["sw2-info"]["fabric-name"],
+            "src_interface": link["sw1-info"]["if-name"],
+            "dst_interface": link["sw2-info"]["if-name"],
+            "src_device": self.fabric.switches[link["sw1-info"]["sw-serial-number"]]["ipAddress"],
+            "dst_device": self.fabric.switches[link["sw2-info"]["sw-serial-number"]]["ipAddress"],
+        }
+        if state in ("deleted", "query"):
+            return config
+        config["template"] = "int_intra_fabric_num_link"
+        config["profile"] = {
+            "peer1_ipv4_addr": nv_pairs["PEER1_IP"],
+            "peer2_ipv4_addr": nv_pairs["PEER2_IP"],
+            "admin_state": True,
+            "mtu": 9216,
+            "peer1_description": description,
+            "peer2_description": description,
+        }
+        return config
+
+    def dcnm_links(self, state):
+        links = sorted(self.fabric.links.values(), key=lambda link: link["link-dbid"])
+        if state in ("overridden", "deleted"):
+            links = self.half(links, state)
+        description = "benchmark {0}".format(state) if state in ("merged", "replaced") else ""
+        return [self.link(link, state, description) for link in links]
+
+
+class Benchmark:
+    """Run the scenarios against an NDFC stand-in server and collect the results"""
+
+    def __init__(self, server, workdir, collections_path, verbose=False):
+        self.server = server
+        self.workdir = workdir
+        self.collections_path = collections_path
+        self.verbose = verbose
+
+    def control(self, path, data=None):
+        request = Request(self.server.url + path, data=json.dumps(data or {}).encode("utf-8") if data is not None else None)
+        if data is not None:
+            request.add_header("Content-Type", "application/json")
+        with urlopen(request) as response:
+            return json.loads(response.read() or b"{}")
+
+    def inventory(self):
+        host, port = self.server.server_address[:2]
+        return {
+            "all": {
+                "hosts": {
+                    "ndfc": {
+                        "ansible_host": host,
+                        "ansible_connection": "ansible.netcommon.httpapi",
+                        "ansible_network_os": "cisco.dcnm.dcnm",
+                        "ansible_httpapi_use_ssl": False,
+                        "ansible_httpapi_port": port,
+                        "ansible_user": "admin",
+                        "ansible_password": "benchmark",
+                    }
+                }
+            }
+        }
+
+    def run(self, topology, module, state):
+        scenarios = Scenarios(topology)
+        playbook = [
+            {
+                "hosts": "ndfc",
+                "gather_facts": False,
+                "tasks": [scenarios.task(module, state), {"meta": "reset_connection"}],
+            }
+        ]
+        run_dir = tempfile.mkdtemp(prefix="{0}-{1}-".format(module, state), dir=self.workdir)
+        paths = {}
+        for name, content in (("inventory.yml", self.inventory()), ("playbook.yml", playbook)):
+            paths[name] = os.path.join(run_dir, name)
+            with open(paths[name], "w") as fd:
+                yaml.safe_dump(content, fd, sort_keys=False)
+
+        env = dict(os.environ)
+        env.update(
+            {
+                "ANSIBLE_COLLECTIONS_PATH": os.pathsep.join(
+                    [self.collections_path, os.environ.get("ANSIBLE_COLLECTIONS_PATH", "~/.ansible/collections:/usr/share/ansible/collections")]
+                ),
+                "ANSIBLE_PERSISTENT_CONTROL_PATH_DIR": os.path.join(run_dir, "pc"),
+                "ANSIBLE_LOCAL_TEMP": os.path.join(run_dir, "tmp"),
+                "ANSIBLE_HOST_KEY_CHECKING": "False",
+                "ANSIBLE_RETRY_FILES_ENABLED": "False",
+                "ANSIBLE_STDOUT_CALLBACK": "json",
+            }
+        )
+        command = ["ansible-playbook", "-i", paths["inventory.yml"], paths["playbook.yml"]]
+
+        self.control("/_benchmark/seed", topology.to_dict())
+        start = time.monotonic()
+        output = subprocess.run([sys.executable, "-c", MEASURE] + command, env=env, cwd=run_dir, stdout=subprocess.PIPE, check=False)
+        wall = time.monotonic() - start
+        stats = self.control("/_benchmark/stats")
+
+        measured = json.loads(output.stdout.decode("utf-8").strip().splitlines()[-1])
+        result = {
+            "scale": scale_name(topology),
+            "module": module,
+            "state": state,
+            "status": "ok" if measured["rc"] == 0 else "failed",
+            "requests": stats["requests"],
+            "wall": round(wall, 2),
+            "cpu": round(measured["cpu"], 2),
+            "rss": round(measured["maxrss"] / 1024.0, 1),
+            "unhandled": sum(stats["unhandled"].values()),
+            "endpoints": stats["endpoints"],
+        }
+        if measured["rc"] != 0 or self.verbose:
+            result["log"] = self.failure_log(command, env, run_dir) if measured["rc"] != 0 else None
+            result["unhandled_endpoints"] = stats["unhandled"]
+        return result
+
+    def failure_log(self, command, env, run_dir):
+        """Rerun a failed scenario to capture its output"""
+        output = subprocess.run(command, env=env, cwd=run_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False)
+        return output.stdout.decode("utf-8", "replace")[-4000:]
+
+
+def compare(results, baseline, tolerance):
+    """Return the scenarios whose request count exceeds the baseline by more than tolerance percent"""
+    previous = {(item["scale"], item["module"], item["state"]): item for item in baseline}
+    regressions = []
+    for item in results:
+        before = previous.get((item["scale"], item["module"], item["state"]))
+        if before is None or before["status"] != "ok":
+            continue
+        if item["requests"] > before["requests"] * (1 + tolerance / 100.0):
+            regressions.append((item, before))
+    return regressions
+
+
+def report(results, stream=sys.stdout):
+    header = "{0:<16} {1:<16} {2:<11} {3:<7} {4:>9} {5:>9} {6:>9} {7:>9} {8:>10}".format(
+        "scale", "module", "state", "status", "requests", "wall(s)", "cpu(s)", "rss(MB)", "unhandled"
+    )
+    stream.write(header + "\n" + "-" * len(header) + "\n")
+    for item in results:
+        stream.write(
+            "{scale:<16} {module:<16} {state:<11} {status:<7} {requests:>9} {wall:>9} {cpu:>9} {rss:>9} {unhandled:>10}\n".format(**item)
+        )
+
+
+def default_collections_path():
+    """Return the directory holding the ansible_collections directory of this collection, if any"""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while os.path.dirname(path) != path:
+        if os.path.basename(path) == "ansible_collections":
+            return os.path.dirname(path)
+        path = os.path.dirname(path)
+    return None
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="End-to-end performance benchmark of the cisco.dcnm modules")
+    parser.add_argument("--scale", type=parse_scale, action="append", help="SWITCHESxVRFSxNETWORKSxINTERFACES[xLINKS], default 4x4x8x8x4")
+    parser.add_argument("--module", action="append", choices=MODULES, help="default: all modules")
+    parser.add_argument("--state", action="append", choices=STATES, help="default: all states")
+    parser.add_argument("--latency", type=float, default=0.0, help="default latency of the server in seconds")
+    parser.add_argument("--latency-rule", action="append", default=[], help="[METHOD:]REGEX=SECONDS")
+    parser.add_argument("--collections-path", default=default_collections_path(), help="directory holding ansible_collections/cisco/dcnm")
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--baseline", help="compare the request counts with the results in this file")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="allowed request count growth in percent")
+    parser.add_argument("--verbose", action="store_true", help="print the output of failed scenarios")
+    args = parser.parse_args()
+    if not args.collections_path:
+        parser.error("--collections-path is required when the collection is not in an ansible_collections directory")
+
+    scales = args.scale or [parse_scale("4x4x8x8x4")]
+    server = NdfcServer(("127.0.0.1", 0), scales[0], Latency(args.latency, args.latency_rule)).start()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="dcnm-benchmark-") as workdir:
+        benchmark = Benchmark(server, workdir, args.collections_path, args.verbose)
+        for topology in scales:
+            for module in args.module or MODULES:
+                for state in args.state or STATES:
+                    if state in UNSUPPORTED.get(module, ()):
+                        continue
+                    result = benchmark.run(topology, module, state)
+                    results.append(result)
+                    if args.verbose and result.get("log"):
+                        sys.stderr.write(result["log"] + "\n")
+    server.shutdown()
+
+    report(results)
+    if args.json:
+        with open(args.json, "w") as fd:
+            json.dump(results, fd, indent=4)
+
+    failed = [item for item in results if item["status"] != "ok"]
+    if args.baseline:
+        with open(args.baseline) as fd:
+            regressions = compare(results, json.load(fd), args.tolerance)
+        for item, before in regressions:
+            sys.stdout.write(
+                "REGRESSION {scale} {module} {state}: {0} -> {requests} requests\n".format(before["requests"], **item)
+            )
+        failed += [item for item, before in regressions]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
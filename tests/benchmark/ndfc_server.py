@@ -0,0 +1,1238 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local NDFC stand-in HTTP server used by the benchmark suite.
+
+The server keeps an in-memory model of one VXLAN fabric, seeded with synthetic
+switches, VRFs, networks, interfaces and links, and implements the subset of the
+NDFC 12 REST API used by the dcnm_vrf, dcnm_network, dcnm_interface and dcnm_links
+modules. It is not a faithful controller: deployments complete immediately and
+payloads are only validated as far as needed to keep the model consistent.
+
+Every request is counted per method and endpoint. A per-endpoint latency can be
+configured to measure how sensitive a module is to controller response times.
+
+The following endpoints control the server and are not counted:
+    GET  /_benchmark/stats      request counters and unhandled requests
+    POST /_benchmark/reset      reset the request counters
+    POST /_benchmark/seed       reseed the fabric, the body holds the Topology fields
+    POST /_benchmark/latency    set the latency rules, see Latency
+
+Usage:
+    python ndfc_server.py --port 8443 --switches 32 --vrfs 50 --networks 200
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+API = "/appcenter/cisco/ndfc/api/v1"
+LAN_FABRIC = API + "/lan-fabric/rest"
+TOP_DOWN = LAN_FABRIC + "/top-down"
+CONTROL = LAN_FABRIC + "/control"
+INTERFACE = LAN_FABRIC + "/interface"
+
+VERSION = "12.2.2.238"
+FEATURES = {
+    "lan": {"admin_state": "enabled", "oper_state": "started"},
+    "vxlan": {"admin_state": "enabled", "oper_state": "started"},
+    "pmn": {"admin_state": "disabled", "oper_state": ""},
+}
+
+
+class Topology:
+    """
+    Size of the synthetic fabric seeded into the server
+
+    switches: number of leaf switches, plus two spines
+    vrfs: number of VRFs, attached to every leaf
+    networks: number of networks, spread over the first half of the VRFs and attached to every leaf
+    interfaces: number of ethernet interfaces per switch
+    links: number of leaf to spine links
+    """
+
+    FIELDS = ("fabric", "switches", "vrfs", "networks", "interfaces", "links")
+
+    def __init__(self, fabric="bench-fabric", switches=4, vrfs=4, networks=8, interfaces=8, links=0):
+        self.fabric = fabric
+        self.switches = int(switches)
+        self.vrfs = int(vrfs)
+        self.networks = int(networks)
+        self.interfaces = int(interfaces)
+        self.links = int(links)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: value for key, value in data.items() if key in cls.FIELDS})
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+
+class Latency:
+    """
+    Per-endpoint latency rules
+
+    A rule is "[METHOD:]REGEX=SECONDS", e.g. "GET:/vrfs$=0.05" or "/interface=0.02".
+    The first rule matching a request path applies, the default applies otherwise.
+    """
+
+    def __init__(self, default=0.0, rules=None):
+        self.default = float(default)
+        self.rules = []
+        for rule in rules or []:
+            self.add(rule)
+
+    def add(self, rule):
+        pattern, seconds = rule.rsplit("=", 1)
+        method = None
+        mo = re.match(r"^(GET|POST|PUT|DELETE):(.*)$", pattern)
+        if mo:
+            method, pattern = mo.group(1), mo.group(2)
+        self.rules.append((method, re.compile(pattern), float(seconds)))
+
+    def get(self, method, path):
+        for rule_method, pattern, seconds in self.rules:
+            if rule_method in (None, method) and pattern.search(path):
+                return seconds
+        return self.default
+
+
+def json_str(data):
+    return json.dumps(data, separators=(",", ":"))
+
+
+class Fabric:
+    """In-memory model of a seeded fabric"""
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.name = topology.fabric
+        self.lock = threading.RLock()
+        self.next_id = 1000
+        self.switches = {}
+        self.vrfs = {}
+        self.vrf_attachments = {}
+        self.networks = {}
+        self.net_attachments = {}
+        self.interfaces = {}
+        self.links = {}
+        self.seed()
+
+    def allocate_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def details(self):
+        return {
+            "id": 1,
+            "fabricId": "FABRIC-1",
+            "fabricName": self.name,
+            "fabricType": "Switch_Fabric",
+            "fabricTypeFriendly": "Switch Fabric",
+            "fabricTechnology": "VXLANFabric",
+            "fabricTechnologyFriendly": "VXLAN EVPN",
+            "provisionMode": "DCNMTopDown",
+            "deviceType": "n9k",
+            "replicationMode": "Multicast",
+            "operStatus": "HEALTHY",
+            "templateName": "Easy_Fabric",
+            "vrfTemplate": "Default_VRF_Universal",
+            "vrfExtensionTemplate": "Default_VRF_Extension_Universal",
+            "networkTemplate": "Default_Network_Universal",
+            "networkExtensionTemplate": "Default_Network_Extension_Universal",
+            "asn": "65001",
+            "nvPairs": {
+                "FABRIC_NAME": self.name,
+                "FABRIC_TYPE": "Switch_Fabric",
+                "FF": "Easy_Fabric",
+                "BGP_AS": "65001",
+                "ENABLE_NETFLOW": "false",
+                "L2_SEGMENT_ID_RANGE": "30000-49000",
+                "L3_PARTITION_ID_RANGE": "50000-59000",
+                "NETWORK_VLAN_RANGE": "2300-2999",
+                "VRF_VLAN_RANGE": "2000-2299",
+                "default_network": "Default_Network_Universal",
+                "default_vrf": "Default_VRF_Universal",
+                "network_extension_template": "Default_Network_Extension_Universal",
+                "vrf_extension_template": "Default_VRF_Extension_Universal",
+            },
+        }
+
+    def switch(self, index, role):
+        serial = "SN{0:06d}".format(index)
+        return {
+            "serialNumber": serial,
+            "ipAddress": "10.{0}.{1}.{2}".format(index // 65536, (index // 256) % 256, index % 256),
+            "logicalName": "{0}-{1}".format(role, index),
+            "switchRole": role,
+            "switchRoleEnum": role.capitalize(),
+            "fabricName": self.name,
+            "switchDbID": 100000 + index,
+            "model": "N9K-C93180YC-EX",
+            "release": "10.3(3)",
+            "mode": "Normal",
+            "managable": True,
+            "status": "ok",
+            "ccStatus": "In-Sync",
+            "isVpcConfigured": False,
+            "vpcDomain": 0,
+            "peerSerialNumber": None,
+        }
+
+    def seed(self):
+        topology = self.topology
+        for index in range(1, topology.switches + 3):
+            role = "spine" if index > topology.switches else "leaf"
+            switch = self.switch(index, role)
+            self.switches[switch["serialNumber"]] = switch
+            self.interfaces[switch["serialNumber"]] = {}
+            for port in range(1, topology.interfaces + 1):
+                self.add_interface(switch, "Ethernet1/{0}".format(port))
+        leafs = [sn for sn, switch in self.switches.items() if switch["switchRole"] == "leaf"]
+
+        for index in range(1, topology.vrfs + 1):
+            name = "vrf_{0}".format(index)
+            self.add_vrf(self.vrf_payload(name, 50000 + index, 2000 + index))
+            for serial in leafs:
+                self.attach_vrf(name, serial, 2000 + index, True)
+
+        # Networks only use the first half of the VRFs, the other VRFs can be deleted
+        vrf_names = ["vrf_{0}".format(index) for index in range(1, max(1, topology.vrfs // 2) + 1)]
+        for index in range(1, topology.networks + 1):
+            name = "net_{0}".format(index)
+            vrf = vrf_names[index % len(vrf_names)] if topology.vrfs else "NA"
+            self.add_network(self.network_payload(name, 30000 + index, 2300 + index, vrf))
+            for serial in leafs:
+                self.attach_network(name, serial, 2300 + index, True)
+
+        # Numbered intra-fabric links from the leafs to the spines, on the ports after
+        # the seeded interfaces
+        spines = [sn for sn, switch in self.switches.items() if switch["switchRole"] == "spine"]
+        for index in range(topology.links):
+            self.add_link(
+                {
+                    "sourceFabric": self.name,
+                    "destinationFabric": self.name,
+                    "sourceDevice": leafs[index % len(leafs)],
+                    "destinationDevice": spines[index % len(spines)],
+                    "sourceInterface": "Ethernet1/{0}".format(topology.interfaces + 1 + index // len(leafs)),
+                    "destinationInterface": "Ethernet1/{0}".format(topology.interfaces + 1 + index),
+                    "templateName": "int_intra_fabric_num_link",
+                    "nvPairs": {
+                        "ADMIN_STATE": "true",
+                        "MTU": "9216",
+                        "PEER1_IP": "10.200.{0}.{1}".format(index * 4 // 256, index * 4 % 256 + 1),
+                        "PEER2_IP": "10.200.{0}.{1}".format(index * 4 // 256, index * 4 % 256 + 2),
+                        "PEER1_DESC": "",
+                        "PEER2_DESC": "",
+                        "PEER1_CONF": "",
+                        "PEER2_CONF": "",
+                        "PEER1_BFD_ECHO_DISABLE": "false",
+                        "PEER2_BFD_ECHO_DISABLE": "false",
+                        "ENABLE_MACSEC": "false",
+                    },
+                }
+            )
+
+    # VRFs
+
+    def vrf_payload(self, name, vrf_id, vlan_id):
+        template_config = {
+            "vrfName": name,
+            "vrfSegmentId": str(vrf_id),
+            "vrfVlanId": str(vlan_id),
+            "vrfVlanName": "",
+            "vrfIntfDescription": "",
+            "vrfDescription": "",
+            "mtu": "9216",
+            "tag": "12345",
+            "vrfRouteMap": "FABRIC-RMAP-REDIST-SUBNET",
+            "v6VrfRouteMap": "FABRIC-RMAP-REDIST-SUBNET",
+            "maxBgpPaths": "1",
+            "maxIbgpPaths": "2",
+            "ipv6LinkLocalFlag": "true",
+            "trmEnabled": "false",
+            "isRPExternal": "false",
+            "rpAddress": "",
+            "loopbackNumber": "",
+            "L3VniMcastGroup": "",
+            "multicastGroup": "",
+            "trmBGWMSiteEnabled": "false",
+            "advertiseHostRouteFlag": "false",
+            "advertiseDefaultRouteFlag": "true",
+            "configureStaticDefaultRouteFlag": "true",
+            "bgpPassword": "",
+            "bgpPasswordKeyType": "3",
+            "ENABLE_NETFLOW": "false",
+            "NETFLOW_MONITOR": "",
+            "disableRtAuto": "false",
+            "routeTargetImport": "",
+            "routeTargetExport": "",
+            "routeTargetImportEvpn": "",
+            "routeTargetExportEvpn": "",
+            "routeTargetImportMvpn": "",
+            "routeTargetExportMvpn": "",
+            "isRPAbsent": "false",
+            "nveId": "1",
+            "asn": "65001",
+        }
+        return {
+            "fabric": self.name,
+            "vrfName": name,
+            "vrfId": vrf_id,
+            "vrfTemplate": "Default_VRF_Universal",
+            "vrfExtensionTemplate": "Default_VRF_Extension_Universal",
+            "serviceVrfTemplate": None,
+            "source": None,
+            "vrfTemplateConfig": json_str(template_config),
+        }
+
+    def add_vrf(self, payload):
+        vrf = copy.deepcopy(payload)
+        vrf["fabric"] = self.name
+        vrf.setdefault("vrfId", self.allocate_id())
+        vrf["vrfStatus"] = "NA"
+        vrf.setdefault("serviceVrfTemplate", None)
+        vrf.setdefault("source", None)
+        self.vrfs[vrf["vrfName"]] = vrf
+        self.vrf_attachments.setdefault(vrf["vrfName"], {})
+        return vrf
+
+    def attach_vrf(self, name, serial, vlan, deployed, instance_values="", extension_values="", freeform_config=""):
+        switch = self.switches[serial]
+        self.vrf_attachments.setdefault(name, {})[serial] = {
+            "vrfName": name,
+            "vrfId": self.vrfs[name]["vrfId"],
+            "switchName": switch["logicalName"],
+            "switchSerialNo": serial,
+            "switchRole": switch["switchRole"],
+            "fabricName": self.name,
+            "ipAddress": switch["ipAddress"],
+            "vlanId": int(vlan),
+            "isLanAttached": True,
+            "lanAttachState": "DEPLOYED" if deployed else "PENDING",
+            "instanceValues": instance_values or "",
+            "extensionValues": extension_values or "",
+            "freeformConfig": freeform_config or "",
+        }
+        self.update_vrf_status(name)
+
+    def update_vrf_status(self, name):
+        attachments = self.vrf_attachments.get(name, {})
+        if not attachments:
+            status = "NA"
+        elif all(attach["lanAttachState"] == "DEPLOYED" for attach in attachments.values()):
+            status = "DEPLOYED"
+        else:
+            status = "PENDING"
+        if name in self.vrfs:
+            self.vrfs[name]["vrfStatus"] = status
+
+    @staticmethod
+    def deploy_attachments(attachments, serial, names, update_status):
+        for name in sorted(attachments) if names is None else names:
+            attach = attachments.get(name, {}).get(serial)
+            if attach is None:
+                continue
+            if attach["isLanAttached"]:
+                attach["lanAttachState"] = "DEPLOYED"
+            else:
+                del attachments[name][serial]
+            update_status(name)
+
+    def deploy_vrfs(self, serial, names=None):
+        self.deploy_attachments(self.vrf_attachments, serial, names, self.update_vrf_status)
+
+    # Networks
+
+    def network_payload(self, name, net_id, vlan_id, vrf):
+        template_config = {
+            "networkName": name,
+            "segmentId": str(net_id),
+            "vlanId": str(vlan_id),
+            "vlanName": "",
+            "vrfName": vrf,
+            "gatewayIpAddress": "192.168.{0}.1/24".format(net_id % 256),
+            "gatewayIpV6Address": "",
+            "intfDescription": "",
+            "mtu": "9216",
+            "tag": "12345",
+            "isLayer2Only": "false",
+            "suppressArp": "false",
+            "mcastGroup": "239.1.1.0",
+            "dhcpServerAddr1": "",
+            "dhcpServerAddr2": "",
+            "dhcpServerAddr3": "",
+            "vrfDhcp": "",
+            "vrfDhcp2": "",
+            "vrfDhcp3": "",
+            "loopbackId": "",
+            "secondaryGW1": "",
+            "secondaryGW2": "",
+            "secondaryGW3": "",
+            "secondaryGW4": "",
+            "trmEnabled": "false",
+            "rtBothAuto": "false",
+            "enableL3OnBorder": "false",
+            "ENABLE_NETFLOW": "false",
+            "SVI_NETFLOW_MONITOR": "",
+            "VLAN_NETFLOW_MONITOR": "",
+            "nveId": "1",
+        }
+        return {
+            "fabric": self.name,
+            "networkName": name,
+            "networkId": net_id,
+            "vrf": vrf,
+            "networkTemplate": "Default_Network_Universal",
+            "networkExtensionTemplate": "Default_Network_Extension_Universal",
+            "serviceNetworkTemplate": None,
+            "source": None,
+            "networkTemplateConfig": json_str(template_config),
+        }
+
+    def add_network(self, payload):
+        network = copy.deepcopy(payload)
+        network["fabric"] = self.name
+        network.setdefault("networkId", self.allocate_id())
+        network["networkStatus"] = "NA"
+        network.setdefault("serviceNetworkTemplate", None)
+        network.setdefault("source", None)
+        self.networks[network["networkName"]] = network
+        self.net_attachments.setdefault(network["networkName"], {})
+        return network
+
+    def attach_network(self, name, serial, vlan, deployed, switch_ports="", detach_switch_ports="", tor_ports=""):
+        switch = self.switches[serial]
+        network = self.networks[name]
+        attachments = self.net_attachments.setdefault(name, {})
+        ports = [port for port in (attachments.get(serial, {}).get("portNames") or "").split(",") if port]
+        for port in (switch_ports or "").split(","):
+            if port and port not in ports:
+                ports.append(port)
+        for port in (detach_switch_ports or "").split(","):
+            if port in ports:
+                ports.remove(port)
+        attachments[serial] = {
+            "networkName": name,
+            "displayName": name,
+            "networkId": network["networkId"],
+            "switchName": switch["logicalName"],
+            "switchSerialNo": serial,
+            "switchRole": switch["switchRole"],
+            "switchDbId": switch["switchDbID"],
+            "fabricName": self.name,
+            "ipAddress": switch["ipAddress"],
+            "vlanId": int(vlan),
+            "portNames": ",".join(ports),
+            "interfaceGroups": None,
+            "entityName": name,
+            "isLanAttached": True,
+            "lanAttachState": "DEPLOYED" if deployed else "PENDING",
+            "torPorts": tor_ports or "",
+        }
+        self.update_network_status(name)
+
+    def update_network_status(self, name):
+        attachments = self.net_attachments.get(name, {})
+        if not attachments:
+            status = "NA"
+        elif all(attach["lanAttachState"] == "DEPLOYED" for attach in attachments.values()):
+            status = "DEPLOYED"
+        else:
+            status = "PENDING"
+        if name in self.networks:
+            self.networks[name]["networkStatus"] = status
+
+    def deploy_networks(self, serial, names=None):
+        self.deploy_attachments(self.net_attachments, serial, names, self.update_network_status)
+
+    # Interfaces
+
+    def add_interface(self, switch, name, policy="int_trunk_host", nv_pairs=None, admin_state=True):
+        nv_pairs = dict(nv_pairs or {})
+        nv_pairs.setdefault("INTF_NAME", name)
+        nv_pairs.setdefault("ADMIN_STATE", "true" if admin_state else "false")
+        nv_pairs.setdefault("DESC", "")
+        nv_pairs.setdefault("MTU", "jumbo")
+        nv_pairs.setdefault("SPEED", "Auto")
+        nv_pairs.setdefault("ALLOWED_VLANS", "none")
+        nv_pairs.setdefault("BPDUGUARD_ENABLED", "no")
+        nv_pairs.setdefault("PORTTYPE_FAST_ENABLED", "true")
+        nv_pairs.setdefault("CONF", "")
+        nv_pairs.setdefault("PRIORITY", "450")
+        self.interfaces[switch["serialNumber"]][name] = {
+            "policy": policy,
+            "ifType": "INTERFACE_ETHERNET",
+            "nvPairs": nv_pairs,
+            "complianceStatus": "In-Sync",
+        }
+
+    def update_interface(self, policy, intf):
+        """Apply one element of a PUT/POST interface payload"""
+        serial, name = intf["serialNumber"], intf["ifName"]
+        if serial not in self.interfaces:
+            return False
+        record = self.interfaces[serial].setdefault(name, {"ifType": intf.get("interfaceType", "INTERFACE_ETHERNET")})
+        record.update({"policy": policy, "nvPairs": copy.deepcopy(intf.get("nvPairs") or {}), "complianceStatus": "Pending"})
+        return True
+
+    def interface_config(self, serial, name):
+        """An interface as returned by GET .../interface?serialNumber=X&ifName=Y"""
+        record = self.interfaces[serial][name]
+        return {
+            "policy": record["policy"],
+            "interfaces": [
+                {
+                    "interfaceType": record["ifType"],
+                    "nvPairs": copy.deepcopy(record["nvPairs"]),
+                    "ifName": name,
+                    "serialNumber": serial,
+                    "fabricName": self.name,
+                }
+            ],
+            "skipResourceCheck": "True",
+        }
+
+    def interface_detail(self, serial, name):
+        """An interface as returned by GET .../interface/detail?serialNumber=X"""
+        record = self.interfaces[serial][name]
+        switch = self.switches[serial]
+        return {
+            "policy": record["policy"],
+            "mode": "trunk",
+            "ifName": name,
+            "serialNo": serial,
+            "sysName": switch["logicalName"],
+            "fabricName": self.name,
+            "ifType": record["ifType"],
+            "isPhysical": "True",
+            "deletable": "False",
+            "markDeleted": "False",
+            "alias": record["nvPairs"].get("DESC", ""),
+            "adminStatusStr": "up" if record["nvPairs"].get("ADMIN_STATE", "true") == "true" else "down",
+            "operStatusStr": "up",
+            "deleteReason": None,
+            "complianceStatus": record["complianceStatus"],
+            "underlayPolicies": [{"source": "", "policyName": record["policy"], "serialNumber": serial}],
+            "interfaces": [{"nvPairs": {}}],
+        }
+
+    # Links
+
+    def add_link(self, payload):
+        link_uuid = "LINK-UUID-{0}".format(uuid.uuid4().hex[:12])
+        link = {"link-uuid": link_uuid, "link-dbid": self.allocate_id()}
+        self.links[link_uuid] = link
+        self.update_link(link_uuid, payload)
+        return link
+
+    def update_link(self, link_uuid, payload):
+        link = self.links[link_uuid]
+        nv_pairs = {key: str(value).lower() if isinstance(value, bool) else str(value) for key, value in (payload.get("nvPairs") or {}).items()}
+        for end, device, interface, fabric in (
+            ("sw1-info", payload["sourceDevice"], payload["sourceInterface"], payload["sourceFabric"]),
+            ("sw2-info", payload["destinationDevice"], payload["destinationInterface"], payload["destinationFabric"]),
+        ):
+            switch = self.switches.get(device, {})
+            link[end] = {
+                "fabric-name": fabric,
+                "if-name": interface,
+                "sw-sys-name": switch.get("logicalName", device),
+                "sw-serial-number": device,
+            }
+        nv_pairs.update(
+            {
+                "LINK_UUID": link_uuid,
+                "FABRIC1": payload["sourceFabric"],
+                "FABRIC2": payload["destinationFabric"],
+                "PEER1_SN": payload["sourceDevice"],
+                "PEER2_SN": payload["destinationDevice"],
+                "PEER1_INTF": payload["sourceInterface"],
+                "PEER2_INTF": payload["destinationInterface"],
+            }
+        )
+        link.update({"templateName": payload.get("templateName"), "fabricName": self.name, "nvPairs": nv_pairs})
+
+
+class NdfcServer(ThreadingHTTPServer):
+    """HTTP server holding the fabric model, the latency rules and the request counters"""
+
+    daemon_threads = True
+
+    def __init__(self, address, topology=None, latency=None):
+        super().__init__(address, NdfcRequestHandler)
+        self.fabric = Fabric(topology or Topology())
+        self.latency = latency or Latency()
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self):
+        return "http://{0}:{1}".format(*self.server_address[:2])
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = Counter()
+            self.unhandled = Counter()
+            self.started = time.monotonic()
+
+    def stats(self):
+        with self.stats_lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "endpoints": dict(self.requests),
+                "unhandled": dict(self.unhandled),
+                "elapsed": round(time.monotonic() - self.started, 3),
+                "topology": self.fabric.topology.to_dict(),
+            }
+
+    def count(self, method, endpoint, handled):
+        with self.stats_lock:
+            self.requests["{0} {1}".format(method, endpoint)] += 1
+            if not handled:
+                self.unhandled["{0} {1}".format(method, endpoint)] += 1
+
+    def start(self):
+        """Serve requests from a daemon thread and return the server"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+# (method, regex, handler name). The regex is matched against the URL path without
+# the query string. Handlers are NdfcRequestHandler methods that receive the match
+# groups and return (status, body). Routes with fewer parameters are tried first so
+# that literal paths like .../networks/attachments win over .../networks/{name}.
+ROUTES = []
+
+
+def route(method, pattern):
+    def register(func):
+        ROUTES.append((method, re.compile("^" + pattern + "$"), func))
+        ROUTES.sort(key=lambda item: item[1].groups)
+        return func
+
+    return register
+
+
+FABRIC = r"/fabrics/([^/]+)"
+
+
+class NdfcRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch requests to the route handlers"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "NdfcStandIn/1.0"
+
+    def log_message(self, format, *args):
+        # Keep the benchmark output readable
+        pass
+
+    @property
+    def fabric(self):
+        return self.server.fabric
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def read_chunked(self):
+        # The httpapi connection sends string bodies with chunked transfer encoding
+        raw = b""
+        while True:
+            size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return raw
+            raw += self.rfile.read(size)
+            self.rfile.readline()
+
+    def read_body(self):
+        if "chunked" in (self.headers.get("Transfer-Encoding") or "").lower():
+            raw = self.read_chunked()
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw.decode("utf-8", "replace")
+
+    def dispatch(self, method):
+        split = urlsplit(self.path)
+        path = split.path
+        self.query = {key: values[-1] for key, values in parse_qs(split.query).items()}
+        self.body = self.read_body()
+
+        if path.startswith("/_benchmark/"):
+            status, body = self.benchmark(method, path)
+            return self.respond(status, body)
+
+        for route_method, pattern, handler in ROUTES:
+            if route_method != method:
+                continue
+            mo = pattern.match(path)
+            if mo is None:
+                continue
+            endpoint = pattern.pattern[1:-1].replace(API, "").replace("([^/]+)", "{}")
+            self.server.count(method, endpoint, True)
+            delay = self.server.latency.get(method, path)
+            if delay:
+                time.sleep(delay)
+            with self.fabric.lock:
+                status, body = handler(self, *[unquote(group) for group in mo.groups()])
+            return self.respond(status, body)
+
+        self.server.count(method, path, False)
+        return self.respond(404, {"code": 404, "message": "Not Found: {0} {1}".format(method, path)})
+
+    def respond(self, status, body):
+        data = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode("utf-8"))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def benchmark(self, method, path):
+        if method == "GET" and path == "/_benchmark/stats":
+            return 200, self.server.stats()
+        if method == "POST" and path == "/_benchmark/reset":
+            self.server.reset_stats()
+            return 200, {}
+        if method == "POST" and path == "/_benchmark/seed":
+            with self.fabric.lock:
+                self.server.fabric = Fabric(Topology.from_dict(self.body or {}))
+            self.server.reset_stats()
+            return 200, self.server.fabric.topology.to_dict()
+        if method == "POST" and path == "/_benchmark/latency":
+            body = self.body or {}
+            self.server.latency = Latency(body.get("default", 0.0), body.get("rules", []))
+            return 200, {}
+        return 404, {}
+
+    def names(self, key):
+        """Return the comma separated names of query parameter key"""
+        return [name for name in (self.query.get(key) or "").split(",") if name]
+
+    def check_fabric(self, fabric):
+        return fabric == self.fabric.name
+
+    # Session and controller information
+
+    @route("POST", r"/login")
+    def login(self):
+        return 200, {"token": "benchmark-token", "jwttoken": "benchmark-token"}
+
+    @route("POST", r"/logout")
+    def logout(self):
+        return 200, {}
+
+    @route("GET", r"/appcenter/cisco/ndfc/api/about/version")
+    def version(self):
+        return 200, {"version": VERSION, "mode": "LAN", "isMediaController": False, "dev": False, "isHaEnabled": False}
+
+    @route("GET", r"/fm/fmrest/about/version")
+    def fm_version(self):
+        return 404, {"code": 404, "message": "Not Found"}
+
+    @route("GET", API + r"/fm/features")
+    def features(self):
+        return 200, {"status": "success", "data": {"name": "", "version": 1, "features": FEATURES}}
+
+    @route("GET", TOP_DOWN + r"/v2/bulk-update/(networks|vrfs)")
+    def bulk_update_probe(self, entity):
+        return 405, {"code": 405, "message": "Method Not Allowed"}
+
+    # Fabrics and inventory
+
+    @route("GET", CONTROL + r"/fabrics/msd/fabric-associations")
+    def fabric_associations(self):
+        return 200, [
+            {
+                "fabricId": 1,
+                "fabricName": self.fabric.name,
+                "fabricParent": "None",
+                "fabricState": "standalone",
+                "fabricTechnology": "VXLANFabric",
+                "fabricType": "Switch_Fabric",
+            }
+        ]
+
+    @route("GET", API + r"/onemanage/fabrics")
+    def onemanage_fabrics(self):
+        return 400, {"error": "A federation manager does not exist"}
+
+    @route("GET", CONTROL + FABRIC)
+    def fabric_details(self, fabric):
+        if not self.check_fabric(fabric):
+            return 404, {"code": 404, "message": "Fabric not found"}
+        return 200, self.fabric.details()
+
+    @route("GET", CONTROL + FABRIC + r"/inventory/switchesByFabric")
+    def inventory(self, fabric):
+        if not self.check_fabric(fabric):
+            return 200, []
+        return 200, list(self.fabric.switches.values())
+
+    @route("GET", LAN_FABRIC + r"/inventory/allswitches")
+    def all_switches(self):
+        return 200, list(self.fabric.switches.values())
+
+    @route("POST", CONTROL + FABRIC + r"/config-save")
+    def config_save(self, fabric):
+        return 200, {"status": "Config save is completed"}
+
+    @route("POST", CONTROL + FABRIC + r"/config-deploy(?:/([^/]+))?")
+    def config_deploy(self, fabric, serials=None):
+        # A switch level deployment pushes everything pending on the switch
+        for serial in serials.split(",") if serials else list(self.fabric.switches):
+            self.fabric.deploy_vrfs(serial)
+            self.fabric.deploy_networks(serial)
+        return 200, {"status": "Configuration deployment completed."}
+
+    # VRFs
+
+    def vrf_attachment_list(self, name):
+        return [copy.deepcopy(attach) for serial, attach in sorted(self.fabric.vrf_attachments.get(name, {}).items())]
+
+    @route("GET", TOP_DOWN + FABRIC + r"/vrfs")
+    def get_vrfs(self, fabric):
+        return 200, [copy.deepcopy(vrf) for name, vrf in sorted(self.fabric.vrfs.items())]
+
+    @route("POST", TOP_DOWN + FABRIC + r"/vrfs")
+    def create_vrf(self, fabric):
+        if self.body["vrfName"] in self.fabric.vrfs:
+            return 400, {"code": 400, "message": "VRF {0} already exists".format(self.body["vrfName"])}
+        return 200, self.fabric.add_vrf(self.body)
+
+    @route("POST", TOP_DOWN + r"/bulk-create/vrfs")
+    def bulk_create_vrfs(self):
+        for vrf in self.body:
+            self.fabric.add_vrf(vrf)
+        return 200, {"successList": [vrf["vrfName"] for vrf in self.body], "failureList": []}
+
+    @route("PUT", TOP_DOWN + FABRIC + r"/vrfs/([^/]+)")
+    def update_vrf(self, fabric, name):
+        if name not in self.fabric.vrfs:
+            return 404, {"code": 404, "message": "VRF {0} not found".format(name)}
+        self.fabric.vrfs[name].update(copy.deepcopy(self.body))
+        return 200, copy.deepcopy(self.fabric.vrfs[name])
+
+    @route("PUT", TOP_DOWN + r"/v2/bulk-update/vrfs")
+    def bulk_update_vrfs(self):
+        for vrf in self.body:
+            vrf = copy.deepcopy(vrf)
+            if isinstance(vrf.get("vrfTemplateConfig"), dict):
+                vrf["vrfTemplateConfig"] = json_str(vrf["vrfTemplateConfig"])
+            self.fabric.vrfs[vrf["vrfName"]].update(vrf)
+        return 200, {"successList": [vrf["vrfName"] for vrf in self.body], "failureList": []}
+
+    @route("DELETE", TOP_DOWN + FABRIC + r"/vrfs/([^/]+)")
+    def delete_vrf(self, fabric, name):
+        self.fabric.vrfs.pop(name, None)
+        self.fabric.vrf_attachments.pop(name, None)
+        return 200, {}
+
+    @route("DELETE", TOP_DOWN + FABRIC + r"/bulk-delete/vrfs")
+    def bulk_delete_vrfs(self, fabric):
+        names = self.names("vrf-names")
+        for name in names:
+            self.delete_vrf(fabric, name)
+        return 200, {"successList": names, "failureList": []}
+
+    @route("GET", TOP_DOWN + FABRIC + r"/vrfs/attachments")
+    def get_vrf_attachments(self, fabric):
+        names = self.names("vrf-names") or sorted(self.fabric.vrfs)
+        return 200, [
+            {"vrfName": name, "lanAttachList": self.vrf_attachment_list(name)} for name in names if name in self.fabric.vrfs
+        ]
+
+    @route("POST", TOP_DOWN + FABRIC + r"/vrfs/attachments")
+    def attach_vrfs(self, fabric):
+        result = {}
+        for vrf in self.body:
+            name = vrf["vrfName"]
+            for attach in vrf.get("lanAttachList", []):
+                serial = attach["serialNumber"]
+                if name not in self.fabric.vrfs or serial not in self.fabric.switches:
+                    result["{0}-[{1}]".format(name, serial)] = "Invalid VRF or switch"
+                    continue
+                if attach.get("deployment") is False:
+                    current = self.fabric.vrf_attachments[name].get(serial)
+                    if current is not None:
+                        current.update({"isLanAttached": False, "lanAttachState": "PENDING"})
+                else:
+                    self.fabric.attach_vrf(
+                        name,
+                        serial,
+                        attach.get("vlan") or 0,
+                        False,
+                        attach.get("instanceValues"),
+                        attach.get("extensionValues"),
+                        attach.get("freeformConfig"),
+                    )
+                self.fabric.update_vrf_status(name)
+                switch = self.fabric.switches[serial]
+                result["{0}-[{1}/{2}]".format(name, serial, switch["logicalName"])] = "SUCCESS"
+        return 200, result
+
+    @route("POST", TOP_DOWN + r"/vrfs/deploy")
+    def deploy_vrfs(self):
+        for serial, names in self.body.items():
+            self.fabric.deploy_vrfs(serial, names.split(","))
+        return 200, {"status": ""}
+
+    @route("GET", TOP_DOWN + FABRIC + r"/vrfs/switches")
+    def get_vrf_switches(self, fabric):
+        serials = self.names("serial-numbers")
+        result = []
+        for name in self.names("vrf-names"):
+            if name not in self.fabric.vrfs:
+                continue
+            details = []
+            for serial in serials:
+                switch = self.fabric.switches.get(serial)
+                if switch is None:
+                    continue
+                attach = self.fabric.vrf_attachments[name].get(serial, {})
+                details.append(
+                    {
+                        "switchName": switch["logicalName"],
+                        "serialNumber": serial,
+                        "peerSerialNumber": None,
+                        "role": switch["switchRole"],
+                        "vlan": attach.get("vlanId"),
+                        "vlanModifiable": True,
+                        "islanAttached": attach.get("isLanAttached", False),
+                        "lanAttachedState": attach.get("lanAttachState", "NA"),
+                        "errorMessage": None,
+                        "instanceValues": attach.get("instanceValues", ""),
+                        "freeformConfig": attach.get("freeformConfig", ""),
+                        "extensionValues": attach.get("extensionValues", ""),
+                        "extensionPrototypeValues": [],
+                    }
+                )
+            result.append({"vrfName": name, "templateName": "Default_VRF_Extension_Universal", "switchDetailsList": details})
+        return 200, result
+
+    @route("GET", TOP_DOWN + FABRIC + r"/vrfinfo")
+    def vrf_info(self, fabric):
+        used = {int(vrf["vrfId"]) for vrf in self.fabric.vrfs.values()}
+        return 200, {"l3vni": next(vni for vni in range(50001, 60000) if vni not in used)}
+
+    @route("GET", LAN_FABRIC + r"/resource-manager/vlan/([^/]+)")
+    def vlan(self, fabric):
+        if self.query.get("vlanUsageType") == "TOP_DOWN_VRF_VLAN":
+            used = {int(attach["vlanId"]) for attachments in self.fabric.vrf_attachments.values() for attach in attachments.values()}
+            start = 2000
+        else:
+            used = {int(attach["vlanId"]) for attachments in self.fabric.net_attachments.values() for attach in attachments.values()}
+            start = 2300
+        return 200, next(vlan for vlan in range(start, 4000) if vlan not in used)
+
+    @route("GET", LAN_FABRIC + r"/resource-manager/fabric/([^/]+)/pools/([^/]+)")
+    def resource_pool(self, fabric, pool):
+        return 200, []
+
+    @route("DELETE", LAN_FABRIC + r"/resource-manager/resources")
+    def release_resources(self):
+        return 200, {}
+
+    @route("POST", LAN_FABRIC + r"/resource-manager/reserve-id")
+    def reserve_id(self):
+        return 200, 2
+
+    # Networks
+
+    @route("GET", TOP_DOWN + FABRIC + r"/networks")
+    def get_networks(self, fabric):
+        vrf = self.query.get("vrf-name")
+        return 200, [
+            copy.deepcopy(net) for name, net in sorted(self.fabric.networks.items()) if vrf is None or net.get("vrf") == vrf
+        ]
+
+    @route("GET", TOP_DOWN + FABRIC + r"/networks/([^/]+)")
+    def get_network(self, fabric, name):
+        # NDFC answers a GET of a missing network with 400 rather than 404
+        if name not in self.fabric.networks:
+            return 400, {"code": 400, "message": "Invalid network name"}
+        return 200, copy.deepcopy(self.fabric.networks[name])
+
+    @route("GET", TOP_DOWN + FABRIC + r"/networks/([^/]+)/status")
+    def get_network_status(self, fabric, name):
+        network = self.fabric.networks.get(name, {})
+        return 200, {"networkName": name, "networkStatus": network.get("networkStatus", "NA")}
+
+    @route("POST", TOP_DOWN + FABRIC + r"/networks")
+    def create_network(self, fabric):
+        if self.body["networkName"] in self.fabric.networks:
+            return 400, {"code": 400, "message": "Network {0} already exists".format(self.body["networkName"])}
+        return 200, self.fabric.add_network(self.body)
+
+    @route("POST", TOP_DOWN + r"/bulk-create/networks")
+    def bulk_create_networks(self):
+        for network in self.body:
+            self.fabric.add_network(network)
+        return 200, {"successList": [network["networkName"] for network in self.body], "failureList": []}
+
+    @route("PUT", TOP_DOWN + FABRIC + r"/networks/([^/]+)")
+    def update_network(self, fabric, name):
+        if name not in self.fabric.networks:
+            return 404, {"code": 404, "message": "Network {0} not found".format(name)}
+        self.fabric.networks[name].update(copy.deepcopy(self.body))
+        return 200, copy.deepcopy(self.fabric.networks[name])
+
+    @route("PUT", TOP_DOWN + r"/v2/bulk-update/networks")
+    def bulk_update_networks(self):
+        for network in self.body:
+            network = copy.deepcopy(network)
+            if isinstance(network.get("networkTemplateConfig"), dict):
+                network["networkTemplateConfig"] = json_str(network["networkTemplateConfig"])
+            self.fabric.networks[network["networkName"]].update(network)
+        return 200, {"successList": [network["networkName"] for network in self.body], "failureList": []}
+
+    @route("DELETE", TOP_DOWN + FABRIC + r"/networks/([^/]+)")
+    def delete_network(self, fabric, name):
+        self.fabric.networks.pop(name, None)
+        self.fabric.net_attachments.pop(name, None)
+        return 200, {}
+
+    @route("DELETE", TOP_DOWN + FABRIC + r"/bulk-delete/networks")
+    def bulk_delete_networks(self, fabric):
+        names = self.names("network-names")
+        for name in names:
+            self.delete_network(fabric, name)
+        return 200, {"successList": names, "failureList": []}
+
+    @route("GET", TOP_DOWN + FABRIC + r"/networks/attachments")
+    def get_network_attachments(self, fabric):
+        names = self.names("network-names") or sorted(self.fabric.networks)
+        return 200, [
+            {
+                "networkName": name,
+                "lanAttachList": [copy.deepcopy(attach) for serial, attach in sorted(self.fabric.net_attachments.get(name, {}).items())],
+            }
+            for name in names
+            if name in self.fabric.networks
+        ]
+
+    @route("POST", TOP_DOWN + FABRIC + r"/networks/attachments")
+    def attach_networks(self, fabric):
+        result = {}
+        for network in self.body:
+            name = network["networkName"]
+            for attach in network.get("lanAttachList", []):
+                serial = attach["serialNumber"]
+                if name not in self.fabric.networks or serial not in self.fabric.switches:
+                    result["{0}-[{1}]".format(name, serial)] = "Invalid network or switch"
+                    continue
+                if attach.get("deployment") is False:
+                    current = self.fabric.net_attachments[name].get(serial)
+                    if current is not None:
+                        current.update({"isLanAttached": False, "lanAttachState": "PENDING"})
+                else:
+                    self.fabric.attach_network(
+                        name,
+                        serial,
+                        attach.get("vlan") or 0,
+                        False,
+                        attach.get("switchPorts"),
+                        attach.get("detachSwitchPorts"),
+                        attach.get("torPorts"),
+                    )
+                self.fabric.update_network_status(name)
+                switch = self.fabric.switches[serial]
+                result["{0}-[{1}/{2}]".format(name, serial, switch["logicalName"])] = "SUCCESS"
+        return 200, result
+
+    @route("POST", TOP_DOWN + r"/networks/deploy")
+    def deploy_networks(self):
+        body = self.body or {}
+        if "networkNames" in body:
+            # Fabric wide deployment of the named networks
+            body = {serial: body["networkNames"] for serial in self.fabric.switches}
+        for serial, names in body.items():
+            self.fabric.deploy_networks(serial, names.split(","))
+        return 200, {"status": ""}
+
+    @route("GET", TOP_DOWN + FABRIC + r"/netinfo")
+    def net_info(self, fabric):
+        used = {int(net["networkId"]) for net in self.fabric.networks.values()}
+        return 200, {"l2vni": next(vni for vni in range(30001, 50000) if vni not in used)}
+
+    # Interfaces
+
+    def interface_items(self):
+        body = self.body or []
+        return body if isinstance(body, list) else [body]
+
+    @route("GET", CONTROL + FABRIC + r"/accessmode")
+    def access_mode(self, fabric):
+        return 200, {"fabricName": fabric, "readonly": False}
+
+    @route("GET", CONTROL + r"/policies/switches/([^/]+)")
+    def switch_policies(self, serial):
+        return 200, []
+
+    @route("GET", INTERFACE)
+    def get_interfaces(self):
+        serial, name = self.query.get("serialNumber"), self.query.get("ifName")
+        interfaces = self.fabric.interfaces.get(serial, {})
+        names = [name] if name else sorted(interfaces)
+        return 200, [self.fabric.interface_config(serial, name) for name in names if name in interfaces]
+
+    @route("GET", INTERFACE + r"/detail")
+    def get_interface_details(self):
+        serial = self.query.get("serialNumber")
+        interfaces = self.fabric.interfaces.get(serial, {})
+        return 200, [self.fabric.interface_detail(serial, name) for name in sorted(interfaces)]
+
+    @route("PUT", INTERFACE)
+    def update_interfaces(self):
+        for intf in self.body["interfaces"]:
+            self.fabric.update_interface(self.body["policy"], intf)
+        return 200, {}
+
+    @route("POST", INTERFACE + r"/modify")
+    def bulk_update_interfaces(self):
+        for payload in self.interface_items():
+            for intf in payload["interfaces"]:
+                self.fabric.update_interface(payload["policy"], intf)
+        return 200, {}
+
+    @route("POST", LAN_FABRIC + r"/globalInterface")
+    def create_interfaces(self):
+        for intf in self.body["interfaces"]:
+            if not self.fabric.update_interface(self.body["policy"], intf):
+                return 400, {"code": 400, "message": "Invalid switch {0}".format(intf["serialNumber"])}
+        return 200, {}
+
+    @route("POST", LAN_FABRIC + r"/globalInterface/deploy")
+    def deploy_interfaces(self):
+        for item in self.interface_items():
+            record = self.fabric.interfaces.get(item["serialNumber"].split("~")[0], {}).get(item["ifName"])
+            if record is not None:
+                record["complianceStatus"] = "In-Sync"
+        return 200, {}
+
+    @route("DELETE", INTERFACE + r"/markdelete")
+    def delete_interfaces(self):
+        for item in self.interface_items():
+            self.fabric.interfaces.get(item["serialNumber"].split("~")[0], {}).pop(item["ifName"], None)
+        return 200, {}
+
+    # Links
+
+    def link_list(self, match=None):
+        return [copy.deepcopy(link) for link in sorted(self.fabric.links.values(), key=lambda link: link["link-dbid"]) if match is None or match(link)]
+
+    @route("GET", CONTROL + r"/links")
+    def get_links(self):
+        query = self.query
+
+        def match(link):
+            return (
+                link["sw1-info"]["sw-serial-number"] == query.get("switch1Sn", link["sw1-info"]["sw-serial-number"])
+                and link["sw2-info"]["sw-serial-number"] == query.get("switch2Sn", link["sw2-info"]["sw-serial-number"])
+                and link["sw1-info"]["if-name"].lower() == query.get("switch1IfName", link["sw1-info"]["if-name"]).lower()
+                and link["sw2-info"]["if-name"].lower() == query.get("switch2IfName", link["sw2-info"]["if-name"]).lower()
+            )
+
+        return 200, self.link_list(match)
+
+    @route("GET", CONTROL + r"/links/fabrics/([^/]+)")
+    def get_fabric_links(self, fabric):
+        return 200, self.link_list(lambda link: fabric in (link["sw1-info"]["fabric-name"], link["sw2-info"]["fabric-name"]))
+
+    @route("POST", CONTROL + r"/links")
+    def create_link(self):
+        return 200, copy.deepcopy(self.fabric.add_link(self.body))
+
+    @route("PUT", CONTROL + r"/links/modify")
+    def bulk_update_links(self):
+        for link in self.body:
+            self.fabric.update_link(link["link-uuid"], link)
+        return 200, {}
+
+    @route("PUT", CONTROL + r"/links/([^/]+)")
+    def update_link(self, link_uuid):
+        if link_uuid not in self.fabric.links:
+            return 404, {"code": 404, "message": "Link {0} not found".format(link_uuid)}
+        self.fabric.update_link(link_uuid, self.body)
+        return 200, copy.deepcopy(self.fabric.links[link_uuid])
+
+    @route("DELETE", CONTROL + r"/links/([^/]+)")
+    def delete_link(self, link_uuid):
+        self.fabric.links.pop(link_uuid, None)
+        return 200, {}
+
+    @route("GET", CONTROL + FABRIC + r"/config-preview/([^/]+)")
+    def config_preview(self, fabric, serials):
+        return 200, [{"switchId": serial, "status": "In-Sync"} for serial in serials.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local NDFC stand-in server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    for field in Topology.FIELDS:
+        parser.add_argument("--" + field, default=getattr(Topology(), field))
+    parser.add_argument("--latency", type=float, default=0.0, help="default latency in seconds")
+    parser.add_argument("--latency-rule", action="append", default=[], help="[METHOD:]REGEX=SECONDS")
+    args = parser.parse_args()
+
+    topology = Topology(**{field: getattr(args, field) for field in Topology.FIELDS})
+    server = NdfcServer((args.host, args.port), topology, Latency(args.latency, args.latency_rule))
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
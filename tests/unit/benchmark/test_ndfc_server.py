@@ -0,0 +1,284 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Unit tests of the NDFC stand-in server and the helpers of the benchmark suite
+# in tests/benchmark. The benchmark itself needs ansible-playbook and is not run here.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import http.client
+import importlib.util
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from ansible.module_utils import basic
+from ansible.module_utils.connection import ConnectionError
+from ansible.playbook.task import Task
+from ansible_collections.ansible.netcommon.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    exit_json,
+    fail_json,
+    set_module_args,
+)
+from ansible_collections.cisco.dcnm.plugins.action import dcnm_network as dcnm_network_action
+from ansible_collections.cisco.dcnm.plugins.modules import dcnm_network
+
+BENCHMARK_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "benchmark"))
+
+
+def load(name):
+    # The scripts are not part of a package, load them by path under a unique name
+    spec = importlib.util.spec_from_file_location("dcnm_" + name, os.path.join(BENCHMARK_DIR, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+pytest.importorskip("yaml")
+benchmark = load("benchmark")
+ndfc_server = load("ndfc_server")
+
+TOP_DOWN = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/bench-fabric"
+CONTROL = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/bench-fabric"
+
+
+@pytest.fixture(name="server")
+def server_fixture():
+    server = ndfc_server.NdfcServer(("127.0.0.1", 0), ndfc_server.Topology(switches=2, vrfs=2, networks=4, interfaces=2, links=2)).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None, chunked=False):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    headers = {"Content-Type": "application/json"}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        if chunked:
+            data = iter([data[:5], data[5:]])
+            headers["Transfer-Encoding"] = "chunked"
+    conn.request(method, path, body=data, headers=headers, encode_chunked=chunked)
+    resp = conn.getresponse()
+    status, payload = resp.status, json.loads(resp.read() or b"null")
+    conn.close()
+    return status, payload
+
+
+def test_ndfc_server_00001(server):
+    """
+    Seeded objects are served and every request is counted per endpoint.
+    """
+    status, vrfs = request(server, "GET", TOP_DOWN + "/vrfs")
+    assert status == 200
+    assert [vrf["vrfName"] for vrf in vrfs] == ["vrf_1", "vrf_2"]
+
+    request(server, "GET", TOP_DOWN + "/vrfs")
+    stats = server.stats()
+    assert stats["requests"] == 2
+    assert stats["endpoints"] == {"GET /lan-fabric/rest/top-down/fabrics/{}/vrfs": 2}
+    assert stats["unhandled"] == {}
+
+
+def test_ndfc_server_00002(server):
+    """
+    Literal routes win over parameterized routes and unknown endpoints are
+    answered with 404 and reported as unhandled.
+    """
+    status, attachments = request(server, "GET", TOP_DOWN + "/networks/attachments?network-names=net_1,net_2")
+    assert status == 200
+    assert [item["networkName"] for item in attachments] == ["net_1", "net_2"]
+    assert len(attachments[0]["lanAttachList"]) == 2
+
+    status, body = request(server, "GET", TOP_DOWN + "/unknown")
+    assert status == 404
+    assert server.stats()["unhandled"] == {"GET " + TOP_DOWN + "/unknown": 1}
+
+
+def test_ndfc_server_00003(server):
+    """
+    Chunked request bodies are decoded, and a detach only removes the
+    attachment once it is deployed.
+    """
+    detach = [{"vrfName": "vrf_2", "lanAttachList": [{"serialNumber": "SN000001", "vlan": 2002, "deployment": False}]}]
+    status, result = request(server, "POST", TOP_DOWN + "/vrfs/attachments", detach, chunked=True)
+    assert status == 200
+    assert list(result.values()) == ["SUCCESS"]
+    assert server.fabric.vrf_attachments["vrf_2"]["SN000001"]["lanAttachState"] == "PENDING"
+
+    status, result = request(server, "POST", CONTROL + "/config-deploy/SN000001", {})
+    assert status == 200
+    assert "SN000001" not in server.fabric.vrf_attachments["vrf_2"]
+    assert server.fabric.vrfs["vrf_2"]["vrfStatus"] == "DEPLOYED"
+
+
+def test_ndfc_server_00004(server):
+    """
+    Reseeding replaces the fabric and resets the counters.
+    """
+    request(server, "GET", TOP_DOWN + "/vrfs")
+    status, topology = request(server, "POST", "/_benchmark/seed", {"switches": 3, "vrfs": 5})
+    assert status == 200
+    assert topology["switches"] == 3
+    assert len(server.fabric.vrfs) == 5
+    assert len(server.fabric.switches) == 5
+    assert server.stats()["requests"] == 0
+
+
+def test_ndfc_server_00005():
+    """
+    The first matching latency rule applies, the default applies otherwise.
+    """
+    latency = ndfc_server.Latency(0.01, ["GET:/vrfs$=0.5", "/interface=0.2"])
+    assert latency.get("GET", "/x/vrfs") == 0.5
+    assert latency.get("POST", "/x/vrfs") == 0.01
+    assert latency.get("PUT", "/x/interface") == 0.2
+
+
+def test_ndfc_server_00006():
+    """
+    Scenarios use the module specific fabric option and the deleted state
+    works on the half of the seeded objects that overridden leaves out.
+    """
+    scenarios = benchmark.Scenarios(ndfc_server.Topology(switches=2, vrfs=4, networks=4, interfaces=2, links=2))
+    task = scenarios.task("dcnm_links", "deleted")
+    assert task["cisco.dcnm.dcnm_links"]["src_fabric"] == "bench-fabric"
+    assert len(task["cisco.dcnm.dcnm_links"]["config"]) == 1
+
+    overridden = [vrf["vrf_name"] for vrf in scenarios.dcnm_vrf("overridden")]
+    deleted = [vrf["vrf_name"] for vrf in scenarios.dcnm_vrf("deleted")]
+    assert overridden == ["vrf_1", "vrf_2"]
+    assert deleted == ["vrf_3", "vrf_4"]
+    assert benchmark.parse_scale("8x16x32x4").to_dict() == {
+        "fabric": "bench-fabric", "switches": 8, "vrfs": 16, "networks": 32, "interfaces": 4, "links": 0
+    }
+
+
+def test_ndfc_server_00007():
+    """
+    A scenario regresses when its request count grows by more than the tolerance.
+    """
+    baseline = [
+        {"scale": "4x4x8x8x4", "module": "dcnm_vrf", "state": "merged", "status": "ok", "requests": 20},
+        {"scale": "4x4x8x8x4", "module": "dcnm_vrf", "state": "query", "status": "failed", "requests": 5},
+    ]
+    results = [
+        {"scale": "4x4x8x8x4", "module": "dcnm_vrf", "state": "merged", "status": "ok", "requests": 23},
+        {"scale": "4x4x8x8x4", "module": "dcnm_vrf", "state": "query", "status": "ok", "requests": 50},
+    ]
+    assert benchmark.compare(results, baseline, 20) == []
+    regressions = benchmark.compare(results, baseline, 10)
+    assert [(item["state"], before["requests"]) for item, before in regressions] == [("merged", 20)]
+
+
+def connection(server):
+    """
+    Return a stand-in for the persistent connection of the modules that sends the
+    requests to server, and returns the responses as the httpapi plugin does.
+    """
+
+    class StandInConnection:
+        def __init__(self, socket_path=None):
+            pass
+
+        def __getattr__(self, name):
+            def rpc(*args):
+                raise ConnectionError("Method not found: {0}".format(name))
+
+            return rpc
+
+        def get_version(self):
+            return 12
+
+        def send_request(self, method, path, data=None):
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+            if data is not None and not isinstance(data, str):
+                data = json.dumps(data)
+            conn.request(method, path, body=data, headers={"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            payload = resp.read()
+            conn.close()
+            return {
+                "RETURN_CODE": resp.status,
+                "METHOD": method,
+                "REQUEST_PATH": path,
+                "MESSAGE": resp.reason,
+                "DATA": json.loads(payload) if payload else {},
+            }
+
+        send_cacheable_request = send_request
+        send_txt_request = send_request
+
+    return StandInConnection
+
+
+def run_action(server, task):
+    """Run the dcnm_network action plugin and module for task against server"""
+
+    stand_in = connection(server)
+    args = task["cisco.dcnm.dcnm_network"]
+
+    def execute_module(module_name=None, module_args=None, task_vars=None, tmp=None, **kwargs):
+        if module_name == "cisco.dcnm.dcnm_rest":
+            # Same result as the dcnm_rest module
+            response = stand_in().send_request(module_args["method"], module_args["path"], module_args.get("json_data"))
+            if response["RETURN_CODE"] >= 400:
+                return {"failed": True, "msg": response}
+            return {"changed": False, "response": response}
+        set_module_args(module_args)
+        try:
+            dcnm_network.main()
+        except (AnsibleExitJson, AnsibleFailJson) as exc:
+            return exc.args[0]
+
+    mock_task = Mock(spec=Task)
+    mock_task.args = args
+    mock_task.async_val = 0
+    mock_task.action = "cisco.dcnm.dcnm_network"
+    action = dcnm_network_action.ActionModule(
+        task=mock_task, connection=Mock(), play_context=Mock(), loader=Mock(), templar=Mock(), shared_loader_obj=Mock()
+    )
+
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json), patch("time.sleep"), patch(
+        "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.Connection", stand_in
+    ), patch.object(action, "_execute_module", side_effect=execute_module):
+        return action.run(tmp=None, task_vars={})
+
+
+def test_ndfc_server_00008():
+    """
+    The merged dcnm_network scenario succeeds against the stand-in when the
+    networks are looked up one by one, which needs NDFC's answer for a GET of
+    a missing network.
+    """
+    topology = ndfc_server.Topology(switches=2, vrfs=2, networks=2, interfaces=2)
+    server = ndfc_server.NdfcServer(("127.0.0.1", 0), topology).start()
+    try:
+        status, body = request(server, "GET", TOP_DOWN + "/networks/net_missing")
+        assert status == 400
+        assert body["message"] == "Invalid network name"
+
+        result = run_action(server, benchmark.Scenarios(topology).task("dcnm_network", "merged"))
+        assert not result.get("failed"), result
+        assert result["changed"]
+        assert sorted(server.fabric.networks) == ["net_1", "net_2", "net_3"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,119 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for auth_token.py
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import base64
+import json
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.auth_token import (
+    AuthToken,
+    jwt_expiry,
+)
+
+
+def jwt(claims):
+    """
+    Return an unsigned JSON Web Token with ``claims``
+    """
+
+    def encode(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("utf-8").rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        (jwt({"sub": "admin", "exp": 1800000000}), 1800000000),
+        (jwt({"sub": "admin"}), None),
+        (jwt({"exp": "tomorrow"}), None),
+        ("a.b.c", None),
+        ("opaque-token", None),
+        (None, None),
+    ],
+)
+def test_auth_token_00000(token, expected) -> None:
+    """
+    ### Classes and Methods
+    -   jwt_expiry()
+
+    ### Summary
+    Verify the ``exp`` claim is returned for JSON Web Tokens only.
+    """
+    assert jwt_expiry(token) == expected
+
+
+def test_auth_token_00100() -> None:
+    """
+    ### Classes and Methods
+    -   AuthToken()
+            -   set()
+            -   needs_refresh()
+            -   expires_in()
+
+    ### Summary
+    Verify a token with an explicit lifetime needs a refresh within
+    ``refresh_margin`` seconds of its expiry.
+    """
+    instance = AuthToken(refresh_margin=60)
+    assert instance.needs_refresh(now=0) is False
+
+    instance.set("opaque-token", lifetime=600, now=1000)
+    assert instance.expires_in(now=1000) == 600
+    assert instance.needs_refresh(now=1539) is False
+    assert instance.needs_refresh(now=1540) is True
+    assert instance.logins == 1
+
+    instance.refresh_margin = 0
+    assert instance.needs_refresh(now=1599) is False
+
+
+def test_auth_token_00110() -> None:
+    """
+    ### Classes and Methods
+    -   AuthToken()
+            -   set()
+            -   needs_refresh()
+            -   clear()
+
+    ### Summary
+    Verify the expiry of a JSON Web Token is read from the token, that a
+    token with a short lifetime is refreshed half way through it, and that
+    a token with an unknown expiry or a cleared token never needs a refresh.
+    """
+    instance = AuthToken(refresh_margin=60)
+    instance.set(jwt({"exp": 2000}), now=1000)
+    assert instance.needs_refresh(now=1939) is False
+    assert instance.needs_refresh(now=1940) is True
+
+    instance.set("opaque-token", lifetime=40, now=1000)
+    assert instance.needs_refresh(now=1019) is False
+    assert instance.needs_refresh(now=1020) is True
+
+    instance.set("opaque-token", now=1000)
+    assert instance.expires_in(now=1000) is None
+    assert instance.needs_refresh(now=10**10) is False
+
+    instance.set(jwt({"exp": 2000}), now=1000)
+    instance.clear()
+    assert instance.needs_refresh(now=1999) is False
@@ -34,8 +34,8 @@ import logging
 from os import environ
 
 import pytest
-from ansible_collections.cisco.dcnm.plugins.module_utils.common.log_v2 import \
-    Log
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.log_v2 import (
+    LazyJson, Log)
 from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import \
     does_not_raise
 
@@ -440,3 +440,47 @@ def test_log_v2_00310(develop) -> None:
         instance = Log()
         instance.develop = develop
     assert instance.develop == develop
+
+
+def test_log_v2_00400(tmp_path) -> None:
+    """
+    ### Methods
+    -   LazyJson()
+
+    ### Test
+    -   A value wrapped in LazyJson() is serialized only if a handler
+        emits the message.
+    -   The value is logged as pretty-printed JSON.
+    """
+
+    class Counted:
+        """Count the serializations of the value"""
+
+        count = 0
+
+        def __str__(self):
+            Counted.count += 1
+            return "counted"
+
+    log_dir = tmp_path / "log_dir"
+    log_dir.mkdir()
+    config_file = log_dir / "logging_config.json"
+    log_file = log_dir / "dcnm.log"
+    config = logging_config(str(log_file))
+    config["handlers"]["file"]["level"] = "INFO"
+    with open(config_file, "w", encoding="UTF-8") as fp:
+        json.dump(config, fp)
+
+    with does_not_raise():
+        instance = Log()
+        instance.config = str(config_file)
+        instance.commit()
+
+    log = logging.getLogger("dcnm.test_logger")
+    log.debug("payload: %s", LazyJson({"key": Counted()}))
+    assert Counted.count == 0
+
+    log.info("payload: %s", LazyJson({"key": Counted()}))
+    assert Counted.count > 0
+    assert str(LazyJson({"b": 1, "a": [1]})) == json.dumps({"a": [1], "b": 1}, indent=4)
+    assert '"key": "counted"' in log_file.read_text(encoding="UTF-8")
@@ -51,7 +51,8 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.common.sender_file impo
     Sender
 from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import (
     ResponseGenerator, does_not_raise, maintenance_mode_fixture, params,
-    responses_deploy_maintenance_mode, responses_maintenance_mode)
+    responses_deploy_maintenance_mode, responses_fabric_details_by_name,
+    responses_maintenance_mode)
 
 FABRIC_NAME = "VXLAN_Fabric"
 CONFIG = [
@@ -1196,3 +1197,169 @@ def test_maintenance_mode_01100(monkeypatch, maintenance_mode) -> None:
     match += r"Got response.*\."
     with pytest.raises(ValueError, match=match):
         instance.commit()
+
+
+def switch_configs(count, **kwargs):
+    """
+    Return ``count`` configs, for switches 192.168.1.2 onward, updated
+    with ``kwargs``.
+    """
+    configs = []
+    for index in range(count):
+        config = copy.deepcopy(CONFIG[0])
+        config["ip_address"] = f"192.168.1.{index + 2}"
+        config["serial_number"] = f"FDO2218{index:04d}"
+        config.update(kwargs)
+        configs.append(config)
+    return configs
+
+
+def switch_details_response(modes):
+    """
+    Return a SwitchDetails response for switches 192.168.1.2 onward, where
+    ``modes`` is a list of (mode, systemMode) tuples.
+    """
+    data = []
+    for index, (mode, system_mode) in enumerate(modes):
+        data.append(
+            {
+                "fabricName": FABRIC_NAME,
+                "freezeMode": None,
+                "ipAddress": f"192.168.1.{index + 2}",
+                "mode": mode,
+                "serialNumber": f"FDO2218{index:04d}",
+                "switchRole": "leaf",
+                "systemMode": system_mode,
+            }
+        )
+    return {"DATA": data, "MESSAGE": "OK", "METHOD": "GET", "RETURN_CODE": 200}
+
+
+def rest_send_01200(responses):
+    """
+    Return a RestSend instance returning ``responses``.
+    """
+    sender = Sender()
+    sender.gen = ResponseGenerator(responses)
+    rest_send = RestSend({"state": "merged", "check_mode": False})
+    rest_send.response_handler = ResponseHandler()
+    rest_send.sender = sender
+    rest_send.unit_test = True
+    rest_send.timeout = 1
+    return rest_send
+
+
+@pytest.mark.parametrize(
+    "param, value, expected",
+    [
+        ("fabric_deploy", True, does_not_raise()),
+        ("fabric_deploy", "yes", pytest.raises(TypeError, match=r"Expected boolean for fabric_deploy")),
+    ],
+)
+def test_maintenance_mode_01200(maintenance_mode, param, value, expected) -> None:
+    """
+    ### Classes and Methods
+    -   MaintenanceMode()
+            -   fabric_deploy.setter
+
+    ### Summary
+    Verify the fabric_deploy setter validates its value.
+    """
+    instance = maintenance_mode
+    assert instance.fabric_deploy is False
+    with expected:
+        setattr(instance, param, value)
+        assert getattr(instance, param) == value
+
+
+def test_maintenance_mode_01400(maintenance_mode) -> None:
+    """
+    ### Classes and Methods
+    -   MaintenanceMode()
+            -   commit()
+            -   deploy_switches()
+            -   build_endpoints()
+            -   wait_for_mode_change()
+
+    ### Summary
+    Verify that, with ``fabric_deploy`` True, the switches of a fabric are
+    deployed with one config-deploy request, and that the switches are
+    polled with one ``MaintenanceModeInfo().refresh()`` per round until
+    all of them are in maintenance mode.
+    """
+    method_name = inspect.stack()[0][3]
+    key = f"{method_name}a"
+
+    def responses():
+        for _ in range(3):
+            yield {"MESSAGE": "OK", "METHOD": "POST", "RETURN_CODE": 200, "DATA": {"status": "Success"}}
+        yield switch_details_response([("Maintenance", "Maintenance"), ("Maintenance", "Normal")])
+        yield responses_fabric_details_by_name(key)
+        yield switch_details_response([("Maintenance", "Maintenance"), ("Maintenance", "Maintenance")])
+        yield responses_fabric_details_by_name(key)
+
+    rest_send = rest_send_01200(responses())
+    rest_send.timeout = 10
+    configs = switch_configs(2, deploy=True, wait_for_mode_change=True)
+
+    with does_not_raise():
+        instance = maintenance_mode
+        instance.fabric_deploy = True
+        instance.rest_send = rest_send
+        instance.results = Results()
+        instance.config = configs
+        instance.commit()
+
+    assert len(instance.endpoints) == 1
+    assert instance.endpoints[0]["path"].endswith(
+        f"/fabrics/{FABRIC_NAME}/config-deploy/FDO22180000,FDO22180001?forceShowRun=False"
+    )
+    assert instance.endpoints[0]["verb"] == "POST"
+    assert instance.results.diff[2] == {
+        "deploy_maintenance_mode": True,
+        "192.168.1.2": "192.168.1.2",
+        "192.168.1.3": "192.168.1.3",
+        "sequence_number": 3,
+    }
+    assert instance.results.metadata[2]["action"] == "deploy_maintenance_mode"
+    # The polls are not registered
+    assert len(instance.results.result) == 3
+    assert len(rest_send.response) == 7
+
+
+def test_maintenance_mode_01410(maintenance_mode) -> None:
+    """
+    ### Classes and Methods
+    -   MaintenanceMode()
+            -   commit()
+            -   wait_for_mode_change()
+
+    ### Summary
+    Verify ``ValueError`` is raised if the switches deployed with
+    ``fabric_deploy`` are not in their intended mode before
+    ``rest_send.timeout`` expires.
+    """
+    method_name = inspect.stack()[0][3]
+    key = f"{method_name}a"
+
+    def responses():
+        for _ in range(3):
+            yield {"MESSAGE": "OK", "METHOD": "POST", "RETURN_CODE": 200, "DATA": {"status": "Success"}}
+        yield switch_details_response([("Maintenance", "Maintenance"), ("Maintenance", "Normal")])
+        yield responses_fabric_details_by_name(key)
+
+    rest_send = rest_send_01200(responses())
+    configs = switch_configs(2, deploy=True, wait_for_mode_change=True)
+
+    with does_not_raise():
+        instance = maintenance_mode
+        instance.fabric_deploy = True
+        instance.rest_send = rest_send
+        instance.results = Results()
+        instance.config = configs
+
+    match = r"MaintenanceMode\.wait_for_mode_change:\s+"
+    match += r"Timed out waiting for the mode change of switches:\s+"
+    match += r"192\.168\.1\.3 \(maintenance\)\."
+    with pytest.raises(ValueError, match=match):
+        instance.commit()
@@ -0,0 +1,100 @@
+# Copyright (c) 2025 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the method name lookup used in module_utils.
+
+module_utils classes record the name of the running method with
+inspect.currentframe().f_code.co_name.  These tests verify that it returns
+the same value as the inspect.stack()[0][3] idiom it replaced.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+
+import inspect
+
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.results_v2 import Results
+
+
+def method_name_stack():
+    """Return the name of this function using inspect.stack()."""
+    return inspect.stack()[0][3]
+
+
+def method_name_frame():
+    """Return the name of this function using inspect.currentframe()."""
+    return inspect.currentframe().f_code.co_name
+
+
+def caller_stack():
+    """Return the name of the caller using inspect.stack()."""
+    return inspect.stack()[1][3]
+
+
+def caller_frame():
+    """Return the name of the caller using inspect.currentframe()."""
+    return inspect.currentframe().f_back.f_code.co_name
+
+
+def nested(depth, func):
+    """Call func with depth additional frames on the stack."""
+    if depth == 0:
+        return func()
+    return nested(depth - 1, func)
+
+
+def test_method_name_00000() -> None:
+    """
+    ### Summary
+    Verify that both idioms return the name of the running method.
+    """
+    assert method_name_stack() == "method_name_stack"
+    assert method_name_frame() == "method_name_frame"
+
+
+def test_method_name_00010() -> None:
+    """
+    ### Summary
+    Verify that both idioms return the name of the calling method.
+    """
+    assert nested(0, caller_stack) == nested(0, caller_frame) == "nested"
+
+
+def test_method_name_00100() -> None:
+    """
+    ### Summary
+    Verify that both idioms return the name of the running method for a
+    call made 20 frames deep.
+    """
+    assert nested(20, method_name_stack) == "method_name_stack"
+    assert nested(20, method_name_frame) == "method_name_frame"
+    assert nested(20, caller_frame) == "nested"
+
+
+def test_method_name_00110() -> None:
+    """
+    ### Summary
+    Verify that a Results property setter, which records its method name,
+    can be called repeatedly.
+    """
+    instance = Results()
+
+    for idx in range(10000):
+        instance.action = f"action_{idx}"
+
+    assert instance.action == "action_9999"
@@ -37,6 +37,12 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.common.response_handler
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.rest_send_v2 import (
     RestSend,
 )
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.retry_policy import (
+    RetryPolicy,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.results_v2 import (
+    Results,
+)
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.sender_file import (
     Sender,
 )
@@ -1325,3 +1331,196 @@ def test_rest_send_v2_01700(value, does_raise, expected) -> None:
     if does_raise is False:
         assert isinstance(instance.verb, str)
         assert instance.verb == value
+
+
+def response_01800(return_code, message=None):
+    """
+    Return a controller response with RETURN_CODE ``return_code``.
+
+    ResponseHandler() derives the success of a POST from its MESSAGE.
+    """
+    if message is None:
+        message = "OK" if return_code == 200 else "Error"
+    return {
+        "METHOD": "POST",
+        "MESSAGE": message,
+        "REQUEST_PATH": "/foo/path",
+        "RETURN_CODE": return_code,
+        "DATA": {},
+    }
+
+
+def rest_send_01800(response_list, retry_policy=None):
+    """
+    Return a RestSend() instance which sends a POST and gets the
+    responses in ``response_list``
+    """
+
+    def responses_01800():
+        for response in response_list:
+            yield copy.deepcopy(response)
+
+    sender = Sender()
+    sender.gen = ResponseGenerator(responses_01800())
+    instance = RestSend(copy.copy(PARAMS))
+    instance.unit_test = True
+    instance.path = "/foo/path"
+    instance.response_handler = ResponseHandler()
+    instance.sender = sender
+    instance.verb = "POST"
+    if retry_policy is not None:
+        instance.retry_policy = retry_policy
+    return instance
+
+
+def test_rest_send_v2_01800() -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   retry_policy.setter
+
+    ### Summary
+    Verify ``retry_policy.setter`` raises ``TypeError`` when set to a
+    value that does not implement ``retry_policy_v1``.
+    """
+    with does_not_raise():
+        instance = RestSend(PARAMS)
+    assert instance.retry_policy.implements == "retry_policy_v1"
+
+    match = r"RestSend\.retry_policy:\s+"
+    match += r"retry_policy must implement retry_policy_v1\."
+    with pytest.raises(TypeError, match=match):
+        instance.retry_policy = ResponseHandler()
+
+
+def test_rest_send_v2_01810() -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   commit_normal_mode()
+
+    ### Summary
+    Verify a terminal response (400) is not retried, and that
+    ``retry_current`` reports it.
+
+    ### Expected Result
+    -   Only one response is consumed.
+    -   ``RETRY`` is not added to ``response_current``.
+    """
+    with does_not_raise():
+        instance = rest_send_01800([response_01800(400, "Bad Request"), response_01800(200)])
+        instance.commit()
+    assert instance.response_current["RETURN_CODE"] == 400
+    assert instance.result_current["success"] is False
+    assert "RETRY" not in instance.response_current
+    assert instance.retry_current["attempts"] == 1
+    assert instance.retry_current["stopped"] == "terminal"
+
+
+def test_rest_send_v2_01820() -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   commit_normal_mode()
+    -   Results()
+            -   register_task_result()
+
+    ### Summary
+    Verify retryable responses (500, 429) are retried with backoff until
+    success, honoring ``RETRY_AFTER``, and that the retries are reported in
+    ``response_current`` and in the metadata of ``Results()``.
+
+    ### Expected Result
+    -   Waits are 1s (backoff, no jitter) and 3s (Retry-After).
+    """
+    retry_policy = RetryPolicy()
+    retry_policy.jitter = 0
+    too_many = response_01800(429, "Too Many Requests")
+    too_many["RETRY_AFTER"] = "3"
+    with does_not_raise():
+        instance = rest_send_01800([response_01800(500), too_many, response_01800(200)], retry_policy)
+        instance.commit()
+    assert instance.result_current["success"] is True
+    assert instance.retry_current == {
+        "attempts": 3,
+        "retries": 2,
+        "waited": 4,
+        "stopped": None,
+        "circuit_open": False,
+        "retry_budget_remaining": 18,
+    }
+    assert instance.response_current["RETRY"] == instance.retry_current
+
+    results = Results()
+    results.action = "retry"
+    results.response_current = instance.response_current
+    results.result_current = instance.result_current
+    results.register_task_result()
+    assert results.metadata[0]["retry"]["retries"] == 2
+
+
+def test_rest_send_v2_01830() -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   commit_normal_mode()
+
+    ### Summary
+    Verify the retry budget is shared by the requests sent with one
+    ``RestSend()`` instance, and ``timeout`` still bounds the attempts.
+
+    ### Expected Result
+    -   The first request is retried twice (budget of 2).
+    -   The second request is sent once.
+    -   With timeout 1, a request is sent once.
+    """
+    retry_policy = RetryPolicy()
+    retry_policy.retry_budget = 2
+    with does_not_raise():
+        instance = rest_send_01800([response_01800(500)] * 4, retry_policy)
+        instance.commit()
+    assert instance.retry_current["attempts"] == 3
+    assert instance.retry_current["stopped"] == "retry_budget_exhausted"
+
+    with does_not_raise():
+        instance.commit()
+    assert instance.retry_current["attempts"] == 1
+    assert instance.retry_current["stopped"] == "retry_budget_exhausted"
+    assert instance.response_current["RETRY"]["retry_budget_remaining"] == 0
+
+    with does_not_raise():
+        instance = rest_send_01800([response_01800(500)] * 2)
+        instance.timeout = 1
+        instance.commit()
+    assert instance.retry_current["attempts"] == 1
+    assert instance.retry_current["stopped"] == "timeout"
+    assert "RETRY" not in instance.response_current
+
+
+def test_rest_send_v2_01840() -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   commit_normal_mode()
+
+    ### Summary
+    Verify the circuit opens after ``circuit_threshold`` consecutive 503
+    responses, that requests are then not retried, and that a successful
+    response closes the circuit.
+    """
+    with does_not_raise():
+        instance = rest_send_01800([response_01800(503)] * 4 + [response_01800(200)])
+        instance.commit()
+    assert instance.retry_current["attempts"] == 3
+    assert instance.retry_current["stopped"] == "circuit_open"
+    assert instance.retry_current["circuit_open"] is True
+
+    with does_not_raise():
+        instance.commit()
+    assert instance.retry_current["attempts"] == 1
+    assert instance.retry_current["stopped"] == "circuit_open"
+
+    with does_not_raise():
+        instance.commit()
+    assert instance.result_current["success"] is True
+    assert instance.retry_current["circuit_open"] is False
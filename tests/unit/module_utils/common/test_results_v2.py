@@ -0,0 +1,163 @@
+# Copyright (c) 2025 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# pylint: disable=unused-import
+# Some tests require calling protected methods
+# pylint: disable=protected-access
+"""
+Unit tests for results_v2.py
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.operation_type import OperationType
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.results_v2 import Results
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import does_not_raise
+
+
+def register(instance: Results, data) -> None:
+    """
+    Register a successful task whose response contains data.
+    """
+    instance.action = "test_action"
+    instance.operation_type = OperationType.UPDATE
+    instance.state = "merged"
+    instance.response_current = {"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": data}
+    instance.result_current = {"success": True, "changed": True}
+    instance.diff_current = {"FABRIC_NAME": "f1"}
+    instance.register_task_result()
+
+
+def test_results_v2_00000() -> None:
+    """
+    # Summary
+
+    Verify class properties are initialized to expected values.
+    """
+    with does_not_raise():
+        instance = Results()
+    assert instance.class_name == "Results"
+    assert instance.max_response_data_size is None
+    assert instance.diff == []
+    assert instance.response == []
+    assert instance.result == []
+    assert instance.metadata == []
+
+
+def test_results_v2_00100() -> None:
+    """
+    # Summary
+
+    Verify registered responses share nested DATA with the caller instead
+    of copying it, while top-level keys are snapshots.
+    """
+    data = [{"serialNumber": f"FDO{idx}"} for idx in range(10)]
+    instance = Results()
+    register(instance, data)
+
+    response_current = instance.response_current
+    assert instance.response[0]["DATA"] is data
+    assert instance.response[0] is not response_current
+    assert instance.response[0]["sequence_number"] == 1
+
+    register(instance, data)
+    assert instance.response[0]["sequence_number"] == 1
+    assert instance.response[1]["sequence_number"] == 2
+
+
+def test_results_v2_00200() -> None:
+    """
+    # Summary
+
+    Verify `build_final_result()` deep copies the registered values.
+    """
+    data = [{"serialNumber": "FDO1"}]
+    instance = Results()
+    register(instance, data)
+    instance.build_final_result()
+
+    data[0]["serialNumber"] = "FDO2"
+    instance.diff[0]["FABRIC_NAME"] = "f2"
+
+    assert instance.final_result["changed"] is True
+    assert instance.final_result["failed"] is False
+    assert instance.final_result["response"][0]["DATA"] == [{"serialNumber": "FDO1"}]
+    assert instance.final_result["diff"][0]["FABRIC_NAME"] == "f1"
+
+
+def test_results_v2_00300() -> None:
+    """
+    # Summary
+
+    Verify `did_anything_change()` ignores sequence_number in diffs.
+    """
+    instance = Results()
+    instance.action = "test_action"
+    instance.operation_type = OperationType.UPDATE
+    instance.response_current = {"RETURN_CODE": 200}
+    instance.result_current = {"success": True}
+    instance.diff_current = {}
+    instance.register_task_result()
+    assert instance.changed == {False}
+
+    instance.diff_current = {"FABRIC_NAME": "f1"}
+    instance.register_task_result()
+    assert True in instance.changed
+
+
+def test_results_v2_00400() -> None:
+    """
+    # Summary
+
+    Verify DATA larger than `max_response_data_size` is summarized in the
+    final result, and smaller DATA is returned unchanged.
+    """
+    large = [{"serialNumber": f"FDO{idx}"} for idx in range(100)]
+    small = {"status": "ok"}
+    instance = Results()
+    instance.max_response_data_size = 100
+    register(instance, large)
+    register(instance, small)
+    instance.build_final_result()
+
+    summary = instance.final_result["response"][0]
+    assert summary["RETURN_CODE"] == 200
+    assert summary["DATA"]["truncated"] is True
+    assert summary["DATA"]["type"] == "list"
+    assert summary["DATA"]["length"] == 100
+    assert summary["DATA"]["size"] > 100
+    assert instance.final_result["response"][1]["DATA"] == small
+    assert instance.response[0]["DATA"] is large
+
+
+@pytest.mark.parametrize("value", ["100", 1.5, True])
+def test_results_v2_00410(value) -> None:
+    """
+    # Summary
+
+    Verify `max_response_data_size` raises `TypeError` if value is not an
+    int or None.
+    """
+    instance = Results()
+    match = r"Results\.max_response_data_size:\s+"
+    match += r"instance\.max_response_data_size must be an int or None\."
+    with pytest.raises(TypeError, match=match):
+        instance.max_response_data_size = value
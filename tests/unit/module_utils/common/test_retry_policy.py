@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for retry_policy.py
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.retry_policy import (
+    RetryPolicy,
+)
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import (
+    does_not_raise,
+)
+
+
+def test_retry_policy_00000() -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   __init__()
+
+    ### Summary
+    Verify the class attributes are initialized to expected values.
+    """
+    with does_not_raise():
+        instance = RetryPolicy()
+    assert instance.class_name == "RetryPolicy"
+    assert instance.implements == "retry_policy_v1"
+    assert instance.backoff_base == 1
+    assert instance.backoff_max is None
+    assert instance.circuit_threshold == 3
+    assert instance.jitter == 0.5
+    assert instance.retry_after_max == 60
+    assert instance.retry_budget == 20
+    assert instance.summary == {"circuit_open": False, "retry_budget_remaining": 20}
+
+
+@pytest.mark.parametrize(
+    "return_code, success, expected",
+    [
+        (200, True, RetryPolicy.SUCCESS),
+        (404, True, RetryPolicy.SUCCESS),
+        (200, False, RetryPolicy.RETRYABLE),
+        (400, False, RetryPolicy.TERMINAL),
+        (403, False, RetryPolicy.TERMINAL),
+        (409, False, RetryPolicy.TERMINAL),
+        (423, False, RetryPolicy.RETRYABLE),
+        (429, False, RetryPolicy.RETRYABLE),
+        (500, False, RetryPolicy.RETRYABLE),
+        (503, False, RetryPolicy.RETRYABLE),
+        (None, False, RetryPolicy.RETRYABLE),
+    ],
+)
+def test_retry_policy_00100(return_code, success, expected) -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   classify()
+
+    ### Summary
+    Verify failed responses are classified by their RETURN_CODE.
+    """
+    instance = RetryPolicy()
+    assert instance.classify({"RETURN_CODE": return_code}, {"success": success}) == expected
+
+
+def test_retry_policy_00200() -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   delay()
+
+    ### Summary
+    Verify the backoff doubles up to the cap, that jitter only shortens the
+    wait, and that each delay consumes one retry of the budget.
+    """
+    instance = RetryPolicy()
+    instance.jitter = 0
+    assert [instance.delay(attempt, {}, 5) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    instance.backoff_max = 3
+    assert instance.delay(4, {}, 5) == 3
+    assert instance.retries == 6
+    assert instance.summary["retry_budget_remaining"] == 14
+
+    instance.jitter = 0.5
+    for _ in range(20):
+        assert 1.5 <= instance.delay(3, {}, 5) <= 3
+
+
+def test_retry_policy_00210() -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   delay()
+
+    ### Summary
+    Verify ``RETRY_AFTER`` is honored in delay-seconds and HTTP-date format,
+    up to ``retry_after_max``, and ignored if invalid.
+    """
+    instance = RetryPolicy()
+    instance.jitter = 0
+    assert instance.delay(1, {"RETRY_AFTER": "7"}, 5) == 7
+    assert instance.delay(1, {"RETRY_AFTER": "600"}, 5) == 60
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= instance.delay(1, {"RETRY_AFTER": retry_at}, 5) <= 30
+    assert instance.delay(1, {"RETRY_AFTER": "soon"}, 5) == 1
+
+
+def test_retry_policy_00300() -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   classify()
+            -   refusal()
+
+    ### Summary
+    Verify the circuit opens after ``circuit_threshold`` consecutive
+    unavailable responses, that another failure resets the count, that a
+    success closes the circuit, and that the budget refuses retries.
+    """
+    instance = RetryPolicy()
+    unavailable = {"RETURN_CODE": 503}
+    failed = {"success": False}
+    instance.classify(unavailable, failed)
+    instance.classify(unavailable, failed)
+    instance.classify({"RETURN_CODE": 500}, failed)
+    instance.classify(unavailable, failed)
+    assert instance.refusal() is None
+    instance.classify(unavailable, failed)
+    instance.classify(unavailable, failed)
+    assert instance.refusal() == "circuit_open"
+    instance.classify({"RETURN_CODE": 200}, {"success": True})
+    assert instance.refusal() is None
+
+    instance.retry_budget = 0
+    assert instance.refusal() == "retry_budget_exhausted"
+
+
+@pytest.mark.parametrize(
+    "name, value, expected",
+    [
+        ("backoff_base", 0.5, does_not_raise()),
+        ("backoff_base", "1", pytest.raises(TypeError, match=r"RetryPolicy\.backoff_base: backoff_base must be a number")),
+        ("backoff_base", -1, pytest.raises(ValueError, match=r"RetryPolicy\.backoff_base:")),
+        ("backoff_max", None, does_not_raise()),
+        ("circuit_threshold", 1.5, pytest.raises(TypeError, match=r"circuit_threshold must be an integer")),
+        ("jitter", 1.5, pytest.raises(ValueError, match=r"jitter must be between 0 and 1")),
+        ("retry_after_max", True, pytest.raises(TypeError)),
+        ("retry_budget", 0, does_not_raise()),
+    ],
+)
+def test_retry_policy_00400(name, value, expected) -> None:
+    """
+    ### Classes and Methods
+    -   RetryPolicy()
+            -   property setters
+
+    ### Summary
+    Verify the property setters validate their values.
+    """
+    instance = RetryPolicy()
+    with expected:
+        setattr(instance, name, value)
+        assert getattr(instance, name) == value
@@ -0,0 +1,190 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for template_cache.py
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import json
+import os
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.template_cache import (
+    TemplateCache,
+    default_cache_dir,
+)
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import (
+    does_not_raise,
+)
+
+
+def template(name, timestamp="2024-02-02 23:04:09"):
+    """
+    Return a template as returned in the DATA of a controller response
+    """
+    return {
+        "content": "##template content\n" * 100,
+        "name": name,
+        "newContent": None,
+        "parameters": [
+            {
+                "annotations": {"IsMandatory": "true"},
+                "defaultValue": "65000",
+                "name": "BGP_AS",
+                "parameterType": "string",
+                "parameterTypeStructure": False,
+                "structureParameters": {},
+            },
+        ],
+        "templateType": "FABRIC",
+        "timestamp": timestamp,
+    }
+
+
+def template_cache(tmp_path, version="12.2.2.238"):
+    """
+    Return a TemplateCache() instance writing to tmp_path
+    """
+    instance = TemplateCache(path=str(tmp_path))
+    instance.controller_version = version
+    instance.controller_uuid = "f49e6088-ad4f-4406-bef6-2419de914df1"
+    return instance
+
+
+def test_template_cache_00000(monkeypatch) -> None:
+    """
+    ### Classes and Methods
+    -   TemplateCache()
+            -   __init__()
+    -   default_cache_dir()
+
+    ### Summary
+    Verify the class attributes are initialized to expected values, and
+    that the cache directory is under ``ANSIBLE_HOME``.
+    """
+    monkeypatch.setenv("ANSIBLE_HOME", "/tmp/ansible_home")
+    with does_not_raise():
+        instance = TemplateCache()
+    assert instance.class_name == "TemplateCache"
+    assert instance.implements == "template_cache_v1"
+    assert instance.controller_uuid is None
+    assert instance.controller_version is None
+    assert instance.enabled is False
+    assert instance.max_age == 86400
+    assert instance.path == "/tmp/ansible_home/cache/cisco.dcnm/templates"
+    assert default_cache_dir() == instance.path
+
+
+def test_template_cache_00100(tmp_path) -> None:
+    """
+    ### Classes and Methods
+    -   TemplateCache()
+            -   put()
+            -   get()
+
+    ### Summary
+    Verify a template is read back in compact form, that the cache is
+    keyed on controller version, and that it is disabled without one.
+    """
+    instance = template_cache(tmp_path)
+    assert instance.get("Easy_Fabric") is None
+    instance.put("Easy_Fabric", template("Easy_Fabric"))
+    assert instance.get("Easy_Fabric") == {
+        "template_name": "Easy_Fabric",
+        "parameters": [
+            {
+                "annotations": {"IsMandatory": "true"},
+                "defaultValue": "65000",
+                "name": "BGP_AS",
+                "parameterType": "string",
+            },
+        ],
+    }
+    assert instance.hits == 1
+    assert instance.misses == 1
+
+    assert template_cache(tmp_path, version="12.3.1.248").get("Easy_Fabric") is None
+
+    instance.controller_version = None
+    assert instance.get("Easy_Fabric") is None
+    instance.put("LAN_Classic", template("LAN_Classic"))
+    instance.controller_version = "12.2.2.238"
+    assert instance.get("LAN_Classic") is None
+    assert os.listdir(str(tmp_path)) == ["f49e6088-ad4f-4406-bef6-2419de914df1_12.2.2.238"]
+
+
+def test_template_cache_00110(tmp_path) -> None:
+    """
+    ### Classes and Methods
+    -   TemplateCache()
+            -   get()
+
+    ### Summary
+    Verify stale, corrupt, and foreign cache files are ignored.
+    """
+    instance = template_cache(tmp_path)
+    instance.put("Easy_Fabric", template("Easy_Fabric"))
+    path = instance._template_path("Easy_Fabric")  # pylint: disable=protected-access
+
+    with open(path, encoding="utf-8") as cache_file:
+        content = json.load(cache_file)
+    content["written"] -= 7200
+    with open(path, "w", encoding="utf-8") as cache_file:
+        json.dump(content, cache_file)
+    assert instance.get("Easy_Fabric") is not None
+    instance.max_age = 3600
+    assert instance.get("Easy_Fabric") is None
+
+    content["written"] += 7200
+    content["format"] = 0
+    with open(path, "w", encoding="utf-8") as cache_file:
+        json.dump(content, cache_file)
+    assert instance.get("Easy_Fabric") is None
+
+    with open(path, "w", encoding="utf-8") as cache_file:
+        cache_file.write("{not json")
+    assert instance.get("Easy_Fabric") is None
+
+
+@pytest.mark.parametrize(
+    "name, value, expected",
+    [
+        ("controller_uuid", None, does_not_raise()),
+        ("controller_uuid", 10, pytest.raises(TypeError, match=r"TemplateCache\.controller_uuid: controller_uuid must be a string, or None")),
+        ("controller_version", "12.2.2.238", does_not_raise()),
+        ("controller_version", 12, pytest.raises(TypeError, match=r"controller_version must be a string, or None")),
+        ("max_age", 0, does_not_raise()),
+        ("max_age", True, pytest.raises(TypeError, match=r"TemplateCache\.max_age: max_age must be an integer")),
+        ("max_age", -1, pytest.raises(ValueError, match=r"TemplateCache\.max_age: max_age must be >= 0")),
+        ("path", "/tmp/templates", does_not_raise()),
+        ("path", None, pytest.raises(TypeError, match=r"TemplateCache\.path: path must be a string")),
+    ],
+)
+def test_template_cache_00300(name, value, expected) -> None:
+    """
+    ### Classes and Methods
+    -   TemplateCache()
+            -   property setters
+
+    ### Summary
+    Verify the property setters validate their values.
+    """
+    instance = TemplateCache()
+    with expected:
+        setattr(instance, name, value)
+        assert getattr(instance, name) == value
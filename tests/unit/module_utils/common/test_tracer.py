@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+"""
+Unit tests for tracer.py
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type  # pylint: disable=invalid-name
+
+__copyright__ = "Copyright (c) 2026 Cisco and/or its affiliates."
+
+import copy
+import json
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common import tracer as tracer_module
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.response_handler import (
+    ResponseHandler,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.rest_send_v2 import (
+    RestSend,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.results_v2 import (
+    Results,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.sender_file import (
+    Sender,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.tracer import (
+    Tracer,
+    path_template,
+    set_tracer,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm import dcnm
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import (
+    ResponseGenerator,
+    does_not_raise,
+)
+
+PARAMS = {"state": "merged", "check_mode": False}
+
+
+@pytest.fixture(name="tracer")
+def tracer_fixture():
+    """
+    Enable tracing for one test and restore the tracer of the process afterwards
+    """
+    saved = tracer_module._TRACER
+    yield set_tracer(Tracer({"NDFC_TRACE": "true"}))
+    set_tracer(saved)
+
+
+def test_tracer_00000() -> None:
+    """
+    ### Classes and Methods
+    -   Tracer()
+            -   __init__()
+
+    ### Summary
+    Verify tracing is enabled only by ``NDFC_TRACE`` or ``NDFC_TRACE_FILE``.
+    """
+    assert Tracer({}).enabled is False
+    assert Tracer({"NDFC_TRACE": "false"}).enabled is False
+    assert Tracer({"NDFC_TRACE": "True"}).enabled is True
+    instance = Tracer({"NDFC_TRACE_FILE": "/tmp/trace.json"})
+    assert instance.enabled is True
+    assert instance.file == "/tmp/trace.json"
+    assert Tracer({}).add_to({"changed": False}) == {"changed": False}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        (
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/f1/vrfs/attachments?vrf-names=vrf_1,vrf_2",
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/top-down/fabrics/{}/vrfs/attachments?vrf-names={}",
+        ),
+        (
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/f1/config-deploy/FDO1,FDO2",
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{}/config-deploy/{}",
+        ),
+        (
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches/FDO1",
+            "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/policies/switches/{}",
+        ),
+        ("/rest/interface?serialNumber=FDO1&ifName=Ethernet1/1", "/rest/interface?serialNumber={}&ifName={}"),
+    ],
+)
+def test_tracer_00010(path, expected) -> None:
+    """
+    ### Classes and Methods
+    -   path_template()
+
+    ### Summary
+    Verify names, identifiers and query values are replaced with ``{}``.
+    """
+    assert path_template(path) == expected
+
+
+def test_tracer_00020() -> None:
+    """
+    ### Classes and Methods
+    -   Tracer()
+            -   request()
+            -   summary()
+
+    ### Summary
+    Verify the summary counts overlapping requests once in ``request_time``
+    and aggregates the requests per endpoint.
+    """
+    instance = Tracer({"NDFC_TRACE": "true"})
+    instance.request("dcnm_send", "GET", "/fabrics/f1/vrfs", {"RETURN_CODE": 200, "DATA": [1, 2]}, 0.0)
+    instance.request("dcnm_send", "GET", "/fabrics/f2/vrfs", {"RETURN_CODE": 200, "DATA": []}, 0.0)
+    instance.requests[0].update({"start": 0.0, "latency_ms": 1000.0})
+    instance.requests[1].update({"start": 0.5, "latency_ms": 1000.0})
+
+    summary = instance.summary()
+    assert summary["request_count"] == 2
+    assert summary["request_time"] == 1.5
+    assert summary["endpoints"] == {"GET /fabrics/{}/vrfs": {"count": 2, "time_ms": 2000.0}}
+    assert summary["requests"][0]["bytes"] == len("[1,2]")
+    assert summary["requests"][0]["status"] == 200
+    assert instance.add_to({})["trace"]["request_count"] == 2
+
+
+def test_tracer_00030(tracer) -> None:
+    """
+    ### Classes and Methods
+    -   Tracer()
+            -   span()
+
+    ### Summary
+    Verify nested spans are recorded when they end, inner span first.
+    """
+    with tracer.span("get_have"):
+        with tracer.span("diff"):
+            pass
+
+    assert [span["name"] for span in tracer.spans] == ["diff", "get_have"]
+    assert tracer.spans[1]["duration_ms"] >= tracer.spans[0]["duration_ms"]
+
+
+def test_tracer_00040(tracer) -> None:
+    """
+    ### Classes and Methods
+    -   RestSend()
+            -   commit()
+
+    ### Summary
+    Verify ``RestSend().commit()`` records one request with the number of
+    retries, and ``Results().build_final_result()`` returns the trace.
+    """
+
+    def responses():
+        yield {"METHOD": "GET", "MESSAGE": "Internal Server Error", "REQUEST_PATH": "/fabrics/f1", "RETURN_CODE": 500, "DATA": {}}
+        yield {"METHOD": "GET", "MESSAGE": "OK", "REQUEST_PATH": "/fabrics/f1", "RETURN_CODE": 200, "DATA": {"a": 1}}
+
+    sender = Sender()
+    sender.gen = ResponseGenerator(responses())
+    with does_not_raise():
+        instance = RestSend(copy.copy(PARAMS))
+        instance.unit_test = True
+        instance.path = "/fabrics/f1"
+        instance.response_handler = ResponseHandler()
+        instance.sender = sender
+        instance.verb = "GET"
+        instance.commit()
+
+    assert len(tracer.requests) == 1
+    record = tracer.requests[0]
+    assert record["source"] == "RestSend"
+    assert record["path"] == "/fabrics/{}"
+    assert record["status"] == 200
+    assert record["retries"] == 1
+
+    results = Results()
+    results.build_final_result()
+    assert results.final_result["trace"]["request_count"] == 1
+
+
+def test_tracer_00050(tracer, monkeypatch) -> None:
+    """
+    ### Classes and Methods
+    -   dcnm_send()
+
+    ### Summary
+    Verify ``dcnm_send()`` records its requests, except inside a request group.
+    """
+
+    class MockConnection:
+        """Mock the persistent connection"""
+
+        def __init__(self, socket_path):
+            self.socket_path = socket_path
+
+        def send_request(self, method, path, data):
+            """Return a successful response"""
+            return {"RETURN_CODE": 200, "METHOD": method, "REQUEST_PATH": path, "DATA": {"ok": True}}
+
+    class MockModule:
+        """Mock AnsibleModule"""
+
+        _socket_path = "/tmp/socket"
+        _name = "dcnm_vrf"
+
+    monkeypatch.setattr(dcnm, "Connection", MockConnection)
+    dcnm.dcnm_send(MockModule(), "GET", "/fabrics/f1/vrfs")
+    with tracer.request_group():
+        dcnm.dcnm_send(MockModule(), "GET", "/fabrics/f1/networks")
+
+    assert [record["path"] for record in tracer.requests] == ["/fabrics/{}/vrfs"]
+    assert tracer.requests[0]["source"] == "dcnm_send"
+    assert tracer.module_name == "dcnm_vrf"
+
+
+def test_tracer_00060(tmp_path) -> None:
+    """
+    ### Classes and Methods
+    -   Tracer()
+            -   write()
+
+    ### Summary
+    Verify the trace of several module runs is appended to one file, as JSON
+    lines or as an open Chrome trace event array.
+    """
+    for name in ("trace.jsonl", "trace.json"):
+        path = str(tmp_path / name)
+        for module in ("dcnm_vrf", "dcnm_network"):
+            instance = Tracer({"NDFC_TRACE_FILE": path})
+            instance.name = module
+            with instance.span("get_have"):
+                instance.request("dcnm_send", "GET", "/fabrics/f1/vrfs", {"RETURN_CODE": 200, "DATA": []}, instance.now())
+            instance.write()
+            instance.write()
+
+        with open(path, encoding="utf-8") as trace_file:
+            text = trace_file.read()
+        if name.endswith(".jsonl"):
+            lines = [json.loads(line) for line in text.splitlines()]
+            assert [(line["module"], line["type"]) for line in lines] == [
+                ("dcnm_vrf", "span"),
+                ("dcnm_vrf", "request"),
+                ("dcnm_network", "span"),
+                ("dcnm_network", "request"),
+            ]
+        else:
+            events = json.loads(text.rstrip().rstrip(",") + "]")
+            assert [event["ph"] for event in events] == ["M", "X", "X", "M", "X", "X"]
+            assert events[2]["name"] == "GET /fabrics/{}/vrfs"
+            assert events[3]["args"]["name"].startswith("dcnm_network")
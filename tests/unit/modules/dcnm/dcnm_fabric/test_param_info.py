@@ -505,3 +505,42 @@ def test_param_info_00070() -> None:
     match += r"not appropriate for the fabric type\."
     with pytest.raises(KeyError, match=match):
         instance.parameter("UNDERLAY_IS_V6")
+
+
+def test_param_info_00080(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - ParamInfo
+        - __init__()
+        - template.setter
+        - refresh()
+
+    Summary
+    -   Verify refresh() reuses the parameter information built for a
+        template when called again with the same template, and builds
+        new parameter information for a different template.
+    """
+    key = "test_param_info_00070a"
+
+    with does_not_raise():
+        instance = ParamInfo()
+        template = templates_param_info(key)
+        instance.template = template
+        instance.refresh()
+    info = instance.info
+
+    def mock_build_info():
+        raise AssertionError("info was rebuilt")
+
+    monkeypatch.setattr(instance, "_build_info", mock_build_info)
+    with does_not_raise():
+        instance.template = template
+        instance.refresh()
+    assert instance.info is info
+
+    monkeypatch.undo()
+    with does_not_raise():
+        instance.template = templates_param_info(key)
+        instance.refresh()
+    assert instance.info is not info
+    assert instance.info == info
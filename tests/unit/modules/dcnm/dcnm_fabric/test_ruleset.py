@@ -228,3 +228,42 @@ def test_ruleset_00043() -> None:
     match = r"RuleSet\.refresh: name key missing from parameter:"
     with pytest.raises(ValueError, match=match):
         instance.refresh()
+
+
+def test_ruleset_00050(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - RuleSet
+        - __init__()
+        - template.setter
+        - refresh()
+
+    Summary
+    -   Verify refresh() reuses the ruleset built for a template when
+        called again with the same template, and builds a new ruleset
+        for a different template.
+    """
+    key = "test_ruleset_00030a"
+
+    with does_not_raise():
+        instance = RuleSet()
+        template = templates_ruleset(key)
+        instance.template = template
+        instance.refresh()
+    ruleset = instance.ruleset
+
+    def mock_update_ruleset():
+        raise AssertionError("ruleset was rebuilt")
+
+    monkeypatch.setattr(instance, "_update_ruleset", mock_update_ruleset)
+    with does_not_raise():
+        instance.template = template
+        instance.refresh()
+    assert instance.ruleset is ruleset
+
+    monkeypatch.undo()
+    with does_not_raise():
+        instance.template = templates_ruleset(key)
+        instance.refresh()
+    assert instance.ruleset is not ruleset
+    assert instance.ruleset == ruleset
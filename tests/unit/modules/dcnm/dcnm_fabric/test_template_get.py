@@ -38,6 +38,10 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.common.rest_send import
     RestSend
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.results import \
     Results
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.template_cache import \
+    TemplateCache
+from ansible_collections.cisco.dcnm.plugins.module_utils.fabric.template_get import \
+    TemplateGet
 from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import \
     ResponseGenerator
 from ansible_collections.cisco.dcnm.tests.unit.modules.dcnm.dcnm_fabric.utils import (
@@ -64,6 +68,7 @@ def test_template_get_00000(template_get) -> None:
     assert instance.result == []
     assert instance.result_current == {}
     assert instance.template_name is None
+    assert instance.controller_version is None
     assert instance.template is None
     assert instance.rest_send is None
     assert instance.results is None
@@ -379,6 +384,175 @@ def test_template_get_00063(monkeypatch, template_get) -> None:
     assert instance.result_current.get("found", None) is True
 
 
+def test_template_get_00064(monkeypatch, template_get) -> None:
+    """
+    Classes and Methods
+    - TemplateGet
+        - __init__()
+        - controller_version.setter
+        - refresh()
+
+    Summary
+    -   Verify that refresh() retrieves a template from the controller
+        once per template_name and controller_version, and returns the
+        cached template otherwise.
+    """
+    key = "test_template_get_00063a"
+
+    PATCH_DCNM_SEND = "ansible_collections.cisco.dcnm.plugins."
+    PATCH_DCNM_SEND += "module_utils.common.rest_send.dcnm_send"
+
+    def responses():
+        yield responses_template_get(key)
+        yield responses_template_get(key)
+
+    gen = ResponseGenerator(responses())
+    requests = []
+
+    def mock_dcnm_send(*args, **kwargs):
+        requests.append(args)
+        item = gen.next
+        return item
+
+    with does_not_raise():
+        instance = template_get
+
+        instance.rest_send = RestSend(MockAnsibleModule())
+        instance.rest_send.unit_test = True
+
+        instance.results = Results()
+        instance.template_name = "Easy_Fabric"
+        instance.controller_version = "12.2.2.238"
+
+    monkeypatch.setattr(PATCH_DCNM_SEND, mock_dcnm_send)
+
+    with does_not_raise():
+        instance.refresh()
+    template = instance.template
+    with does_not_raise():
+        instance.refresh()
+    assert instance.template is template
+    assert len(requests) == 1
+
+    with does_not_raise():
+        instance.controller_version = "12.3.1.248"
+        instance.refresh()
+    assert instance.template is not template
+    assert instance.template == template
+    assert len(requests) == 2
+    assert len(instance.response) == 2
+
+
+MATCH_00065 = r"TemplateGet\.controller_version: "
+MATCH_00065 += r"controller_version must be an instance of str, or None\."
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("12.2.2.238", does_not_raise()),
+        (None, does_not_raise()),
+        (12, pytest.raises(TypeError, match=MATCH_00065)),
+        ([], pytest.raises(TypeError, match=MATCH_00065)),
+    ],
+)
+def test_template_get_00065(template_get, value, expected) -> None:
+    """
+    Classes and Methods
+    - TemplateGet
+        - __init__()
+        - controller_version.setter
+
+    Summary
+    -   Verify that the controller_version setter accepts str and None,
+        and raises ``TypeError`` otherwise.
+    """
+    with does_not_raise():
+        instance = template_get
+    with expected:
+        instance.controller_version = value
+        assert instance.controller_version == value
+
+
+def test_template_get_00066(monkeypatch, tmp_path) -> None:
+    """
+    Classes and Methods
+    - TemplateGet
+        - __init__()
+        - template_cache.setter
+        - refresh()
+
+    Summary
+    -   Verify that refresh() persists the template to the template cache,
+        and that another instance reads it from the template cache
+        instead of the controller.
+    """
+    key = "test_template_get_00063a"
+
+    PATCH_DCNM_SEND = "ansible_collections.cisco.dcnm.plugins."
+    PATCH_DCNM_SEND += "module_utils.common.rest_send.dcnm_send"
+
+    def responses():
+        yield responses_template_get(key)
+
+    gen = ResponseGenerator(responses())
+    requests = []
+
+    def mock_dcnm_send(*args, **kwargs):
+        requests.append(args)
+        item = gen.next
+        return item
+
+    monkeypatch.setattr(PATCH_DCNM_SEND, mock_dcnm_send)
+
+    template_cache = TemplateCache(path=str(tmp_path))
+    template_cache.controller_version = "12.2.2.238"
+
+    templates = []
+    for _ in range(2):
+        with does_not_raise():
+            instance = TemplateGet()
+            instance.rest_send = RestSend(MockAnsibleModule())
+            instance.rest_send.unit_test = True
+            instance.results = Results()
+            instance.template_name = "Easy_Fabric"
+            instance.template_cache = template_cache
+            instance.refresh()
+        templates.append(instance.template)
+    assert len(requests) == 1
+    assert template_cache.hits == 1
+    names = [parameter["name"] for parameter in templates[0]["parameters"]]
+    assert len(names) > 0
+    assert [parameter["name"] for parameter in templates[1]["parameters"]] == names
+    assert set(templates[1]["parameters"][0]) <= set(templates[0]["parameters"][0])
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, does_not_raise()),
+        (TemplateCache(), does_not_raise()),
+        (Results(), pytest.raises(TypeError, match=r"TemplateGet\.template_cache: template_cache must implement template_cache_v1")),
+    ],
+)
+def test_template_get_00067(template_get, value, expected) -> None:
+    """
+    Classes and Methods
+    - TemplateGet
+        - __init__()
+        - template_cache.setter
+
+    Summary
+    -   Verify that the template_cache setter accepts a TemplateCache()
+        instance and None, and raises ``TypeError`` otherwise.
+    """
+    with does_not_raise():
+        instance = template_get
+    with expected:
+        instance.template_cache = value
+        assert instance.template_cache is value
+
+
 def test_template_get_00070(monkeypatch, template_get) -> None:
     """
     Classes and Methods
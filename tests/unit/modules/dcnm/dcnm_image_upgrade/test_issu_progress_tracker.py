@@ -0,0 +1,225 @@
+# Copyright (c) 2025 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# pylint: disable=unused-import
+# Some fixtures need to use *args to match the signature of the function they are mocking
+# pylint: disable=unused-argument
+# pylint: disable=protected-access
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+__copyright__ = "Copyright (c) 2025 Cisco and/or its affiliates."
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.image_upgrade.issu_progress_tracker import \
+    IssuProgressTracker
+
+from .utils import does_not_raise, issu_details_by_ip_address_fixture
+
+
+def switch(ip_address, upgrade="In-Progress", upgrade_percent=0) -> dict:
+    """
+    Return a minimal lastOperDataObject entry.
+    """
+    return {
+        "ipAddress": ip_address,
+        "imageStaged": "Success",
+        "imageStagedPercent": 100,
+        "validated": "Success",
+        "validatedPercent": 100,
+        "upgrade": upgrade,
+        "upgradePercent": upgrade_percent,
+    }
+
+
+@pytest.fixture(name="tracker")
+def tracker_fixture(issu_details_by_ip_address):
+    """
+    Return an IssuProgressTracker using SwitchIssuDetailsByIpAddress.
+    """
+    instance = IssuProgressTracker()
+    instance.issu_details = issu_details_by_ip_address
+    instance.interval = 10
+    return instance
+
+
+def test_issu_progress_tracker_00000() -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``__init__``
+
+    ### Summary
+    Verify class initialization.
+    """
+    with does_not_raise():
+        instance = IssuProgressTracker()
+
+    assert instance.class_name == "IssuProgressTracker"
+    assert instance.elapsed == 0
+    assert instance.interval == 5
+    assert instance.issu_details is None
+    assert instance.progressed is False
+    assert instance.timelines == {}
+
+
+def test_issu_progress_tracker_00100(tracker) -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``next_interval``
+
+    ### Summary
+    Verify the interval backs off while progress is stalled, is
+    shortened while progress is moving, and is capped by ``limit``.
+    """
+    assert tracker.next_interval() == 10
+    assert tracker.next_interval() == 20
+    assert tracker.next_interval() == 40
+    assert tracker.next_interval() == 40
+
+    tracker.progressed = True
+    assert tracker.next_interval() == 5
+
+    tracker.progressed = False
+    assert tracker.next_interval() == 10
+    assert tracker.next_interval(limit=3) == 3
+    assert tracker.next_interval(limit=0) == 1
+    assert tracker.elapsed == 10 + 20 + 40 + 40 + 5 + 10 + 3 + 1
+
+
+def test_issu_progress_tracker_00200(tracker) -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``update``
+            - ``timelines``
+
+    ### Summary
+    Verify timeline entries are added only when progress values change,
+    and that ``progressed`` reflects whether anything changed.
+    """
+    index = tracker.issu_details.data_subclass
+    index["10.1.1.1"] = switch("10.1.1.1")
+    index["10.1.1.2"] = switch("10.1.1.2")
+    items = {"10.1.1.1", "10.1.1.2"}
+
+    tracker.next_interval()
+    tracker.update(items)
+    assert tracker.progressed is False
+    assert len(tracker.timelines["10.1.1.1"]) == 1
+
+    tracker.next_interval()
+    tracker.update(items)
+    assert tracker.progressed is False
+    assert len(tracker.timelines["10.1.1.1"]) == 1
+
+    index["10.1.1.1"] = switch("10.1.1.1", upgrade_percent=50)
+    tracker.next_interval()
+    tracker.update(items)
+    assert tracker.progressed is True
+
+    index["10.1.1.1"] = switch("10.1.1.1", upgrade="Success", upgrade_percent=100)
+    tracker.next_interval()
+    tracker.update(items)
+
+    timeline = tracker.timelines["10.1.1.1"]
+    assert [entry["upgradePercent"] for entry in timeline] == [0, 50, 100]
+    assert [entry["elapsed"] for entry in timeline] == [10, 70, 75]
+    assert timeline[-1]["upgrade"] == "Success"
+    assert len(tracker.timelines["10.1.1.2"]) == 1
+
+
+def test_issu_progress_tracker_00210(tracker) -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``update``
+
+    ### Summary
+    Verify that only the items passed to ``update()`` are tracked, and that
+    items missing from the controller data are skipped.
+    """
+    index = tracker.issu_details.data_subclass
+    index["10.1.1.1"] = switch("10.1.1.1")
+    index["10.1.1.2"] = switch("10.1.1.2")
+
+    tracker.update({"10.1.1.1", "10.1.1.3"})
+
+    assert list(tracker.timelines) == ["10.1.1.1"]
+
+
+def test_issu_progress_tracker_00300(tracker) -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``switch``
+            - ``actions_in_progress``
+
+    ### Summary
+    Verify ``switch()`` and ``actions_in_progress()`` read the controller
+    data index, and raise ``ValueError`` for unknown items.
+    """
+    index = tracker.issu_details.data_subclass
+    index["10.1.1.1"] = switch("10.1.1.1")
+    index["10.1.1.2"] = switch("10.1.1.2", upgrade="Success", upgrade_percent=100)
+
+    assert tracker.switch("10.1.1.2")["upgrade"] == "Success"
+    assert tracker.actions_in_progress("10.1.1.1") is True
+    assert tracker.actions_in_progress("10.1.1.2") is False
+
+    match = r"IssuProgressTracker\.switch:\s+"
+    match += r"10\.1\.1\.3 does not exist on the controller\."
+    with pytest.raises(ValueError, match=match):
+        tracker.actions_in_progress("10.1.1.3")
+
+
+def test_issu_progress_tracker_00400() -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``update``
+
+    ### Summary
+    Verify ``update()`` raises ``ValueError`` if ``issu_details`` is not set.
+    """
+    instance = IssuProgressTracker()
+
+    match = r"IssuProgressTracker\.update:\s+"
+    match += r"issu_details must be set before calling update\(\)\."
+    with pytest.raises(ValueError, match=match):
+        instance.update({"10.1.1.1"})
+
+
+@pytest.mark.parametrize("value", ["10", 1.5, True, None])
+def test_issu_progress_tracker_00500(value) -> None:
+    """
+    ### Classes and Methods
+    -   ``IssuProgressTracker``
+            - ``interval.setter``
+
+    ### Summary
+    Verify ``interval`` raises ``TypeError`` if value is not an integer.
+    """
+    instance = IssuProgressTracker()
+
+    match = r"IssuProgressTracker\.interval:\s+"
+    match += r"instance\.interval must be an integer\."
+    with pytest.raises(TypeError, match=match):
+        instance.interval = value
@@ -17,8 +17,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from unittest.mock import patch
+import hashlib
+import io
+from unittest.mock import MagicMock, patch
 
+import requests
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm import dcnm
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_image_upload
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
 
@@ -87,6 +91,7 @@ class TestDcnmImageUploadModule(TestDcnmModule):
         self.mock_dcnm_get_protocol_and_address.stop()
         self.mock_dcnm_get_auth_token.stop()
         self.mock_dcnm_post_request.stop()
+        self.mock_open.stop()
 
     # -------------------------- FIXTURES --------------------------
 
@@ -373,6 +378,58 @@ class TestDcnmImageUploadModule(TestDcnmModule):
 
             self.run_dcnm_post_request.side_effect = [create_resp]
 
+        if self._testMethodName in [
+            "test_dcnm_image_upload_merged_local_stream",
+            "test_dcnm_image_upload_merged_local_checksum_mismatch",
+        ]:
+
+            create_resp = self.payloads_data.get("create_response")
+            image_list_no_images_response = self.payloads_data.get(
+                "image_list_no_images_response"
+            )
+            if "mismatch" in self._testMethodName:
+                checksum = hashlib.md5(b"other_file").hexdigest()
+            else:
+                checksum = hashlib.md5(b"dummy_file").hexdigest()
+            image_list_uploaded_response = {
+                "RETURN_CODE": 200,
+                "METHOD": "GET",
+                "MESSAGE": "OK",
+                "DATA": {
+                    "status": "SUCCESS",
+                    "lastOperDataObject": [
+                        {"imageName": "nxos.9.3.8.bin", "checksum": checksum},
+                        {"imageName": "nxos.9.3.10.bin", "checksum": checksum},
+                    ],
+                    "message": "",
+                },
+            }
+
+            def post_request_side_effect(path, hdrs, verify_flag, upload_files):
+                # Consume the streamed body as requests would
+                self.uploaded.append(b"".join(upload_files))
+                return dict(create_resp)
+
+            self.uploaded = []
+            self.run_dcnm_send.side_effect = [
+                image_list_no_images_response,
+                image_list_uploaded_response,
+            ]
+            self.run_dcnm_post_request.side_effect = post_request_side_effect
+
+        if "test_dcnm_image_upload_merged_local_retry" == self._testMethodName:
+
+            create_resp = self.payloads_data.get("create_response")
+            image_list_no_images_response = self.payloads_data.get(
+                "image_list_no_images_response"
+            )
+
+            self.run_dcnm_send.side_effect = [image_list_no_images_response]
+            self.run_dcnm_post_request.side_effect = [
+                {"RETURN_CODE": 503, "METHOD": "POST", "DATA": "Service Unavailable"},
+                dict(create_resp),
+            ]
+
     def load_fixtures(self, response=None, device=""):
 
         self.run_dcnm_version_supported.side_effect = [11]
@@ -388,7 +445,10 @@ class TestDcnmImageUploadModule(TestDcnmModule):
             {"BearerToken": "SampleTokenForUT6"},
             {"BearerToken": "SampleTokenForUT7"},
         ]
-        self.run_open.side_effect = ["dummy_file"]
+        self.run_open.side_effect = [
+            io.BytesIO(b"dummy_file"),
+            io.BytesIO(b"dummy_file"),
+        ]
 
         # Load image upload related side-effects
         self.load_image_upload_fixtures()
@@ -860,3 +920,110 @@ class TestDcnmImageUploadModule(TestDcnmModule):
             self.assertTrue(
                 "Successfully uploaded selected image file(s)." in resp["DATA"]
             )
+
+    def test_dcnm_image_upload_merged_local_stream(self):
+
+        # load the json from playbooks
+        self.payloads_data = loadPlaybookData("dcnm_image_upload_payloads")
+
+        self.playbook_config = [
+            {"path": "/images/nxos.9.3.8.bin", "source": "local"},
+            {"path": "/images/nxos.9.3.10.bin", "source": "local"},
+        ]
+
+        set_module_args(
+            dict(state="merged", files=self.playbook_config, upload_workers=2)
+        )
+        result = self.execute_module(changed=True, failed=False)
+
+        self.assertEqual(len(result["diff"][0]["merged"]), 2)
+        self.assertEqual(len(result["response"]), 2)
+
+        # Responses are in playbook order irrespective of upload_workers
+        self.assertEqual(
+            [resp["UPLOAD"]["file"] for resp in result["response"]],
+            ["/images/nxos.9.3.8.bin", "/images/nxos.9.3.10.bin"],
+        )
+        for resp in result["response"]:
+            self.assertEqual(resp["MESSAGE"], "OK")
+            self.assertEqual(resp["UPLOAD"]["size"], len(b"dummy_file"))
+            self.assertEqual(resp["UPLOAD"]["attempts"], 1)
+            self.assertEqual(
+                resp["UPLOAD"]["sha256"], hashlib.sha256(b"dummy_file").hexdigest()
+            )
+            self.assertEqual(
+                resp["UPLOAD"]["md5"], hashlib.md5(b"dummy_file").hexdigest()
+            )
+            self.assertTrue(resp["UPLOAD"]["verified"])
+
+        # Multipart body with the file contents as the only part
+        for body in self.uploaded:
+            self.assertTrue(b'name="file"; filename="nxos.9.3.' in body)
+            self.assertTrue(b"\r\n\r\ndummy_file\r\n--" in body)
+
+    def test_dcnm_image_upload_merged_local_retry(self):
+
+        # load the json from playbooks
+        self.payloads_data = loadPlaybookData("dcnm_image_upload_payloads")
+
+        self.playbook_config = [
+            {"path": "/images/nxos.9.3.8.bin", "source": "local"},
+        ]
+
+        set_module_args(dict(state="merged", files=self.playbook_config))
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.modules.dcnm_image_upload.time.sleep"
+        ) as sleep:
+            result = self.execute_module(changed=True, failed=False)
+
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(self.run_dcnm_post_request.call_count, 2)
+        self.assertEqual(len(result["response"]), 1)
+        self.assertEqual(result["response"][0]["RETURN_CODE"], 200)
+        self.assertEqual(result["response"][0]["UPLOAD"]["attempts"], 2)
+
+    def test_dcnm_image_upload_merged_local_checksum_mismatch(self):
+
+        # load the json from playbooks
+        self.payloads_data = loadPlaybookData("dcnm_image_upload_payloads")
+
+        self.playbook_config = [
+            {"path": "/images/nxos.9.3.8.bin", "source": "local"},
+        ]
+
+        set_module_args(dict(state="merged", files=self.playbook_config))
+        result = self.execute_module(changed=False, failed=True)
+
+        self.assertEqual(
+            result["msg"]["FAILURE REASON"],
+            "Checksum of uploaded image nxos.9.3.8.bin does not match the local file",
+        )
+        self.assertFalse(result["msg"]["UPLOAD"]["verified"])
+
+    def test_dcnm_image_upload_post_request_transport_error(self):
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.requests.post",
+            side_effect=requests.ConnectionError("Connection refused"),
+        ):
+            resp = dcnm.dcnm_post_request(
+                "https://10.195.225.193/upload", {}, False, {"file": b"dummy_file"}
+            )
+
+        self.assertEqual(resp["RETURN_CODE"], 503)
+        self.assertEqual(resp["DATA"], "Connection refused")
+
+    def test_dcnm_image_upload_post_request_non_json_response(self):
+
+        response = MagicMock(status_code=500, text="<html>Internal Server Error</html>")
+        response.json.side_effect = ValueError("No JSON object could be decoded")
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.requests.post",
+            return_value=response,
+        ):
+            resp = dcnm.dcnm_post_request(
+                "https://10.195.225.193/upload", {}, False, {"file": b"dummy_file"}
+            )
+
+        self.assertEqual(resp["RETURN_CODE"], 500)
+        self.assertEqual(resp["DATA"], "<html>Internal Server Error</html>")
@@ -18,7 +18,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import copy
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # from units.compat.mock import patch
 
@@ -137,6 +137,55 @@ class TestDcnmIntfModule(TestDcnmModule):
             True,
         )
 
+    def build_prefetch_intf(self):
+
+        dcnm_intf = object.__new__(dcnm_interface.DcnmIntf)
+        dcnm_intf.module = None
+        dcnm_intf.paths = dcnm_interface.DcnmIntf.dcnm_intf_paths[12]
+        dcnm_intf.prefetch_stats = {
+            "requests": 0,
+            "retries": 0,
+            "elapsed": 0.0,
+            "slowest": 0.0,
+        }
+        dcnm_intf.have_all = []
+        dcnm_intf.have_all_list = []
+        dcnm_intf.have_breakout = []
+        dcnm_intf.manageable = {}
+        dcnm_intf.intf_detail_cache = {}
+        dcnm_intf.intf_detail_cached_snos = set()
+        return dcnm_intf
+
+    def test_dcnm_intf_prefetch_ordered_with_retry(self):
+
+        attempts = {}
+
+        def dcnm_send_side_effect(module, method, path):
+            attempts[path] = attempts.get(path, 0) + 1
+            sno = path.split("serialNumber=")[1]
+            if sno == "SNO2" and attempts[path] == 1:
+                return {"RETURN_CODE": 500, "MESSAGE": "Internal Server Error"}
+            return {
+                "RETURN_CODE": 200,
+                "DATA": [{"policy": sno, "interfaces": [{"ifName": "Ethernet1/1"}]}],
+            }
+
+        self.run_dcnm_send.side_effect = dcnm_send_side_effect
+
+        dcnm_intf = self.build_prefetch_intf()
+        with patch("ansible_collections.cisco.dcnm.plugins.modules.dcnm_interface.time.sleep") as sleep:
+            dcnm_intf.dcnm_intf_bulk_fetch_intf_info_all(["SNO1~SNO4", "SNO2", "SNO3", "SNO1"])
+
+        self.assertEqual(dcnm_intf.intf_detail_cached_snos, {"SNO1", "SNO2", "SNO3"})
+        self.assertEqual(dcnm_intf.intf_detail_cache[("SNO2", "ethernet1/1")]["policy"], "SNO2")
+        sleep.assert_called_once_with(1)
+        self.assertEqual(dcnm_intf.prefetch_stats["requests"], 3)
+        self.assertEqual(dcnm_intf.prefetch_stats["retries"], 1)
+
+        # Cached serial numbers are not fetched again
+        dcnm_intf.dcnm_intf_bulk_fetch_intf_info("SNO3")
+        self.assertEqual(self.run_dcnm_send.call_count, 4)
+
     def setUp(self):
 
         super(TestDcnmIntfModule, self).setUp()
@@ -20,6 +20,7 @@ __metaclass__ = type
 from unittest.mock import patch
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_inventory
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import DcnmWaiter
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
 
 import copy
@@ -578,6 +579,44 @@ class TestDcnmInvModule(TestDcnmModule):
                 ),
             )
 
+        elif "merge_switch_wait_timeline" in self._testMethodName:
+            self.init_data()
+            normal = self.get_inventory_initial_switch_success
+            migration = copy.deepcopy(normal)
+            migration["DATA"][0]["mode"] = "Migration"
+            reloading = copy.deepcopy(normal)
+            reloading["DATA"][0]["managable"] = False
+            reloading["DATA"][0]["status"] = "unreachable"
+            self._set_send_routes(
+                self._inventory_route(
+                    [normal, normal, migration, migration, reloading, normal]
+                ),
+                self._send_route(
+                    "POST",
+                    "/inventory/discover?setAndUseDiscoveryCredForLan=true",
+                    self.import_switch_discover_success,
+                ),
+                self._send_route(
+                    "POST", "/inventory/rediscover/", self.rediscover_switch_success
+                ),
+                self._send_route(
+                    "GET",
+                    "getLanSwitchCredentials",
+                    self.get_lan_switch_cred_success,
+                ),
+                self._send_route(
+                    "POST",
+                    "saveSwitchCredentials",
+                    self.set_lan_switch_cred_success,
+                ),
+                self._send_route("PUT", "/topology/role/", self.set_assign_role_success),
+                self._fabric_id_route(self.get_fabric_id_success),
+                self._send_route("POST", "/config-save", self.config_save_switch_success),
+                self._send_route(
+                    "POST", "/config-deploy/", self.config_deploy_switch_success
+                ),
+            )
+
         elif "merge_switch" in self._testMethodName:
             self.init_data()
             self._set_send_routes(
@@ -1255,6 +1294,55 @@ class TestDcnmInvModule(TestDcnmModule):
             self.assertEqual(resp["RETURN_CODE"], 200)
             self.assertEqual(resp["MESSAGE"], "OK")
 
+    def test_dcnm_inv_merge_switch_wait_timeline_fabric(self):
+        set_module_args(
+            dict(
+                state="merged",
+                fabric="kharicha-fabric",
+                config=self.playbook_merge_switch_config,
+            )
+        )
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.sleep"
+        ) as sleep:
+            result = self.execute_module(changed=True, failed=False)
+
+        timeline = result["timeline"]["FGE19030RSA"]
+        self.assertEqual(
+            [(entry["mode"], entry["managable"]) for entry in timeline],
+            [("Normal", True), ("Migration", True), ("Normal", False), ("Normal", True)],
+        )
+        self.assertEqual(timeline[-1]["status"], "ok")
+
+        # Polls back off exponentially, followed by the config-save settle time
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        self.assertTrue(1.5 <= delays[0] <= 2)
+        self.assertTrue(3 <= delays[1] <= 4)
+        self.assertEqual(delays[2], 5)
+
+    def test_dcnm_inv_waiter_deadline(self):
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.sleep"
+        ) as sleep:
+            waiter = DcnmWaiter(60, initial=10, maximum=20, jitter=0)
+            polls = []
+            self.assertFalse(waiter.wait(lambda: polls.append(1)))
+
+        self.assertEqual(
+            [call.args[0] for call in sleep.call_args_list], [10, 20, 20, 10]
+        )
+        self.assertEqual(len(polls), 5)
+        self.assertEqual(waiter.remaining, 0)
+
+        waiter.record("SN1", {"status": "ok"})
+        waiter.record("SN1", {"status": "ok"})
+        waiter.record("SN1", {"status": "unreachable"})
+        self.assertEqual(
+            [entry["status"] for entry in waiter.timeline["SN1"]], ["ok", "unreachable"]
+        )
+
     def test_dcnm_inv_merge_role_switch_fabric(self):
         set_module_args(
             dict(
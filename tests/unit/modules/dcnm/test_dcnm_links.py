@@ -17,6 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
 from unittest.mock import patch
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_links
@@ -78,6 +79,21 @@ class TestDcnmLinksModule(TestDcnmModule):
 
     # -------------------------- FIXTURES --------------------------
 
+    def build_fabric_links_response(self, *resps):
+
+        # Response to LINKS_GET_BY_FABRIC including the links from the given
+        # LINKS_GET_BY_SWITCH_PAIR responses
+        data = []
+        for resp in resps:
+            if isinstance(resp["DATA"], list):
+                data.extend(resp["DATA"])
+            else:
+                data.append(resp["DATA"])
+
+        fabric_resp = copy.deepcopy(resps[0])
+        fabric_resp["DATA"] = copy.deepcopy(data)
+        return fabric_resp
+
     def load_links_fixtures(self):
 
         if "test_dcnm_intra_links_numbered_" in self._testMethodName:
@@ -915,6 +931,54 @@ class TestDcnmLinksModule(TestDcnmModule):
                 config_preview_resp,
             ]
 
+        if (
+            "test_dcnm_intra_links_numbered_fabric_lookup_merged_new_existing_and_non_existing"
+            == self._testMethodName
+        ):
+
+            have_links_resp = self.build_fabric_links_response(
+                self.payloads_data.get("intra_have_link1_num_fabric_response"),
+                self.payloads_data.get("intra_have_link3_num_fabric_response"),
+            )
+            merge_links_resp = self.payloads_data.get(
+                "merge_links_fabric_response"
+            )
+            deploy_resp = self.payloads_data.get("deploy_resp")
+            config_preview_resp = self.payloads_data.get("config_preview_resp")
+
+            self.run_dcnm_send.side_effect = [
+                self.mock_monitor_false_resp,
+                have_links_resp,
+                merge_links_resp,
+                deploy_resp,
+                config_preview_resp,
+            ]
+
+        if (
+            "test_dcnm_intra_links_numbered_fabric_lookup_modify_existing"
+            == self._testMethodName
+        ):
+
+            have_links_resp = self.build_fabric_links_response(
+                self.payloads_data.get("intra_have_link1_num_fabric_response"),
+                self.payloads_data.get("intra_have_link2_num_fabric_response"),
+                self.payloads_data.get("intra_have_link3_num_fabric_response"),
+            )
+            merge_links_resp = self.payloads_data.get(
+                "merge_links_fabric_response"
+            )
+            deploy_resp = self.payloads_data.get("deploy_resp")
+            config_preview_resp = self.payloads_data.get("config_preview_resp")
+
+            self.run_dcnm_send.side_effect = [
+                self.mock_monitor_false_resp,
+                have_links_resp,
+                merge_links_resp,
+                merge_links_resp,
+                deploy_resp,
+                config_preview_resp,
+            ]
+
         if (
             "test_dcnm_intra_links_numbered_modify_existing"
             == self._testMethodName
@@ -2037,6 +2101,91 @@ class TestDcnmLinksModule(TestDcnmModule):
         for resp in result["response"]:
             self.assertEqual(resp["RETURN_CODE"], 200)
 
+    def test_dcnm_intra_links_numbered_fabric_lookup_merged_new_existing_and_non_existing(
+        self
+    ):
+
+        # load the json from playbooks
+        self.config_data = loadPlaybookData("dcnm_links_configs")
+        self.payloads_data = loadPlaybookData("dcnm_links_payloads")
+
+        # load required config data
+        self.playbook_config = self.config_data.get("intra_merge_num_config")
+        self.mock_ip_sn = self.payloads_data.get("mock_ip_sn")
+        self.mock_hn_sn = self.payloads_data.get("mock_hn_sn")
+        self.mock_fab_inv = self.payloads_data.get("mock_fab_inv_data")
+        self.mock_num_fab_info = self.payloads_data.get("mock_num_fab_data")
+        self.mock_monitor_true_resp = self.payloads_data.get("mock_monitor_true_resp")
+        self.mock_monitor_false_resp = self.payloads_data.get("mock_monitor_false_resp")
+
+        set_module_args(
+            dict(
+                state="merged",
+                src_fabric="mmudigon-numbered",
+                have_lookup="fabric",
+                config=self.playbook_config,
+            )
+        )
+
+        result = self.execute_module(changed=True, failed=False)
+
+        self.assertEqual(len(result["diff"][0]["merged"]), 1)
+        self.assertEqual(len(result["diff"][0]["modified"]), 0)
+        self.assertEqual(len(result["diff"][0]["deleted"]), 0)
+        self.assertEqual(len(result["diff"][0]["query"]), 0)
+        self.assertEqual(
+            len(result["diff"][0]["deploy"][0]["mmudigon-numbered"]), 2
+        )
+
+        # A single GET for all the links of the source fabric
+        get_paths = [
+            call.args[2]
+            for call in self.run_dcnm_send.call_args_list
+            if call.args[1] == "GET"
+        ]
+        self.assertEqual(
+            [path for path in get_paths if "/control/links" in path],
+            ["/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/links/fabrics/mmudigon-numbered"],
+        )
+
+    def test_dcnm_intra_links_numbered_fabric_lookup_modify_existing(self):
+
+        # load the json from playbooks
+        self.config_data = loadPlaybookData("dcnm_links_configs")
+        self.payloads_data = loadPlaybookData("dcnm_links_payloads")
+
+        # load required config data
+        self.playbook_config = self.config_data.get("intra_modify_num_config")
+        self.mock_ip_sn = self.payloads_data.get("mock_ip_sn")
+        self.mock_hn_sn = self.payloads_data.get("mock_hn_sn")
+        self.mock_fab_inv = self.payloads_data.get("mock_fab_inv_data")
+        self.mock_num_fab_info = self.payloads_data.get("mock_num_fab_data")
+        self.mock_monitor_true_resp = self.payloads_data.get("mock_monitor_true_resp")
+        self.mock_monitor_false_resp = self.payloads_data.get("mock_monitor_false_resp")
+
+        set_module_args(
+            dict(
+                state="merged",
+                src_fabric="mmudigon-numbered",
+                have_lookup="fabric",
+                config=self.playbook_config,
+            )
+        )
+
+        result = self.execute_module(changed=True, failed=False)
+
+        self.assertEqual(len(result["diff"][0]["merged"]), 0)
+        self.assertEqual(len(result["diff"][0]["modified"]), 2)
+        self.assertEqual(len(result["diff"][0]["deleted"]), 0)
+        self.assertEqual(len(result["diff"][0]["query"]), 0)
+        self.assertEqual(
+            len(result["diff"][0]["deploy"][0]["mmudigon-numbered"]), 2
+        )
+
+        # Validate create responses
+        for resp in result["response"]:
+            self.assertEqual(resp["RETURN_CODE"], 200)
+
     def test_dcnm_intra_links_numbered_replace_existing(self):
 
         # load the json from playbooks
@@ -6614,3 +6763,34 @@ class TestDcnmLinksModule(TestDcnmModule):
         self.assertEqual(len(result["diff"][0]["deleted"]), 0)
         self.assertEqual(len(result["diff"][0]["deploy"][0]["mmudigon-numbered"]), 1)
         self.assertEqual(len(result["diff"][0]["deploy"][0]["mmudigon-dst-fab-rw"]), 1)
+
+    def test_dcnm_links_want_link_keys_unmanagable_destination(self):
+
+        links = dcnm_links.DcnmLinks.__new__(dcnm_links.DcnmLinks)
+        want = {
+            "sourceFabric": "mmudigon-numbered",
+            "sourceDevice": "9M99N34RDED",
+            "sourceInterface": "Ethernet1/1",
+            "destinationFabric": "mmudigon-dst-fab-ro",
+            "destinationDevice": "n9kv-200-mmudigon-dst-fab-ro",
+            "destinationSwitchName": "n9kv-200",
+            "destinationInterface": "Ethernet1/1",
+        }
+        key = (
+            "mmudigon-numbered",
+            "9M99N34RDED",
+            "ethernet1/1",
+            "mmudigon-dst-fab-ro",
+            "n9kv-200-mmudigon-dst-fab-ro",
+            "ethernet1/1",
+        )
+
+        # The destination device is already "<switch name>-<fabric>", so there is a single key
+        self.assertEqual(links.dcnm_links_get_want_link_keys(want), [key])
+        self.assertEqual(links.dcnm_links_get_want_link_keys(want, match_sno=False), [key])
+
+        want["destinationDevice"] = "9M99N34RDEE"
+        keys = links.dcnm_links_get_want_link_keys(want)
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0][4], "9M99N34RDEE")
+        self.assertEqual(links.dcnm_links_get_want_link_keys(want, match_sno=False), [key])
@@ -19,14 +19,28 @@ __metaclass__ = type
 
 from unittest.mock import Mock, patch
 
+from ansible.module_utils.connection import ConnectionError
+
 # from units.compat.mock import patch
 
 from ansible_collections.cisco.dcnm.plugins.action import dcnm_network as dcnm_network_action
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_network
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
+    dcnm_batch_url_items,
+    DcnmCapabilities,
+    dcnm_get_bulk_api_support,
+    dcnm_get_controller_context,
+    dcnm_get_url,
+    dcnm_version_supported,
+    get_nd_version,
+    obtain_fabric_associations,
+    run_child_fabric_tasks,
+)
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
 
 import copy
 import json
+import threading
 
 
 class TestDcnmNetworkModule(TestDcnmModule):
@@ -174,7 +188,7 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
     @staticmethod
     def _build_test_logger():
-        return type("Logger", (), {"debug": lambda *args, **kwargs: None})()
+        return type("Logger", (), {"debug": lambda *args, **kwargs: None, "isEnabledFor": lambda *args, **kwargs: True})()
 
     @staticmethod
     def _build_secondary_ip_network_template(secondary_gw1="", secondary_gw2="", secondary_gw3="", secondary_gw4=""):
@@ -380,6 +394,337 @@ class TestDcnmNetworkModule(TestDcnmModule):
         child_config = configs[1]["config"][0]
         self.assertEqual(child_config["dhcp_loopback_id"], 204)
 
+    def _child_fabric_action(self, pipelining=True):
+        action = dcnm_network_action.ActionModule.__new__(dcnm_network_action.ActionModule)
+        action.logger = Mock()
+        action._is_pipelining_enabled = Mock(return_value=pipelining)
+        return action
+
+    def _child_fabric_execute(self, failed_fabrics=()):
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0, "started": []}
+
+        def execute(child_task):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+                state["started"].append(child_task["fabric"])
+            # Later tasks finish first so completion order differs from task order
+            threading.Event().wait(child_task["delay"])
+            with lock:
+                state["running"] -= 1
+            return {"failed": child_task["fabric"] in failed_fabrics, "fabric": child_task["fabric"]}
+
+        return execute, state
+
+    def test_dcnm_net_child_fabric_tasks_parallel_order(self):
+        action = self._child_fabric_action()
+        child_tasks = [{"fabric": f"child-{idx}", "delay": 0.05 - idx * 0.01} for idx in range(4)]
+        execute, state = self._child_fabric_execute()
+
+        executed = run_child_fabric_tasks(action, child_tasks, execute, 2)
+
+        self.assertEqual([result["fabric"] for dummy, result in executed], [task["fabric"] for task in child_tasks])
+        self.assertEqual([task for task, dummy in executed], child_tasks)
+        self.assertEqual(state["max_running"], 2)
+
+    def test_dcnm_net_child_fabric_tasks_parallel_fail_fast(self):
+        action = self._child_fabric_action()
+        child_tasks = [{"fabric": "child-0", "delay": 0}]
+        child_tasks += [{"fabric": f"child-{idx}", "delay": 0.05} for idx in range(1, 6)]
+        execute, state = self._child_fabric_execute(failed_fabrics=("child-0",))
+
+        executed = run_child_fabric_tasks(action, child_tasks, execute, 2)
+
+        self.assertTrue(executed[0][1]["failed"])
+        self.assertLess(len(state["started"]), len(child_tasks))
+        self.assertEqual(len(executed), len(state["started"]))
+
+    def test_dcnm_net_child_fabric_tasks_sequential_fail_fast(self):
+        action = self._child_fabric_action()
+        child_tasks = [{"fabric": f"child-{idx}", "delay": 0} for idx in range(3)]
+        execute, state = self._child_fabric_execute(failed_fabrics=("child-1",))
+
+        executed = run_child_fabric_tasks(action, child_tasks, execute)
+
+        self.assertEqual(state["started"], ["child-0", "child-1"])
+        self.assertEqual(len(executed), 2)
+        action._is_pipelining_enabled.assert_not_called()
+
+    def test_dcnm_net_child_fabric_tasks_without_pipelining(self):
+        action = self._child_fabric_action(pipelining=False)
+        child_tasks = [{"fabric": f"child-{idx}", "delay": 0.01} for idx in range(3)]
+        execute, state = self._child_fabric_execute()
+
+        executed = run_child_fabric_tasks(action, child_tasks, execute, 4)
+
+        self.assertEqual(len(executed), 3)
+        self.assertEqual(state["max_running"], 1)
+        action.logger.warning.assert_called_once()
+
+    def test_dcnm_net_batch_url_items(self):
+        path = "/rest/top-down/fabrics/{}/networks/attachments?network-names={}"
+        names = [f"net-{idx:04d}" for idx in range(500)]
+        base_length = len(path.format("fab", ""))
+
+        batches = dcnm_batch_url_items(path, "fab", ",".join(names), max_url_length=base_length + 100)
+
+        self.assertEqual(",".join(batches).split(","), names)
+        for batch in batches:
+            self.assertLessEqual(len(path.format("fab", batch)), base_length + 100)
+        # 8 character names plus a separating comma
+        self.assertEqual(len(batches[0].split(",")), 11)
+
+    def test_dcnm_net_batch_url_items_encoded_length(self):
+        path = "/fabrics/{}/networks/attachments?network-names={}"
+        base_length = len(path.format("fab", ""))
+
+        # The names are 8 and 6 bytes long once URL encoded
+        batches = dcnm_batch_url_items(path, "fab", ["n\u00e9t", "n et"], max_url_length=base_length + 12)
+        self.assertEqual(batches, ["n\u00e9t", "n et"])
+
+        # A name that does not fit on its own is sent by itself
+        batches = dcnm_batch_url_items(path, "fab", ["a" * 50, "b", "c"], max_url_length=base_length + 10)
+        self.assertEqual(batches, ["a" * 50, "b,c"])
+
+    def test_dcnm_net_get_url_merges_batches_in_order(self):
+        path = "/fabrics/{}/networks/attachments?network-names={}"
+        names = [f"net-{idx}" for idx in range(12)]
+
+        def dcnm_send_side_effect(module, method, url):
+            batch = url.split("network-names=")[1].split(",")
+            return {"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": [{"networkName": name} for name in batch]}
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            side_effect=dcnm_send_side_effect,
+        ) as send:
+            resp = dcnm_get_url(
+                Mock(), "fab", path, ",".join(names), "networks",
+                max_url_length=len(path.format("fab", "")) + 20,
+            )
+
+        self.assertGreater(send.call_count, 1)
+        self.assertEqual([item["networkName"] for item in resp["DATA"]], names)
+        # Batches are queried one after the other, in order
+        urls = [call.args[2] for call in send.call_args_list]
+        self.assertEqual(",".join(url.split("network-names=")[1] for url in urls), ",".join(names))
+
+    def test_dcnm_net_get_url_fails_on_error(self):
+        path = "/fabrics/{}/networks/attachments?network-names={}"
+        module = Mock()
+        module.fail_json.side_effect = Exception("fail_json")
+
+        def dcnm_send_side_effect(module, method, url):
+            if "net-1" in url:
+                return {"RETURN_CODE": 500, "MESSAGE": "Internal Server Error", "DATA": []}
+            return {"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": []}
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            side_effect=dcnm_send_side_effect,
+        ):
+            with self.assertRaises(Exception):
+                dcnm_get_url(
+                    module, "fab", path, "net-0,net-1,net-2", "networks",
+                    max_url_length=len(path.format("fab", "")) + 5,
+                )
+
+        self.assertTrue("Unable to find networks" in module.fail_json.call_args.kwargs["msg"])
+
+    def controller_context_connection(self):
+        context = {}
+
+        class ControllerContextConnection:
+            def __init__(self, socket_path):
+                self.socket_path = socket_path
+
+            def get_controller_context(self):
+                return copy.deepcopy(context)
+
+            def set_controller_context(self, values):
+                context.update(copy.deepcopy(values))
+
+        return context, patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.Connection",
+            ControllerContextConnection,
+        )
+
+    def test_dcnm_net_controller_context_errors(self):
+        module = Mock(_socket_path="/tmp/dcnm-socket")
+
+        # Connections without a controller context, e.g. other httpapi plugins, have none
+        connection = Mock()
+        connection.return_value.get_controller_context.side_effect = ConnectionError("Method not found")
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.Connection",
+            connection,
+        ):
+            self.assertEqual(dcnm_get_controller_context(module), {})
+
+        # Unexpected errors are not hidden
+        connection.return_value.get_controller_context.side_effect = TypeError("unexpected")
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.Connection",
+            connection,
+        ):
+            with self.assertRaises(TypeError):
+                dcnm_get_controller_context(module)
+
+    def test_dcnm_net_controller_context_skips_probes(self):
+        context, connection = self.controller_context_connection()
+
+        def dcnm_send_side_effect(module, method, path, data=None):
+            if "bulk-update" in path:
+                return {"RETURN_CODE": 405, "MESSAGE": "Method Not Allowed"}
+            if "features" in path:
+                return {"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": {"data": {"features": {}}}}
+            return {"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": {"version": "12.2.2"}}
+
+        with connection, patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            side_effect=dcnm_send_side_effect,
+        ) as dcnm_send:
+            # Later tasks use the same persistent connection
+            for dummy in range(3):
+                module = Mock(_socket_path="/tmp/dcnm-socket")
+                self.assertEqual(dcnm_version_supported(module), 12)
+                self.assertTrue(dcnm_get_bulk_api_support(module))
+                self.assertTrue(dcnm_get_bulk_api_support(module, "vrfs"))
+
+        # The capability queries are all GETs and are sent once. The features are not
+        # queried since they are not asked for.
+        self.assertEqual(
+            [call.args[1:] for call in dcnm_send.call_args_list],
+            [
+                ("GET", "/fm/fmrest/about/version"),
+                ("GET", DcnmCapabilities.BULK_API_PATHS["bulk_network_api"]),
+                ("GET", DcnmCapabilities.BULK_API_PATHS["bulk_vrf_api"]),
+            ],
+        )
+        self.assertTrue("features" not in context["capabilities"])
+        self.assertEqual(context["version"], 12)
+        self.assertEqual(context["nd_version"], 12.2)
+        self.assertTrue(context["bulk_api"])
+        self.assertEqual(context["capabilities"]["raw_version"], "12.2.2")
+
+    def test_dcnm_net_controller_capabilities_once_per_run(self):
+        # Without a controller context the capabilities are still queried once per module run
+        module = Mock(_socket_path=None)
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            return_value={"RETURN_CODE": 200, "MESSAGE": "OK", "DATA": {"version": "12.2.2"}},
+        ) as dcnm_send:
+            for dummy in range(3):
+                self.assertEqual(dcnm_version_supported(module), 12)
+                self.assertTrue(dcnm_get_bulk_api_support(module))
+
+        self.assertEqual(
+            [call.args[2] for call in dcnm_send.call_args_list],
+            ["/fm/fmrest/about/version", DcnmCapabilities.BULK_API_PATHS["bulk_network_api"]],
+        )
+
+        # The bulk API support does not depend on the version endpoints
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            return_value={"RETURN_CODE": 405, "MESSAGE": "Method Not Allowed"},
+        ) as dcnm_send:
+            self.assertTrue(dcnm_get_bulk_api_support(Mock(_socket_path=None), "vrfs"))
+
+        self.assertEqual(
+            [call.args[2] for call in dcnm_send.call_args_list],
+            [DcnmCapabilities.BULK_API_PATHS["bulk_vrf_api"]],
+        )
+
+    def test_dcnm_net_controller_capabilities(self):
+        responses = {
+            "/fm/fmrest/about/version": {"RETURN_CODE": 404, "MESSAGE": "Not Found"},
+            "/appcenter/cisco/ndfc/api/about/version": {"RETURN_CODE": 200, "DATA": {"version": "12.4.1.245"}},
+            DcnmCapabilities.FEATURES_PATH: {
+                "RETURN_CODE": 200,
+                "DATA": {
+                    "data": {
+                        "features": {
+                            "vxlan": {"admin_state": "enabled", "oper_state": "started"},
+                            "pmn": {"admin_state": "disabled", "oper_state": ""},
+                        }
+                    }
+                },
+            },
+            DcnmCapabilities.BULK_API_PATHS["bulk_network_api"]: {"RETURN_CODE": 405},
+            DcnmCapabilities.BULK_API_PATHS["bulk_vrf_api"]: {"RETURN_CODE": 404},
+        }
+        capabilities = DcnmCapabilities.derive(responses)
+
+        self.assertEqual(capabilities["version"], 12)
+        self.assertEqual(capabilities["nd_version"], 12.4)
+        self.assertTrue(capabilities["ndfc_api"])
+        self.assertTrue(capabilities["onemanage"])
+        self.assertEqual(capabilities["onemanage_proxy"], "/onemanage")
+        self.assertTrue(capabilities["bulk_network_api"])
+        self.assertFalse(capabilities["bulk_vrf_api"])
+        self.assertTrue(capabilities["v2_api"])
+
+        module = Mock(_socket_path=None)
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            side_effect=lambda module, method, path, data=None: responses[path],
+        ) as dcnm_send:
+            queryable = DcnmCapabilities(module)
+            self.assertEqual(queryable.nd_version, 12.4)
+            self.assertTrue(queryable.supports("onemanage"))
+            # Only the version is queried until other capabilities are asked for
+            self.assertEqual(dcnm_send.call_count, 2)
+            self.assertTrue(queryable.feature_enabled("vxlan"))
+            self.assertTrue(queryable.feature_started("vxlan"))
+            self.assertFalse(queryable.feature_enabled("pmn"))
+            self.assertFalse(queryable.feature_enabled("lan"))
+            self.assertEqual(dcnm_send.call_count, 3)
+
+        # DCNM 11 has neither the NDFC APIs nor the features endpoint
+        responses = {
+            "/fm/fmrest/about/version": {"RETURN_CODE": 200, "DATA": {"version": "DEVEL"}},
+            DcnmCapabilities.BULK_API_PATHS["bulk_network_api"]: None,
+        }
+        capabilities = DcnmCapabilities.derive(responses)
+        self.assertEqual((capabilities["version"], capabilities["nd_version"]), (11, 11.0))
+        self.assertEqual(capabilities["raw_version"], "DEVEL")
+        self.assertFalse(capabilities["onemanage"])
+        self.assertFalse(capabilities["v2_api"])
+        self.assertEqual(capabilities["features"], {})
+
+        self.assertIsNone(DcnmCapabilities.derive({}))
+
+    def test_dcnm_net_controller_context_action_plugin(self):
+        context, connection = self.controller_context_connection()
+        action_module = Mock()
+        action_module._connection.socket_path = "/tmp/dcnm-socket"
+
+        def execute_module(module_name=None, module_args=None, task_vars=None, tmp=None):
+            if "/about/version" in module_args["path"]:
+                return {"failed": False, "response": {"RETURN_CODE": 200, "DATA": {"version": "12.2.2"}}}
+            return {"failed": False, "response": {"RETURN_CODE": 200, "DATA": fabrics}}
+
+        fabrics = [{"fabricName": "fab1", "fabricType": "Switch_Fabric", "fabricState": "standalone"}]
+        action_module._execute_module.side_effect = execute_module
+        action_module.error_handler.validate_api_response.side_effect = lambda response, operation: response["response"]
+
+        with connection:
+            self.assertEqual(get_nd_version(action_module, {}, None), 12.2)
+            self.assertEqual(get_nd_version(action_module, {}, None), 12.2)
+            self.assertIn("fab1", obtain_fabric_associations(action_module, {}, None, fabrics=["fab1"]))
+            self.assertIn("fab1", obtain_fabric_associations(action_module, {}, None, fabrics=["fab1"]))
+            self.assertEqual(action_module._execute_module.call_count, 2)
+
+            # Fabrics that are not in the cached associations are looked up on the controller
+            fabrics.append({"fabricName": "fab2", "fabricType": "Switch_Fabric", "fabricState": "standalone"})
+            self.assertIn("fab2", obtain_fabric_associations(action_module, {}, None, fabrics=["fab2"]))
+            self.assertEqual(action_module._execute_module.call_count, 3)
+
+        self.assertEqual(context["nd_version"], 12.2)
+        self.assertEqual(sorted(context["fabric_associations"]), ["fab1", "fab2"])
+
     def test_dcnm_net_delete_switch_config_deploy_serials_are_dynamic(self):
         dcnm_net = dcnm_network.DcnmNetwork.__new__(dcnm_network.DcnmNetwork)
         dcnm_net.diff_detach = [
@@ -1405,7 +1750,7 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
     def test_dcnm_net_merged_tor_vpc_idempotent(self):
         dcnm_net = dcnm_network.DcnmNetwork.__new__(dcnm_network.DcnmNetwork)
-        dcnm_net.log = type("Logger", (), {"debug": lambda *args, **kwargs: None})()
+        dcnm_net.log = type("Logger", (), {"debug": lambda *args, **kwargs: None, "isEnabledFor": lambda *args, **kwargs: True})()
         dcnm_net.inventory_data = copy.deepcopy(self.net_inv_data_vpc_tor)
         dcnm_net.ip_sn = copy.deepcopy(self.mock_ip_sn)
 
@@ -1468,7 +1813,7 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
     def test_dcnm_net_replace_tor_vpc_one_sided_idempotent(self):
         dcnm_net = dcnm_network.DcnmNetwork.__new__(dcnm_network.DcnmNetwork)
-        dcnm_net.log = type("Logger", (), {"debug": lambda *args, **kwargs: None})()
+        dcnm_net.log = type("Logger", (), {"debug": lambda *args, **kwargs: None, "isEnabledFor": lambda *args, **kwargs: True})()
         dcnm_net.inventory_data = copy.deepcopy(self.net_inv_data_vpc_tor)
         dcnm_net.ip_sn = copy.deepcopy(self.mock_ip_sn)
 
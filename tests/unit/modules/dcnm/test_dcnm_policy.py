@@ -17,7 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_policy
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
@@ -1784,3 +1784,92 @@ class TestDcnmPolicyModule(TestDcnmModule):
             result = self.execute_module(changed=False, failed=False)
         except Exception:
             self.assertEqual(result, None)
+
+    def build_policy(self, use_desc_as_key=False):
+
+        dcnm_pol = object.__new__(dcnm_policy.DcnmPolicy)
+        dcnm_pol.module = MagicMock(params={"state": "merged"})
+        dcnm_pol.paths = dcnm_policy.DcnmPolicy.dcnm_policy_paths[12]
+        dcnm_pol.use_desc_as_key = use_desc_as_key
+        dcnm_pol.want = []
+        dcnm_pol.have = []
+        dcnm_pol.have_index = {"policyId": {}, "description": {}, "templateName": {}}
+        return dcnm_pol
+
+    def test_dcnm_policy_get_all_policies_chunked(self):
+
+        def dcnm_send_side_effect(module, method, path):
+            snos = path.split("serialNumber=")[1].split(",")
+            return {
+                "RETURN_CODE": 200,
+                "MESSAGE": "OK",
+                "DATA": [{"serialNumber": sno} for sno in snos],
+            }
+
+        self.run_dcnm_send.side_effect = dcnm_send_side_effect
+
+        dcnm_pol = self.build_policy()
+        snos = ["SNO{0}".format(i) for i in range(120)]
+        plist = dcnm_pol.dcnm_policy_get_all_policies(",".join(snos))
+
+        self.assertEqual(self.run_dcnm_send.call_count, 3)
+        self.assertEqual([pol["serialNumber"] for pol in plist], snos)
+
+        # Switch lists that fit in a single chunk are fetched with a single request
+        self.run_dcnm_send.reset_mock()
+        plist = dcnm_pol.dcnm_policy_get_all_policies(",".join(snos[:50]))
+        self.assertEqual(self.run_dcnm_send.call_count, 1)
+        self.assertEqual(len(plist), 50)
+
+    def test_dcnm_policy_get_have_index_and_dedup(self):
+
+        def policy(policy_id, sno, template, description="", **kwargs):
+            pol = {
+                "policyId": policy_id,
+                "serialNumber": sno,
+                "templateName": template,
+                "description": description,
+                "priority": 500,
+                "source": "",
+                "deleted": False,
+                "nvPairs": {},
+            }
+            pol.update(kwargs)
+            return pol
+
+        self.run_dcnm_send.return_value = {
+            "RETURN_CODE": 200,
+            "MESSAGE": "OK",
+            "DATA": [
+                policy("POLICY-1", "SNO1", "tmpl_a", "desc_a"),
+                policy("POLICY-1", "SNO1", "tmpl_a", "desc_a"),
+                policy("POLICY-2", "SNO1", "tmpl_b", "desc_b"),
+                policy("POLICY-3", "SNO2", "tmpl_a", "desc_x", source="POLICY-1"),
+                policy("POLICY-4", "SNO2", "tmpl_a", "desc_y", deleted=True),
+                policy("POLICY-5", "SNO2", "tmpl_c", "desc_c"),
+            ],
+        }
+
+        dcnm_pol = self.build_policy(use_desc_as_key=True)
+        dcnm_pol.want = [
+            policy("POLICY-9", "SNO1", "tmpl_a", "desc_a"),
+            policy("POLICY-9", "SNO2", "tmpl_z", "desc_b"),
+        ]
+        dcnm_pol.dcnm_policy_get_have()
+
+        self.assertEqual(
+            [pol["policyId"] for pol in dcnm_pol.have], ["POLICY-1", "POLICY-2"]
+        )
+        self.assertEqual(
+            dcnm_pol.have_index["description"][("SNO1", "desc_b")], [dcnm_pol.have[1]]
+        )
+        self.assertEqual(
+            dcnm_pol.have_index["templateName"].get(("SNO2", "tmpl_a")), None
+        )
+
+        want = policy(None, "SNO1", "tmpl_a", "desc_a")
+        want.pop("policyId")
+        self.assertEqual(
+            dcnm_pol.dcnm_policy_compare_policies(want),
+            ("DCNM_POLICY_DONT_ADD", "POLICY-1"),
+        )
@@ -17,7 +17,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_service_policy
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
@@ -98,6 +98,43 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_sn1_att_status,
                 get_sn2_att_status,
+            ]
+
+        if "test_dcnm_sp_merged_new_out_of_sync" == self._testMethodName:
+
+            have_sp1_resp = []
+            have_sp2_resp = []
+            have_sp3_resp = []
+            get_snt_resp1 = self.payloads_data.get("get_snt1_response")
+            get_snt_resp2 = self.payloads_data.get("get_snt2_response")
+            create_sp1_resp = self.payloads_data.get("create_sp1_resp")
+            create_sp2_resp = self.payloads_data.get("create_sp2_resp")
+            create_sp3_resp = self.payloads_data.get("create_sp3_resp")
+            deploy_sp1_resp = self.payloads_data.get("deploy_sp1_resp")
+            deploy_sp2_sp3_resp = self.payloads_data.get("deploy_sp2_sp3_resp")
+            get_sn1_att_status = self.payloads_data.get("get_sn1_att_status")
+            get_sn2_att_status = self.payloads_data.get("get_sn2_att_status")
+            get_sn2_oos_att_status = copy.deepcopy(get_sn2_att_status)
+            for pol in get_sn2_oos_att_status["DATA"]:
+                if pol["policyName"] == "service_policy_2":
+                    pol["status"] = "Out-of-Sync"
+
+            self.run_dcnm_send.side_effect = [
+                get_snt_resp1,
+                get_snt_resp2,
+                get_snt_resp2,
+                have_sp1_resp,
+                have_sp2_resp,
+                have_sp3_resp,
+                create_sp1_resp,
+                create_sp2_resp,
+                create_sp3_resp,
+                deploy_sp1_resp,
+                deploy_sp2_sp3_resp,
+                get_sn1_att_status,
+                get_sn2_oos_att_status,
+                deploy_sp2_sp3_resp,
+                deploy_sp1_resp,
                 get_sn2_att_status,
             ]
 
@@ -219,7 +256,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_sn1_att_status,
                 get_sn2_att_status,
-                get_sn2_att_status,
             ]
 
         if "test_dcnm_sp_merge_no_deploy" == self._testMethodName:
@@ -252,7 +288,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_sn1_att_status,
                 get_sn2_att_status,
-                get_sn2_att_status,
             ]
 
             pass
@@ -309,7 +344,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 create_sp3_resp,
                 deploy_sp2_sp3_resp,
                 get_sn2_att_status,
-                get_sn2_att_status,
             ]
 
             pass
@@ -342,7 +376,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -371,7 +404,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -405,7 +437,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -468,7 +499,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -504,7 +534,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -536,7 +565,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 resp_unauth_err,
                 delete_sp1_resp,
                 delete_sp2_resp,
@@ -561,7 +589,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 det_sp2_sp3_resp,
                 deploy_sp2_sp3_resp,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp2_resp,
                 delete_sp3_resp,
             ]
@@ -605,7 +632,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_sn1_att_status,
                 get_sn2_att_status,
-                get_sn2_att_status,
             ]
 
         if "test_dcnm_sp_replace_sp1_to_sp3_existing" == self._testMethodName:
@@ -642,7 +668,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_sn1_att_status,
                 get_sn2_att_status,
-                get_sn2_att_status,
             ]
 
         if "test_dcnm_sp_replace_sp1_to_sp3_existing_no_change" == self._testMethodName:
@@ -695,7 +720,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 det_sp2_sp3_resp,
                 deploy_sp2_sp3_resp,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp2_resp,
                 delete_sp3_resp,
                 deploy_sp1_resp,
@@ -729,7 +753,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 det_sp2_sp3_resp,
                 deploy_sp2_sp3_resp,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp2_resp,
                 delete_sp3_resp,
             ]
@@ -767,7 +790,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 det_sp2_sp3_resp,
                 deploy_sp2_sp3_resp,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp2_resp,
                 delete_sp3_resp,
                 deploy_sp1_resp,
@@ -799,7 +821,6 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
                 deploy_sp2_sp3_resp,
                 get_dd_sn1_att_status,
                 get_dd_sn2_att_status,
-                get_dd_sn2_att_status,
                 delete_sp1_resp,
                 delete_sp2_resp,
                 delete_sp3_resp,
@@ -877,6 +898,75 @@ class TestDcnmServicePolicyModule(TestDcnmModule):
         for resp in result["response"]:
             self.assertEqual(resp["RETURN_CODE"], 200)
 
+    def test_dcnm_sp_merged_new_out_of_sync(self):
+
+        # load the json from playbooks
+        self.config_data = loadPlaybookData("dcnm_service_policy_configs")
+        self.payloads_data = loadPlaybookData("dcnm_service_policy_payloads")
+
+        # load required config data
+        self.playbook_config = self.config_data.get("create_sp1_sp3_config")
+
+        set_module_args(
+            dict(
+                state="merged",
+                attach=True,
+                deploy=True,
+                fabric="mmudigon",
+                service_fabric="external",
+                config=self.playbook_config,
+            )
+        )
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.sleep"
+        ) as sleep:
+            result = self.execute_module(changed=True, failed=False)
+
+        # The status of all policies on a service node is fetched once per round. The out-of-sync policy is
+        # deployed again and the configuration saved and deployed once before the next round.
+        calls = [(call.args[1], call.args[2]) for call in self.run_dcnm_send.call_args_list]
+        status_calls = [path for method, path in calls[11:] if "/policies/" in path and method == "GET"]
+        self.assertEqual(len(status_calls), 3)
+        self.assertEqual(len([path for method, path in calls if path.endswith("/config-deploy")]), 1)
+        # One adaptive wait between the two rounds, the other sleeps follow the deploy requests
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len([delay for delay in delays if delay < 10]), 1)
+
+        converge = dict(
+            (item["PolicyName"], item["ConvergeTime"])
+            for item in result["diff"][0]["debugs"]
+            if "ConvergeTime" in item
+        )
+        self.assertEqual(sorted(converge), ["service_policy_1", "service_policy_2", "service_policy_3"])
+        self.assertTrue(converge["service_policy_2"] >= converge["service_policy_1"])
+
+    def test_dcnm_sp_check_deployment_status_delete_cutoff(self):
+
+        # A policy whose status stays "success" after detach and deploy is treated as deleted once polling has
+        # gone on for 5 minutes
+        dcnm_sp = object.__new__(dcnm_service_policy.DcnmServicePolicy)
+        dcnm_sp.module = MagicMock()
+        dcnm_sp.changed_dict = [{"debugs": []}]
+        dcnm_sp.dcnm_sp_get_deployment_status_key = MagicMock(return_value="sn1")
+        dcnm_sp.dcnm_sp_get_deployment_status_from_dcnm = MagicMock()
+        dcnm_sp.dcnm_sp_get_sp_deployment_status = MagicMock(return_value=(None, None, None, "success"))
+        dcnm_sp.dcnm_sp_redeploy_sp = MagicMock()
+        dcnm_sp.dcnm_sp_config_save_and_deploy = MagicMock()
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.sleep"
+        ) as sleep:
+            dcnm_sp.dcnm_sp_check_deployment_status([{"policyName": "service_policy_1"}], "na")
+
+        slept = sum(call.args[0] for call in sleep.call_args_list)
+        self.assertTrue(300 <= slept < 330)
+        dcnm_sp.module.fail_json.assert_not_called()
+        self.assertEqual(dcnm_sp.changed_dict[0]["debugs"][0]["State"], "na")
+        self.assertTrue(dcnm_sp.changed_dict[0]["debugs"][0]["ConvergeTime"] >= 300)
+        # The policy is deployed again after each round before the cutoff
+        self.assertEqual(dcnm_sp.dcnm_sp_redeploy_sp.call_count, len(sleep.call_args_list))
+        dcnm_sp.dcnm_sp_config_save_and_deploy.assert_not_called()
+
     def test_dcnm_sp_merged_new_no_opt_elems(self):
 
         # load the json from playbooks
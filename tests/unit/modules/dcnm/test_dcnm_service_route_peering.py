@@ -17,7 +17,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import DcnmWaiter
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_service_route_peering
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
@@ -1346,6 +1348,60 @@ class TestDcnmServiceRoutePeeringModule(TestDcnmModule):
         for resp in result["response"]:
             self.assertEqual(resp["RETURN_CODE"], 200)
 
+    def test_dcnm_srp_check_deployment_status_recover(self):
+
+        # SRP1 stays pending until 650 seconds have elapsed. SRP2 stays in "na" until it is attached again.
+        # The configuration is saved and deployed, and SRP2 attached again, at most every 5 minutes.
+        clock = [0]
+        recover = []
+        srp1 = {"fabricName": "f1", "serviceNodeName": "sn1", "attachedFabricName": "f2", "peeringName": "rp1", "enabled": True}
+        srp2 = dict(srp1, peeringName="rp2")
+
+        def srp_status(srp, have, chk_deployed, redeploy=True):
+            if srp is srp1:
+                return (None, None, None, "deployed" if clock[0] >= 650 else "pending")
+            return (None, None, None, "deployed" if ("attach", srp2) in recover else "na")
+
+        dcnm_srp = object.__new__(dcnm_service_route_peering.DcnmServiceRoutePeering)
+        dcnm_srp.module = MagicMock()
+        dcnm_srp.changed_dict = [{"debugs": []}]
+        dcnm_srp.dcnm_srp_get_srp_deployment_status = MagicMock(side_effect=srp_status)
+        dcnm_srp.dcnm_srp_redeploy_srp = MagicMock()
+        dcnm_srp.dcnm_srp_config_save_and_deploy = MagicMock(side_effect=lambda: recover.append(("save", clock[0])))
+        dcnm_srp.dcnm_srp_attach_and_deploy_srp = MagicMock(side_effect=lambda srp: recover.append(("attach", srp)))
+
+        def sleep(delay):
+            clock[0] += delay
+
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.sleep",
+            side_effect=sleep,
+        ):
+            dcnm_srp.dcnm_srp_check_deployment_status([srp1, srp2], "deployed")
+
+        dcnm_srp.module.fail_json.assert_not_called()
+        saves = [elapsed for action, elapsed in recover if action == "save"]
+        self.assertEqual(len(saves), 2)
+        self.assertTrue(300 <= saves[0] < 330)
+        self.assertTrue(600 <= saves[1] < 630)
+        self.assertEqual([srp for action, srp in recover if action == "attach"], [srp2])
+        self.assertEqual(recover[1], ("attach", srp2))
+        self.assertEqual(
+            dict((item["PeeringName"], item["State"]) for item in dcnm_srp.changed_dict[0]["debugs"]),
+            {"rp1": "deployed", "rp2": "deployed"},
+        )
+
+    def test_dcnm_srp_waiter_due(self):
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.time.monotonic",
+            side_effect=[0, 100, 310, 320, 650, 660],
+        ):
+            waiter = DcnmWaiter(900)
+            due = [waiter.due("srp_recover", 300) for dummy in range(5)]
+
+        # Due once per 300 seconds elapsed, whatever the number of calls in between
+        self.assertEqual(due, [False, True, False, True, False])
+
     def test_dcnm_srp_merged_new_no_opt_elems(self):
 
         # load the json from playbooks
@@ -26,6 +26,7 @@ from ansible_collections.ansible.netcommon.tests.unit.modules.utils import (
     AnsibleFailJson,
 )
 
+import copy
 import pytest
 
 
@@ -129,7 +130,7 @@ class TestDcnmTemplateModule(TestDcnmModule):
                 self.create_inuse_resp,
             ]
 
-        if "_template_merged_existing" in self._testMethodName:
+        if self._testMethodName.endswith("_template_merged_existing"):
 
             # Templates exist
 
@@ -261,7 +262,7 @@ class TestDcnmTemplateModule(TestDcnmModule):
 
         if "_template_replace_one_existing" in self._testMethodName:
 
-            # Templates exist
+            # Templates exist. Only the changed template is validated
 
             template1 = self.payloads_data.get("template_101_have_resp")
             template2 = self.payloads_data.get("template_102_have_resp")
@@ -274,6 +275,24 @@ class TestDcnmTemplateModule(TestDcnmModule):
                 template3,
                 template4,
                 self.validate_resp,
+                self.create_succ_resp,
+            ]
+
+        if "_template_merged_existing_bulk_fetch" in self._testMethodName:
+
+            # Templates exist. template_104 is not in the template list and is fetched by name
+
+            template1 = self.payloads_data.get("template_101_have_resp")
+            template2 = self.payloads_data.get("template_102_have_resp")
+            template3 = self.payloads_data.get("template_103_have_resp")
+            template4 = self.payloads_data.get("template_104_have_resp")
+            templates = copy.deepcopy(template1)
+            templates["DATA"] = [template1["DATA"], template2["DATA"], template3["DATA"]]
+
+            self.run_dcnm_send.side_effect = [
+                templates,
+                template4,
+                self.validate_resp,
                 self.validate_resp,
                 self.validate_resp,
                 self.validate_resp,
@@ -448,6 +467,36 @@ class TestDcnmTemplateModule(TestDcnmModule):
         for r in result["response"]:
             self.assertEqual(("Template Created" in r["DATA"]["status"]), True)
 
+    def test_dcnm_template_merged_existing_bulk_fetch(self):
+
+        # load the json from playbooks
+        self.config_data = loadPlaybookData("dcnm_template_configs")
+        self.payloads_data = loadPlaybookData("dcnm_template_payloads")
+
+        # load required config data
+        self.playbook_config = self.config_data.get("template_merge_existing_config")
+        self.validate_resp = self.payloads_data.get("template_validate_resp")
+        self.create_succ_resp = self.payloads_data.get("template_create_succ_resp")
+
+        set_module_args(
+            dict(
+                state="merged",
+                bulk_fetch=True,
+                config=self.playbook_config,
+            )
+        )
+        result = self.execute_module(changed=True, failed=False)
+
+        self.assertEqual(len(result["diff"][0]["merged"]), 4)
+        for r in result["response"]:
+            self.assertEqual(("Template Created" in r["DATA"]["status"]), True)
+
+        paths = [call.args[2] for call in self.run_dcnm_send.call_args_list]
+        self.assertEqual(paths[0], "/rest/config/templates")
+        self.assertEqual(paths[1], "/rest/config/templates/template_104")
+        self.assertEqual(paths[2:6], ["/rest/config/templates/validate"] * 4)
+        self.assertEqual(self.run_dcnm_send.call_count, 10)
+
     def test_dcnm_template_delete_existing(self):
 
         # load the json from playbooks
@@ -569,6 +618,8 @@ class TestDcnmTemplateModule(TestDcnmModule):
         for r in result["response"]:
             self.assertEqual(("Template Created" in r["DATA"]["status"]), True)
 
+        self.assertEqual(self.run_dcnm_send.call_count, 6)
+
         r = result["diff"][0]["merged"]
 
         self.assertEqual(("Template_101 being replaced" in r[0]["content"]), True)
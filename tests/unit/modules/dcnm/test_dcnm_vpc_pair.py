@@ -2113,6 +2113,10 @@ class TestDcnmVpcPairModule(TestDcnmModule):
         super(TestDcnmVpcPairModule, self).setUp()
         self.monkeypatch = MonkeyPatch()
 
+    def tearDown(self):
+        super(TestDcnmVpcPairModule, self).tearDown()
+        self.monkeypatch.undo()
+
     def test_dcnm_vpc_pair_merged_new(self):
 
         data = load_data("dcnm_vpc_pair_data")
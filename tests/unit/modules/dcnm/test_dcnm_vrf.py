@@ -967,6 +967,16 @@ class TestDcnmVrfModule(TestDcnmModule):
         self.assertEqual(result["response"][2]["DATA"]["status"], "")
         self.assertEqual(result["response"][2]["RETURN_CODE"], self.SUCCESS_RETURN_CODE)
 
+    def test_dcnm_vrf_merged_new_caller_logged(self):
+        # The methods called from main() log main() as their caller
+        playbook = self.test_data.get("playbook_config")
+        set_module_args(dict(state="merged", fabric="standalone_fabric", config=playbook))
+        with self.assertLogs("dcnm.DcnmVrf", level="DEBUG") as logs:
+            self.execute_module(changed=True, failed=False, use_action_plugin=True)
+        callers = [line for line in logs.output if "ENTERED" in line and "caller: " in line]
+        self.assertTrue(any("caller: main." in line for line in callers), callers)
+        self.assertFalse(any("caller: wrapper." in line for line in callers), callers)
+
     def test_dcnm_vrf_merged_lite_new_interface_with_extensions(self):
         playbook = self.test_data.get(
             "playbook_vrf_merged_lite_new_interface_with_extensions"
@@ -30,6 +30,7 @@ __author__ = "Mike Wiebe"
 
 import json
 import io
+import time
 from unittest.mock import Mock, MagicMock, patch
 
 import pytest
@@ -100,7 +101,7 @@ class TestHttpApiTokenMethods:
 class TestHttpApiConnectionMethods:
     """Test URL connection methods."""
 
-    @patch("requests.head")
+    @patch("requests.Session.head")
     def test_check_url_connection_success(self, mock_head, mock_connection):
         """Test successful URL connection check."""
         mock_head.return_value = Mock()
@@ -111,8 +112,10 @@ class TestHttpApiConnectionMethods:
         # Should not raise exception
         http_api.check_url_connection()
         mock_head.assert_called_once_with("https://test.nd.com", verify=False)
+        assert http_api.get_url_probe_stats() == {"performed": 1, "skipped": 0, "failed": 0}
+        assert http_api.url_verified_time is not None
 
-    @patch("requests.head", side_effect=requests.exceptions.RequestException("Connection failed"))
+    @patch("requests.Session.head", side_effect=requests.exceptions.RequestException("Connection failed"))
     def test_check_url_connection_failure(self, mock_head, mock_connection):
         """Test URL connection check failure."""
         http_api = HttpApi(mock_connection)
@@ -124,6 +127,21 @@ class TestHttpApiConnectionMethods:
 
         assert "Connection failed" in str(exc_info.value)
         assert "Please verify that the DCNM controller HTTPS URL" in str(exc_info.value)
+        assert http_api.get_url_probe_stats() == {"performed": 1, "skipped": 0, "failed": 1}
+        assert http_api.url_verified_time is None
+
+    @patch("requests.Session.head")
+    def test_check_url_connection_reuses_session(self, mock_head, mock_connection):
+        """Test that URL probes share a single keep-alive session."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+
+        http_api.check_url_connection()
+        session = http_api.url_probe_session
+        http_api.check_url_connection()
+
+        assert http_api.url_probe_session is session
+        assert mock_head.call_count == 2
 
     def test_get_url_connection(self, mock_connection):
         """Test getting URL connection."""
@@ -276,6 +294,24 @@ class TestHttpApiVerifyResponse:
 
         result = http_api._verify_response(mock_response, "GET", "/api/test", mock_rdata)
         assert result["RETURN_CODE"] == 599
+        assert "RETRY_AFTER" not in result
+
+    def test_verify_response_retry_after(self, mock_connection):
+        """Test the Retry-After header is returned as RETRY_AFTER."""
+        http_api = HttpApi(mock_connection)
+
+        mock_response = Mock()
+        mock_response.getcode.return_value = 503
+        mock_response.geturl.return_value = "/api/test"
+        mock_response.msg = "Service Unavailable"
+        mock_response.headers = {"Retry-After": "7"}
+
+        mock_rdata = Mock()
+        mock_rdata.getvalue.return_value = b""
+
+        result = http_api._verify_response(mock_response, "GET", "/api/test", mock_rdata)
+        assert result["RETURN_CODE"] == 503
+        assert result["RETRY_AFTER"] == "7"
 
 
 class TestHttpApiAttemptLogin:
@@ -456,6 +492,98 @@ class TestHttpApiLogin:
             assert "custom-domain" in ndfc_call["data"]
 
 
+class TestHttpApiTokenLifecycle:
+    """Test login method memory and proactive token refresh."""
+
+    @staticmethod
+    def options(**kwargs):
+        values = {"host": "10.1.1.1", "port": 443, "remote_user": "admin", "password": "secret", "persistent_connect_timeout": 30}
+        values.update(kwargs)
+        return lambda option: values.get(option)
+
+    @patch.object(HttpApi, "get_option")
+    def test_login_method_remembered(self, mock_get_option, mock_connection, tmp_path):
+        """The login method that succeeded is tried first, also by a new connection."""
+        mock_get_option.return_value = "local"
+        mock_connection.get_option.side_effect = self.options()
+        methods_path = str(tmp_path / "dcnm_login_methods.json")
+
+        with patch.object(HttpApi, "_login_methods_path", return_value=methods_path):
+            http_api = HttpApi(mock_connection)
+            with patch.object(http_api, "_attempt_login", side_effect=[False, False, True, True]) as mock_attempt:
+                http_api.login("admin", "secret")
+                http_api.login("admin", "secret")
+            types = [call[0][0]["controller_type"] for call in mock_attempt.call_args_list]
+            assert types == ["NDFC", "NDFC_Legacy", "DCNM", "DCNM"]
+
+            with open(methods_path) as methods_file:
+                assert list(json.load(methods_file).values()) == ["DCNM"]
+
+            new_connection = HttpApi(mock_connection)
+            with patch.object(new_connection, "_attempt_login", return_value=True) as mock_attempt:
+                new_connection.login("admin", "secret")
+            assert mock_attempt.call_args[0][0]["controller_type"] == "DCNM"
+            assert new_connection.get_token_stats()["login_method"] == "DCNM"
+
+    def test_dcnm_token_lifetime(self, mock_connection):
+        """DCNM tokens expire after persistent_connect_timeout."""
+        mock_connection.get_option.side_effect = self.options()
+        http_api = HttpApi(mock_connection)
+        http_api.login_fail_msg = []
+
+        mock_response = Mock()
+        mock_response.getcode.return_value = 200
+        mock_response.geturl.return_value = "/rest/logon"
+        mock_response.msg = "OK"
+        mock_response_data = Mock()
+        mock_response_data.getvalue.return_value = b'{"Dcnm-Token": "test-token"}'
+        mock_connection.send.return_value = (mock_response, mock_response_data)
+
+        login_config = {"controller_type": "DCNM", "version": 11, "path": "/rest/logon", "data": "{}", "force_basic_auth": True, "lifetime": 30}
+        assert http_api._attempt_login(login_config) is True
+        assert 29 <= http_api.get_token_stats()["expires_in"] <= 30
+
+    def test_token_refreshed_before_request(self, mock_connection):
+        """A token about to expire is refreshed before the next request and before it is handed out."""
+        mock_connection.get_option.side_effect = self.options()
+        mock_connection._auth = {"Authorization": "Bearer old"}
+        http_api = HttpApi(mock_connection)
+        http_api.url_verified_time = time.monotonic()
+        http_api.token = {"Authorization": "Bearer old"}
+        http_api.auth_token.set("old", lifetime=600, now=time.time() - 590)
+
+        def login(username, password):
+            http_api.auth_token.set("new", lifetime=600)
+            http_api.token = {"Authorization": "Bearer new"}
+
+        mock_response = Mock()
+        mock_response.getcode.return_value = 200
+        mock_response.geturl.return_value = "/api/test"
+        mock_response.msg = "OK"
+        mock_rdata = Mock()
+        mock_rdata.getvalue.return_value = b"{}"
+        mock_connection.send.return_value = (mock_response, mock_rdata)
+
+        with patch.object(http_api, "login", side_effect=login) as mock_login:
+            http_api.send_request("GET", "/api/test")
+            assert mock_login.call_args[0] == ("admin", "secret")
+            http_api.send_request("GET", "/api/test")
+            assert http_api.get_token() == {"Authorization": "Bearer new"}
+        assert mock_login.call_count == 1
+        assert http_api.get_token_stats()["refreshes"] == 1
+
+    def test_token_refresh_disabled(self, mock_connection):
+        """token_refresh_margin 0 disables the proactive refresh."""
+        mock_connection._auth = {"Authorization": "Bearer old"}
+        http_api = HttpApi(mock_connection)
+        http_api.token = {"Authorization": "Bearer old"}
+        http_api.auth_token.set("old", lifetime=600, now=time.time() - 599)
+
+        with patch.object(http_api, "get_option", return_value=0), patch.object(http_api, "login") as mock_login:
+            assert http_api.get_token() == {"Authorization": "Bearer old"}
+        mock_login.assert_not_called()
+
+
 class TestHttpApiAttemptLogout:
     """Test attempt logout method."""
 
@@ -680,6 +808,345 @@ class TestHttpApiSendRequestInternal:
         assert call_args[1]["headers"] == custom_headers
 
 
+class TestHttpApiUrlProbe:
+    """Test that the controller URL is probed only when needed."""
+
+    @staticmethod
+    def _send_success(http_api):
+        mock_response = Mock()
+        mock_response.getcode.return_value = 200
+        mock_response.geturl.return_value = "/api/test"
+        mock_response.msg = "OK"
+
+        mock_rdata = Mock()
+        mock_rdata.getvalue.return_value = b'{"result": "success"}'
+
+        http_api.connection.send.return_value = (mock_response, mock_rdata)
+
+    @patch("requests.Session.head")
+    def test_url_probe_once_per_connection(self, mock_head, mock_connection):
+        """Test that the URL is probed on the first request only."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+        self._send_success(http_api)
+
+        for idx in range(10):
+            http_api._send_request_internal("GET", "/api/test/{0}".format(idx))
+
+        mock_head.assert_called_once()
+        assert http_api.get_url_probe_stats() == {"performed": 1, "skipped": 9, "failed": 0}
+
+    @patch("requests.Session.head")
+    def test_url_probe_after_transport_failure(self, mock_head, mock_connection):
+        """Test that a transport failure triggers a probe on the next request."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+        self._send_success(http_api)
+        http_api._send_request_internal("GET", "/api/test")
+
+        success = http_api.connection.send.return_value
+        http_api.connection.send.return_value = None
+        http_api.connection.send.side_effect = Exception("Connection reset")
+        with pytest.raises(ConnectionError):
+            http_api._send_request_internal("GET", "/api/test")
+        assert http_api.url_verified_time is None
+
+        http_api.connection.send.side_effect = None
+        http_api.connection.send.return_value = success
+        http_api._send_request_internal("GET", "/api/test")
+
+        assert mock_head.call_count == 2
+        assert http_api.get_url_probe_stats() == {"performed": 2, "skipped": 1, "failed": 0}
+
+    @patch("requests.Session.head")
+    def test_url_probe_not_triggered_by_http_error(self, mock_head, mock_connection):
+        """Test that an HTTP error response does not trigger another probe."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+        http_api.connection.send.side_effect = Exception({"METHOD": "GET", "RETURN_CODE": 404})
+
+        http_api._send_request_internal("GET", "/api/test")
+        http_api._send_request_internal("GET", "/api/test")
+
+        mock_head.assert_called_once()
+
+    @patch("requests.Session.head")
+    def test_url_probe_ttl_expired(self, mock_head, mock_connection):
+        """Test that the URL is probed again once url_probe_ttl expires."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+        self._send_success(http_api)
+
+        with patch.object(HttpApi, "get_option", return_value=0):
+            http_api._send_request_internal("GET", "/api/test")
+            http_api._send_request_internal("GET", "/api/test")
+
+        assert mock_head.call_count == 2
+        assert http_api.get_url_probe_stats() == {"performed": 2, "skipped": 0, "failed": 0}
+
+    @patch("requests.Session.head", side_effect=requests.exceptions.RequestException("Connection refused"))
+    def test_url_probe_failure_probes_again(self, mock_head, mock_connection):
+        """Test that a failed probe is repeated on the next request."""
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                http_api._send_request_internal("GET", "/api/test")
+
+        http_api.connection.send.assert_not_called()
+        assert http_api.get_url_probe_stats() == {"performed": 2, "skipped": 0, "failed": 2}
+
+
+class TestHttpApiResponseCache:
+    """Test the GET response cache."""
+
+    @staticmethod
+    def _http_api(mock_connection, options):
+        http_api = HttpApi(mock_connection)
+        http_api.connection = mock_connection
+        http_api.connection.get_option.return_value = "admin"
+        http_api.url_verified_time = time.monotonic()
+
+        mock_response = Mock()
+        mock_response.getcode.return_value = 200
+        mock_response.geturl.return_value = "/api/test"
+        mock_response.msg = "OK"
+
+        mock_rdata = Mock()
+        mock_rdata.getvalue.return_value = b'{"result": "success"}'
+
+        http_api.connection.send.return_value = (mock_response, mock_rdata)
+
+        def get_option(option):
+            if option in options:
+                return options[option]
+            raise KeyError(option)
+
+        return http_api, patch.object(HttpApi, "get_option", side_effect=get_option)
+
+    def test_response_cache_disabled_by_default(self, mock_connection):
+        """Test that GET responses are not cached unless enabled."""
+        http_api, options = self._http_api(mock_connection, {})
+        path = "/appcenter/cisco/ndfc/api/about/version"
+
+        with options:
+            http_api._send_request_internal("GET", path)
+            http_api._send_request_internal("GET", path)
+
+            assert http_api.connection.send.call_count == 2
+            assert http_api.get_response_cache_stats() is None
+
+    def test_response_cache_hit(self, mock_connection):
+        """Test that a cacheable GET is sent to the controller once."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/f1"
+
+        with options:
+            first = http_api._send_request_internal("GET", path)
+            first["DATA"]["result"] = "modified"
+            second = http_api._send_request_internal("GET", path)
+
+            assert http_api.connection.send.call_count == 1
+            assert second["DATA"] == {"result": "success"}
+            assert http_api.get_response_cache_stats() == {"hits": 1, "misses": 1, "invalidations": 0, "entries": 1}
+
+    def test_response_cache_path_not_cacheable(self, mock_connection):
+        """Test that GETs of other paths are not cached unless requested."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/f1/inventory/switchesByFabric"
+
+        with options:
+            http_api._send_request_internal("GET", path)
+            http_api._send_request_internal("GET", path)
+            assert http_api.connection.send.call_count == 2
+
+            http_api._send_request_internal("GET", path, cacheable=True)
+            http_api._send_request_internal("GET", path, cacheable=True)
+            assert http_api.connection.send.call_count == 3
+
+    def test_response_cache_ttl_expired(self, mock_connection):
+        """Test that cached responses expire after response_cache_ttl."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True, "response_cache_ttl": 0})
+        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/f1"
+
+        with options:
+            http_api._send_request_internal("GET", path)
+            http_api._send_request_internal("GET", path)
+
+            assert http_api.connection.send.call_count == 2
+
+    def test_response_cache_error_not_cached(self, mock_connection):
+        """Test that unsuccessful responses are not cached."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        http_api.connection.send.return_value[0].getcode.return_value = 404
+        path = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/f1"
+
+        with options:
+            http_api._send_request_internal("GET", path)
+            http_api._send_request_internal("GET", path)
+
+            assert http_api.connection.send.call_count == 2
+
+    def test_response_cache_invalidate_fabric(self, mock_connection):
+        """Test that a non-GET for a fabric discards only that fabric's responses."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        base = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/"
+
+        with options:
+            http_api._send_request_internal("GET", base + "f1")
+            http_api._send_request_internal("GET", base + "f2")
+            http_api._send_request_internal("POST", base + "f1/config-deploy")
+            http_api._send_request_internal("GET", base + "f1")
+            http_api._send_request_internal("GET", base + "f2")
+
+            assert http_api.connection.send.call_count == 4
+            assert http_api.get_response_cache_stats() == {"hits": 1, "misses": 3, "invalidations": 1, "entries": 2}
+
+    def test_response_cache_invalidate_all(self, mock_connection):
+        """Test that a non-GET not for a fabric discards all cached responses."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        base = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/"
+
+        with options:
+            http_api._send_request_internal("GET", base + "f1")
+            http_api._send_request_internal("GET", base + "f2")
+            http_api._send_request_internal("POST", "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/switches/roles")
+
+            assert http_api.get_response_cache_stats()["entries"] == 0
+            assert http_api.get_response_cache_stats()["invalidations"] == 2
+
+    def test_response_cache_keyed_by_user(self, mock_connection):
+        """Test that cached responses are not shared between users."""
+        http_api, options = self._http_api(mock_connection, {"response_cache": True})
+        path = "/appcenter/cisco/ndfc/api/about/version"
+
+        with options:
+            http_api._send_request_internal("GET", path)
+            http_api.connection.get_option.return_value = "operator"
+            http_api._send_request_internal("GET", path)
+
+            assert http_api.connection.send.call_count == 2
+
+    def test_send_cacheable_request(self, mock_connection):
+        """Test send_cacheable_request method."""
+        http_api = HttpApi(mock_connection)
+
+        with patch.object(http_api, "_send_request_internal") as mock_internal:
+            http_api.send_cacheable_request("GET", "/api/test")
+
+            mock_internal.assert_called_once_with("GET", "/api/test", {}, http_api.headers, cacheable=True)
+
+
+class TestHttpApiControllerContext:
+    """Test the controller context shared by the tasks of a persistent connection."""
+
+    def test_controller_context_merge(self, mock_connection):
+        """Test that fabric details are merged by fabric name and other keys are replaced."""
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 3600})
+
+        with options:
+            assert http_api.get_controller_context() == {}
+            http_api.set_controller_context({"version": 12, "fabrics": {"f1": {"id": 1}}})
+            http_api.set_controller_context({"bulk_api": True, "fabrics": {"f2": {"id": 2}}})
+
+            context = http_api.get_controller_context()
+            context["fabrics"]["f1"]["id"] = 10
+
+            assert http_api.get_controller_context() == {
+                "version": 12,
+                "bulk_api": True,
+                "fabrics": {"f1": {"id": 1}, "f2": {"id": 2}},
+            }
+
+    def test_controller_context_ttl(self, mock_connection):
+        """Test that the controller context is disabled by default, expires and can be disabled."""
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {})
+
+        with options:
+            http_api.set_controller_context({"version": 12})
+            assert http_api.get_controller_context() == {}
+
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 0})
+
+        with options:
+            http_api.set_controller_context({"version": 12})
+            assert http_api.get_controller_context() == {}
+
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 10})
+
+        with options:
+            http_api.set_controller_context({"version": 12})
+            key = list(http_api.controller_context)[0]
+            http_api.controller_context[key]["created"] -= 10
+            assert http_api.get_controller_context() == {}
+
+    def test_controller_context_keyed_by_user(self, mock_connection):
+        """Test that the controller context is not shared between users."""
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 3600})
+
+        with options:
+            http_api.set_controller_context({"version": 12})
+            http_api.connection.get_option.return_value = "operator"
+            assert http_api.get_controller_context() == {}
+
+    def test_controller_context_invalidate(self, mock_connection):
+        """Test that non-GET requests discard the fabric details and associations they may change."""
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 3600})
+        base = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/"
+        context = {
+            "version": 12,
+            "fabrics": {"f1": {"id": 1}, "f2": {"id": 2}},
+            "fabric_associations": {"f1": {}},
+        }
+
+        with options:
+            http_api.set_controller_context(context)
+            http_api._send_request_internal("GET", base + "f1")
+            http_api._send_request_internal("POST", base + "f1/config-deploy")
+            assert http_api.get_controller_context() == {
+                "version": 12,
+                "fabrics": {"f2": {"id": 2}},
+                "fabric_associations": {"f1": {}},
+            }
+
+            http_api._send_request_internal("POST", base + "msdAdd")
+            assert "fabric_associations" not in http_api.get_controller_context()
+
+            http_api.set_controller_context(context)
+            http_api._send_request_internal("DELETE", base + "f2")
+            assert http_api.get_controller_context() == {"version": 12, "fabrics": {"f1": {"id": 1}}}
+
+            http_api._send_request_internal("POST", "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/switches/roles")
+            assert http_api.get_controller_context() == {"version": 12}
+
+    def test_controller_context_capabilities_invalidate(self, mock_connection):
+        """Test that the capabilities are discarded on another controller version or a feature change."""
+        http_api, options = TestHttpApiResponseCache._http_api(mock_connection, {"controller_context_ttl": 3600})
+        path = "/appcenter/cisco/ndfc/api/about/version"
+        context = {
+            "version": 12,
+            "nd_version": 12.2,
+            "bulk_api": True,
+            "capabilities": {"raw_version": "12.2.2"},
+            "fabrics": {"f1": {"id": 1}},
+        }
+
+        with options:
+            http_api.set_controller_context(context)
+            http_api.connection.send.return_value[1].getvalue.return_value = b'{"version": "12.2.2"}'
+            http_api._send_request_internal("GET", path)
+            assert http_api.get_controller_context() == context
+
+            http_api.connection.send.return_value[1].getvalue.return_value = b'{"version": "12.4.1.245"}'
+            http_api._send_request_internal("GET", path)
+            assert http_api.get_controller_context() == {"fabrics": {"f1": {"id": 1}}}
+
+            http_api.set_controller_context(context)
+            http_api._send_request_internal("PUT", "/appcenter/cisco/ndfc/api/v1/fm/features/pmn")
+            assert http_api.get_controller_context() == {}
+
+
 class TestHttpApiPublicMethods:
     """Test public request methods."""
 